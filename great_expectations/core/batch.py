@@ -13,6 +13,15 @@ from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class BatchDefinition(SerializableDictDot):
+    # Data connectors hold a BatchDefinition for each of their data references, which can number in the millions.
+    __slots__ = (
+        "_datasource_name",
+        "_data_connector_name",
+        "_data_asset_name",
+        "_batch_identifiers",
+        "_batch_spec_passthrough",
+    )
+
     def __init__(
         self,
         datasource_name: str,
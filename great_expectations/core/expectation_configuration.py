@@ -1,6 +1,6 @@
 import json
 import logging
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Any, Dict
 
 import jsonpatch
@@ -934,13 +934,27 @@ class ExpectationConfiguration(SerializableDictDot):
 
     def get_raw_configuration(self):
         # return configuration without substituted evaluation parameters
-        raw_config = deepcopy(self)
+        raw_config = copy(self)
+        # only the kwargs that are kept are copied
         if raw_config._raw_kwargs is not None:
             raw_config._kwargs = raw_config._raw_kwargs
             raw_config._raw_kwargs = None
+        raw_config._kwargs = deepcopy(raw_config._kwargs)
+        raw_config.meta = deepcopy(raw_config.meta)
 
         return raw_config
 
+    def copy_with_kwargs(self, kwargs: Dict[str, Any]) -> "ExpectationConfiguration":
+        """Returns a copy of this configuration in which kwargs are added to (or replace) its kwargs.
+
+        Unlike a deep copy, the copy shares meta and the values of the kwargs that are not replaced with this
+        configuration, so it is cheap to make even when the kwargs are large (e.g. a value_set). The kwargs of the copy
+        can be updated without affecting this configuration, but the shared values must not be modified in place.
+        """
+        config = copy(self)
+        config._kwargs = {**self._kwargs, **kwargs}
+        return config
+
     def patch(self, op: str, path: str, value: Any) -> "ExpectationConfiguration":
         """
 
@@ -1101,11 +1115,11 @@ class ExpectationConfiguration(SerializableDictDot):
             runtime_keys = self.runtime_kwargs
 
         success_kwargs = self.get_success_kwargs()
-        lookup_kwargs = deepcopy(self.kwargs)
+        lookup_kwargs = self.kwargs
         if runtime_configuration:
-            lookup_kwargs.update(runtime_configuration)
+            lookup_kwargs = {**lookup_kwargs, **runtime_configuration}
         runtime_kwargs = {
-            key: lookup_kwargs.get(key, default_kwarg_values.get(key))
+            key: deepcopy(lookup_kwargs.get(key, default_kwarg_values.get(key)))
             for key in runtime_keys
         }
         runtime_kwargs["result_format"] = parse_result_format(
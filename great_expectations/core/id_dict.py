@@ -1,3 +1,4 @@
+import copy
 import hashlib
 import json
 
@@ -23,6 +24,48 @@ class IDDict(dict):
         ).hexdigest()
 
 
+class FrozenIDDict(IDDict):
+    """An IDDict that cannot be modified, so that its id can be computed once and shared (e.g. by the kwargs of a
+    MetricConfiguration). Its values are deep copies of those it is built from, so that they cannot be changed in
+    place through references held elsewhere either. Copies of a FrozenIDDict are ordinary, modifiable IDDicts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(copy.deepcopy(dict(*args, **kwargs)))
+        self._id = None
+
+    def to_id(self, id_keys=None, id_ignore_keys=None):
+        # Only the id computed with the default id_keys and id_ignore_keys is cached.
+        if id_keys is not None or id_ignore_keys is not None:
+            return super().to_id(id_keys=id_keys, id_ignore_keys=id_ignore_keys)
+        if self._id is None:
+            self._id = super().to_id()
+        return self._id
+
+    def _raise_frozen(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} cannot be modified")
+
+    __setitem__ = _raise_frozen
+    __delitem__ = _raise_frozen
+    clear = _raise_frozen
+    pop = _raise_frozen
+    popitem = _raise_frozen
+    setdefault = _raise_frozen
+    update = _raise_frozen
+    __ior__ = _raise_frozen
+
+    def copy(self):
+        return IDDict(self)
+
+    def __copy__(self):
+        return IDDict(self)
+
+    def __deepcopy__(self, memo):
+        return IDDict(copy.deepcopy(dict(self), memo))
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
 class BatchKwargs(IDDict):
     pass
 
@@ -0,0 +1,386 @@
+"""Mergeable sketches that summarize the values of a column in bounded memory.
+
+A sketch is updated with values (in as many calls as needed), can be merged with another sketch of the same kind and
+configuration (e.g. one built on another partition or batch of the same data), and can be serialized with to_json_dict
+and from_json_dict (or pickled).
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.types import SerializableDictDot
+
+
+def _hash_values(values: Iterable) -> np.ndarray:
+    """Returns a 64-bit hash of each of the values.
+
+    The hashes do not depend on the process that computes them, so that sketches built in different processes (e.g. on
+    Spark executors) can be merged. Note that values of different types hash differently (e.g. 1 and 1.0).
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(list(values), dtype=object)
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Returns the number of bits needed to represent each of the (uint64) values."""
+    # frexp is exact for values below 2 ** 53, so the high and low 32 bits are measured separately.
+    high_bits = (values >> np.uint64(32)).astype(np.float64)
+    low_bits = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high_bits > 0, 32 + np.frexp(high_bits)[1], np.frexp(low_bits)[1])
+
+
+class HyperLogLogSketch(SerializableDictDot):
+    """Estimates the number of distinct values (HyperLogLog; Flajolet, Fusy, Gandouet and Meunier, 2007).
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2 ** precision): 0.8% for the default precision
+    of 14, for which the sketch holds 16384 one-byte registers.
+    """
+
+    def __init__(self, precision: int = 14, registers: Optional[np.ndarray] = None):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self._precision = precision
+        if registers is None:
+            registers = np.zeros(2 ** precision, dtype=np.uint8)
+        elif len(registers) != 2 ** precision:
+            raise ValueError(
+                f"a precision of {precision} requires {2 ** precision} registers"
+            )
+        self._registers = registers
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def update(self, values: Iterable) -> "HyperLogLogSketch":
+        hashes = _hash_values(values)
+        if len(hashes) == 0:
+            return self
+
+        # The first precision bits of a hash select a register, which keeps the largest position of the first set bit
+        # in the remaining bits of the hashes that it is selected by.
+        register_indices = (hashes >> np.uint64(64 - self._precision)).astype(np.intp)
+        remaining_bits = hashes & np.uint64((1 << (64 - self._precision)) - 1)
+        ranks = (64 - self._precision) - _bit_length(remaining_bits) + 1
+        max_ranks = pd.Series(ranks.astype(np.uint8)).groupby(register_indices).max()
+        indices = max_ranks.index.to_numpy()
+        self._registers[indices] = np.maximum(
+            self._registers[indices], max_ranks.to_numpy()
+        )
+        return self
+
+    def merge(self, other: "HyperLogLogSketch") -> "HyperLogLogSketch":
+        if (
+            not isinstance(other, HyperLogLogSketch)
+            or other.precision != self.precision
+        ):
+            raise ValueError(
+                "Only HyperLogLogSketches with the same precision can be merged."
+            )
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def estimate(self) -> float:
+        """Returns the estimated number of distinct values."""
+        m = len(self._registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        raw_estimate = alpha * m * m / np.sum(np.exp2(-self._registers.astype(float)))
+        empty_registers = int(np.count_nonzero(self._registers == 0))
+        if raw_estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting is more accurate for small cardinalities.
+            return m * np.log(m / empty_registers)
+        return float(raw_estimate)
+
+    def to_json_dict(self) -> dict:
+        return {
+            "precision": self._precision,
+            "registers": self._registers.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: dict) -> "HyperLogLogSketch":
+        return cls(
+            precision=data["precision"],
+            registers=np.array(data["registers"], dtype=np.uint8),
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, HyperLogLogSketch)
+            and self._precision == other._precision
+            and np.array_equal(self._registers, other._registers)
+        )
+
+
+class KLLSketch(SerializableDictDot):
+    """Estimates quantiles of numeric values (KLL; Karnin, Lang and Liberty, 2016).
+
+    The sketch keeps a hierarchy of compactors, the largest of which holds about k values; the rank of an estimated
+    quantile is typically within 1.7 / k of the requested one (0.85% for the default k of 200). The smallest and largest
+    values are kept exactly.
+
+    Compaction is randomized. The default seed makes estimates reproducible for the same sequence of updates and
+    merges; pass seed=None for fresh randomness.
+    """
+
+    _COMPACTOR_CAPACITY_RATIO = 2 / 3
+
+    def __init__(
+        self,
+        k: int = 200,
+        seed: Optional[int] = 0,
+        compactors: Optional[List[np.ndarray]] = None,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+    ):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self._k = k
+        self._seed = seed
+        if hasattr(np.random, "default_rng"):
+            self._rng = np.random.default_rng(seed)
+        else:
+            # NumPy versions older than 1.17 do not provide the Generator API.
+            self._rng = np.random.RandomState(seed)
+        if compactors is None:
+            compactors = [np.empty(0)]
+        self._compactors = compactors
+        self._min_value = min_value
+        self._max_value = max_value
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """The number of values that the sketch summarizes."""
+        return sum(
+            len(compactor) << height
+            for height, compactor in enumerate(self._compactors)
+        )
+
+    def update(self, values: Iterable) -> "KLLSketch":
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+
+        self._update_min_max(values.min(), values.max())
+        self._compactors[0] = np.concatenate([self._compactors[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        if not isinstance(other, KLLSketch) or other.k != self.k:
+            raise ValueError("Only KLLSketches with the same k can be merged.")
+        if other.count == 0:
+            return self
+
+        self._update_min_max(other._min_value, other._max_value)
+        for height, compactor in enumerate(other._compactors):
+            if height == len(self._compactors):
+                self._compactors.append(np.empty(0))
+            self._compactors[height] = np.concatenate(
+                [self._compactors[height], compactor]
+            )
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[Optional[float]]:
+        """Returns the estimated value of each of the quantiles (each between 0 and 1), or None if the sketch is
+        empty."""
+        quantiles = list(quantiles)
+        if self.count == 0:
+            return [None] * len(quantiles)
+
+        values = np.concatenate(self._compactors)
+        weights = np.concatenate(
+            [
+                np.full(len(compactor), 1 << height, dtype=np.int64)
+                for height, compactor in enumerate(self._compactors)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative_weights = np.cumsum(weights[order])
+
+        estimates = []
+        for quantile in quantiles:
+            if not 0 <= quantile <= 1:
+                raise ValueError("quantiles must be between 0 and 1")
+            if quantile == 0:
+                estimates.append(self._min_value)
+            elif quantile == 1:
+                estimates.append(self._max_value)
+            else:
+                index = np.searchsorted(
+                    cumulative_weights, quantile * cumulative_weights[-1], side="left"
+                )
+                estimates.append(float(values[min(index, len(values) - 1)]))
+        return estimates
+
+    def _update_min_max(self, min_value: float, max_value: float):
+        if self._min_value is None or min_value < self._min_value:
+            self._min_value = float(min_value)
+        if self._max_value is None or max_value > self._max_value:
+            self._max_value = float(max_value)
+
+    def _capacity(self, height: int) -> int:
+        depth = len(self._compactors) - height - 1
+        return max(2, int(np.ceil(self._k * self._COMPACTOR_CAPACITY_RATIO ** depth)))
+
+    def _compress(self):
+        while True:
+            for height, compactor in enumerate(self._compactors):
+                if len(compactor) >= self._capacity(height):
+                    break
+            else:
+                return
+
+            if height + 1 == len(self._compactors):
+                self._compactors.append(np.empty(0))
+
+            # Half of the (sorted) values, either those at even or at odd positions, are promoted to the next compactor
+            # with twice the weight; an odd value out stays behind.
+            compactor = np.sort(compactor)
+            number_compacted = len(compactor) - len(compactor) % 2
+            offset = int(
+                self._rng.integers(2)
+                if hasattr(self._rng, "integers")
+                else self._rng.randint(2)
+            )
+            promoted = compactor[offset:number_compacted:2]
+            self._compactors[height] = compactor[number_compacted:]
+            self._compactors[height + 1] = np.concatenate(
+                [self._compactors[height + 1], promoted]
+            )
+
+    def to_json_dict(self) -> dict:
+        return {
+            "k": self._k,
+            "seed": self._seed,
+            "compactors": [compactor.tolist() for compactor in self._compactors],
+            "min_value": self._min_value,
+            "max_value": self._max_value,
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: dict) -> "KLLSketch":
+        return cls(
+            k=data["k"],
+            seed=data["seed"],
+            compactors=[
+                np.array(compactor, dtype=float) for compactor in data["compactors"]
+            ],
+            min_value=data["min_value"],
+            max_value=data["max_value"],
+        )
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, KLLSketch)
+            and self._k == other._k
+            and self._min_value == other._min_value
+            and self._max_value == other._max_value
+            and len(self._compactors) == len(other._compactors)
+            and all(
+                np.array_equal(compactor, other_compactor)
+                for compactor, other_compactor in zip(
+                    self._compactors, other._compactors
+                )
+            )
+        )
+
+
+class CountMinSketch(SerializableDictDot):
+    """Estimates how often values occur (count-min sketch; Cormode and Muthukrishnan, 2005).
+
+    An estimate is never lower than the true count. With probability at least 1 - exp(-depth), it exceeds the true
+    count by at most e / width times the number of values in the sketch (0.13% for the default width of 2048).
+    """
+
+    def __init__(
+        self, width: int = 2048, depth: int = 5, counts: Optional[np.ndarray] = None
+    ):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be positive")
+        if counts is None:
+            counts = np.zeros((depth, width), dtype=np.int64)
+        elif counts.shape != (depth, width):
+            raise ValueError(f"counts must have the shape {(depth, width)}")
+        self._counts = counts
+
+    @property
+    def width(self) -> int:
+        return self._counts.shape[1]
+
+    @property
+    def depth(self) -> int:
+        return self._counts.shape[0]
+
+    @property
+    def count(self) -> int:
+        """The number of values that the sketch summarizes."""
+        return int(self._counts[0].sum())
+
+    def _get_column_indices(self, values: Iterable) -> np.ndarray:
+        # The hash functions of the rows are derived from two halves of a single hash (Kirsch and Mitzenmacher, 2006).
+        hashes = _hash_values(values)
+        low_bits = hashes & np.uint64(0xFFFFFFFF)
+        high_bits = hashes >> np.uint64(32)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, np.newaxis]
+        return ((low_bits + rows * high_bits) % np.uint64(self.width)).astype(np.intp)
+
+    def update(self, values: Iterable) -> "CountMinSketch":
+        column_indices = self._get_column_indices(values)
+        for row, row_column_indices in enumerate(column_indices):
+            self._counts[row] += np.bincount(row_column_indices, minlength=self.width)
+        return self
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (
+            not isinstance(other, CountMinSketch)
+            or other._counts.shape != self._counts.shape
+        ):
+            raise ValueError(
+                "Only CountMinSketches with the same width and depth can be merged."
+            )
+        self._counts += other._counts
+        return self
+
+    def estimate(self, values: Iterable) -> np.ndarray:
+        """Returns the estimated number of occurrences of each of the values."""
+        column_indices = self._get_column_indices(values)
+        rows = np.arange(self.depth)[:, np.newaxis]
+        return self._counts[rows, column_indices].min(axis=0)
+
+    def to_json_dict(self) -> dict:
+        return {
+            "width": self.width,
+            "depth": self.depth,
+            "counts": self._counts.tolist(),
+        }
+
+    @classmethod
+    def from_json_dict(cls, data: dict) -> "CountMinSketch":
+        return cls(
+            width=data["width"],
+            depth=data["depth"],
+            counts=np.array(data["counts"], dtype=np.int64),
+        )
+
+    def __eq__(self, other):
+        return isinstance(other, CountMinSketch) and np.array_equal(
+            self._counts, other._counts
+        )
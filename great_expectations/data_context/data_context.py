@@ -2354,6 +2354,7 @@ class BaseDataContext:
             "data_asset_name"
         )
 
+        metrics = []
         for expectation_suite_dependency, metrics_list in requested_metrics.items():
             if (expectation_suite_dependency != "*") and (
                 expectation_suite_dependency != expectation_suite_name
@@ -2375,19 +2376,21 @@ class BaseDataContext:
                         metric_value = validation_results.get_metric(
                             metric_name, **metric_kwargs
                         )
-                        self.stores[target_store_name].set(
-                            ValidationMetricIdentifier(
-                                run_id=run_id,
-                                data_asset_name=data_asset_name,
-                                expectation_suite_identifier=ExpectationSuiteIdentifier(
-                                    expectation_suite_name
+                        metrics.append(
+                            (
+                                ValidationMetricIdentifier(
+                                    run_id=run_id,
+                                    data_asset_name=data_asset_name,
+                                    expectation_suite_identifier=ExpectationSuiteIdentifier(
+                                        expectation_suite_name
+                                    ),
+                                    metric_name=metric_name,
+                                    metric_kwargs_id=get_metric_kwargs_id(
+                                        metric_name, metric_kwargs
+                                    ),
                                 ),
-                                metric_name=metric_name,
-                                metric_kwargs_id=get_metric_kwargs_id(
-                                    metric_name, metric_kwargs
-                                ),
-                            ),
-                            metric_value,
+                                metric_value,
+                            )
                         )
                     except ge_exceptions.UnavailableMetricError:
                         # This will happen frequently in larger pipelines
@@ -2396,6 +2399,10 @@ class BaseDataContext:
                             "this validation result.".format(metric_name)
                         )
 
+        # The metrics are stored with a single bulk request rather than one request for each metric.
+        if metrics:
+            self.stores[target_store_name].set_many(metrics)
+
     def store_validation_result_metrics(
         self, requested_metrics, validation_results, target_store_name
     ):
@@ -5,6 +5,7 @@ from .store_backend import (  # isort:skip
     StoreBackend,
     InMemoryStoreBackend,
 )
+from .caching_store_backend import CachingStoreBackend  # isort:skip
 from .ge_cloud_store_backend import GeCloudStoreBackend  # isort:skip
 from .tuple_store_backend import (  # isort:skip
     TupleFilesystemStoreBackend,
@@ -35,6 +36,7 @@ for module_name, package_name in [
     (".metric_store", "great_expectations.data_context.store"),
     (".checkpoint_store", "great_expectations.data_context.store"),
     (".store_backend", "great_expectations.data_context.store"),
+    (".caching_store_backend", "great_expectations.data_context.store"),
     (".tuple_store_backend", "great_expectations.data_context.store"),
     (".database_store_backend", "great_expectations.data_context.store"),
     (".ge_cloud_store_backend", "great_expectations.data_context.store"),
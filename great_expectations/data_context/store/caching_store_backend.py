@@ -0,0 +1,294 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional, Union
+
+from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
+from great_expectations.util import filter_properties_dict
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheEntry:
+    __slots__ = ("value", "version", "validated_at", "deserialized_value")
+
+    # Marks entries whose value has not been deserialized yet (None is a valid deserialized value).
+    NOT_DESERIALIZED = object()
+
+    def __init__(self, value: Any, version: Optional[Hashable], validated_at: float):
+        self.value = value
+        self.version = version
+        self.validated_at = validated_at
+        self.deserialized_value = _CacheEntry.NOT_DESERIALIZED
+
+
+class CachingStoreBackend(StoreBackend):
+    """
+    Wraps another StoreBackend with a size-limited, in-memory LRU cache of the values that are read from it.
+
+    For revalidate_after_seconds after a cached value was read or validated, it is served without any request to the
+    wrapped backend.  After that, it is validated by comparing the version of the stored value (the ETag of an S3, GCS
+    or Azure Blob object, or the modification time and size of a file) with the version of the cached value, which is
+    much cheaper than reading the value again.  Values of backends that cannot report versions are only cached for
+    revalidate_after_seconds.
+
+    Values that are set, moved or removed through the CachingStoreBackend are invalidated, and changes made by other
+    writers are picked up when the cached values are validated.  Stores also cache the objects that they deserialize
+    from the cached values (e.g. ExpectationSuites and CheckpointConfigs), and return copies of them.
+
+    Caching is opt-in, by wrapping the configuration of a store backend:
+
+        store_backend:
+          class_name: CachingStoreBackend
+          max_size: 128
+          revalidate_after_seconds: 0
+          store_backend:
+            class_name: TupleS3StoreBackend
+            bucket: my_bucket
+    """
+
+    def __init__(
+        self,
+        store_backend: Union[dict, StoreBackend],
+        max_size: int = 128,
+        revalidate_after_seconds: float = 0,
+        runtime_environment: Optional[dict] = None,
+        store_name: Optional[str] = None,
+    ):
+        """
+        Args:
+            store_backend: the configuration of the StoreBackend to wrap (or a StoreBackend)
+            max_size: the maximum number of values to cache; the least recently used values are evicted first
+            revalidate_after_seconds: for how long cached values are served without validating them
+            runtime_environment: used to instantiate the wrapped StoreBackend
+            store_name: store name given in the DataContextConfig (via either in-code or yaml configuration)
+        """
+        if max_size < 1:
+            raise DataContextError(
+                "Invalid CachingStoreBackend configuration: max_size must be a positive number."
+            )
+
+        if isinstance(store_backend, StoreBackend):
+            wrapped_store_backend = store_backend
+        else:
+            module_name = "great_expectations.data_context.store"
+            wrapped_store_backend = instantiate_class_from_config(
+                config=store_backend,
+                runtime_environment=runtime_environment or {},
+                config_defaults={
+                    "module_name": module_name,
+                    "store_name": store_name,
+                },
+            )
+            if not wrapped_store_backend:
+                raise ClassInstantiationError(
+                    module_name=module_name,
+                    package_name=None,
+                    class_name=store_backend,
+                )
+            if not isinstance(wrapped_store_backend, StoreBackend):
+                raise DataContextError(
+                    "Invalid CachingStoreBackend configuration: expected a StoreBackend instance to wrap."
+                )
+
+        super().__init__(
+            fixed_length_key=wrapped_store_backend.fixed_length_key,
+            suppress_store_backend_id=True,
+            store_name=store_name,
+        )
+        self._store_backend = wrapped_store_backend
+        self._max_size = max_size
+        self._revalidate_after_seconds = revalidate_after_seconds
+        if (
+            type(wrapped_store_backend)._get_version is StoreBackend._get_version
+            and revalidate_after_seconds <= 0
+        ):
+            logger.warning(
+                f"CachingStoreBackend: {type(wrapped_store_backend).__name__} cannot report the versions of its values, "
+                f"so no values are cached unless revalidate_after_seconds is set to a positive number."
+            )
+        self._entries: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter
+        # out the Falsy values, and set the instance "_config" variable equal to the resulting dictionary.
+        self._config = {
+            "store_backend": wrapped_store_backend.config,
+            "max_size": max_size,
+            "revalidate_after_seconds": revalidate_after_seconds,
+            "store_name": store_name,
+            "module_name": self.__class__.__module__,
+            "class_name": self.__class__.__name__,
+        }
+        filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+
+    def __getattr__(self, name):
+        # Attributes that are specific to the wrapped backend (e.g. its root_directory or bucket) are looked up on it.
+        if name.startswith("__") or name == "_store_backend":
+            raise AttributeError(name)
+        return getattr(self._store_backend, name)
+
+    @staticmethod
+    def get_wrapped_store_backend_config(store_backend: dict) -> dict:
+        """
+        Return the configuration of the store backend that the given store backend configuration describes, or wraps
+        if it is the configuration of a CachingStoreBackend; stores apply their backend-specific defaults to it.
+        """
+        while store_backend.get("class_name") == CachingStoreBackend.__name__:
+            store_backend = store_backend["store_backend"]
+        return store_backend
+
+    @property
+    def store_backend(self) -> StoreBackend:
+        return self._store_backend
+
+    @property
+    def store_backend_id(self):
+        return self._store_backend.store_backend_id
+
+    @property
+    def store_backend_id_warnings_suppressed(self):
+        return self._store_backend.store_backend_id_warnings_suppressed
+
+    def _validate_key(self, key):
+        self._store_backend._validate_key(key)
+
+    def _validate_value(self, value):
+        self._store_backend._validate_value(value)
+
+    def get_deserialized(self, key, deserialize: Callable[[Any], Any]) -> Any:
+        """
+        Retrieve the value of key, deserialized by deserialize; the deserialized value is cached along with the value,
+        and a copy of it is returned, so that callers can modify it.
+        """
+        self._validate_key(key)
+        entry: _CacheEntry = self._get_entry(key)
+        if not self._is_cacheable(entry):
+            # The deserialized value of an entry that is not cached is not shared, so it does not need to be copied.
+            return deserialize(entry.value)
+        deserialized_value: Any = entry.deserialized_value
+        if deserialized_value is _CacheEntry.NOT_DESERIALIZED:
+            deserialized_value = deserialize(entry.value)
+            entry.deserialized_value = deserialized_value
+        return copy.deepcopy(deserialized_value)
+
+    def clear(self):
+        """Drop all of the cached values."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get_entry(self, key) -> _CacheEntry:
+        key = tuple(key)
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        now: float = time.monotonic()
+        if (
+            entry is not None
+            and now - entry.validated_at < self._revalidate_after_seconds
+        ):
+            return entry
+
+        # The version is retrieved before the value, so that a value written in between is never cached with the
+        # version of the value that it replaced (it would be read again, rather than served out of date).
+        try:
+            version: Optional[Hashable] = self._store_backend.get_version(key)
+        except InvalidKeyError:
+            self._invalidate(keys=[key])
+            raise
+
+        if entry is not None and version is not None and version == entry.version:
+            entry.validated_at = now
+            return entry
+
+        entry = _CacheEntry(
+            value=self._store_backend.get(key), version=version, validated_at=now
+        )
+        if self._is_cacheable(entry):
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def _is_cacheable(self, entry: _CacheEntry) -> bool:
+        return entry.version is not None or self._revalidate_after_seconds > 0
+
+    def _invalidate(self, keys: List[tuple]):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(tuple(key), None)
+
+    def _get(self, key):
+        return self._get_entry(key).value
+
+    def _get_many(self, keys):
+        return [self._get_entry(key).value for key in keys]
+
+    def _get_version(self, key):
+        return self._store_backend.get_version(key)
+
+    def _set(self, key, value, **kwargs):
+        try:
+            return self._store_backend.set(key, value, **kwargs)
+        finally:
+            self._invalidate(keys=[key])
+
+    def _set_many(self, key_value_pairs, **kwargs):
+        keys: List[tuple] = [key for key, _ in key_value_pairs]
+        try:
+            return self._store_backend.set_many(key_value_pairs, **kwargs)
+        finally:
+            self._invalidate(keys=keys)
+
+    def _move(self, source_key, dest_key, **kwargs):
+        try:
+            return self._store_backend.move(source_key, dest_key, **kwargs)
+        finally:
+            self._invalidate(keys=[source_key, dest_key])
+
+    def _has_key(self, key):
+        with self._lock:
+            entry: Optional[_CacheEntry] = self._entries.get(tuple(key))
+        if (
+            entry is not None
+            and time.monotonic() - entry.validated_at < self._revalidate_after_seconds
+        ):
+            return True
+        return self._store_backend.has_key(key)
+
+    def _has_many(self, keys):
+        return self._store_backend.has_many(keys)
+
+    def list_keys(self, prefix=()):
+        return self._store_backend.list_keys(prefix=prefix)
+
+    def iter_keys(self, prefix=()):
+        return self._store_backend.iter_keys(prefix=prefix)
+
+    def remove_key(self, key):
+        try:
+            return self._store_backend.remove_key(key)
+        finally:
+            self._invalidate(keys=[key])
+
+    def get_url_for_key(self, key, protocol=None):
+        return self._store_backend.get_url_for_key(key, protocol=protocol)
+
+    def is_ignored_key(self, key):
+        return self._store_backend.is_ignored_key(key)
+
+    @property
+    def config(self) -> dict:
+        return self._config
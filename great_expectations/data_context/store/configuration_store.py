@@ -6,6 +6,9 @@ from ruamel.yaml.comments import CommentedMap
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.data_context.store import GeCloudStoreBackend
+from great_expectations.data_context.store.caching_store_backend import (
+    CachingStoreBackend,
+)
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.store.tuple_store_backend import TupleStoreBackend
 from great_expectations.data_context.types.base import BaseYamlConfig
@@ -49,10 +52,14 @@ class ConfigurationStore(Store):
             )
 
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            # Defaults are provided for the backend that a CachingStoreBackend wraps.
+            store_backend_config: dict = (
+                CachingStoreBackend.get_wrapped_store_backend_config(store_backend)
+            )
+            store_backend_module_name = store_backend_config.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = store_backend_config.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -63,7 +70,7 @@ class ConfigurationStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
-                store_backend["filepath_template"] = store_backend.get(
+                store_backend_config["filepath_template"] = store_backend_config.get(
                     "filepath_template", "{0}.yml"
                 )
 
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import great_expectations.exceptions as ge_exceptions
@@ -16,8 +16,10 @@ try:
         String,
         Table,
         and_,
+        bindparam,
         column,
         create_engine,
+        or_,
         select,
         text,
     )
@@ -33,6 +35,22 @@ logger = logging.getLogger(__name__)
 
 
 class DatabaseStoreBackend(StoreBackend):
+    """
+    Stores values in a database table that has one column for each of key_columns and a "value" column.
+
+    Values are written with dialect-native upserts (INSERT ... ON CONFLICT on PostgreSQL, INSERT OR REPLACE on SQLite,
+    INSERT ... ON DUPLICATE KEY UPDATE on MySQL and MERGE on SQL Server and Snowflake), so that storing a value takes a
+    single statement, and set_many stores all of its values in one transaction.  The connection pool of the engine
+    that the backend creates can be sized with pool_size, max_overflow, pool_recycle and pool_pre_ping.
+    """
+
+    # Dialects whose upsert is a MERGE statement.
+    MERGE_DIALECTS = ("mssql", "snowflake")
+
+    # The number of bound parameters in a single statement is limited (to 999 by older versions of SQLite), so the
+    # keys of bulk operations are looked up in chunks that stay below that limit.
+    MAX_BULK_QUERY_PARAMETERS = 900
+
     def __init__(
         self,
         table_name,
@@ -45,6 +63,10 @@ class DatabaseStoreBackend(StoreBackend):
         store_name=None,
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_recycle: Optional[int] = None,
+        pool_pre_ping: Optional[bool] = None,
         **kwargs,
     ):
         super().__init__(
@@ -68,6 +90,19 @@ class DatabaseStoreBackend(StoreBackend):
         self._connection_string = connection_string
         self._url = url
 
+        # Pool options are only passed on when they are given, since not every pool class (e.g. the one that SQLite
+        # uses for in-memory databases) accepts them.
+        pool_kwargs: dict = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_recycle": pool_recycle,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        engine_kwargs: dict = {
+            **{name: value for name, value in pool_kwargs.items() if value is not None},
+            **kwargs,
+        }
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -76,12 +111,12 @@ class DatabaseStoreBackend(StoreBackend):
                 )
             self.engine = engine
         elif credentials is not None:
-            self.engine = self._build_engine(credentials=credentials, **kwargs)
+            self.engine = self._build_engine(credentials=credentials, **engine_kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = sa.create_engine(connection_string, **engine_kwargs)
         elif url is not None:
             self.drivername = urlparse(url).scheme
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = sa.create_engine(url, **engine_kwargs)
         else:
             raise ge_exceptions.InvalidConfigError(
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."
@@ -120,6 +155,8 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {str(e)}"
                 )
         self._table = table
+        self._has_unique_key_columns: bool = self._ensure_unique_key_columns_index()
+        self._upsert_statement = None
         # Initialize with store_backend_id
         self._store_backend_id = None
         self._store_backend_id = self.store_backend_id
@@ -140,6 +177,7 @@ class DatabaseStoreBackend(StoreBackend):
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
+        self._config.update(pool_kwargs)
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
@@ -175,9 +213,10 @@ class DatabaseStoreBackend(StoreBackend):
             create_engine_kwargs["connect_args"] = connect_args
 
         if "private_key_path" in credentials:
-            options, create_engine_kwargs = self._get_sqlalchemy_key_pair_auth_url(
+            options, key_pair_auth_kwargs = self._get_sqlalchemy_key_pair_auth_url(
                 drivername, credentials
             )
+            create_engine_kwargs.update(key_pair_auth_kwargs)
         else:
             options = sa.engine.url.URL(drivername, **credentials)
 
@@ -255,15 +294,138 @@ class DatabaseStoreBackend(StoreBackend):
             logger.debug("Error fetching value: " + str(e))
             raise ge_exceptions.StoreError("Unable to fetch value for key: " + str(key))
 
+    def _ensure_unique_key_columns_index(self) -> bool:
+        """
+        Make sure that the key columns of the table are unique, which upserts rely on: the tables that this backend
+        creates have the key columns as their primary key, and a composite unique index on the key columns is created
+        for existing tables that have neither such a primary key nor such an index.
+
+        Returns:
+            whether the key columns are unique, so that values can be upserted
+        """
+        key_columns = {key_col.lower() for key_col in self.key_columns}
+        if {
+            str(col.name).lower() for col in self._table.primary_key.columns
+        } == key_columns:
+            return True
+
+        try:
+            inspector: Inspector = sa.inspect(self.engine)
+            for index in inspector.get_indexes(
+                self._table.name, schema=self._table.schema
+            ):
+                if (
+                    index.get("unique")
+                    and {str(col).lower() for col in index["column_names"]}
+                    == key_columns
+                ):
+                    return True
+
+            sa.Index(
+                f"ix_{self._table.name}_key_columns",
+                *(
+                    getattr(self._table.columns, key_col)
+                    for key_col in self.key_columns
+                ),
+                unique=True,
+            ).create(bind=self.engine)
+        except SQLAlchemyError as e:
+            logger.warning(
+                f"Unable to create a unique index on the key columns of table {self._table.name}; values will not "
+                f"be upserted. SqlAlchemyError: {str(e)}"
+            )
+            return False
+
+        return True
+
+    def _get_upsert_statement(self):
+        """
+        Build (once) the statement that inserts a row, or updates the value of the row with the same key, in a single
+        round trip; or return None if the dialect has no supported upsert.
+        """
+        if self._upsert_statement is not None or not self._has_unique_key_columns:
+            return self._upsert_statement
+
+        dialect_name: str = self.engine.dialect.name
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects import postgresql
+
+            insert = postgresql.insert(self._table)
+            self._upsert_statement = insert.on_conflict_do_update(
+                index_elements=[
+                    getattr(self._table.columns, key_col)
+                    for key_col in self.key_columns
+                ],
+                set_={"value": insert.excluded.value},
+            )
+        elif dialect_name == "sqlite":
+            # The key columns and the value are all of the columns, so replacing a conflicting row updates its value.
+            self._upsert_statement = self._table.insert().prefix_with("OR REPLACE")
+        elif dialect_name == "mysql":
+            from sqlalchemy.dialects import mysql
+
+            insert = mysql.insert(self._table)
+            self._upsert_statement = insert.on_duplicate_key_update(
+                value=insert.inserted.value
+            )
+        elif dialect_name in self.MERGE_DIALECTS:
+            preparer = self.engine.dialect.identifier_preparer
+            table_name: str = preparer.format_table(self._table)
+            key_columns: List[str] = [
+                preparer.quote(key_col) for key_col in self.key_columns
+            ]
+            value_column: str = preparer.quote("value")
+            source_columns: str = ", ".join(
+                f":{key_col} AS {quoted_key_col}"
+                for key_col, quoted_key_col in zip(self.key_columns, key_columns)
+            )
+            condition: str = " AND ".join(
+                f"target.{key_col} = source.{key_col}" for key_col in key_columns
+            )
+            insert_columns: str = ", ".join(key_columns + [value_column])
+            insert_values: str = ", ".join(
+                f"source.{col}" for col in key_columns + [value_column]
+            )
+            self._upsert_statement = text(
+                f"MERGE INTO {table_name} AS target "
+                f"USING (SELECT {source_columns}, :value AS {value_column}) AS source "
+                f"ON {condition} "
+                f"WHEN MATCHED THEN UPDATE SET {value_column} = source.{value_column} "
+                f"WHEN NOT MATCHED THEN INSERT ({insert_columns}) VALUES ({insert_values});"
+            )
+
+        return self._upsert_statement
+
+    def _build_row(self, key, value) -> dict:
+        row = {key_col: val for key_col, val in zip(self.key_columns, key)}
+        row["value"] = value
+        return row
+
     def _set(self, key, value, allow_update=True):
-        cols = {k: v for (k, v) in zip(self.key_columns, key)}
-        cols["value"] = value
+        cols = self._build_row(key, value)
+
+        upsert_statement = self._get_upsert_statement() if allow_update else None
+        if upsert_statement is not None:
+            try:
+                self.engine.execute(upsert_statement, cols)
+            except SQLAlchemyError as e:
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to store key {str(key)}: got sqlalchemy error {str(e)}"
+                )
+            return
 
         if allow_update:
             if self.has_key(key):
                 ins = (
                     self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
+                    .where(
+                        and_(
+                            *(
+                                getattr(self._table.columns, key_col) == val
+                                for key_col, val in zip(self.key_columns, key)
+                            )
+                        )
+                    )
                     .values(**cols)
                 )
             else:
@@ -281,6 +443,138 @@ class DatabaseStoreBackend(StoreBackend):
                     f"Integrity error {str(e)} while trying to store key"
                 )
 
+    def _get_many(self, keys):
+        values_by_key: Dict[tuple, str] = self._select_values_by_key(
+            keys=keys, select_values=True
+        )
+        values: list = []
+        for key in keys:
+            try:
+                values.append(values_by_key[tuple(key)])
+            except KeyError:
+                raise ge_exceptions.StoreError(
+                    "Unable to fetch value for key: " + str(key)
+                )
+        return values
+
+    def _has_many(self, keys):
+        existing_keys: Dict[tuple, None] = self._select_values_by_key(
+            keys=keys, select_values=False
+        )
+        return [tuple(key) in existing_keys for key in keys]
+
+    def _select_values_by_key(self, keys: List[tuple], select_values: bool) -> dict:
+        """
+        Look up keys with one query per chunk of keys (a single IN query for single-column keys), rather than one
+        query per key.
+        """
+        key_columns = [getattr(self._table.columns, col) for col in self.key_columns]
+        selected_columns = [column(col) for col in self.key_columns]
+        if select_values:
+            selected_columns.append(column("value"))
+
+        chunk_size: int = max(self.MAX_BULK_QUERY_PARAMETERS // len(key_columns), 1)
+        unique_keys: List[tuple] = list(dict.fromkeys(tuple(key) for key in keys))
+        values_by_key: dict = {}
+        for start in range(0, len(unique_keys), chunk_size):
+            chunk: List[tuple] = unique_keys[start : start + chunk_size]
+            if len(key_columns) == 1:
+                condition = key_columns[0].in_([key[0] for key in chunk])
+            else:
+                condition = or_(
+                    *(
+                        and_(
+                            *(
+                                key_column == val
+                                for key_column, val in zip(key_columns, key)
+                            )
+                        )
+                        for key in chunk
+                    )
+                )
+            sel = select(selected_columns).select_from(self._table).where(condition)
+            try:
+                for row in self.engine.execute(sel):
+                    values_by_key[tuple(row[: len(key_columns)])] = (
+                        row[-1] if select_values else None
+                    )
+            except SQLAlchemyError as e:
+                logger.debug("Error fetching values: " + str(e))
+                raise ge_exceptions.StoreError(
+                    f"Unable to fetch values for {len(chunk)} keys"
+                )
+        return values_by_key
+
+    def _set_many(self, key_value_pairs, allow_update=True):
+        # When a key is given more than once, its last value is the one that is stored, as it would be by _set.
+        values_by_key: Dict[tuple, str] = {
+            tuple(key): value for key, value in key_value_pairs
+        }
+        keys: List[tuple] = list(values_by_key.keys())
+
+        upsert_statement = self._get_upsert_statement() if allow_update else None
+        if upsert_statement is not None:
+            try:
+                # All of the values are upserted with a single executemany, in one transaction.
+                with self.engine.begin() as connection:
+                    connection.execute(
+                        upsert_statement,
+                        [self._build_row(key, values_by_key[key]) for key in keys],
+                    )
+            except SQLAlchemyError as e:
+                raise ge_exceptions.StoreBackendError(
+                    f"Unable to store {len(keys)} keys: got sqlalchemy error {str(e)}"
+                )
+            return [None] * len(key_value_pairs)
+
+        if allow_update:
+            existing_keys: List[bool] = self._has_many(keys)
+        else:
+            existing_keys = [False] * len(keys)
+
+        new_rows: List[dict] = []
+        updated_rows: List[dict] = []
+        for key, exists in zip(keys, existing_keys):
+            if exists:
+                row = {
+                    f"_{key_col}": val for key_col, val in zip(self.key_columns, key)
+                }
+                row["value"] = values_by_key[key]
+                updated_rows.append(row)
+            else:
+                row = self._build_row(key, values_by_key[key])
+                new_rows.append(row)
+
+        try:
+            with self.engine.begin() as connection:
+                if new_rows:
+                    connection.execute(self._table.insert(), new_rows)
+                if updated_rows:
+                    upd = (
+                        self._table.update()
+                        .where(
+                            and_(
+                                *(
+                                    getattr(self._table.columns, key_col)
+                                    == bindparam(f"_{key_col}")
+                                    for key_col in self.key_columns
+                                )
+                            )
+                        )
+                        .values(value=bindparam("value"))
+                    )
+                    connection.execute(upd, updated_rows)
+        except IntegrityError:
+            # Some of the keys exist already (e.g. they were added concurrently); _set tells apart the keys that
+            # already have the same value from conflicting ones.
+            logger.debug(
+                "Integrity error while storing keys in bulk; storing them one at a time."
+            )
+            for key, value in values_by_key.items():
+                self._set(key, value, allow_update=allow_update)
+
+        return [None] * len(key_value_pairs)
+
     def _move(self):
         raise NotImplementedError
 
@@ -322,6 +616,9 @@ class DatabaseStoreBackend(StoreBackend):
             return False
 
     def list_keys(self, prefix=()):
+        return list(self.iter_keys(prefix=prefix))
+
+    def iter_keys(self, prefix=()):
         sel = (
             select([column(col) for col in self.key_columns])
             .select_from(self._table)
@@ -334,7 +631,9 @@ class DatabaseStoreBackend(StoreBackend):
                 )
             )
         )
-        return [tuple(row) for row in self.engine.execute(sel).fetchall()]
+        # Rows are fetched from the cursor as the keys are iterated over.
+        for row in self.engine.execute(sel):
+            yield tuple(row)
 
     def remove_key(self, key):
         delete_statement = self._table.delete().where(
@@ -5,6 +5,9 @@ from typing import Dict
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.expectation_suite import ExpectationSuiteSchema
 from great_expectations.data_context.store import GeCloudStoreBackend
+from great_expectations.data_context.store.caching_store_backend import (
+    CachingStoreBackend,
+)
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
@@ -111,10 +114,14 @@ class ExpectationsStore(Store):
         self._expectationSuiteSchema = ExpectationSuiteSchema()
 
         if store_backend is not None:
-            store_backend_module_name = store_backend.get(
+            # Defaults are provided for the backend that a CachingStoreBackend wraps.
+            store_backend_config: dict = (
+                CachingStoreBackend.get_wrapped_store_backend_config(store_backend)
+            )
+            store_backend_module_name = store_backend_config.get(
                 "module_name", "great_expectations.data_context.store"
             )
-            store_backend_class_name = store_backend.get(
+            store_backend_class_name = store_backend_config.get(
                 "class_name", "InMemoryStoreBackend"
             )
             verify_dynamic_loading_support(module_name=store_backend_module_name)
@@ -125,15 +132,15 @@ class ExpectationsStore(Store):
             # Store Backend Class was loaded successfully; verify that it is of a correct subclass.
             if issubclass(store_backend_class, TupleStoreBackend):
                 # Provide defaults for this common case
-                store_backend["filepath_suffix"] = store_backend.get(
+                store_backend_config["filepath_suffix"] = store_backend_config.get(
                     "filepath_suffix", ".json"
                 )
             elif issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
-                store_backend["table_name"] = store_backend.get(
+                store_backend_config["table_name"] = store_backend_config.get(
                     "table_name", "ge_expectations_store"
                 )
-                store_backend["key_columns"] = store_backend.get(
+                store_backend_config["key_columns"] = store_backend_config.get(
                     "key_columns", ["expectation_suite_name"]
                 )
 
@@ -1,7 +1,9 @@
 import inspect
+import json
 import logging
 import os
 from mimetypes import guess_type
+from typing import List
 
 from great_expectations.data_context.types.resource_identifiers import (
     ExpectationSuiteIdentifier,
@@ -24,6 +26,10 @@ from .tuple_store_backend import TupleStoreBackend
 
 logger = logging.getLogger(__name__)
 
+INDEX_PAGE_FILEPATH = "index.html"
+NUMBERED_INDEX_PAGE_FILEPATH_TEMPLATE = "index_{0}.html"
+SITE_MANIFEST_FILEPATH = "data_docs_manifest.json"
+
 
 class HtmlSiteStore:
     """
@@ -160,7 +166,7 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
-        filepath_template = "index.html"
+        filepath_template = INDEX_PAGE_FILEPATH
         index_page_obj = instantiate_class_from_config(
             config=store_backend,
             runtime_environment=runtime_environment,
@@ -177,6 +183,40 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        filepath_template = NUMBERED_INDEX_PAGE_FILEPATH_TEMPLATE
+        numbered_index_pages_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+                "suppress_store_backend_id": True,
+            },
+        )
+        if not numbered_index_pages_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
+        filepath_template = SITE_MANIFEST_FILEPATH
+        site_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults={
+                "module_name": module_name,
+                "filepath_template": filepath_template,
+                "suppress_store_backend_id": True,
+            },
+        )
+        if not site_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         filepath_template = None
         static_assets_obj = instantiate_class_from_config(
             config=store_backend,
@@ -198,6 +238,8 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "numbered_index_pages": numbered_index_pages_obj,
+            "site_manifest": site_manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -236,6 +278,29 @@ class HtmlSiteStore:
             content_type="text/html; charset=utf-8",
         )
 
+    def set_many(self, key_value_pairs):
+        """
+        Set the serialized value of each key in key_value_pairs, with a single bulk request to each store backend
+        (which the S3, GCS and Azure store backends make concurrently).
+        """
+        key_value_pairs_by_resource_identifier_type = {}
+        for key, serialized_value in key_value_pairs:
+            self._validate_key(key)
+            self.keys.add(key)
+            key_value_pairs_by_resource_identifier_type.setdefault(
+                type(key.resource_identifier), []
+            ).append((key.resource_identifier.to_tuple(), serialized_value))
+
+        for (
+            resource_identifier_type,
+            resource_key_value_pairs,
+        ) in key_value_pairs_by_resource_identifier_type.items():
+            self.store_backends[resource_identifier_type].set_many(
+                resource_key_value_pairs,
+                content_encoding="utf-8",
+                content_type="text/html; charset=utf-8",
+            )
+
     def get_url_for_resource(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -331,15 +396,70 @@ class HtmlSiteStore:
                 pass
         return keys
 
-    def write_index_page(self, page):
-        """This third param_store has a special method, which uses a zero-length tuple as a key."""
-        return self.store_backends["index_page"].set(
-            (),
+    def write_index_page(self, page, page_number: int = 0):
+        """
+        This third param_store has a special method, which uses a zero-length tuple as a key.
+
+        Index pages other than the first one (see get_index_page_filepath) are numbered from 1.
+        """
+        if page_number == 0:
+            return self.store_backends["index_page"].set(
+                (),
+                page,
+                content_encoding="utf-8",
+                content_type="text/html; " "charset=utf-8",
+            )
+        return self.store_backends["numbered_index_pages"].set(
+            (str(page_number),),
             page,
             content_encoding="utf-8",
             content_type="text/html; " "charset=utf-8",
         )
 
+    def list_numbered_index_page_numbers(self) -> List[int]:
+        return sorted(
+            int(key[0])
+            for key in self.store_backends["numbered_index_pages"].list_keys()
+            if key[0].isdigit()
+        )
+
+    def remove_numbered_index_page(self, page_number: int):
+        return self.store_backends["numbered_index_pages"].remove_key(
+            (str(page_number),)
+        )
+
+    @staticmethod
+    def get_index_page_filepath(page_number: int = 0) -> str:
+        """Return the filepath of an index page, relative to the root of the site."""
+        if page_number == 0:
+            return INDEX_PAGE_FILEPATH
+        return NUMBERED_INDEX_PAGE_FILEPATH_TEMPLATE.format(page_number)
+
+    def get_site_manifest(self) -> dict:
+        """
+        Return the manifest written by the last incremental build of the site, or an empty dict if there is none (or
+        if it cannot be read, in which case the site is built again in full).
+        """
+        store_backend = self.store_backends["site_manifest"]
+        if not store_backend.has_key(()):
+            return {}
+        try:
+            site_manifest = json.loads(store_backend.get(()))
+        except ValueError:
+            logger.warning(
+                "The Data Docs site manifest could not be read; the site will be built again in full."
+            )
+            return {}
+        return site_manifest if isinstance(site_manifest, dict) else {}
+
+    def write_site_manifest(self, site_manifest: dict):
+        return self.store_backends["site_manifest"].set(
+            (),
+            json.dumps(site_manifest, indent=2, sort_keys=True),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self):
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -100,11 +100,15 @@ class EvaluationParameterStore(MetricStore):
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
     def get_bind_params(self, run_id):
-        params = {}
-        for k in self._store_backend.list_keys(run_id.to_tuple()):
-            key = self.tuple_to_key(k)
-            params[key.to_evaluation_parameter_urn()] = self.get(key)
-        return params
+        keys = [
+            self.tuple_to_key(k)
+            for k in self._store_backend.iter_keys(prefix=run_id.to_tuple())
+        ]
+        # The values are retrieved with a single bulk request rather than one request for each metric.
+        values = self.get_many(keys)
+        return {
+            key.to_evaluation_parameter_urn(): value for key, value in zip(keys, values)
+        }
 
     @property
     def config(self) -> dict:
@@ -3,6 +3,9 @@ import logging
 from typing import Dict
 
 from great_expectations.core.data_context_key import DataContextKey
+from great_expectations.data_context.store.caching_store_backend import (
+    CachingStoreBackend,
+)
 from great_expectations.data_context.store.ge_cloud_store_backend import (
     GeCloudStoreBackend,
 )
@@ -145,6 +148,15 @@ class Store:
             # TODO [Robby] MER-285: Handle non-200 http errors
             if value:
                 value = self.ge_cloud_response_json_to_object_dict(response_json=value)
+        elif isinstance(self._store_backend, CachingStoreBackend):
+            # The deserialized value is cached along with the value, so that repeated reads are not parsed again.
+            self._validate_key(key)
+            return self._store_backend.get_deserialized(
+                self.key_to_tuple(key),
+                deserialize=lambda value: self.deserialize(key, value)
+                if value
+                else None,
+            )
         else:
             self._validate_key(key)
             value = self._store_backend.get(self.key_to_tuple(key))
@@ -163,6 +175,44 @@ class Store:
                 self.key_to_tuple(key), self.serialize(key, value), **kwargs
             )
 
+    def get_many(self, keys):
+        """Retrieve the values of keys, in the same order, using a single bulk request to the store backend."""
+        keys = list(keys)
+        if self.ge_cloud_mode or StoreBackend.STORE_BACKEND_ID_KEY in keys:
+            return [self.get(key) for key in keys]
+
+        for key in keys:
+            self._validate_key(key)
+        values = self._store_backend.get_many([self.key_to_tuple(key) for key in keys])
+        return [
+            self.deserialize(key, value) if value else None
+            for key, value in zip(keys, values)
+        ]
+
+    def set_many(self, key_value_pairs, **kwargs):
+        """Set the value of each key in key_value_pairs, using a single bulk request to the store backend."""
+        key_value_pairs = list(key_value_pairs)
+        for key, _ in key_value_pairs:
+            self._validate_key(key)
+        return self._store_backend.set_many(
+            [
+                (self.key_to_tuple(key), self.serialize(key, value))
+                for key, value in key_value_pairs
+            ],
+            **kwargs,
+        )
+
+    def has_many(self, keys):
+        """Return whether each of keys exists, in the same order."""
+        return self._store_backend.has_many(
+            [
+                key
+                if key == StoreBackend.STORE_BACKEND_ID_KEY
+                else self.key_to_tuple(key)
+                for key in keys
+            ]
+        )
+
     def list_keys(self):
         keys_without_store_backend_id = [
             key
@@ -1,7 +1,8 @@
+import concurrent.futures
 import logging
 import uuid
 from abc import ABCMeta, abstractmethod
-from typing import Optional
+from typing import Any, Callable, Hashable, Iterable, List, Optional, Tuple
 
 import pyparsing as pp
 
@@ -20,6 +21,10 @@ class StoreBackend(metaclass=ABCMeta):
       - _set
       - list_keys
       - _has_key
+
+    Implementations may also provide native bulk implementations of _get_many, _set_many and _has_many, which
+    otherwise call _get, _set and _has_key for each key, and _get_version, which lets cached values be validated
+    without reading them.
     """
 
     IGNORED_FILES = [".ipynb_checkpoints"]
@@ -140,6 +145,49 @@ class StoreBackend(metaclass=ABCMeta):
         self._validate_key(key)
         return self._has_key(key)
 
+    def get_many(self, keys: Iterable[tuple], **kwargs) -> list:
+        """
+        Retrieve the values of keys, in the same order; like get, raises an error if any of the keys does not exist.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._get_many(keys, **kwargs)
+
+    def set_many(self, key_value_pairs: Iterable[Tuple[tuple, Any]], **kwargs) -> list:
+        """
+        Set the value of each key in key_value_pairs, returning what set would return for each of them.
+        """
+        key_value_pairs = list(key_value_pairs)
+        for key, value in key_value_pairs:
+            self._validate_key(key)
+            self._validate_value(value)
+        try:
+            return self._set_many(key_value_pairs, **kwargs)
+        except ValueError as e:
+            logger.debug(str(e))
+            raise StoreBackendError(
+                "ValueError while calling _set_many on store backend."
+            )
+
+    def has_many(self, keys: Iterable[tuple]) -> List[bool]:
+        """
+        Return whether each of keys exists, in the same order.
+        """
+        keys = list(keys)
+        for key in keys:
+            self._validate_key(key)
+        return self._has_many(keys)
+
+    def get_version(self, key) -> Optional[Hashable]:
+        """
+        Return a token that changes whenever the value of key changes (e.g. the ETag of an object or the modification
+        time of a file), without reading the value; or None if the backend cannot tell.  Like get, raises an
+        InvalidKeyError if key does not exist.
+        """
+        self._validate_key(key)
+        return self._get_version(key)
+
     def get_url_for_key(self, key, protocol=None):
         raise StoreError(
             "Store backend of type {:s} does not have an implementation of get_url_for_key".format(
@@ -186,6 +234,13 @@ class StoreBackend(metaclass=ABCMeta):
     def list_keys(self, prefix=()):
         raise NotImplementedError
 
+    def iter_keys(self, prefix=()):
+        """
+        Iterate over the keys that start with prefix.  Backends that list their keys page by page override this to
+        yield the keys of each page as it is listed, instead of after all of the keys have been listed.
+        """
+        return iter(self.list_keys(prefix=prefix))
+
     @abstractmethod
     def remove_key(self, key):
         raise NotImplementedError
@@ -193,6 +248,34 @@ class StoreBackend(metaclass=ABCMeta):
     def _has_key(self, key):
         raise NotImplementedError
 
+    def _get_version(self, key) -> Optional[Hashable]:
+        return None
+
+    def _get_many(self, keys: List[tuple], **kwargs) -> list:
+        return [self._get(key, **kwargs) for key in keys]
+
+    def _set_many(self, key_value_pairs: List[Tuple[tuple, Any]], **kwargs) -> list:
+        return [self._set(key, value, **kwargs) for key, value in key_value_pairs]
+
+    def _has_many(self, keys: List[tuple]) -> List[bool]:
+        return [self._has_key(key) for key in keys]
+
+    @staticmethod
+    def _map_concurrently(
+        function: Callable, items: List[Any], max_workers: Optional[int] = None
+    ) -> list:
+        """
+        Apply function to each of items, in up to max_workers threads, returning the results in the order of items.
+        Backends whose requests spend most of their time waiting on the network use this for their bulk operations.
+        """
+        if max_workers is None or max_workers <= 1 or len(items) <= 1:
+            return [function(item) for item in items]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))
+        ) as executor:
+            return list(executor.map(function, items))
+
     def is_ignored_key(self, key):
         for ignored in self.IGNORED_FILES:
             if ignored in key:
@@ -22,6 +22,10 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     three components.
     """
 
+    # The number of concurrent requests that backends of remote object stores send for get_many and set_many, unless
+    # they are configured with max_request_workers.
+    DEFAULT_MAX_REQUEST_WORKERS = 16
+
     def __init__(
         self,
         filepath_template=None,
@@ -194,6 +198,63 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             new_key = tuple(filepath.split(os.sep))
         return new_key
 
+    def _convert_key_prefix_to_filepath_prefix(self, prefix):
+        """
+        Convert a key prefix to a string that the filepaths of all keys starting with that prefix start with, so that
+        only those filepaths need to be listed.  Some of the filepaths starting with the string may belong to keys that
+        do not start with the key prefix (e.g. the key prefix ("a",) is converted to "a", which "ab/c" starts with), so
+        listed keys still have to be checked against the key prefix.
+        """
+        if not prefix:
+            return ""
+        if prefix[0] == self.STORE_BACKEND_ID_KEY[0]:
+            return self._convert_key_to_filepath(self.STORE_BACKEND_ID_KEY)
+
+        if self.filepath_template:
+            # Fill in the template up to its first element that is not part of the prefix.
+            filepath_prefix = ""
+            position = 0
+            for match in re.finditer(r"{(\d+)}", self.filepath_template):
+                filepath_prefix += self.filepath_template[position : match.start()]
+                tuple_index = int(match.group(1))
+                if tuple_index >= len(prefix):
+                    break
+                filepath_prefix += prefix[tuple_index]
+                position = match.end()
+            else:
+                filepath_prefix += self.filepath_template[position:]
+        else:
+            filepath_prefix = "/".join(prefix)
+
+        if self.filepath_prefix:
+            filepath_prefix = self.filepath_prefix + "/" + filepath_prefix
+        if self.platform_specific_separator and filepath_prefix:
+            filepath_prefix = os.path.normpath(filepath_prefix)
+
+        return filepath_prefix
+
+    def list_keys(self, prefix=()):
+        return list(self.iter_keys(prefix=prefix))
+
+    def _has_key(self, key):
+        return key in self.iter_keys(prefix=key)
+
+    def _has_many(self, keys):
+        if len(keys) <= 1:
+            return [self._has_key(key) for key in keys]
+
+        # A single listing of the longest prefix that the keys share replaces a listing for each of the keys.
+        prefix = keys[0]
+        for key in keys[1:]:
+            common_length = 0
+            for prefix_element, key_element in zip(prefix, key):
+                if prefix_element != key_element:
+                    break
+                common_length += 1
+            prefix = prefix[:common_length]
+        existing_keys = set(self.iter_keys(prefix=prefix))
+        return [key in existing_keys for key in keys]
+
     def verify_that_key_to_filepath_operation_is_reversible(self):
         def get_random_hex(size=4):
             return "".join(
@@ -308,6 +369,19 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return contents
 
+    def _get_version(self, key):
+        filepath: str = os.path.join(
+            self.full_base_directory, self._convert_key_to_filepath(key)
+        )
+        try:
+            stat_result: os.stat_result = os.stat(filepath)
+        except FileNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleFilesystemStoreBackend with the following Key: {str(filepath)}"
+            )
+
+        return stat_result.st_mtime_ns, stat_result.st_size
+
     def _set(self, key, value, **kwargs):
         if not isinstance(key, tuple):
             key = key.to_tuple()
@@ -341,11 +415,19 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return False
 
-    def list_keys(self, prefix=()):
-        key_list = []
-        for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)
-        ):
+    def iter_keys(self, prefix=()):
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        # Only the directories that may hold filepaths starting with filepath_prefix are walked.
+        start_directory = os.path.join(
+            self.full_base_directory, os.path.dirname(filepath_prefix)
+        )
+        start_name_prefix = os.path.basename(filepath_prefix)
+        for root, dirs, files in os.walk(start_directory):
+            if root == start_directory and start_name_prefix:
+                dirs[:] = [dir_ for dir_ in dirs if dir_.startswith(start_name_prefix)]
+                files = [
+                    file_ for file_ in files if file_.startswith(start_name_prefix)
+                ]
             for file_ in files:
                 full_path, file_name = os.path.split(os.path.join(root, file_))
                 relative_path = os.path.relpath(
@@ -366,10 +448,12 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 ):
                     continue
                 key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
-
-        return key_list
+                if (
+                    key
+                    and not self.is_ignored_key(key)
+                    and key[: len(prefix)] == prefix
+                ):
+                    yield key
 
     def rrmdir(self, mroot, curpath):
         """
@@ -425,6 +509,10 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             os.path.join(self.full_base_directory, self._convert_key_to_filepath(key))
         )
 
+    def _has_many(self, keys):
+        # Checking for a file is cheaper than listing the directory that holds it.
+        return [self._has_key(key) for key in keys]
+
     @property
     def config(self) -> dict:
         return self._config
@@ -455,6 +543,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        max_request_workers=None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -481,6 +570,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
             boto3_options = {}
         self._boto3_options = boto3_options
         self.endpoint_url = endpoint_url
+        if max_request_workers is None:
+            max_request_workers = self.DEFAULT_MAX_REQUEST_WORKERS
+        self._max_request_workers = max_request_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -502,6 +594,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "max_request_workers": max_request_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -525,10 +618,32 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _get(self, key):
+        return self._get_with_client(s3=self._create_client(), key=key)
+
+    def _get_many(self, keys):
+        # boto3 clients are thread-safe, but creating them is not, so a single client serves all of the requests.
+        s3 = self._create_client()
+        return self._map_concurrently(
+            function=lambda key: self._get_with_client(s3=s3, key=key),
+            items=keys,
+            max_workers=self._max_request_workers,
+        )
+
+    def _get_version(self, key):
         s3_object_key = self._build_s3_object_key(key)
 
         s3 = self._create_client()
 
+        try:
+            return s3.head_object(Bucket=self.bucket, Key=s3_object_key)["ETag"]
+        except s3.exceptions.ClientError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleS3StoreBackend with the following Key: {str(s3_object_key)}"
+            )
+
+    def _get_with_client(self, s3, key):
+        s3_object_key = self._build_s3_object_key(key)
+
         try:
             s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
         except (s3.exceptions.NoSuchKey, s3.exceptions.NoSuchBucket):
@@ -545,21 +660,60 @@ class TupleS3StoreBackend(TupleStoreBackend):
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
-        s3_object_key = self._build_s3_object_key(key)
+        return self._set_with_client(
+            s3=self._create_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
 
-        s3 = self._create_resource()
+    def _set_many(
+        self,
+        key_value_pairs,
+        content_encoding="utf-8",
+        content_type="application/json",
+    ):
+        s3 = self._create_client()
+        return self._map_concurrently(
+            function=lambda key_value_pair: self._set_with_client(
+                s3=s3,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items=key_value_pairs,
+            max_workers=self._max_request_workers,
+        )
+
+    def _set_with_client(
+        self,
+        s3,
+        key,
+        value,
+        content_encoding="utf-8",
+        content_type="application/json",
+    ):
+        s3_object_key = self._build_s3_object_key(key)
 
         try:
-            result_s3 = s3.Object(self.bucket, s3_object_key)
             if isinstance(value, str):
-                result_s3.put(
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
                     Body=value.encode(content_encoding),
                     ContentEncoding=content_encoding,
                     ContentType=content_type,
                 )
             else:
-                result_s3.put(Body=value, ContentType=content_type)
-        except s3.meta.client.exceptions.ClientError as e:
+                s3.put_object(
+                    Bucket=self.bucket,
+                    Key=s3_object_key,
+                    Body=value,
+                    ContentType=content_type,
+                )
+        except s3.exceptions.ClientError as e:
             logger.debug(str(e))
             raise StoreBackendError("Unable to set object in s3.")
 
@@ -581,58 +735,66 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
-    def list_keys(self):
+    def iter_keys(self, prefix=()):
         s3 = self._create_client()
         paginator = s3.get_paginator("list_objects_v2")
 
-        if self.prefix:
-            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=self.prefix)
+        s3_prefix = self.prefix
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix:
+            s3_prefix = self._join_prefix(filepath_prefix)
+
+        if s3_prefix:
+            page_iterator = paginator.paginate(Bucket=self.bucket, Prefix=s3_prefix)
         else:
             page_iterator = paginator.paginate(Bucket=self.bucket)
 
-        objects = []
-
+        found_contents = False
         for page in page_iterator:
             current_page_contents = page.get("Contents")
-            # On first iteration check for "CommonPrefixes"
+            # Until the first contents are found, check for "CommonPrefixes"
             if (
                 current_page_contents is None
-                and objects == []
+                and not found_contents
                 and "CommonPrefixes" in page
             ):
                 logger.warning(
                     "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
                 )
-                objects = []
-                break
-            if current_page_contents is not None:
-                objects.extend(current_page_contents)
-
-        key_list = []
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
-            if self.platform_specific_separator:
-                s3_object_key = os.path.relpath(s3_object_key, self.prefix)
-            else:
-                if self.prefix is None:
-                    if s3_object_key.startswith("/"):
-                        s3_object_key = s3_object_key[1:]
-                else:
-                    if s3_object_key.startswith(self.prefix + "/"):
-                        s3_object_key = s3_object_key[len(self.prefix) + 1 :]
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
+                return
+            if current_page_contents is None:
                 continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+            found_contents = True
 
-        return key_list
+            for s3_object_info in current_page_contents:
+                s3_object_key = s3_object_info["Key"]
+                if self.platform_specific_separator:
+                    s3_object_key = os.path.relpath(s3_object_key, self.prefix)
+                else:
+                    if self.prefix is None:
+                        if s3_object_key.startswith("/"):
+                            s3_object_key = s3_object_key[1:]
+                    else:
+                        if s3_object_key.startswith(self.prefix + "/"):
+                            s3_object_key = s3_object_key[len(self.prefix) + 1 :]
+                if self.filepath_prefix and not s3_object_key.startswith(
+                    self.filepath_prefix
+                ):
+                    continue
+                elif self.filepath_suffix and not s3_object_key.endswith(
+                    self.filepath_suffix
+                ):
+                    continue
+                key = self._convert_filepath_to_key(s3_object_key)
+                if key and key[: len(prefix)] == prefix:
+                    yield key
+
+    def _join_prefix(self, filepath):
+        if not self.prefix:
+            return filepath
+        if self.platform_specific_separator:
+            return os.path.join(self.prefix, filepath)
+        return "/".join((self.prefix, filepath))
 
     def get_url_for_key(self, key, protocol=None):
         location = self._create_client().get_bucket_location(Bucket=self.bucket)[
@@ -697,10 +859,6 @@ class TupleS3StoreBackend(TupleStoreBackend):
         else:
             return False
 
-    def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
-
     @property
     def boto3_options(self):
         from botocore.client import Config
@@ -754,6 +912,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        max_request_workers=None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -771,6 +930,9 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        if max_request_workers is None:
+            max_request_workers = self.DEFAULT_MAX_REQUEST_WORKERS
+        self._max_request_workers = max_request_workers
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -792,6 +954,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "max_request_workers": max_request_workers,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -815,12 +978,36 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         return gcs_object_key
 
     def _get(self, key):
+        return self._get_from_bucket(bucket=self._get_bucket(), key=key)
+
+    def _get_many(self, keys):
+        bucket = self._get_bucket()
+        return self._map_concurrently(
+            function=lambda key: self._get_from_bucket(bucket=bucket, key=key),
+            items=keys,
+            max_workers=self._max_request_workers,
+        )
+
+    def _get_version(self, key):
         gcs_object_key = self._build_gcs_object_key(key)
 
+        # Only the metadata of the blob is retrieved.
+        blob = self._get_bucket().get_blob(gcs_object_key)
+        if not blob:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleGCSStoreBackend with the following Key: {str(key)}"
+            )
+        return blob.etag
+
+    def _get_bucket(self):
         from google.cloud import storage
 
         gcs = storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
+        return gcs.bucket(self.bucket)
+
+    def _get_from_bucket(self, bucket, key):
+        gcs_object_key = self._build_gcs_object_key(key)
+
         gcs_response_object = bucket.get_blob(gcs_object_key)
         if not gcs_response_object:
             raise InvalidKeyError(
@@ -832,12 +1019,43 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _set(
         self, key, value, content_encoding="utf-8", content_type="application/json"
     ):
-        gcs_object_key = self._build_gcs_object_key(key)
+        return self._set_in_bucket(
+            bucket=self._get_bucket(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+            content_type=content_type,
+        )
 
-        from google.cloud import storage
+    def _set_many(
+        self,
+        key_value_pairs,
+        content_encoding="utf-8",
+        content_type="application/json",
+    ):
+        bucket = self._get_bucket()
+        return self._map_concurrently(
+            function=lambda key_value_pair: self._set_in_bucket(
+                bucket=bucket,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+                content_type=content_type,
+            ),
+            items=key_value_pairs,
+            max_workers=self._max_request_workers,
+        )
+
+    def _set_in_bucket(
+        self,
+        bucket,
+        key,
+        value,
+        content_encoding="utf-8",
+        content_type="application/json",
+    ):
+        gcs_object_key = self._build_gcs_object_key(key)
 
-        gcs = storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
         blob = bucket.blob(gcs_object_key)
 
         if isinstance(value, str):
@@ -865,14 +1083,18 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         _ = bucket.rename_blob(blob, dest_filepath)
 
-    def list_keys(self):
-        key_list = []
-
+    def iter_keys(self, prefix=()):
         from google.cloud import storage
 
         gcs = storage.Client(self.project)
 
-        for blob in gcs.list_blobs(self.bucket, prefix=self.prefix):
+        gcs_prefix = self.prefix
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix:
+            gcs_prefix = self._join_prefix(filepath_prefix)
+
+        # The blobs are listed page by page, as they are iterated over.
+        for blob in gcs.list_blobs(self.bucket, prefix=gcs_prefix):
             gcs_object_name = blob.name
             gcs_object_key = os.path.relpath(
                 gcs_object_name,
@@ -887,9 +1109,15 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
-            if key:
-                key_list.append(key)
-        return key_list
+            if key and key[: len(prefix)] == prefix:
+                yield key
+
+    def _join_prefix(self, filepath):
+        if not self.prefix:
+            return filepath
+        if self.platform_specific_separator:
+            return os.path.join(self.prefix, filepath)
+        return "/".join((self.prefix, filepath))
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
@@ -940,10 +1168,6 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             return False
         return True
 
-    def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
-
 
 class TupleAzureBlobStoreBackend(TupleStoreBackend):
     """
@@ -972,6 +1196,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        max_request_workers=None,
     ):
         super().__init__(
             filepath_template=filepath_template,
@@ -987,6 +1212,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         self.connection_string = connection_string
         self.prefix = prefix
         self.container = container
+        if max_request_workers is None:
+            max_request_workers = self.DEFAULT_MAX_REQUEST_WORKERS
+        self._max_request_workers = max_request_workers
 
     def _get_container_client(self):
 
@@ -1002,15 +1230,64 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             )
 
     def _get(self, key):
-        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
-        return (
-            self._get_container_client()
-            .download_blob(az_blob_key)
-            .readall()
-            .decode("utf-8")
+        return self._get_with_container_client(
+            container_client=self._get_container_client(), key=key
+        )
+
+    def _get_many(self, keys):
+        container_client = self._get_container_client()
+        return self._map_concurrently(
+            function=lambda key: self._get_with_container_client(
+                container_client=container_client, key=key
+            ),
+            items=keys,
+            max_workers=self._max_request_workers,
         )
 
+    def _get_version(self, key):
+        from azure.core.exceptions import ResourceNotFoundError
+
+        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
+        try:
+            return (
+                self._get_container_client()
+                .get_blob_client(az_blob_key)
+                .get_blob_properties()
+                .etag
+            )
+        except ResourceNotFoundError:
+            raise InvalidKeyError(
+                f"Unable to retrieve object from TupleAzureBlobStoreBackend with the following Key: {str(az_blob_key)}"
+            )
+
+    def _get_with_container_client(self, container_client, key):
+        az_blob_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
+        return container_client.download_blob(az_blob_key).readall().decode("utf-8")
+
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
+        return self._set_with_container_client(
+            container_client=self._get_container_client(),
+            key=key,
+            value=value,
+            content_encoding=content_encoding,
+        )
+
+    def _set_many(self, key_value_pairs, content_encoding="utf-8", **kwargs):
+        container_client = self._get_container_client()
+        return self._map_concurrently(
+            function=lambda key_value_pair: self._set_with_container_client(
+                container_client=container_client,
+                key=key_value_pair[0],
+                value=key_value_pair[1],
+                content_encoding=content_encoding,
+            ),
+            items=key_value_pairs,
+            max_workers=self._max_request_workers,
+        )
+
+    def _set_with_container_client(
+        self, container_client, key, value, content_encoding="utf-8"
+    ):
 
         from azure.storage.blob import ContentSettings
 
@@ -1019,7 +1296,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         if isinstance(value, str):
             if az_blob_key.endswith(".html"):
                 my_content_settings = ContentSettings(content_type="text/html")
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
@@ -1027,24 +1304,24 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
                     content_settings=my_content_settings,
                 )
             else:
-                self._get_container_client().upload_blob(
+                container_client.upload_blob(
                     name=az_blob_key,
                     data=value,
                     encoding=content_encoding,
                     overwrite=True,
                 )
         else:
-            self._get_container_client().upload_blob(
-                name=az_blob_key, data=value, overwrite=True
-            )
+            container_client.upload_blob(name=az_blob_key, data=value, overwrite=True)
         return az_blob_key
 
-    def list_keys(self):
-        key_list = []
+    def iter_keys(self, prefix=()):
+        az_prefix = self.prefix
+        filepath_prefix = self._convert_key_prefix_to_filepath_prefix(prefix)
+        if filepath_prefix:
+            az_prefix = os.path.join(self.prefix, filepath_prefix)
 
-        for obj in self._get_container_client().list_blobs(
-            name_starts_with=self.prefix
-        ):
+        # The blobs are listed page by page, as they are iterated over.
+        for obj in self._get_container_client().list_blobs(name_starts_with=az_prefix):
             az_blob_key = os.path.relpath(obj.name)
             if az_blob_key.startswith(self.prefix + "/"):
                 az_blob_key = az_blob_key[len(self.prefix) + 1 :]
@@ -1057,9 +1334,9 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             ):
                 continue
             key = self._convert_filepath_to_key(az_blob_key)
-
-            key_list.append(key)
-        return key_list
+            if prefix and (key is None or key[: len(prefix)] != prefix):
+                continue
+            yield key
 
     def get_url_for_key(self, key, protocol=None):
         az_blob_key = self._convert_key_to_filepath(key)
@@ -1070,10 +1347,6 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             az_blob_path,
         )
 
-    def _has_key(self, key):
-        all_keys = self.list_keys()
-        return key in all_keys
-
     def _move(self, source_key, dest_key, **kwargs):
         source_blob_path = self._convert_key_to_filepath(source_key)
         if not source_blob_path.startswith(self.prefix):
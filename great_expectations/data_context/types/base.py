@@ -421,6 +421,11 @@ class DataConnectorConfigSchema(Schema):
     # Both S3/Azure
     delimiter = fields.String(required=False, allow_none=True)
 
+    # S3/GCS/Azure
+    max_listing_workers = fields.Integer(required=False, allow_none=True)
+    listing_checkpoint_filepath = fields.String(required=False, allow_none=True)
+    listing_checkpoint_max_age_seconds = fields.Float(required=False, allow_none=True)
+
     data_asset_name_prefix = fields.String(required=False, allow_none=True)
     data_asset_name_suffix = fields.String(required=False, allow_none=True)
     include_schema_name = fields.Boolean(required=False, allow_none=True)
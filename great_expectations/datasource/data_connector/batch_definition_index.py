@@ -0,0 +1,244 @@
+import logging
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from great_expectations.core.batch import BatchDefinition, BatchRequestBase
+from great_expectations.datasource.data_connector.sorter import Sorter
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BatchDefinitionIndex:
+    """
+    An index of the BatchDefinitions cached by a FilePathDataConnector, which answers batch requests without scanning
+    and sorting all of the BatchDefinitions of the DataConnector.
+
+    The BatchDefinitions are indexed by data_asset_name and by the values of their batch_identifiers.  The
+    BatchDefinitions of each data asset are kept sorted by the configured sorters, and the sort keys of each
+    BatchDefinition are computed only once.
+
+    The index is updated incrementally: BatchDefinitions that were indexed by an earlier update are identified by
+    object identity (a DataConnector reuses the BatchDefinitions of data_references that it has mapped before), so
+    only the BatchDefinitions that were added or removed are (re)indexed.
+    """
+
+    def __init__(self, sorters: Optional[Dict[str, Sorter]] = None):
+        if sorters is None:
+            sorters = {}
+        self._sorters = list(sorters.values())
+
+        # BatchDefinitions are keyed by their id() and kept in the order in which they were last given to update().
+        self._batch_definitions: Dict[int, BatchDefinition] = {}
+        self._keys_by_data_asset_name: Dict[str, List[int]] = {}
+        self._keys_by_batch_identifier: Dict[Tuple[str, Hashable], Set[int]] = {}
+        self._positions: Dict[int, int] = {}
+        self._sort_keys: Dict[int, Tuple] = {}
+        self._sorted_keys_by_data_asset_name: Dict[Optional[str], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._batch_definitions)
+
+    def update(self, batch_definition_list: List[BatchDefinition]):
+        """
+        Makes the index hold exactly the given BatchDefinitions, in the given order.
+
+        Args:
+            batch_definition_list (list): all of the BatchDefinitions known to the DataConnector
+        """
+        batch_definitions: Dict[int, BatchDefinition] = {
+            id(batch_definition): batch_definition
+            for batch_definition in batch_definition_list
+        }
+        if list(batch_definitions.keys()) == list(self._batch_definitions.keys()):
+            return
+
+        removed_keys: Set[int] = (
+            self._batch_definitions.keys() - batch_definitions.keys()
+        )
+        added_keys: Set[int] = batch_definitions.keys() - self._batch_definitions.keys()
+        logger.debug(
+            f"Updating BatchDefinitionIndex: {len(added_keys)} BatchDefinitions added, {len(removed_keys)} removed."
+        )
+
+        for key in removed_keys:
+            for index_key in self._get_index_keys(self._batch_definitions[key]):
+                keys: Set[int] = self._keys_by_batch_identifier[index_key]
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_batch_identifier[index_key]
+            self._sort_keys.pop(key, None)
+
+        for key in added_keys:
+            for index_key in self._get_index_keys(batch_definitions[key]):
+                self._keys_by_batch_identifier.setdefault(index_key, set()).add(key)
+
+        self._batch_definitions = batch_definitions
+        self._positions = {
+            key: position for position, key in enumerate(batch_definitions)
+        }
+
+        keys_by_data_asset_name: Dict[str, List[int]] = {}
+        for key, batch_definition in batch_definitions.items():
+            keys_by_data_asset_name.setdefault(
+                batch_definition.data_asset_name, []
+            ).append(key)
+
+        # Only the sort orders of the data assets whose BatchDefinitions (or their order) changed are recomputed.
+        self._sorted_keys_by_data_asset_name.pop(None, None)
+        for data_asset_name in (
+            self._keys_by_data_asset_name.keys() | keys_by_data_asset_name.keys()
+        ):
+            if self._keys_by_data_asset_name.get(
+                data_asset_name
+            ) != keys_by_data_asset_name.get(data_asset_name):
+                self._sorted_keys_by_data_asset_name.pop(data_asset_name, None)
+        self._keys_by_data_asset_name = keys_by_data_asset_name
+
+    def get_batch_definition_list(
+        self, batch_request: BatchRequestBase
+    ) -> List[BatchDefinition]:
+        """
+        Retrieve the BatchDefinitions that match the data_asset_name, the batch_identifiers and the
+        batch_filter_parameters of batch_request, sorted by the configured sorters.
+
+        Args:
+            batch_request (BatchRequestBase): BatchRequestBase to match
+
+        Returns:
+            A list of BatchDefinition objects that match batch_request
+        """
+        data_asset_name: Optional[str] = batch_request.data_asset_name or None
+
+        batch_identifiers: Optional[dict] = self._get_batch_identifiers_to_match(
+            batch_request=batch_request
+        )
+        if batch_identifiers is None:
+            # The batch request cannot be answered from the index (e.g. it has unhashable batch identifier values).
+            return [
+                batch_definition
+                for batch_definition in self._get_sorted_batch_definitions(
+                    data_asset_name=data_asset_name
+                )
+                if batch_definition_matches_batch_request(
+                    batch_definition=batch_definition, batch_request=batch_request
+                )
+            ]
+
+        if not batch_identifiers:
+            return self._get_sorted_batch_definitions(data_asset_name=data_asset_name)
+
+        matching_keys: Optional[Set[int]] = None
+        for index_key in sorted(
+            batch_identifiers.items(),
+            key=lambda item: len(self._keys_by_batch_identifier.get(item, ())),
+        ):
+            keys: Set[int] = self._keys_by_batch_identifier.get(index_key, set())
+            matching_keys = keys if matching_keys is None else matching_keys & keys
+            if not matching_keys:
+                return []
+
+        if data_asset_name is not None:
+            matching_keys = {
+                key
+                for key in matching_keys
+                if self._batch_definitions[key].data_asset_name == data_asset_name
+            }
+
+        # Sorting the matches by position first makes ties between them come out in the same order as they would in
+        # the sorted list of all of the BatchDefinitions.
+        return [
+            self._batch_definitions[key]
+            for key in self._sort_keys_by_sorters(
+                keys=sorted(matching_keys, key=self._positions.__getitem__)
+            )
+        ]
+
+    def _get_sorted_batch_definitions(
+        self, data_asset_name: Optional[str] = None
+    ) -> List[BatchDefinition]:
+        sorted_keys: Optional[List[int]] = self._sorted_keys_by_data_asset_name.get(
+            data_asset_name
+        )
+        if sorted_keys is None:
+            if data_asset_name is None:
+                keys = list(self._batch_definitions.keys())
+            else:
+                keys = self._keys_by_data_asset_name.get(data_asset_name, [])
+            sorted_keys = self._sort_keys_by_sorters(keys=keys)
+            self._sorted_keys_by_data_asset_name[data_asset_name] = sorted_keys
+
+        return [self._batch_definitions[key] for key in sorted_keys]
+
+    def _sort_keys_by_sorters(self, keys: Iterable[int]) -> List[int]:
+        keys = list(keys)
+        if not self._sorters:
+            return keys
+
+        sort_keys: List[Tuple] = [self._get_sort_key(key=key) for key in keys]
+        indices: List[int] = list(range(len(keys)))
+        for sorter_index in reversed(range(len(self._sorters))):
+            indices.sort(
+                key=lambda index: sort_keys[index][sorter_index],
+                reverse=self._sorters[sorter_index].reverse,
+            )
+        return [keys[index] for index in indices]
+
+    def _get_sort_key(self, key: int) -> Tuple:
+        sort_key: Optional[Tuple] = self._sort_keys.get(key)
+        if sort_key is None:
+            batch_definition: BatchDefinition = self._batch_definitions[key]
+            sort_key = tuple(
+                sorter._verify_sorting_directives_and_get_partition_key(
+                    batch_definition=batch_definition
+                )
+                for sorter in self._sorters
+            )
+            self._sort_keys[key] = sort_key
+        return sort_key
+
+    @staticmethod
+    def _get_index_keys(
+        batch_definition: BatchDefinition,
+    ) -> List[Tuple[str, Hashable]]:
+        index_keys: List[Tuple[str, Hashable]] = []
+        for name, value in (batch_definition.batch_identifiers or {}).items():
+            try:
+                hash(value)
+            except TypeError:
+                continue
+            index_keys.append((name, value))
+        return index_keys
+
+    @staticmethod
+    def _get_batch_identifiers_to_match(
+        batch_request: BatchRequestBase,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Combine the batch_filter_parameters and the batch_identifiers of batch_request, or return None if they cannot
+        be matched using the index.
+        """
+        identifier_dicts: List[Any] = []
+        if batch_request.data_connector_query:
+            batch_filter_parameters: Any = batch_request.data_connector_query.get(
+                "batch_filter_parameters"
+            )
+            if batch_filter_parameters:
+                identifier_dicts.append(batch_filter_parameters)
+        if batch_request.batch_identifiers:
+            identifier_dicts.append(batch_request.batch_identifiers)
+
+        batch_identifiers: Dict[str, Any] = {}
+        for identifier_dict in identifier_dicts:
+            if not isinstance(identifier_dict, dict):
+                return None
+            for name, value in identifier_dict.items():
+                try:
+                    hash(value)
+                except TypeError:
+                    return None
+                if name in batch_identifiers and batch_identifiers[name] != value:
+                    return None
+                batch_identifiers[name] = value
+        return batch_identifiers
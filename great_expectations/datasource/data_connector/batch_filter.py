@@ -181,20 +181,24 @@ class BatchFilter:
     ) -> List[BatchDefinition]:
         if batch_definition_list is None:
             return []
-        filter_function: Callable
-        if self.custom_filter_function:
-            filter_function = self.custom_filter_function
-        else:
-            filter_function = self.best_effort_batch_definition_matcher()
         selected_batch_definitions: List[BatchDefinition]
-        selected_batch_definitions = list(
-            filter(
-                lambda batch_definition: filter_function(
-                    batch_identifiers=batch_definition.batch_identifiers,
-                ),
-                batch_definition_list,
+        if self.custom_filter_function is None and not self.batch_filter_parameters:
+            # Every batch_definition matches, so only index and limit have to be applied.
+            selected_batch_definitions = batch_definition_list
+        else:
+            filter_function: Callable
+            if self.custom_filter_function:
+                filter_function = self.custom_filter_function
+            else:
+                filter_function = self.best_effort_batch_definition_matcher()
+            selected_batch_definitions = list(
+                filter(
+                    lambda batch_definition: filter_function(
+                        batch_identifiers=batch_definition.batch_identifiers,
+                    ),
+                    batch_definition_list,
+                )
             )
-        )
         if self.index is None:
             selected_batch_definitions = selected_batch_definitions[: self.limit]
         else:
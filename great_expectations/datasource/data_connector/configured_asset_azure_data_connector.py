@@ -15,7 +15,10 @@ from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
-from great_expectations.datasource.data_connector.util import list_azure_keys
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_azure_keys,
+)
 from great_expectations.execution_engine import (
     ExecutionEngine,
     PandasExecutionEngine,
@@ -59,6 +62,8 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
         delimiter: str = "/",
         azure_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_checkpoint_filepath: Optional[str] = None,
+        listing_checkpoint_max_age_seconds: Optional[float] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to Azure.
@@ -75,6 +80,9 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             delimiter (str): Azure delimiter
             azure_options (dict): wrapper object for **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_checkpoint_filepath (str): optional path of a file recording listed prefixes, which are not
+                listed again (see KeyListingCheckpoint)
+            listing_checkpoint_max_age_seconds (float): optional age after which recorded prefixes are listed again
         """
         logger.debug(f'Constructing ConfiguredAssetAzureDataConnector "{name}".')
 
@@ -87,6 +95,12 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
         )
+
+        if listing_checkpoint_filepath is not None:
+            self._listing_checkpoint = KeyListingCheckpoint(
+                filepath=listing_checkpoint_filepath,
+                max_age_seconds=listing_checkpoint_max_age_seconds,
+            )
         self._container = container
         self._name_starts_with = os.path.join(name_starts_with, "")
         self._delimiter = delimiter
@@ -153,6 +167,7 @@ class ConfiguredAssetAzureDataConnector(ConfiguredAssetFilePathDataConnector):
             azure=self._azure,
             query_options=query_options,
             recursive=False,
+            checkpoint=self._listing_checkpoint,
         )
         return path_list
 
@@ -112,25 +112,33 @@ class ConfiguredAssetFilePathDataConnector(FilePathDataConnector):
         return list(self.assets.keys())
 
     def _refresh_data_references_cache(self):
-
-        # Map data_references to batch_definitions
+        # Map data_references to batch_definitions.  The data_references that were mapped by the previous refresh are
+        # not mapped again; their batch_definitions are reused, so that only the changes have to be indexed.
+        previous_data_references_cache: dict = self._data_references_cache
         self._data_references_cache = {}
 
         for data_asset_name in self.get_available_data_asset_names():
-            self._data_references_cache[data_asset_name] = {}
-
-            for data_reference in self._get_data_reference_list(
+            previous_data_reference_sub_cache: dict = (
+                previous_data_references_cache.get(data_asset_name) or {}
+            )
+            data_reference_list: List[str] = self._get_data_reference_list(
                 data_asset_name=data_asset_name
-            ):
-                mapped_batch_definition_list: List[
-                    BatchDefinition
-                ] = self._map_data_reference_to_batch_definition_list(
-                    data_reference=data_reference,
-                    data_asset_name=data_asset_name,
-                )
-                self._data_references_cache[data_asset_name][
+            )
+            mapped_batch_definition_lists: Dict[
+                str, Optional[List[BatchDefinition]]
+            ] = self._map_data_references_to_batch_definition_lists(
+                data_references=[
                     data_reference
-                ] = mapped_batch_definition_list
+                    for data_reference in data_reference_list
+                    if data_reference not in previous_data_reference_sub_cache
+                ],
+                data_asset_name=data_asset_name,
+            )
+            mapped_batch_definition_lists.update(previous_data_reference_sub_cache)
+            self._data_references_cache[data_asset_name] = {
+                data_reference: mapped_batch_definition_lists[data_reference]
+                for data_reference in data_reference_list
+            }
 
     def _get_data_reference_list(
         self, data_asset_name: Optional[str] = None
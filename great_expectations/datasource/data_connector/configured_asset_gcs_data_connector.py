@@ -8,7 +8,10 @@ from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
-from great_expectations.datasource.data_connector.util import list_gcs_keys
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_gcs_keys,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -65,6 +68,8 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_checkpoint_filepath: Optional[str] = None,
+        listing_checkpoint_max_age_seconds: Optional[float] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to GCS.
@@ -82,6 +87,9 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_checkpoint_filepath (str): optional path of a file recording listed prefixes, which are not
+                listed again (see KeyListingCheckpoint)
+            listing_checkpoint_max_age_seconds (float): optional age after which recorded prefixes are listed again
         """
         logger.debug(f'Constructing ConfiguredAssetGCSDataConnector "{name}".')
 
@@ -94,6 +102,12 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
         )
+
+        if listing_checkpoint_filepath is not None:
+            self._listing_checkpoint = KeyListingCheckpoint(
+                filepath=listing_checkpoint_filepath,
+                max_age_seconds=listing_checkpoint_max_age_seconds,
+            )
         self._bucket_or_name = bucket_or_name
         self._prefix = prefix
         self._delimiter = delimiter
@@ -159,6 +173,7 @@ class ConfiguredAssetGCSDataConnector(ConfiguredAssetFilePathDataConnector):
                 gcs=self._gcs,
                 query_options=query_options,
                 recursive=False,
+                checkpoint=self._listing_checkpoint,
             )
         ]
         return path_list
@@ -13,7 +13,10 @@ from great_expectations.datasource.data_connector import (
     ConfiguredAssetFilePathDataConnector,
 )
 from great_expectations.datasource.data_connector.asset import Asset
-from great_expectations.datasource.data_connector.util import list_s3_keys
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_s3_keys,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -49,6 +52,8 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        listing_checkpoint_filepath: Optional[str] = None,
+        listing_checkpoint_max_age_seconds: Optional[float] = None,
     ):
         """
         ConfiguredAssetDataConnector for connecting to S3.
@@ -66,6 +71,9 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            listing_checkpoint_filepath (str): optional path of a file recording listed prefixes, which are not
+                listed again (see KeyListingCheckpoint)
+            listing_checkpoint_max_age_seconds (float): optional age after which recorded prefixes are listed again
         """
         logger.debug(f'Constructing ConfiguredAssetS3DataConnector "{name}".')
 
@@ -78,6 +86,12 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
             sorters=sorters,
             batch_spec_passthrough=batch_spec_passthrough,
         )
+
+        if listing_checkpoint_filepath is not None:
+            self._listing_checkpoint = KeyListingCheckpoint(
+                filepath=listing_checkpoint_filepath,
+                max_age_seconds=listing_checkpoint_max_age_seconds,
+            )
         self._bucket = bucket
         self._prefix = os.path.join(prefix, "")
         self._delimiter = delimiter
@@ -132,6 +146,7 @@ class ConfiguredAssetS3DataConnector(ConfiguredAssetFilePathDataConnector):
                 query_options=query_options,
                 iterator_dict={},
                 recursive=False,
+                checkpoint=self._listing_checkpoint,
             )
         ]
         return path_list
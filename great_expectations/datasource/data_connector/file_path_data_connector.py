@@ -1,5 +1,5 @@
 import logging
-from typing import Iterator, List, Optional, cast
+from typing import Dict, Iterator, List, Optional, cast
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations.core.batch import (
@@ -9,6 +9,9 @@ from great_expectations.core.batch import (
     BatchSpec,
 )
 from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
 from great_expectations.datasource.data_connector.batch_filter import (
     BatchFilter,
     build_batch_filter,
@@ -16,10 +19,9 @@ from great_expectations.datasource.data_connector.batch_filter import (
 from great_expectations.datasource.data_connector.data_connector import DataConnector
 from great_expectations.datasource.data_connector.sorter import Sorter
 from great_expectations.datasource.data_connector.util import (
-    batch_definition_matches_batch_request,
+    DataReferenceMatcher,
+    KeyListingCheckpoint,
     build_sorters_from_config,
-    map_batch_definition_to_data_reference_string_using_regex,
-    map_data_reference_string_to_batch_definition_list_using_regex,
 )
 from great_expectations.execution_engine import ExecutionEngine
 
@@ -70,22 +72,40 @@ class FilePathDataConnector(DataConnector):
             default_regex = {}
         self._default_regex = default_regex
 
+        # The regex config of each data asset is compiled into a DataReferenceMatcher the first time it is needed.
+        self._data_reference_matchers: Dict[Optional[str], DataReferenceMatcher] = {}
+
         self._sorters = build_sorters_from_config(config_list=sorters)
         self._validate_sorters_configuration()
 
+        # The index is brought up to date with _data_references_cache whenever the cache has been refreshed.
+        self._batch_definition_index = BatchDefinitionIndex(sorters=self._sorters)
+        self._indexed_data_references_cache: Optional[dict] = None
+
+        # Set by the DataConnectors that list keys of cloud storage, when a listing checkpoint is configured.
+        self._listing_checkpoint: Optional[KeyListingCheckpoint] = None
+
     @property
     def sorters(self) -> Optional[dict]:
         return self._sorters
 
+    def invalidate_listing_checkpoint(self, prefix: Optional[str] = None):
+        """
+        Forget the prefixes recorded by the listing checkpoint (all of them, or prefix and its sub-prefixes), so that
+        the next refresh of the data references cache lists them again and picks up keys added since.
+        """
+        if self._listing_checkpoint is not None:
+            self._listing_checkpoint.invalidate(prefix=prefix)
+
     def _get_data_reference_list_from_cache_by_data_asset_name(
         self, data_asset_name: str
     ) -> List[str]:
         """
         Fetch data_references corresponding to data_asset_name from the cache.
         """
-        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
-        pattern: str = regex_config["pattern"]
-        group_names: List[str] = regex_config["group_names"]
+        data_reference_matcher: DataReferenceMatcher = self._get_data_reference_matcher(
+            data_asset_name=data_asset_name
+        )
 
         batch_definition_list = self._get_batch_definition_list_from_batch_request(
             batch_request=BatchRequestBase(
@@ -95,16 +115,10 @@ class FilePathDataConnector(DataConnector):
             )
         )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
-
         path_list: List[str] = [
-            map_batch_definition_to_data_reference_string_using_regex(
-                batch_definition=batch_definition,
-                regex_pattern=pattern,
-                group_names=group_names,
+            data_reference_matcher.get_data_reference(
+                batch_identifiers=batch_definition.batch_identifiers,
+                data_asset_name=batch_definition.data_asset_name,
             )
             for batch_definition in batch_definition_list
         ]
@@ -156,20 +170,12 @@ class FilePathDataConnector(DataConnector):
         if len(self._data_references_cache) == 0:
             self._refresh_data_references_cache()
 
-        batch_definition_list: List[BatchDefinition] = list(
-            filter(
-                lambda batch_definition: batch_definition_matches_batch_request(
-                    batch_definition=batch_definition, batch_request=batch_request
-                ),
-                self._get_batch_definition_list_from_cache(),
-            )
+        batch_definition_list: List[
+            BatchDefinition
+        ] = self._get_batch_definition_index().get_batch_definition_list(
+            batch_request=batch_request
         )
 
-        if len(self.sorters) > 0:
-            batch_definition_list = self._sort_batch_definition_list(
-                batch_definition_list=batch_definition_list
-            )
-
         if batch_request.data_connector_query is not None:
             batch_filter_obj: BatchFilter = build_batch_filter(
                 data_connector_query_dict=batch_request.data_connector_query
@@ -180,6 +186,18 @@ class FilePathDataConnector(DataConnector):
 
         return batch_definition_list
 
+    def _get_batch_definition_index(self) -> BatchDefinitionIndex:
+        """
+        Return the index of the batch_definitions in the cache, updating it if the cache has been refreshed since the
+        index was last updated.
+        """
+        if self._indexed_data_references_cache is not self._data_references_cache:
+            self._batch_definition_index.update(
+                batch_definition_list=self._get_batch_definition_list_from_cache()
+            )
+            self._indexed_data_references_cache = self._data_references_cache
+        return self._batch_definition_index
+
     def _sort_batch_definition_list(
         self, batch_definition_list: List[BatchDefinition]
     ) -> List[BatchDefinition]:
@@ -203,31 +221,57 @@ class FilePathDataConnector(DataConnector):
     def _map_data_reference_to_batch_definition_list(
         self, data_reference: str, data_asset_name: str = None
     ) -> Optional[List[BatchDefinition]]:
-        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
-        pattern: str = regex_config["pattern"]
-        group_names: List[str] = regex_config["group_names"]
-        return map_data_reference_string_to_batch_definition_list_using_regex(
+        return self._get_data_reference_matcher(
+            data_asset_name=data_asset_name
+        ).get_batch_definition_list(
             datasource_name=self.datasource_name,
             data_connector_name=self.name,
-            data_asset_name=data_asset_name,
             data_reference=data_reference,
-            regex_pattern=pattern,
-            group_names=group_names,
+            data_asset_name=data_asset_name,
+        )
+
+    def _map_data_references_to_batch_definition_lists(
+        self, data_references: List[str], data_asset_name: Optional[str] = None
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        """
+        Map data_references in bulk, which is much faster than mapping each of them with
+        _map_data_reference_to_batch_definition_list when refreshing the cache of a large data store.
+        """
+        return self._get_data_reference_matcher(
+            data_asset_name=data_asset_name
+        ).get_batch_definition_lists(
+            datasource_name=self.datasource_name,
+            data_connector_name=self.name,
+            data_references=data_references,
+            data_asset_name=data_asset_name,
         )
 
     def _map_batch_definition_to_data_reference(
         self, batch_definition: BatchDefinition
     ) -> str:
         data_asset_name: str = batch_definition.data_asset_name
-        regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
-        pattern: str = regex_config["pattern"]
-        group_names: List[str] = regex_config["group_names"]
-        return map_batch_definition_to_data_reference_string_using_regex(
-            batch_definition=batch_definition,
-            regex_pattern=pattern,
-            group_names=group_names,
+        return self._get_data_reference_matcher(
+            data_asset_name=data_asset_name
+        ).get_data_reference(
+            batch_identifiers=batch_definition.batch_identifiers,
+            data_asset_name=data_asset_name,
         )
 
+    def _get_data_reference_matcher(
+        self, data_asset_name: Optional[str] = None
+    ) -> DataReferenceMatcher:
+        data_reference_matcher: Optional[
+            DataReferenceMatcher
+        ] = self._data_reference_matchers.get(data_asset_name)
+        if data_reference_matcher is None:
+            regex_config: dict = self._get_regex_config(data_asset_name=data_asset_name)
+            data_reference_matcher = DataReferenceMatcher(
+                regex_pattern=regex_config["pattern"],
+                group_names=regex_config["group_names"],
+            )
+            self._data_reference_matchers[data_asset_name] = data_reference_matcher
+        return data_reference_matcher
+
     def build_batch_spec(self, batch_definition: BatchDefinition) -> PathBatchSpec:
         """
         Build BatchSpec from batch_definition by calling DataConnector's build_batch_spec function.
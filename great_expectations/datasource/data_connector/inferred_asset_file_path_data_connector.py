@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from great_expectations.core.batch import BatchDefinition, BatchRequestBase
 from great_expectations.core.batch_spec import BatchSpec, PathBatchSpec
@@ -58,16 +58,27 @@ class InferredAssetFilePathDataConnector(FilePathDataConnector):
 
     def _refresh_data_references_cache(self):
         """refreshes data_reference cache"""
-        # Map data_references to batch_definitions
+        # Map data_references to batch_definitions.  The data_references that were mapped by the previous refresh are
+        # not mapped again; their batch_definitions are reused, so that only the changes have to be indexed.
+        previous_data_references_cache: dict = self._data_references_cache
         self._data_references_cache = {}
 
-        for data_reference in self._get_data_reference_list():
-            mapped_batch_definition_list: List[
-                BatchDefinition
-            ] = self._map_data_reference_to_batch_definition_list(
-                data_reference=data_reference, data_asset_name=None
-            )
-            self._data_references_cache[data_reference] = mapped_batch_definition_list
+        data_reference_list: List[str] = self._get_data_reference_list()
+        mapped_batch_definition_lists: Dict[
+            str, Optional[List[BatchDefinition]]
+        ] = self._map_data_references_to_batch_definition_lists(
+            data_references=[
+                data_reference
+                for data_reference in data_reference_list
+                if data_reference not in previous_data_references_cache
+            ],
+            data_asset_name=None,
+        )
+        mapped_batch_definition_lists.update(previous_data_references_cache)
+        self._data_references_cache = {
+            data_reference: mapped_batch_definition_lists[data_reference]
+            for data_reference in data_reference_list
+        }
 
     def get_data_reference_list_count(self) -> int:
         """
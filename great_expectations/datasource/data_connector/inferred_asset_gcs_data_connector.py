@@ -7,7 +7,10 @@ from great_expectations.core.batch_spec import GCSBatchSpec, PathBatchSpec
 from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
-from great_expectations.datasource.data_connector.util import list_gcs_keys
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_gcs_keys,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -63,6 +66,9 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
         max_results: Optional[int] = None,
         gcs_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        max_listing_workers: Optional[int] = None,
+        listing_checkpoint_filepath: Optional[str] = None,
+        listing_checkpoint_max_age_seconds: Optional[float] = None,
     ):
         """
         InferredAssetDataConnector for connecting to GCS.
@@ -79,6 +85,10 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             max_results (int): max blob filepaths to return
             gcs_options (dict): wrapper object for optional GCS **kwargs
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            max_listing_workers (int): optional number of threads listing prefixes concurrently
+            listing_checkpoint_filepath (str): optional path of a file recording listed prefixes, which are not
+                listed again (see KeyListingCheckpoint)
+            listing_checkpoint_max_age_seconds (float): optional age after which recorded prefixes are listed again
         """
         logger.debug(f'Constructing InferredAssetGCSDataConnector "{name}".')
 
@@ -91,6 +101,13 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
             batch_spec_passthrough=batch_spec_passthrough,
         )
 
+        self._max_listing_workers = max_listing_workers
+        if listing_checkpoint_filepath is not None:
+            self._listing_checkpoint = KeyListingCheckpoint(
+                filepath=listing_checkpoint_filepath,
+                max_age_seconds=listing_checkpoint_max_age_seconds,
+            )
+
         self._bucket_or_name = bucket_or_name
         self._prefix = prefix
         self._delimiter = delimiter
@@ -148,6 +165,8 @@ class InferredAssetGCSDataConnector(InferredAssetFilePathDataConnector):
                 gcs=self._gcs,
                 query_options=query_options,
                 recursive=True,
+                max_workers=self._max_listing_workers,
+                checkpoint=self._listing_checkpoint,
             )
         ]
         return path_list
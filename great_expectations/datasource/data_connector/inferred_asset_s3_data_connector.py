@@ -14,7 +14,10 @@ except ImportError:
 from great_expectations.datasource.data_connector import (
     InferredAssetFilePathDataConnector,
 )
-from great_expectations.datasource.data_connector.util import list_s3_keys
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_s3_keys,
+)
 from great_expectations.execution_engine import ExecutionEngine
 
 logger = logging.getLogger(__name__)
@@ -48,6 +51,9 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
         max_keys: Optional[int] = 1000,
         boto3_options: Optional[dict] = None,
         batch_spec_passthrough: Optional[dict] = None,
+        max_listing_workers: Optional[int] = None,
+        listing_checkpoint_filepath: Optional[str] = None,
+        listing_checkpoint_max_age_seconds: Optional[float] = None,
     ):
         """
         InferredAssetS3DataConnector for connecting to S3.
@@ -64,6 +70,10 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             max_keys (int): S3 max_keys (default is 1000)
             boto3_options (dict): optional boto3 options
             batch_spec_passthrough (dict): dictionary with keys that will be added directly to batch_spec
+            max_listing_workers (int): optional number of threads listing prefixes concurrently
+            listing_checkpoint_filepath (str): optional path of a file recording listed prefixes, which are not
+                listed again (see KeyListingCheckpoint)
+            listing_checkpoint_max_age_seconds (float): optional age after which recorded prefixes are listed again
         """
         logger.debug(f'Constructing InferredAssetS3DataConnector "{name}".')
 
@@ -76,6 +86,13 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
             batch_spec_passthrough=batch_spec_passthrough,
         )
 
+        self._max_listing_workers = max_listing_workers
+        if listing_checkpoint_filepath is not None:
+            self._listing_checkpoint = KeyListingCheckpoint(
+                filepath=listing_checkpoint_filepath,
+                max_age_seconds=listing_checkpoint_max_age_seconds,
+            )
+
         self._bucket = bucket
         self._prefix = os.path.join(prefix, "")
         self._delimiter = delimiter
@@ -128,6 +145,8 @@ class InferredAssetS3DataConnector(InferredAssetFilePathDataConnector):
                 query_options=query_options,
                 iterator_dict={},
                 recursive=True,
+                max_workers=self._max_listing_workers,
+                checkpoint=self._listing_checkpoint,
             )
         ]
         return path_list
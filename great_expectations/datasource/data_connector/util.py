@@ -1,14 +1,19 @@
 # Utility methods for dealing with DataConnector objects
 
+import concurrent.futures
 import copy
+import json
 import logging
 import os
 import re
 import sre_constants
 import sre_parse
+import sys
+import threading
+import time
 import warnings
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from great_expectations.core.batch import BatchDefinition, BatchRequestBase
 from great_expectations.core.id_dict import IDDict
@@ -99,6 +104,120 @@ def batch_definition_matches_batch_request(
     return True
 
 
+# TODO: <Alex>Accommodating "data_asset_name" inside batch_identifiers (e.g., via "group_names") is problematic; we need a better mechanism.</Alex>
+# TODO: <Alex>Update: Approach -- we can differentiate "def map_data_reference_string_to_batch_definition_list_using_regex(()" methods between ConfiguredAssetFilesystemDataConnector and InferredAssetFilesystemDataConnector so that IDDict never needs to include data_asset_name. (ref: https://superconductivedata.slack.com/archives/C01C0BVPL5Q/p1603843413329400?thread_ts=1603842470.326800&cid=C01C0BVPL5Q)</Alex>
+class DataReferenceMatcher:
+    """
+    Maps data references to BatchDefinitions (and BatchDefinitions back to data references) using the regex pattern
+    and the group names of one data asset.
+
+    The pattern is compiled, and the template used to map batch_identifiers back to a data reference is derived, only
+    once, rather than for each data reference.  The group names are interned, so the batch_identifiers of all of the
+    BatchDefinitions built by the matcher share the same key strings.
+    """
+
+    __slots__ = ("_regex_pattern", "_regex", "_group_names", "_data_reference_template")
+
+    def __init__(self, regex_pattern: str, group_names: List[str]):
+        self._regex_pattern = regex_pattern
+        self._regex: re.Pattern = re.compile(regex_pattern)
+        self._group_names: Tuple[str, ...] = tuple(
+            sys.intern(group_name) for group_name in group_names
+        )
+        self._data_reference_template: Optional[str] = None
+
+    @property
+    def regex_pattern(self) -> str:
+        return self._regex_pattern
+
+    @property
+    def group_names(self) -> List[str]:
+        return list(self._group_names)
+
+    def get_batch_identifiers(
+        self, data_reference: str
+    ) -> Optional[Tuple[str, IDDict]]:
+        """
+        Match data_reference, returning the data_asset_name and the batch_identifiers captured by the groups of the
+        pattern, or None if data_reference does not match.
+        """
+        matches: Optional[re.Match] = self._regex.match(data_reference)
+        if matches is None:
+            return None
+        batch_identifiers: IDDict = IDDict(zip(self._group_names, matches.groups()))
+
+        # A "data_asset_name" group names the data asset, rather than identifying a batch of it.
+        data_asset_name: str = DEFAULT_DATA_ASSET_NAME
+        if "data_asset_name" in batch_identifiers:
+            data_asset_name = batch_identifiers.pop("data_asset_name")
+        return data_asset_name, batch_identifiers
+
+    def get_batch_definition_list(
+        self,
+        datasource_name: str,
+        data_connector_name: str,
+        data_reference: str,
+        data_asset_name: Optional[str] = None,
+    ) -> Optional[List[BatchDefinition]]:
+        processed_data_reference: Optional[
+            Tuple[str, IDDict]
+        ] = self.get_batch_identifiers(data_reference=data_reference)
+        if processed_data_reference is None:
+            return None
+        data_asset_name_from_batch_identifiers: str = processed_data_reference[0]
+        batch_identifiers: IDDict = processed_data_reference[1]
+        if data_asset_name is None:
+            data_asset_name = data_asset_name_from_batch_identifiers
+
+        return [
+            BatchDefinition(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_asset_name=data_asset_name,
+                batch_identifiers=batch_identifiers,
+            )
+        ]
+
+    def get_batch_definition_lists(
+        self,
+        datasource_name: str,
+        data_connector_name: str,
+        data_references: Iterable[str],
+        data_asset_name: Optional[str] = None,
+    ) -> Dict[str, Optional[List[BatchDefinition]]]:
+        """
+        Map each of data_references to the list of BatchDefinitions built from it (or to None, if it does not match).
+        """
+        return {
+            data_reference: self.get_batch_definition_list(
+                datasource_name=datasource_name,
+                data_connector_name=data_connector_name,
+                data_reference=data_reference,
+                data_asset_name=data_asset_name,
+            )
+            for data_reference in data_references
+        }
+
+    def get_data_reference(
+        self, batch_identifiers: IDDict, data_asset_name: Optional[str] = None
+    ) -> str:
+        if not isinstance(batch_identifiers, IDDict):
+            raise TypeError("batch_identifiers is not " "an instance of type IDDict")
+
+        if self._data_reference_template is None:
+            self._data_reference_template = _invert_regex_to_data_reference_template(
+                regex_pattern=self._regex_pattern,
+                group_names=list(self._group_names),
+            )
+
+        template_arguments: dict = dict(batch_identifiers)
+        # The data_asset_name only takes effect if the pattern has a "data_asset_name" group (e.g., for inferred assets).
+        if data_asset_name is not None:
+            template_arguments["data_asset_name"] = data_asset_name
+
+        return self._data_reference_template.format(**template_arguments)
+
+
 def map_data_reference_string_to_batch_definition_list_using_regex(
     datasource_name: str,
     data_connector_name: str,
@@ -107,28 +226,14 @@ def map_data_reference_string_to_batch_definition_list_using_regex(
     group_names: List[str],
     data_asset_name: Optional[str] = None,
 ) -> Optional[List[BatchDefinition]]:
-    processed_data_reference: Optional[
-        Tuple[str, IDDict]
-    ] = convert_data_reference_string_to_batch_identifiers_using_regex(
+    return DataReferenceMatcher(
+        regex_pattern=regex_pattern, group_names=group_names
+    ).get_batch_definition_list(
+        datasource_name=datasource_name,
+        data_connector_name=data_connector_name,
         data_reference=data_reference,
-        regex_pattern=regex_pattern,
-        group_names=group_names,
+        data_asset_name=data_asset_name,
     )
-    if processed_data_reference is None:
-        return None
-    data_asset_name_from_batch_identifiers: str = processed_data_reference[0]
-    batch_identifiers: IDDict = processed_data_reference[1]
-    if data_asset_name is None:
-        data_asset_name = data_asset_name_from_batch_identifiers
-
-    return [
-        BatchDefinition(
-            datasource_name=datasource_name,
-            data_connector_name=data_connector_name,
-            data_asset_name=data_asset_name,
-            batch_identifiers=IDDict(batch_identifiers),
-        )
-    ]
 
 
 def convert_data_reference_string_to_batch_identifiers_using_regex(
@@ -136,19 +241,9 @@ def convert_data_reference_string_to_batch_identifiers_using_regex(
     regex_pattern: str,
     group_names: List[str],
 ) -> Optional[Tuple[str, IDDict]]:
-    # noinspection PyUnresolvedReferences
-    matches: Optional[re.Match] = re.match(regex_pattern, data_reference)
-    if matches is None:
-        return None
-    groups: list = list(matches.groups())
-    batch_identifiers: IDDict = IDDict(dict(zip(group_names, groups)))
-
-    # TODO: <Alex>Accommodating "data_asset_name" inside batch_identifiers (e.g., via "group_names") is problematic; we need a better mechanism.</Alex>
-    # TODO: <Alex>Update: Approach -- we can differentiate "def map_data_reference_string_to_batch_definition_list_using_regex(()" methods between ConfiguredAssetFilesystemDataConnector and InferredAssetFilesystemDataConnector so that IDDict never needs to include data_asset_name. (ref: https://superconductivedata.slack.com/archives/C01C0BVPL5Q/p1603843413329400?thread_ts=1603842470.326800&cid=C01C0BVPL5Q)</Alex>
-    data_asset_name: str = DEFAULT_DATA_ASSET_NAME
-    if "data_asset_name" in batch_identifiers:
-        data_asset_name = batch_identifiers.pop("data_asset_name")
-    return data_asset_name, batch_identifiers
+    return DataReferenceMatcher(
+        regex_pattern=regex_pattern, group_names=group_names
+    ).get_batch_identifiers(data_reference=data_reference)
 
 
 def map_batch_definition_to_data_reference_string_using_regex(
@@ -161,17 +256,12 @@ def map_batch_definition_to_data_reference_string_using_regex(
             "batch_definition is not of an instance of type BatchDefinition"
         )
 
-    data_asset_name: str = batch_definition.data_asset_name
-    batch_identifiers: IDDict = batch_definition.batch_identifiers
-    data_reference: str = (
-        convert_batch_identifiers_to_data_reference_string_using_regex(
-            batch_identifiers=batch_identifiers,
-            regex_pattern=regex_pattern,
-            group_names=group_names,
-            data_asset_name=data_asset_name,
-        )
+    return DataReferenceMatcher(
+        regex_pattern=regex_pattern, group_names=group_names
+    ).get_data_reference(
+        batch_identifiers=batch_definition.batch_identifiers,
+        data_asset_name=batch_definition.data_asset_name,
     )
-    return data_reference
 
 
 # TODO: <Alex>How are we able to recover the full file path, including the file extension?  Relying on file extension being part of the regex_pattern does not work when multiple file extensions are specified as part of the regex_pattern.</Alex>
@@ -181,21 +271,11 @@ def convert_batch_identifiers_to_data_reference_string_using_regex(
     group_names: List[str],
     data_asset_name: Optional[str] = None,
 ) -> str:
-    if not isinstance(batch_identifiers, IDDict):
-        raise TypeError("batch_identifiers is not " "an instance of type IDDict")
-
-    template_arguments: dict = copy.deepcopy(batch_identifiers)
-    # TODO: <Alex>How does "data_asset_name" factor in the computation of "converted_string"?  Does it have any effect?</Alex>
-    if data_asset_name is not None:
-        template_arguments["data_asset_name"] = data_asset_name
-
-    filepath_template: str = _invert_regex_to_data_reference_template(
-        regex_pattern=regex_pattern,
-        group_names=group_names,
+    return DataReferenceMatcher(
+        regex_pattern=regex_pattern, group_names=group_names
+    ).get_data_reference(
+        batch_identifiers=batch_identifiers, data_asset_name=data_asset_name
     )
-    converted_string = filepath_template.format(**template_arguments)
-
-    return converted_string
 
 
 # noinspection PyUnresolvedReferences
@@ -297,10 +377,266 @@ def get_filesystem_one_level_directory_glob_path_list(
     return path_list
 
 
+class KeyListingCheckpoint:
+    """
+    Persists the keys and sub-prefixes found under each fully listed prefix of an object store listing (as JSON lines
+    appended to a file), so that later listings with the same checkpoint do not list those prefixes again.  This lets
+    an interrupted listing of a large bucket be resumed, and a recent listing be reused by later runs.
+
+    Listed prefixes are recorded for at most max_age_seconds (if given); keys added under a recorded prefix after it
+    was listed are not seen until its record expires or is invalidated (see invalidate()).
+    """
+
+    def __init__(self, filepath: str, max_age_seconds: Optional[float] = None):
+        self._filepath = filepath
+        self._max_age_seconds = max_age_seconds
+        self._records: Optional[Dict[Tuple[str, str], dict]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def max_age_seconds(self) -> Optional[float]:
+        return self._max_age_seconds
+
+    def get(
+        self, listing_id: str, prefix: str
+    ) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Return the keys and the sub-prefixes recorded for prefix of the listing identified by listing_id, if any.
+        """
+        with self._lock:
+            records: Dict[Tuple[str, str], dict] = self._load_records()
+            record: Optional[dict] = records.get((listing_id, prefix))
+            if record is not None and self._is_expired(record=record):
+                # The prefix is listed again, and its new record supersedes this one in the file.
+                del records[(listing_id, prefix)]
+                record = None
+        if record is None:
+            return None
+        return record["keys"], record["prefixes"]
+
+    def add(self, listing_id: str, prefix: str, keys: List[str], prefixes: List[str]):
+        """
+        Record the keys and the sub-prefixes found under prefix of the listing identified by listing_id.
+        """
+        record: dict = {
+            "listing_id": listing_id,
+            "prefix": prefix,
+            "keys": keys,
+            "prefixes": prefixes,
+            "listed_at": time.time(),
+        }
+        with self._lock:
+            self._load_records()[(listing_id, prefix)] = record
+            with open(self._filepath, "a") as outfile:
+                outfile.write(json.dumps(record) + "\n")
+
+    def invalidate(
+        self, listing_id: Optional[str] = None, prefix: Optional[str] = None
+    ):
+        """
+        Drop the records of the listing identified by listing_id (or of all listings), optionally only those of prefix
+        and of its sub-prefixes, so that the next listing lists them again and picks up keys added since.
+        """
+        if listing_id is None and prefix is None:
+            self.clear()
+            return
+
+        with self._lock:
+            records: Dict[Tuple[str, str], dict] = self._load_records()
+            for key in [
+                key
+                for key in records
+                if (listing_id is None or key[0] == listing_id)
+                and (prefix is None or key[1].startswith(prefix))
+            ]:
+                del records[key]
+            self._write_records()
+
+    def clear(self):
+        with self._lock:
+            self._records = {}
+            if os.path.isfile(self._filepath):
+                os.remove(self._filepath)
+
+    def _is_expired(self, record: dict) -> bool:
+        return (
+            self._max_age_seconds is not None
+            and time.time() - record["listed_at"] > self._max_age_seconds
+        )
+
+    def _load_records(self) -> Dict[Tuple[str, str], dict]:
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+        if not os.path.isfile(self._filepath):
+            return self._records
+
+        number_of_lines: int = 0
+        with open(self._filepath) as infile:
+            for line in infile:
+                number_of_lines += 1
+                try:
+                    record: dict = json.loads(line)
+                except ValueError:
+                    # A line that was being written when a listing was interrupted
+                    continue
+                if not self._is_expired(record=record):
+                    self._records[(record["listing_id"], record["prefix"])] = record
+
+        if number_of_lines > len(self._records):
+            # Compact the file, dropping expired, superseded and incomplete records.
+            self._write_records()
+
+        return self._records
+
+    def _write_records(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self._filepath)), exist_ok=True)
+        with open(self._filepath, "w") as outfile:
+            for record in self._records.values():
+                outfile.write(json.dumps(record) + "\n")
+
+
+def _walk_key_hierarchy(
+    list_pages: Callable[[str], Iterator[Tuple[List[str], List[str]]]],
+    prefix: str,
+    recursive: bool = False,
+    max_workers: Optional[int] = None,
+    checkpoint: Optional[KeyListingCheckpoint] = None,
+    listing_id: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Iteratively list the keys under prefix (and, if recursive, under all of its sub-prefixes) of an object store.
+
+    :param list_pages: function listing the pages of one prefix, each page being a tuple of the keys and the
+    sub-prefixes that it contains
+    :param prefix: prefix to start listing from
+    :param recursive: whether to list sub-prefixes as well
+    :param max_workers: if greater than one, the maximum number of threads listing prefixes concurrently; the keys are
+    then yielded in the order in which their prefixes finish listing, rather than in depth-first order
+    :param checkpoint: KeyListingCheckpoint recording fully listed prefixes, which are not listed again
+    :param listing_id: identifies the listing (e.g. the bucket, the delimiter and the top-level prefix) in checkpoint
+    :return: iterator over the keys
+    """
+    if max_workers is not None and max_workers > 1:
+        yield from _walk_key_hierarchy_concurrently(
+            list_pages=list_pages,
+            prefix=prefix,
+            recursive=recursive,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            listing_id=listing_id,
+        )
+        return
+
+    # Each stack entry holds a prefix, the iterator over its pages (None until listing has started), and the keys and
+    # the sub-prefixes found so far (collected only for the checkpoint).  Sub-prefixes are pushed after each page, so
+    # that they are listed depth-first before the next page of their parent.
+    stack: List[list] = [[prefix, None, [], []]]
+    while stack:
+        entry: list = stack[-1]
+        current_prefix: str = entry[0]
+        pages: Optional[Iterator[Tuple[List[str], List[str]]]] = entry[1]
+        if pages is None:
+            recorded: Optional[Tuple[List[str], List[str]]] = (
+                checkpoint.get(listing_id=listing_id, prefix=current_prefix)
+                if checkpoint is not None
+                else None
+            )
+            if recorded is not None:
+                stack.pop()
+                keys, sub_prefixes = recorded
+                yield from keys
+                if recursive:
+                    stack.extend(
+                        [sub_prefix, None, [], []]
+                        for sub_prefix in reversed(sub_prefixes)
+                    )
+                continue
+            pages = entry[1] = list_pages(current_prefix)
+
+        page: Optional[Tuple[List[str], List[str]]] = next(pages, None)
+        if page is None:
+            stack.pop()
+            if checkpoint is not None:
+                checkpoint.add(
+                    listing_id=listing_id,
+                    prefix=current_prefix,
+                    keys=entry[2],
+                    prefixes=entry[3],
+                )
+            continue
+
+        keys, sub_prefixes = page
+        if checkpoint is not None:
+            entry[2].extend(keys)
+            entry[3].extend(sub_prefixes)
+        yield from keys
+        if recursive:
+            stack.extend(
+                [sub_prefix, None, [], []] for sub_prefix in reversed(sub_prefixes)
+            )
+
+
+def _walk_key_hierarchy_concurrently(
+    list_pages: Callable[[str], Iterator[Tuple[List[str], List[str]]]],
+    prefix: str,
+    recursive: bool,
+    max_workers: int,
+    checkpoint: Optional[KeyListingCheckpoint] = None,
+    listing_id: Optional[str] = None,
+) -> Iterator[str]:
+    def _list_prefix(current_prefix: str) -> Tuple[List[str], List[str]]:
+        if checkpoint is not None:
+            recorded: Optional[Tuple[List[str], List[str]]] = checkpoint.get(
+                listing_id=listing_id, prefix=current_prefix
+            )
+            if recorded is not None:
+                return recorded
+
+        keys: List[str] = []
+        sub_prefixes: List[str] = []
+        for page_keys, page_sub_prefixes in list_pages(current_prefix):
+            keys.extend(page_keys)
+            sub_prefixes.extend(page_sub_prefixes)
+        if checkpoint is not None:
+            checkpoint.add(
+                listing_id=listing_id,
+                prefix=current_prefix,
+                keys=keys,
+                prefixes=sub_prefixes,
+            )
+        return keys, sub_prefixes
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending_futures: Set[concurrent.futures.Future] = {
+            executor.submit(_list_prefix, prefix)
+        }
+        while pending_futures:
+            done_futures, pending_futures = concurrent.futures.wait(
+                pending_futures,
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
+            for future in done_futures:
+                keys, sub_prefixes = future.result()
+                if recursive:
+                    pending_futures.update(
+                        executor.submit(_list_prefix, sub_prefix)
+                        for sub_prefix in sub_prefixes
+                    )
+                yield from keys
+
+
 def list_azure_keys(
     azure,
     query_options: dict,
     recursive: bool = False,
+    max_workers: Optional[int] = None,
+    checkpoint: Optional[KeyListingCheckpoint] = None,
 ) -> List[str]:
     """
     Utilizes the Azure Blob Storage connection object to retrieve blob names based on user-provided criteria.
@@ -317,6 +653,8 @@ def list_azure_keys(
         azure (BlobServiceClient): Azure connnection object responsible for accessing container
         query_options (dict): Azure query attributes ("container", "name_starts_with", "delimiter")
         recursive (bool): True for InferredAssetAzureDataConnector and False for ConfiguredAssetAzureDataConnector (see above)
+        max_workers (int): if greater than one, the number of threads listing blob prefixes concurrently
+        checkpoint (KeyListingCheckpoint): optional checkpoint recording (and reusing) the blob prefixes that were listed
 
     Returns:
         List of keys representing Azure file paths (as filtered by the query_options dict)
@@ -324,26 +662,35 @@ def list_azure_keys(
     container: str = query_options["container"]
     container_client = azure.get_container_client(container)
 
-    path_list: List[str] = []
-
-    def _walk_blob_hierarchy(name_starts_with: str) -> None:
+    def _list_pages(name_starts_with: str) -> Iterator[Tuple[List[str], List[str]]]:
+        names: List[str] = []
+        prefixes: List[str] = []
         for item in container_client.walk_blobs(name_starts_with=name_starts_with):
             if isinstance(item, BlobPrefix):
-                if recursive:
-                    _walk_blob_hierarchy(name_starts_with=item.name)
+                prefixes.append(item.name)
             else:
-                path_list.append(item.name)
+                names.append(item.name)
+        yield names, prefixes
 
     name_starts_with: str = query_options["name_starts_with"]
-    _walk_blob_hierarchy(name_starts_with)
-
-    return path_list
+    return list(
+        _walk_key_hierarchy(
+            list_pages=_list_pages,
+            prefix=name_starts_with,
+            recursive=recursive,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            listing_id=f"azure://{container}/{name_starts_with}",
+        )
+    )
 
 
 def list_gcs_keys(
     gcs,
     query_options: dict,
     recursive: bool = False,
+    max_workers: Optional[int] = None,
+    checkpoint: Optional[KeyListingCheckpoint] = None,
 ) -> List[str]:
     """
     Utilizes the GCS connection object to retrieve blob names based on user-provided criteria.
@@ -365,10 +712,15 @@ def list_gcs_keys(
     In order to provide users with finer control of their config while also ensuring output that is in line with the `recursive` arg,
     we deem it appropriate to manually override the value of the delimiter only in cases where it is absolutely necessary.
 
+    A recursive traversal with more than one worker lists each directory with the "/" delimiter instead, so that the
+    directories can be listed concurrently.
+
     Args:
         gcs (storage.Client): GCS connnection object responsible for accessing bucket
         query_options (dict): GCS query attributes ("bucket_or_name", "prefix", "delimiter", "max_results")
         recursive (bool): True for InferredAssetGCSDataConnector and False for ConfiguredAssetGCSDataConnector (see above)
+        max_workers (int): if greater than one, the number of threads listing directories concurrently
+        checkpoint (KeyListingCheckpoint): optional checkpoint recording (and reusing) the directories that were listed
 
     Returns:
         List of keys representing GCS file paths (as filtered by the `query_options` dict)
@@ -391,19 +743,46 @@ def list_gcs_keys(
         )
         query_options["delimiter"] = None
 
-    keys: List[str] = []
-    for blob in gcs.list_blobs(**query_options):
-        name: str = blob.name
-        if name.endswith("/"):  # GCS includes directories in blob output
-            continue
-        keys.append(name)
-
-    return keys
+    walk_directories: bool = recursive and max_workers is not None and max_workers > 1
+
+    def _list_pages(prefix: Optional[str]) -> Iterator[Tuple[List[str], List[str]]]:
+        prefix_query_options: dict = dict(query_options)
+        if walk_directories:
+            prefix_query_options.update(prefix=prefix, delimiter="/")
+        blobs = gcs.list_blobs(**prefix_query_options)
+        names: List[str] = []
+        for blob in blobs:
+            name: str = blob.name
+            if name.endswith("/"):  # GCS includes directories in blob output
+                continue
+            names.append(name)
+        directories: List[str] = []
+        if walk_directories:
+            # The directories under prefix are known once the blobs have been iterated over.
+            directories = sorted(blobs.prefixes)
+        yield names, directories
+
+    return list(
+        _walk_key_hierarchy(
+            list_pages=_list_pages,
+            prefix=query_options.get("prefix"),
+            recursive=walk_directories,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+            listing_id=f"gs://{query_options.get('bucket_or_name')}/{query_options.get('prefix')}"
+            f"|{query_options['delimiter']}|{walk_directories}",
+        )
+    )
 
 
 def list_s3_keys(
-    s3, query_options: dict, iterator_dict: dict, recursive: bool = False
-) -> str:
+    s3,
+    query_options: dict,
+    iterator_dict: dict,
+    recursive: bool = False,
+    max_workers: Optional[int] = None,
+    checkpoint: Optional[KeyListingCheckpoint] = None,
+) -> Iterator[str]:
     """
     For InferredAssetS3DataConnector, we take bucket and prefix and search for files using RegEx at and below the level
     specified by that bucket and prefix.  However, for ConfiguredAssetS3DataConnector, we take bucket and prefix and
@@ -411,55 +790,75 @@ def list_s3_keys(
     ConfiguredAssetS3DataConnector is needed, because paths on S3 are comprised not only the leaf file name but the
     full path that includes both the prefix and the file name.  Otherwise, in the situations where multiple data assets
     share levels of a directory tree, matching files to data assets will not be possible, due to the path ambiguity.
+
+    Pages and prefixes are listed iteratively (depth-first, each page before the prefixes that it contains), so the
+    depth and the size of the bucket are not limited by the recursion limit.
     :param s3: s3 client connection
     :param query_options: s3 query attributes ("Bucket", "Prefix", "Delimiter", "MaxKeys")
     :param iterator_dict: dictionary to manage "NextContinuationToken" (if "IsTruncated" is returned from S3)
     :param recursive: True for InferredAssetS3DataConnector and False for ConfiguredAssetS3DataConnector (see above)
+    :param max_workers: if greater than one, the number of threads listing prefixes concurrently
+    :param checkpoint: optional KeyListingCheckpoint recording (and reusing) the prefixes that were listed
     :return: string valued key representing file path on S3 (full prefix and leaf file name)
     """
     if iterator_dict is None:
         iterator_dict = {}
 
-    if "continuation_token" in iterator_dict:
-        query_options.update({"ContinuationToken": iterator_dict["continuation_token"]})
-
-    logger.debug(f"Fetching objects from S3 with query options: {query_options}")
-
-    s3_objects_info: dict = s3.list_objects_v2(**query_options)
-
-    if not any(key in s3_objects_info for key in ["Contents", "CommonPrefixes"]):
-        raise ValueError("S3 query may not have been configured correctly.")
-
-    if "Contents" in s3_objects_info:
-        keys: List[str] = [
-            item["Key"] for item in s3_objects_info["Contents"] if item["Size"] > 0
-        ]
-        yield from keys
-    if recursive and "CommonPrefixes" in s3_objects_info:
-        common_prefixes: List[Dict[str, Any]] = s3_objects_info["CommonPrefixes"]
-        for prefix_info in common_prefixes:
-            query_options_tmp: dict = copy.deepcopy(query_options)
-            query_options_tmp.update({"Prefix": prefix_info["Prefix"]})
-            # Recursively fetch from updated prefix
-            yield from list_s3_keys(
-                s3=s3,
-                query_options=query_options_tmp,
-                iterator_dict={},
-                recursive=recursive,
+    top_level_prefix: str = query_options.get("Prefix", "")
+
+    def _list_pages(prefix: str) -> Iterator[Tuple[List[str], List[str]]]:
+        prefix_query_options: dict = copy.deepcopy(query_options)
+        prefix_query_options["Prefix"] = prefix
+        is_top_level: bool = prefix == top_level_prefix
+        if is_top_level and "continuation_token" in iterator_dict:
+            prefix_query_options["ContinuationToken"] = iterator_dict[
+                "continuation_token"
+            ]
+        while True:
+            logger.debug(
+                f"Fetching objects from S3 with query options: {prefix_query_options}"
             )
-    if s3_objects_info["IsTruncated"]:
-        iterator_dict["continuation_token"] = s3_objects_info["NextContinuationToken"]
-        # Recursively fetch more
-        yield from list_s3_keys(
-            s3=s3,
-            query_options=query_options,
-            iterator_dict=iterator_dict,
-            recursive=recursive,
-        )
+            s3_objects_info: dict = s3.list_objects_v2(**prefix_query_options)
 
-    if "continuation_token" in iterator_dict:
-        # Make sure we clear the token once we've gotten fully through
-        del iterator_dict["continuation_token"]
+            if not any(
+                key in s3_objects_info for key in ["Contents", "CommonPrefixes"]
+            ):
+                raise ValueError("S3 query may not have been configured correctly.")
+
+            keys: List[str] = [
+                item["Key"]
+                for item in s3_objects_info.get("Contents", [])
+                if item["Size"] > 0
+            ]
+            common_prefixes: List[str] = [
+                prefix_info["Prefix"]
+                for prefix_info in s3_objects_info.get("CommonPrefixes", [])
+            ]
+            yield keys, common_prefixes
+
+            if not s3_objects_info["IsTruncated"]:
+                break
+            prefix_query_options["ContinuationToken"] = s3_objects_info[
+                "NextContinuationToken"
+            ]
+            if is_top_level:
+                iterator_dict["continuation_token"] = s3_objects_info[
+                    "NextContinuationToken"
+                ]
+
+        if is_top_level and "continuation_token" in iterator_dict:
+            # Make sure we clear the token once we've gotten fully through
+            del iterator_dict["continuation_token"]
+
+    yield from _walk_key_hierarchy(
+        list_pages=_list_pages,
+        prefix=top_level_prefix,
+        recursive=recursive,
+        max_workers=max_workers,
+        checkpoint=checkpoint,
+        listing_id=f"s3://{query_options.get('Bucket')}/{top_level_prefix}"
+        f"|{query_options.get('Delimiter')}|{recursive}",
+    )
 
 
 # TODO: <Alex>We need to move sorters and _validate_sorters_configuration() to DataConnector</Alex>
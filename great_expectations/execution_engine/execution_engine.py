@@ -1,14 +1,21 @@
 import copy
+import hashlib
+import json
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Iterable, Tuple, Union
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
 
 import pandas as pd
 from ruamel.yaml import YAML
 
 from great_expectations.core.batch import BatchMarkers, BatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.exceptions import ExecutionEngineError, GreatExpectationsError
+from great_expectations.execution_engine.metric_cache import MetricCache
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.util import filter_properties_dict
 from great_expectations.validator.validation_graph import MetricConfiguration
@@ -18,17 +25,6 @@ yaml = YAML()
 yaml.default_flow_style = False
 
 
-class NoOpDict:
-    def __getitem__(self, item):
-        return None
-
-    def __setitem__(self, key, value):
-        return None
-
-    def update(self, value):
-        return None
-
-
 class BatchData:
     def __init__(self, execution_engine):
         self._execution_engine = execution_engine
@@ -42,6 +38,98 @@ class BatchData:
         return pd.DataFrame({})
 
 
+class DomainRecordsCache:
+    """A least recently used cache of materialized compute domain records (e.g. DataFrames filtered by a
+    row_condition), keyed by batch_id and domain.
+
+    The cache is bounded by max_entries and, if a sizeof function is provided, by max_bytes.  If provided, on_insert
+    and on_evict are called with the records of each entry that enters or leaves the cache (e.g. to persist and
+    unpersist a Spark DataFrame).
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        on_insert: Optional[Callable[[Any], None]] = None,
+        on_evict: Optional[Callable[[Any], None]] = None,
+    ):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._on_insert = on_insert
+        self._on_evict = on_evict
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[Any, int]]" = (
+            OrderedDict()
+        )
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, batch_id: str, domain_id: Hashable) -> Optional[Any]:
+        key = (batch_id, domain_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, batch_id: str, domain_id: Hashable, records: Any) -> None:
+        key = (batch_id, domain_id)
+        size = self._sizeof(records) if self._sizeof is not None else 0
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self._max_bytes is not None and size > self._max_bytes:
+                # Records that cannot fit are not cached at all, rather than flushing everything else.
+                return
+            if self._on_insert is not None:
+                self._on_insert(records)
+            self._entries[key] = (records, size)
+            self._total_bytes += size
+            while (
+                self._max_entries is not None and len(self._entries) > self._max_entries
+            ) or (self._max_bytes is not None and self._total_bytes > self._max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, batch_id: str) -> None:
+        """Removes all entries computed from the batch with the given batch_id."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == batch_id]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+    def _remove(self, key: Tuple[str, Hashable]) -> None:
+        records, size = self._entries.pop(key)
+        self._total_bytes -= size
+        if self._on_evict is not None:
+            self._on_evict(records)
+
+
 class MetricFunctionTypes(Enum):
     VALUE = "value"
     MAP_VALUES = "value"  # "map_values"
@@ -66,6 +154,7 @@ class ExecutionEngine(ABC):
         batch_spec_defaults=None,
         batch_data_dict=None,
         validator=None,
+        metric_cache=None,
     ):
         self.name = name
         self._validator = validator
@@ -73,11 +162,28 @@ class ExecutionEngine(ABC):
         # NOTE: using caching makes the strong assumption that the user will not modify the core data store
         # (e.g. self.spark_df) over the lifetime of the dataset instance
         self._caching = caching
-        # NOTE: 20200918 - this is a naive cache; update.
-        if self._caching:
-            self._metric_cache = {}
+        metric_cache_config = metric_cache if isinstance(metric_cache, dict) else None
+        # The metric cache is content-addressed: entries are keyed by a fingerprint of the batch data (see
+        # get_batch_fingerprint), so it is only consulted for batches that the engine is able to fingerprint.
+        if self._caching and metric_cache is not None:
+            if isinstance(metric_cache, dict):
+                metric_cache = instantiate_class_from_config(
+                    config=metric_cache,
+                    runtime_environment={},
+                    config_defaults={
+                        "module_name": "great_expectations.execution_engine.metric_cache"
+                    },
+                )
+            if not isinstance(metric_cache, MetricCache):
+                raise ExecutionEngineError(
+                    f"metric_cache must be a MetricCache or a MetricCache configuration, not {type(metric_cache)}"
+                )
+            self._metric_cache = metric_cache
         else:
-            self._metric_cache = NoOpDict()
+            self._metric_cache = None
+        # Engines that materialize compute domains in memory (e.g. by applying a row_condition) set a
+        # DomainRecordsCache here so that domains shared by several metrics are materialized only once.
+        self._domain_records_cache: Optional[DomainRecordsCache] = None
 
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
@@ -108,6 +214,7 @@ class ExecutionEngine(ABC):
             "batch_spec_defaults": batch_spec_defaults,
             "batch_data_dict": batch_data_dict,
             "validator": validator,
+            "metric_cache": metric_cache_config,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -166,6 +273,75 @@ class ExecutionEngine(ABC):
     def dialect(self):
         return None
 
+    @property
+    def metric_cache(self) -> Optional[MetricCache]:
+        return self._metric_cache
+
+    @property
+    def domain_records_cache(self) -> Optional[DomainRecordsCache]:
+        return self._domain_records_cache
+
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Returns a hash of the content of the loaded batch data with the given batch_id, or None if the engine
+        cannot fingerprint it.  Only metrics of batches that have a fingerprint are stored in the metric cache."""
+        return None
+
+    def _get_metric_cache_key(self, metric: MetricConfiguration) -> Optional[str]:
+        batch_id = (
+            metric.metric_domain_kwargs.get("batch_id") or self.active_batch_data_id
+        )
+        if batch_id is None:
+            return None
+        fingerprint = self.get_batch_fingerprint(batch_id)
+        if fingerprint is None:
+            return None
+        # The batch_id is replaced by the fingerprint of its data, so that identical data is addressed identically.
+        return hashlib.md5(
+            json.dumps(
+                [
+                    self.__class__.__name__,
+                    fingerprint,
+                    metric.metric_name,
+                    metric.metric_domain_kwargs.to_id(id_ignore_keys={"batch_id"}),
+                    metric.metric_value_kwargs_id,
+                ]
+            ).encode("utf-8")
+        ).hexdigest()
+
+    def get_cached_metrics(
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> Dict[Tuple, Any]:
+        """Returns the values of those of the given metrics that are available in the metric cache, keyed by metric
+        id."""
+        if self._metric_cache is None:
+            return {}
+        metric_ids_by_cache_key = {}
+        for metric in metric_configurations:
+            cache_key = self._get_metric_cache_key(metric)
+            if cache_key is not None:
+                metric_ids_by_cache_key[cache_key] = metric.id
+        cached_values = self._metric_cache.get_many(metric_ids_by_cache_key.keys())
+        return {
+            metric_ids_by_cache_key[cache_key]: value
+            for cache_key, value in cached_values.items()
+        }
+
+    def _cache_resolved_metrics(
+        self,
+        metric_configurations: Iterable[MetricConfiguration],
+        resolved_metrics: Dict[Tuple, Any],
+    ) -> None:
+        if self._metric_cache is None:
+            return
+        items = {}
+        for metric in metric_configurations:
+            if metric.id not in resolved_metrics:
+                continue
+            cache_key = self._get_metric_cache_key(metric)
+            if cache_key is not None:
+                items[cache_key] = resolved_metrics[metric.id]
+        self._metric_cache.set_many(items)
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -190,6 +366,8 @@ class ExecutionEngine(ABC):
         """
         Loads the specified batch_data into the execution engine
         """
+        if self._domain_records_cache is not None:
+            self._domain_records_cache.invalidate(batch_id)
         self._batch_data_dict[batch_id] = batch_data
         self._active_batch_data_id = batch_id
 
@@ -223,6 +401,8 @@ class ExecutionEngine(ABC):
         resolved_metrics = {}
 
         metric_fn_bundle = []
+        # Partial functions are closures over engine state; only metric values are stored in the metric cache.
+        cacheable_metrics = []
         for metric_to_resolve in metrics_to_resolve:
             metric_class, metric_fn = get_metric_provider(
                 metric_name=metric_to_resolve.metric_name, execution_engine=self
@@ -262,6 +442,7 @@ class ExecutionEngine(ABC):
                         metric_provider_kwargs,
                     )
                 )
+                cacheable_metrics.append(metric_to_resolve)
                 continue
             metric_fn_type = getattr(
                 metric_fn, "metric_fn_type", MetricFunctionTypes.VALUE
@@ -284,6 +465,7 @@ class ExecutionEngine(ABC):
                 resolved_metrics[metric_to_resolve.id] = metric_fn(
                     **metric_provider_kwargs
                 )
+                cacheable_metrics.append(metric_to_resolve)
             else:
                 logger.warning(
                     f"Unrecognized metric function type while trying to resolve {str(metric_to_resolve.id)}"
@@ -293,6 +475,7 @@ class ExecutionEngine(ABC):
                 )
         if len(metric_fn_bundle) > 0:
             resolved_metrics.update(self.resolve_metric_bundle(metric_fn_bundle))
+        self._cache_resolved_metrics(cacheable_metrics, resolved_metrics)
 
         return resolved_metrics
 
@@ -300,6 +483,46 @@ class ExecutionEngine(ABC):
         """Resolve a bundle of metrics with the same compute domain as part of a single trip to the compute engine."""
         raise NotImplementedError
 
+    @staticmethod
+    def _get_domain_records_cache_id(domain_kwargs: dict) -> Optional[str]:
+        """Returns an id for the records described by domain_kwargs, ignoring keys that only select columns from them
+        (so that, e.g., column domains that share a row_condition share their records), or None if obtaining the
+        records does not require any filtering and so is not worth caching."""
+        filter_keys = ["table", "row_condition", "condition_parser"]
+        if "column" not in domain_kwargs and domain_kwargs.get("ignore_row_if") in [
+            "both_values_are_missing",
+            "either_value_is_missing",
+            "all_values_are_missing",
+            "any_value_is_missing",
+        ]:
+            filter_keys += ["column_A", "column_B", "column_list", "ignore_row_if"]
+        elif not domain_kwargs.get("row_condition"):
+            return None
+        return IDDict(
+            {key: domain_kwargs[key] for key in filter_keys if key in domain_kwargs}
+        ).to_id()
+
+    def _get_or_filter_domain_records(
+        self,
+        batch_id: str,
+        data: Any,
+        domain_kwargs: dict,
+        filter_fn: Callable[[Any, dict], Any],
+    ) -> Any:
+        """Returns filter_fn(data, domain_kwargs), reusing the records already materialized for the same domain of the
+        batch with the given batch_id if the engine has a DomainRecordsCache."""
+        cache_id = None
+        if self._domain_records_cache is not None:
+            cache_id = self._get_domain_records_cache_id(domain_kwargs)
+        if cache_id is None:
+            return filter_fn(data, domain_kwargs)
+
+        records = self._domain_records_cache.get(batch_id, cache_id)
+        if records is None:
+            records = filter_fn(data, domain_kwargs)
+            self._domain_records_cache.put(batch_id, cache_id, records)
+        return records
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -0,0 +1,391 @@
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABCMeta, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class MetricCache(metaclass=ABCMeta):
+    """A MetricCache is a key-value store of resolved metric values that can outlive an ExecutionEngine.
+
+    Keys are content addresses computed by the ExecutionEngine from a batch fingerprint and a metric id, so a cached
+    value can be reused by any Validator or Checkpoint run against identical batch data.
+
+    In general a MetricCache implementation must provide implementations of:
+      - _get
+      - _set
+      - _evict
+      - clear
+
+    Note: persistent implementations serialize values with pickle; only point them at locations that are trusted.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            max_entries: the maximum number of entries to retain; least recently used entries are evicted first
+            ttl_seconds: the number of seconds after which an entry is considered stale and is evicted
+        """
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.RLock()
+
+    @property
+    def max_entries(self) -> Optional[int]:
+        return self._max_entries
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Returns the cached values for those of the given keys that are present and fresh."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                try:
+                    found[key] = self._get(key)
+                    self._hits += 1
+                except KeyError:
+                    self._misses += 1
+        return found
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Stores the given values, skipping (and logging) any value that cannot be serialized."""
+        if not items:
+            return
+        with self._lock:
+            for key, value in items.items():
+                try:
+                    self._set(key, value)
+                except (pickle.PicklingError, TypeError, AttributeError) as e:
+                    logger.debug(f"Unable to cache metric value for key {key}: {e}")
+            self._evict()
+
+    def _is_expired(self, created_at: float, now: Optional[float] = None) -> bool:
+        if self._ttl_seconds is None:
+            return False
+        if now is None:
+            now = time.time()
+        return now - created_at > self._ttl_seconds
+
+    @abstractmethod
+    def _get(self, key: str) -> Any:
+        """Returns the value stored for key, raising KeyError if it is absent or expired."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def _set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _evict(self) -> None:
+        """Removes expired entries, then least recently used entries beyond the configured limits."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class InMemoryMetricCache(MetricCache):
+    """A MetricCache held in process memory, e.g. to share metrics between Validators in one session."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _get(self, key: str) -> Any:
+        created_at, value = self._entries[key]
+        if self._is_expired(created_at):
+            del self._entries[key]
+            raise KeyError(key)
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+
+    def _evict(self) -> None:
+        if self._ttl_seconds is not None:
+            now = time.time()
+            for key in [
+                key
+                for key, (created_at, _) in self._entries.items()
+                if self._is_expired(created_at, now)
+            ]:
+                del self._entries[key]
+        if self._max_entries is not None:
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SqliteMetricCache(MetricCache):
+    """A MetricCache persisted in a local SQLite database file.
+
+    Entries are evicted when they exceed ttl_seconds, and least recently used entries are evicted when either
+    max_entries or max_size_bytes (the total size of the serialized values) is exceeded.
+    """
+
+    def __init__(
+        self,
+        filepath: str,
+        max_entries: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._filepath = filepath
+        self._max_size_bytes = max_size_bytes
+        directory = os.path.dirname(os.path.abspath(filepath))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(filepath, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ge_metric_cache ("
+                "key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS ge_metric_cache_accessed_at "
+                "ON ge_metric_cache (accessed_at)"
+            )
+
+    @property
+    def filepath(self) -> str:
+        return self._filepath
+
+    @property
+    def max_size_bytes(self) -> Optional[int]:
+        return self._max_size_bytes
+
+    def _get(self, key: str) -> Any:
+        row = self._connection.execute(
+            "SELECT value, created_at FROM ge_metric_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+        value, created_at = row
+        if self._is_expired(created_at):
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM ge_metric_cache WHERE key = ?", (key,)
+                )
+            raise KeyError(key)
+        try:
+            value = pickle.loads(value)
+        except Exception as e:
+            # E.g. an entry written by a version of a class that can no longer be loaded.
+            logger.debug(f"Unable to load cached metric value for key {key}: {e}")
+            with self._connection:
+                self._connection.execute(
+                    "DELETE FROM ge_metric_cache WHERE key = ?", (key,)
+                )
+            raise KeyError(key)
+        with self._connection:
+            self._connection.execute(
+                "UPDATE ge_metric_cache SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return value
+
+    def _set(self, key: str, value: Any) -> None:
+        serialized_value = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        with self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO ge_metric_cache "
+                "(key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, serialized_value, len(serialized_value), now, now),
+            )
+
+    def _evict(self) -> None:
+        with self._connection:
+            if self._ttl_seconds is not None:
+                self._connection.execute(
+                    "DELETE FROM ge_metric_cache WHERE created_at < ?",
+                    (time.time() - self._ttl_seconds,),
+                )
+            if self._max_entries is not None:
+                self._connection.execute(
+                    "DELETE FROM ge_metric_cache WHERE key IN ("
+                    "SELECT key FROM ge_metric_cache ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self._max_entries,),
+                )
+            if self._max_size_bytes is not None:
+                (total_size,) = self._connection.execute(
+                    "SELECT COALESCE(SUM(size), 0) FROM ge_metric_cache"
+                ).fetchone()
+                if total_size > self._max_size_bytes:
+                    rows = self._connection.execute(
+                        "SELECT key, size FROM ge_metric_cache ORDER BY accessed_at ASC"
+                    ).fetchall()
+                    keys_to_evict = []
+                    for key, size in rows:
+                        if total_size <= self._max_size_bytes:
+                            break
+                        keys_to_evict.append((key,))
+                        total_size -= size
+                    self._connection.executemany(
+                        "DELETE FROM ge_metric_cache WHERE key = ?", keys_to_evict
+                    )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM ge_metric_cache")
+
+    def __len__(self):
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM ge_metric_cache"
+        ).fetchone()
+        return count
+
+
+class FilesystemMetricCache(MetricCache):
+    """A MetricCache persisted as one file per entry in a local directory.
+
+    The modification time of each file records its last access and drives least recently used eviction; the creation
+    time used for ttl_seconds is stored alongside the value.
+    """
+
+    FILE_SUFFIX = ".metric.pkl"
+
+    def __init__(
+        self,
+        base_directory: str,
+        max_entries: Optional[int] = None,
+        max_size_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._base_directory = base_directory
+        self._max_size_bytes = max_size_bytes
+        os.makedirs(base_directory, exist_ok=True)
+
+    @property
+    def base_directory(self) -> str:
+        return self._base_directory
+
+    @property
+    def max_size_bytes(self) -> Optional[int]:
+        return self._max_size_bytes
+
+    def _get_filepath(self, key: str) -> str:
+        return os.path.join(self._base_directory, key + self.FILE_SUFFIX)
+
+    def _get(self, key: str) -> Any:
+        filepath = self._get_filepath(key)
+        try:
+            with open(filepath, "rb") as infile:
+                created_at, value = pickle.load(infile)
+        except FileNotFoundError:
+            raise KeyError(key)
+        except Exception as e:
+            # E.g. a truncated entry, or one written by a version of a class that can no longer be loaded.
+            logger.debug(f"Unable to load cached metric value for key {key}: {e}")
+            self._remove(filepath)
+            raise KeyError(key)
+        if self._is_expired(created_at):
+            self._remove(filepath)
+            raise KeyError(key)
+        os.utime(filepath)
+        return value
+
+    def _set(self, key: str, value: Any) -> None:
+        filepath = self._get_filepath(key)
+        temp_filepath = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_filepath, "wb") as outfile:
+                pickle.dump((time.time(), value), outfile, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_filepath, filepath)
+        except Exception:
+            self._remove(temp_filepath)
+            raise
+
+    def _list_entries(self):
+        entries = []
+        with os.scandir(self._base_directory) as it:
+            for entry in it:
+                if entry.name.endswith(self.FILE_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(entries)
+
+    @staticmethod
+    def _remove(filepath: str) -> None:
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        if (
+            self._max_entries is None
+            and self._max_size_bytes is None
+            and self._ttl_seconds is None
+        ):
+            return
+        entries = self._list_entries()
+        if self._ttl_seconds is not None:
+            # The modification time is never earlier than the creation time, so an entry that has not been accessed
+            # within ttl_seconds has certainly expired.
+            cutoff = time.time() - self._ttl_seconds
+            expired = [entry for entry in entries if entry[0] < cutoff]
+            for _, _, filepath in expired:
+                self._remove(filepath)
+            entries = entries[len(expired) :]
+        if self._max_entries is not None and len(entries) > self._max_entries:
+            for _, _, filepath in entries[: len(entries) - self._max_entries]:
+                self._remove(filepath)
+            entries = entries[len(entries) - self._max_entries :]
+        if self._max_size_bytes is not None:
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, filepath in entries:
+                if total_size <= self._max_size_bytes:
+                    break
+                self._remove(filepath)
+                total_size -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            for _, _, filepath in self._list_entries():
+                self._remove(filepath)
+
+    def __len__(self):
+        return len(self._list_entries())
@@ -1,12 +1,20 @@
+from typing import Optional
+
 import pandas as pd
 
 from great_expectations.execution_engine.execution_engine import BatchData
 
 
 class PandasBatchData(BatchData):
-    def __init__(self, execution_engine, dataframe: pd.DataFrame):
+    def __init__(
+        self,
+        execution_engine,
+        dataframe: pd.DataFrame,
+        fingerprint: Optional[str] = None,
+    ):
         super().__init__(execution_engine=execution_engine)
         self._dataframe = dataframe
+        self.fingerprint = fingerprint
 
     @property
     def dataframe(self):
@@ -8,8 +8,9 @@ import random
 import warnings
 from functools import partial
 from io import BytesIO
-from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as ge_exceptions
@@ -22,10 +23,16 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
+from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    DomainRecordsCache,
+    MetricDomainTypes,
+)
 from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.expectations.registry import get_metric_provider
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +66,8 @@ except ImportError:
 
 
 HASH_THRESHOLD = 1e9
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES = 32
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 256 * 2 ** 20
 
 
 class PandasExecutionEngine(ExecutionEngine):
@@ -104,6 +113,13 @@ Notes:
         self.discard_subset_failing_expectations = kwargs.pop(
             "discard_subset_failing_expectations", False
         )
+        domain_records_cache_max_entries: int = kwargs.pop(
+            "domain_records_cache_max_entries",
+            DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
+        )
+        domain_records_cache_max_bytes: int = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+        )
         boto3_options: dict = kwargs.pop("boto3_options", {})
         azure_options: dict = kwargs.pop("azure_options", {})
         gcs_options: dict = kwargs.pop("gcs_options", {})
@@ -142,6 +158,15 @@ Notes:
 
         super().__init__(*args, **kwargs)
 
+        # DataFrames filtered by a row_condition (or by ignore_row_if) are retained, up to the given number of entries
+        # and total memory usage, so that metrics sharing a compute domain do not each re-run the filter.
+        if self._caching and domain_records_cache_max_entries:
+            self._domain_records_cache = DomainRecordsCache(
+                max_entries=domain_records_cache_max_entries,
+                max_bytes=domain_records_cache_max_bytes,
+                sizeof=lambda df: int(df.memory_usage(index=True).sum()),
+            )
+
         self._config.update(
             {
                 "discard_subset_failing_expectations": self.discard_subset_failing_expectations,
@@ -150,6 +175,14 @@ Notes:
                 "gcs_options": gcs_options,
             }
         )
+        if domain_records_cache_max_entries != DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES:
+            self._config[
+                "domain_records_cache_max_entries"
+            ] = domain_records_cache_max_entries
+        if domain_records_cache_max_bytes != DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES:
+            self._config[
+                "domain_records_cache_max_bytes"
+            ] = domain_records_cache_max_bytes
 
     def configure_validator(self, validator):
         super().configure_validator(validator)
@@ -166,6 +199,18 @@ Notes:
             )
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def get_batch_fingerprint(self, batch_id: str) -> Optional[str]:
+        """Returns the pandas_data_fingerprint of the loaded batch, hashing the dataframe on first use if the batch was
+        not loaded through get_batch_data_and_markers."""
+        batch_data = self.loaded_batch_data_dict.get(batch_id)
+        if batch_data is None:
+            return None
+        if batch_data.fingerprint is None:
+            df = batch_data.dataframe
+            if df.memory_usage().sum() < HASH_THRESHOLD:
+                batch_data.fingerprint = hash_pandas_dataframe(df)
+        return batch_data.fingerprint
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:  # batch_data
@@ -282,7 +327,11 @@ Please check your config."""
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
 
-        typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
+        typed_batch_data = PandasBatchData(
+            execution_engine=self,
+            dataframe=df,
+            fingerprint=batch_markers.get("pandas_data_fingerprint"),
+        )
 
         return typed_batch_data, batch_markers
 
@@ -380,6 +429,152 @@ Please check your config."""
             f'Unable to determine reader method from path: "{path}".'
         )
 
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Dict[Tuple, Any] = None,
+        runtime_configuration: dict = None,
+    ) -> dict:
+        """Resolves the given metrics as ExecutionEngine.resolve_metrics does, except that column aggregate metrics
+        (those defined with the column_aggregate_value decorator) are resolved together as a bundle: see
+        resolve_column_aggregate_bundle."""
+        if metrics is None:
+            metrics = {}
+
+        column_aggregate_bundle = []
+        other_metrics_to_resolve = []
+        for metric_to_resolve in metrics_to_resolve:
+            metric_class, metric_fn = get_metric_provider(
+                metric_name=metric_to_resolve.metric_name, execution_engine=self
+            )
+            if getattr(metric_fn, "compute_on_domain_records", None) is None:
+                other_metrics_to_resolve.append(metric_to_resolve)
+                continue
+            try:
+                metric_dependencies = {
+                    k: metrics[v.id]
+                    for k, v in metric_to_resolve.metric_dependencies.items()
+                }
+            except KeyError as e:
+                raise ge_exceptions.GreatExpectationsError(
+                    f"Missing metric dependency: {str(e)}"
+                )
+            column_aggregate_bundle.append(
+                (metric_to_resolve, metric_class, metric_fn, metric_dependencies)
+            )
+
+        resolved_metrics = super().resolve_metrics(
+            metrics_to_resolve=other_metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        if len(column_aggregate_bundle) > 0:
+            bundle_resolved_metrics = self.resolve_column_aggregate_bundle(
+                column_aggregate_bundle
+            )
+            self._cache_resolved_metrics(
+                [metric for metric, _, _, _ in column_aggregate_bundle],
+                bundle_resolved_metrics,
+            )
+            resolved_metrics.update(bundle_resolved_metrics)
+
+        return resolved_metrics
+
+    def resolve_column_aggregate_bundle(
+        self,
+        column_aggregate_bundle: Iterable[
+            Tuple[MetricConfiguration, Any, Callable, Dict[str, Any]]
+        ],
+    ) -> dict:
+        """Resolves column aggregate metrics in one pass per compute domain.
+
+        The records of each distinct compute domain (the domain kwargs without "column") are materialized only once.
+        Metrics that declare a dataframe_reduction are then computed with a single DataFrame reduction over all of the
+        requested columns sharing a NumPy dtype; all other metrics are computed column by column on the shared records.
+
+            Args:
+                column_aggregate_bundle (Iterable[Tuple[MetricConfiguration, MetricProvider, Callable, dict]]): \
+                    for each metric, its MetricConfiguration, its MetricProvider class, its column_aggregate_value \
+                    provider function, and its resolved metric dependencies
+
+            Returns:
+                A dictionary of metric ids and their corresponding values.
+        """
+        resolved_metrics = {}
+
+        domains: Dict[str, dict] = {}
+        for (
+            metric_to_resolve,
+            metric_class,
+            metric_fn,
+            metric_dependencies,
+        ) in column_aggregate_bundle:
+            compute_domain_kwargs = IDDict(
+                {
+                    k: v
+                    for k, v in metric_to_resolve.metric_domain_kwargs.items()
+                    if k != "column"
+                }
+            )
+            domain_id = compute_domain_kwargs.to_id()
+            if domain_id not in domains:
+                domains[domain_id] = {
+                    "domain_kwargs": compute_domain_kwargs,
+                    "metrics": [],
+                }
+            domains[domain_id]["metrics"].append(
+                (metric_to_resolve, metric_class, metric_fn, metric_dependencies)
+            )
+
+        for domain in domains.values():
+            df = self.get_domain_records(domain_kwargs=domain["domain_kwargs"])
+
+            # Group the vectorizable metrics by reduction and column dtype, so that each group is a homogeneous block.
+            reductions: Dict[Tuple[str, np.dtype], dict] = {}
+            for (
+                metric_to_resolve,
+                metric_class,
+                metric_fn,
+                metric_dependencies,
+            ) in domain["metrics"]:
+                column_name = metric_to_resolve.metric_domain_kwargs["column"]
+                dataframe_reduction = metric_fn.dataframe_reduction
+                if (
+                    dataframe_reduction is not None
+                    and len(metric_to_resolve.metric_value_kwargs) == 0
+                    and column_name in metric_dependencies.get("table.columns", ())
+                    and _is_vectorizable_dtype(df[column_name].dtype)
+                ):
+                    group = reductions.setdefault(
+                        (dataframe_reduction, df[column_name].dtype), {}
+                    )
+                    group.setdefault(column_name, []).append(metric_to_resolve.id)
+                    continue
+
+                resolved_metrics[
+                    metric_to_resolve.id
+                ] = metric_fn.compute_on_domain_records(
+                    metric_class,
+                    df=df,
+                    column_name=column_name,
+                    metric_value_kwargs=metric_to_resolve.metric_value_kwargs,
+                    metrics=metric_dependencies,
+                )
+
+            for (dataframe_reduction, _), metric_ids_by_column in reductions.items():
+                column_names = list(metric_ids_by_column.keys())
+                values = getattr(df[column_names], dataframe_reduction)()
+                for idx, column_name in enumerate(column_names):
+                    for metric_id in metric_ids_by_column[column_name]:
+                        resolved_metrics[metric_id] = values.iloc[idx]
+
+            logger.debug(
+                f"PandasExecutionEngine computed {len(domain['metrics'])} column aggregate metrics on domain_id "
+                f"{domain['domain_kwargs'].to_id()}"
+            )
+
+        return resolved_metrics
+
     def get_domain_records(
         self,
         domain_kwargs: dict,
@@ -417,6 +612,16 @@ Please check your config."""
                     f"Unable to find batch with batch_id {batch_id}"
                 )
 
+        return self._get_or_filter_domain_records(
+            batch_id=batch_id if batch_id is not None else self.active_batch_data_id,
+            data=data,
+            domain_kwargs=domain_kwargs,
+            filter_fn=self._filter_domain_records,
+        )
+
+    @staticmethod
+    def _filter_domain_records(data: pd.DataFrame, domain_kwargs: dict) -> pd.DataFrame:
+        """Applies the row_condition and ignore_row_if directives of domain_kwargs to the batch DataFrame."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -762,6 +967,16 @@ Please check your config."""
         return df[matches]
 
 
+def _is_vectorizable_dtype(dtype) -> bool:
+    """Whether DataFrame reductions over columns of this dtype return the same values (and types) as the
+    corresponding Series reductions."""
+    return (
+        isinstance(dtype, np.dtype)
+        and pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_bool_dtype(dtype)
+    )
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
@@ -20,7 +20,10 @@ from great_expectations.core.id_dict import IDDict
 from great_expectations.core.util import AzureUrl, get_or_create_spark_application
 from great_expectations.exceptions import exceptions as ge_exceptions
 from great_expectations.execution_engine import ExecutionEngine
-from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.execution_engine import (
+    DomainRecordsCache,
+    MetricDomainTypes,
+)
 
 from ..exceptions import (
     BatchSpecError,
@@ -34,6 +37,8 @@ from .sparkdf_batch_data import SparkDFBatchData
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES = 8
+
 try:
     import pyspark
     import pyspark.sql.functions as F
@@ -155,6 +160,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
         persist=True,
         spark_config=None,
         force_reuse_spark_context=False,
+        domain_records_cache_max_entries=DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
         **kwargs,
     ):
         # Creation of the Spark DataFrame is done outside this class
@@ -179,6 +185,15 @@ class SparkDFExecutionEngine(ExecutionEngine):
 
         super().__init__(*args, **kwargs)
 
+        # Filtered DataFrames are retained (and, if persist is True, persisted until they are evicted) so that metrics
+        # sharing a compute domain do not each re-evaluate the filter.
+        if self._caching and domain_records_cache_max_entries:
+            self._domain_records_cache = DomainRecordsCache(
+                max_entries=domain_records_cache_max_entries,
+                on_insert=lambda df: df.persist() if self._persist else None,
+                on_evict=lambda df: df.unpersist() if self._persist else None,
+            )
+
         self._config.update(
             {
                 "persist": self._persist,
@@ -186,6 +201,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "azure_options": azure_options,
             }
         )
+        if domain_records_cache_max_entries != DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES:
+            self._config[
+                "domain_records_cache_max_entries"
+            ] = domain_records_cache_max_entries
 
     @property
     def dataframe(self):
@@ -398,6 +417,16 @@ Please check your config."""
             else:
                 raise ValidationError(f"Unable to find batch with batch_id {batch_id}")
 
+        return self._get_or_filter_domain_records(
+            batch_id=batch_id if batch_id is not None else self.active_batch_data_id,
+            data=data,
+            domain_kwargs=domain_kwargs,
+            filter_fn=self._filter_domain_records,
+        )
+
+    @staticmethod
+    def _filter_domain_records(data: DataFrame, domain_kwargs: dict) -> DataFrame:
+        """Applies the row_condition and ignore_row_if directives of domain_kwargs to the batch DataFrame."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
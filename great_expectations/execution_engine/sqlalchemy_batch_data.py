@@ -37,6 +37,8 @@ class SqlAlchemyBatchData(BatchData):
         use_quoted_name: bool = False,
         source_table_name: str = None,
         source_schema_name: str = None,
+        split_expression=None,
+        split_value=None,
     ):
         """A Constructor used to initialize and SqlAlchemy Batch, create an id for it, and verify that all necessary
         parameters have been provided. If a Query is given, also builds a temporary table for this query
@@ -73,6 +75,12 @@ class SqlAlchemyBatchData(BatchData):
                 source_schema_name (str): \
                     For SqlAlchemyBatchData based on selectables, source_schema_name provides the name of the schema on which
                     the selectable is based. This is required for most kinds of table introspection (e.g. looking up column types)
+                split_expression (ColumnElement or None): \
+                    For SqlAlchemyBatchData based on selectables that select the rows of a source table for which an expression
+                    equals a value, split_expression provides that expression. It allows metrics of several batches of the same
+                    source table to be computed in one query, grouped by the expression.
+                split_value (Any): \
+                    The value of split_expression for the rows of the batch.
 
         The query that will be executed against the DB can be determined in any of three ways:
 
@@ -99,6 +107,8 @@ class SqlAlchemyBatchData(BatchData):
         self._use_quoted_name = use_quoted_name
         self._source_table_name = source_table_name
         self._source_schema_name = source_schema_name
+        self._split_expression = split_expression
+        self._split_value = split_value
 
         if sum(bool(x) for x in [table_name, query, selectable is not None]) != 1:
             raise ValueError(
@@ -183,6 +193,14 @@ class SqlAlchemyBatchData(BatchData):
     def source_schema_name(self):
         return self._source_schema_name
 
+    @property
+    def split_expression(self):
+        return self._split_expression
+
+    @property
+    def split_value(self):
+        return self._split_value
+
     @property
     def selectable(self):
         return self._selectable
@@ -1,6 +1,8 @@
+import concurrent.futures
 import copy
 import datetime
 import logging
+import threading
 import traceback
 import warnings
 from pathlib import Path
@@ -50,16 +52,25 @@ try:
     from sqlalchemy.engine import reflection
     from sqlalchemy.engine.default import DefaultDialect
     from sqlalchemy.engine.url import URL
-    from sqlalchemy.exc import OperationalError
-    from sqlalchemy.sql import Selectable
-    from sqlalchemy.sql.elements import TextClause, quoted_name
+    from sqlalchemy.exc import OperationalError, SQLAlchemyError
+    from sqlalchemy.sql import Selectable, operators
+    from sqlalchemy.sql.elements import (
+        BinaryExpression,
+        BindParameter,
+        TextClause,
+        quoted_name,
+    )
 except ImportError:
     reflection = None
     DefaultDialect = None
     Selectable = None
+    operators = None
+    BinaryExpression = None
+    BindParameter = None
     TextClause = None
     quoted_name = None
     OperationalError = None
+    SQLAlchemyError = None
 
 
 try:
@@ -162,6 +173,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url=None,
         batch_data_dict=None,
         create_temp_table=True,
+        connection_scope=None,
+        max_concurrent_queries=None,
         **kwargs,  # These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
     ):
         """Builds a SqlAlchemyExecutionEngine, using a provided connection string/url/engine/credentials to access the
@@ -188,7 +201,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     If neither the engines, the credentials, nor the connection_string have been provided,
                     a url can be used to access the data. This will be overridden by all other configuration
                     options if any are provided.
+                connection_scope (string): \
+                    How connections to the database are used:
+                    "session" -- a single connection is opened, and used for all queries for the lifetime of the
+                    SqlAlchemyExecutionEngine, so that temporary tables remain available (the default for sqlite, mssql,
+                    snowflake and mysql);
+                    "pool" -- every query checks a connection out of the pool of the engine (the default otherwise);
+                    "thread" -- every thread opens a connection out of the pool of the engine, and keeps using it, so that
+                    metrics can be resolved concurrently (temporary tables are only available on the connection that
+                    creates them, so this requires create_temp_table to be False).
+                    The pool itself is configured with the keyword arguments of sqlalchemy.create_engine (e.g.,
+                    pool_size, max_overflow, pool_recycle and pool_pre_ping).
+                max_concurrent_queries (int): \
+                    With the "thread" connection_scope, the maximum number of bundled metric queries (one for each
+                    domain) that are executed concurrently, each on the connection of its thread (by default, queries
+                    are executed one at a time).
         """
+        self._connection_scope = None
+
         super().__init__(name=name, batch_data_dict=batch_data_dict)
         self._name = name
 
@@ -244,20 +274,50 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         else:
             self.dialect_module = None
 
+        scope = connection_scope
+        if scope is None:
+            scope = (
+                "session"
+                if self.engine.dialect.name.lower()
+                in [
+                    "sqlite",
+                    "mssql",
+                    "snowflake",
+                    "mysql",
+                ]
+                else "pool"
+            )
+        if scope not in ["session", "pool", "thread"]:
+            raise InvalidConfigError(
+                f'Unknown connection_scope "{scope}"; it must be one of "session", "pool" or "thread".'
+            )
+        if scope == "thread" and create_temp_table:
+            raise InvalidConfigError(
+                'The "thread" connection_scope requires create_temp_table to be False, because temporary tables are '
+                "only available on the connection that creates them."
+            )
+        if (max_concurrent_queries or 1) > 1 and scope != "thread":
+            raise InvalidConfigError(
+                'Queries can only be executed concurrently with the "thread" connection_scope.'
+            )
+        self._max_concurrent_queries = max_concurrent_queries or 1
+        self._query_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+        # Connections of the "thread" connection_scope, by thread.
+        self._thread_connections: Dict[threading.Thread, Any] = {}
+        self._thread_connections_lock = threading.Lock()
+
         # <WILL> 20210726 - engine_backup is used by the snowflake connector, which requires connection and engine
         # to be closed and disposed separately. Currently self.engine can refer to either a Connection or Engine,
         # depending on the backend. This will need to be cleaned up in an upcoming refactor, so that Engine and
         # Connection can be handled separately.
         self._engine_backup = None
-        if self.engine and self.engine.dialect.name.lower() in [
-            "sqlite",
-            "mssql",
-            "snowflake",
-            "mysql",
-        ]:
+        if scope in ["session", "thread"]:
             self._engine_backup = self.engine
-            # sqlite/mssql temp tables only persist within a connection so override the engine
-            self.engine = self.engine.connect()
+            if scope == "session":
+                # sqlite/mssql temp tables only persist within a connection so override the engine
+                self.engine = self.engine.connect()
+        self._connection_scope = scope
 
         # Send a connect event to provide dialect type
         if data_context is not None and getattr(
@@ -285,12 +345,47 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "connection_scope": connection_scope,
+            "max_concurrent_queries": max_concurrent_queries,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    @property
+    def engine(self):
+        """The SqlAlchemy Engine, or Connection (depending on the connection_scope), with which queries are executed."""
+        if self._connection_scope == "thread":
+            return self._get_thread_connection()
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine):
+        self._engine = engine
+
+    @property
+    def connection_scope(self) -> str:
+        return self._connection_scope
+
+    def _get_thread_connection(self) -> "sa.engine.Connection":
+        current_thread: threading.Thread = threading.current_thread()
+        with self._thread_connections_lock:
+            connection = self._thread_connections.get(current_thread)
+            if connection is not None and not connection.closed:
+                return connection
+
+            # Connections of threads that have finished are returned to the pool.
+            thread: threading.Thread
+            for thread in [
+                thread for thread in self._thread_connections if not thread.is_alive()
+            ]:
+                self._thread_connections.pop(thread).close()
+
+            connection = self._engine_backup.connect()
+            self._thread_connections[current_thread] = connection
+            return connection
+
     @property
     def credentials(self):
         return self._credentials
@@ -731,39 +826,182 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 queries[domain_id] = {
                     "select": [],
                     "ids": [],
+                    "signature": [],
                     "domain_kwargs": compute_domain_kwargs,
                 }
             queries[domain_id]["select"].append(
                 engine_fn.label(metric_to_resolve.metric_name)
             )
             queries[domain_id]["ids"].append(metric_to_resolve.id)
-        for query in queries.values():
-            domain_kwargs = query["domain_kwargs"]
-            selectable = self.get_domain_records(
-                domain_kwargs=domain_kwargs,
+            queries[domain_id]["signature"].append(
+                (
+                    metric_to_resolve.metric_name,
+                    IDDict(accessor_domain_kwargs).to_id(),
+                    metric_to_resolve.metric_value_kwargs_id,
+                )
             )
-            assert len(query["select"]) == len(query["ids"])
+
+        resolved_metrics.update(
+            self._resolve_metric_bundle_queries_grouped_by_split(queries=queries)
+        )
+
+        if self._max_concurrent_queries > 1 and len(queries) > 1:
+            # Each query is executed on the connection of the thread of the executor that runs it.
+            if self._query_executor is None:
+                self._query_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self._max_concurrent_queries
+                )
+            for query_resolved_metrics in self._query_executor.map(
+                self._resolve_bundled_query, queries.values()
+            ):
+                resolved_metrics.update(query_resolved_metrics)
+        else:
+            for query in queries.values():
+                resolved_metrics.update(self._resolve_bundled_query(query=query))
+
+        return resolved_metrics
+
+    def _resolve_bundled_query(self, query: dict) -> dict:
+        resolved_metrics = {}
+
+        domain_kwargs = query["domain_kwargs"]
+        selectable = self.get_domain_records(
+            domain_kwargs=domain_kwargs,
+        )
+        assert len(query["select"]) == len(query["ids"])
+        try:
+            res = self.engine.execute(
+                sa.select(query["select"]).select_from(selectable)
+            ).fetchall()
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+            )
+        except OperationalError as oe:
+            exception_message: str = "An SQL execution Exception occurred.  "
+            exception_traceback: str = traceback.format_exc()
+            exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
+            logger.error(exception_message)
+            raise ExecutionEngineError(message=exception_message)
+        assert (
+            len(res) == 1
+        ), "all bundle-computed metrics must be single-value statistics"
+        assert len(query["ids"]) == len(res[0]), "unexpected number of metrics returned"
+        for idx, id in enumerate(query["ids"]):
+            resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+
+        return resolved_metrics
+
+    def _resolve_metric_bundle_queries_grouped_by_split(
+        self, queries: Dict[Tuple, dict]
+    ) -> dict:
+        """Resolves the bundled queries of batches that were split from the same source table in one query per group.
+
+        The queries of whole batches (with no row_condition or other domain restrictions) whose batch data selects the
+        rows of a source table for which a split expression equals a value, and which compute the same metrics, are
+        executed as one query against the source table, grouped by the split expression.  The queries that are resolved
+        this way are removed from queries; the others are left to be executed one domain at a time.
+
+            Args:
+                queries (Dict[Tuple, dict]): the bundled queries of resolve_metric_bundle, keyed by domain id
+
+            Returns:
+                A dictionary of metric ids and their corresponding now-queried values.
+        """
+        resolved_metrics = {}
+
+        groups: Dict[Tuple, List[Tuple[Tuple, SqlAlchemyBatchData]]] = {}
+        for domain_id, query in queries.items():
+            domain_kwargs: IDDict = query["domain_kwargs"]
+            batch_id: Optional[str] = domain_kwargs.get("batch_id")
+            if batch_id is None or any(
+                value is not None
+                for key, value in domain_kwargs.items()
+                if key != "batch_id"
+            ):
+                continue
+
+            batch_data = self.loaded_batch_data_dict.get(batch_id)
+            if (
+                not isinstance(batch_data, SqlAlchemyBatchData)
+                or batch_data.split_expression is None
+                or batch_data.source_table_name is None
+            ):
+                continue
+
+            try:
+                # Batches split on the same expression of the same table share a group, however the expression was built.
+                split_expression_key: str = str(
+                    batch_data.split_expression.compile(
+                        dialect=self.engine.dialect,
+                        compile_kwargs={"literal_binds": True},
+                    )
+                )
+                hash(batch_data.split_value)
+            except Exception:
+                continue
+
+            group_key: Tuple = (
+                batch_data.source_schema_name,
+                batch_data.source_table_name,
+                split_expression_key,
+                tuple(sorted(query["signature"], key=repr)),
+            )
+            groups.setdefault(group_key, []).append((domain_id, batch_data))
+
+        for group in groups.values():
+            if len(group) < 2:
+                continue
+
+            first_domain_id, first_batch_data = group[0]
+            split_expression = first_batch_data.split_expression
+            split_value_label: str = "__ge_split_value"
             try:
                 res = self.engine.execute(
-                    sa.select(query["select"]).select_from(selectable)
+                    sa.select(
+                        [split_expression.label(split_value_label)]
+                        + queries[first_domain_id]["select"]
+                    )
+                    .select_from(
+                        sa.table(
+                            first_batch_data.source_table_name,
+                            schema=first_batch_data.source_schema_name,
+                        )
+                    )
+                    .where(
+                        split_expression.in_(
+                            [batch_data.split_value for _, batch_data in group]
+                        )
+                    )
+                    .group_by(split_expression)
                 ).fetchall()
+            except SQLAlchemyError as e:
                 logger.debug(
-                    f"SqlAlchemyExecutionEngine computed {len(res[0])} metrics on domain_id {IDDict(domain_kwargs).to_id()}"
+                    f"SqlAlchemyExecutionEngine could not group metrics by split; computing them by batch instead: {e}"
                 )
-            except OperationalError as oe:
-                exception_message: str = "An SQL execution Exception occurred.  "
-                exception_traceback: str = traceback.format_exc()
-                exception_message += f'{type(oe).__name__}: "{str(oe)}".  Traceback: "{exception_traceback}".'
-                logger.error(exception_message)
-                raise ExecutionEngineError(message=exception_message)
-            assert (
-                len(res) == 1
-            ), "all bundle-computed metrics must be single-value statistics"
-            assert len(query["ids"]) == len(
-                res[0]
-            ), "unexpected number of metrics returned"
-            for idx, id in enumerate(query["ids"]):
-                resolved_metrics[id] = convert_to_json_serializable(res[0][idx])
+                continue
+
+            rows_by_split_value: Dict[Any, Any] = {row[0]: row for row in res}
+            # The metrics of each batch are selected in the order of the first batch, following the split value.
+            column_index_by_signature: Dict[Tuple, int] = {
+                signature: idx + 1
+                for idx, signature in enumerate(queries[first_domain_id]["signature"])
+            }
+            for domain_id, batch_data in group:
+                row = rows_by_split_value.get(batch_data.split_value)
+                if row is None or len(row) != len(column_index_by_signature) + 1:
+                    # Empty batches, split values that the database returns in another form, and rows that do not hold
+                    # one value per metric are queried by batch.
+                    continue
+
+                query: dict = queries.pop(domain_id)
+                for signature, id in zip(query["signature"], query["ids"]):
+                    resolved_metrics[id] = convert_to_json_serializable(
+                        row[column_index_by_signature[signature]]
+                    )
+
+            logger.debug(
+                f"SqlAlchemyExecutionEngine computed metrics of {len(group)} batches of table {first_batch_data.source_table_name} in one query"
+            )
 
         return resolved_metrics
 
@@ -785,7 +1023,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """
-        if self._engine_backup:
+        if self._query_executor is not None:
+            self._query_executor.shutdown()
+            self._query_executor = None
+
+        if self._connection_scope == "thread":
+            with self._thread_connections_lock:
+                for connection in self._thread_connections.values():
+                    connection.close()
+                self._thread_connections = {}
+            self._engine_backup.dispose()
+        elif self._engine_backup:
             self.engine.close()
             self._engine_backup.dispose()
         else:
@@ -983,6 +1231,28 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             .where(split_clause)
         )
 
+    def _get_split_expression_and_value(self, batch_spec) -> Tuple[Any, Any]:
+        """Returns the expression and value of the split clause of batch_spec, if its batch selects the rows of its table for
+        which an expression equals a value (e.g. using _split_on_column_value or _split_on_converted_datetime) and is not
+        sampled, and (None, None) otherwise."""
+        if "splitter_method" not in batch_spec or "sampling_method" in batch_spec:
+            return None, None
+
+        splitter_fn = getattr(self, batch_spec["splitter_method"])
+        split_clause = splitter_fn(
+            table_name=batch_spec["table_name"],
+            batch_identifiers=batch_spec["batch_identifiers"],
+            **batch_spec["splitter_kwargs"],
+        )
+        if (
+            isinstance(split_clause, BinaryExpression)
+            and split_clause.operator is operators.eq
+            and isinstance(split_clause.right, BindParameter)
+        ):
+            return split_clause.left, split_clause.right.value
+
+        return None, None
+
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[Any, BatchMarkers]:
@@ -1038,15 +1308,24 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     batch_spec=batch_spec
                 )
 
+            create_temp_table: bool = batch_spec.get(
+                "create_temp_table", self._create_temp_table
+            )
+            split_expression, split_value = (
+                (None, None)
+                if create_temp_table
+                else self._get_split_expression_and_value(batch_spec=batch_spec)
+            )
+
             batch_data = SqlAlchemyBatchData(
                 execution_engine=self,
                 selectable=selectable,
                 temp_table_name=temp_table_name,
-                create_temp_table=batch_spec.get(
-                    "create_temp_table", self._create_temp_table
-                ),
+                create_temp_table=create_temp_table,
                 source_table_name=source_table_name,
                 source_schema_name=source_schema_name,
+                split_expression=split_expression,
+                split_value=split_value,
             )
 
         return batch_data, batch_markers
@@ -8,6 +8,7 @@ from great_expectations.expectations.util import render_evaluation_parameter_str
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.types import RenderedStringTemplateContent
 from great_expectations.render.util import num_to_str, substitute_none_for_missing
+from great_expectations.validator.validation_graph import MetricConfiguration
 
 
 class ExpectTableRowCountToEqualOtherTable(TableExpectation):
@@ -137,13 +138,18 @@ class ExpectTableRowCountToEqualOtherTable(TableExpectation):
             configuration, execution_engine, runtime_configuration
         )
         other_table_name = configuration.kwargs.get("other_table_name")
-        # create copy of table.row_count metric and modify "table" metric domain kwarg to be other table name
-        table_row_count_metric_config_other = deepcopy(
-            dependencies["metrics"]["table.row_count"]
+        # create copy of table.row_count metric with "table" metric domain kwarg set to other table name
+        table_row_count_metric_config_self = dependencies["metrics"]["table.row_count"]
+        table_row_count_metric_config_other = MetricConfiguration(
+            metric_name=table_row_count_metric_config_self.metric_name,
+            metric_domain_kwargs={
+                **deepcopy(table_row_count_metric_config_self.metric_domain_kwargs),
+                "table": other_table_name,
+            },
+            metric_value_kwargs=deepcopy(
+                table_row_count_metric_config_self.metric_value_kwargs
+            ),
         )
-        table_row_count_metric_config_other.metric_domain_kwargs[
-            "table"
-        ] = other_table_name
         # rename original "table.row_count" metric to "table.row_count.self"
         dependencies["metrics"]["table.row_count.self"] = dependencies["metrics"].pop(
             "table.row_count"
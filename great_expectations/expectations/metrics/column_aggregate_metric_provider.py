@@ -40,6 +40,10 @@ def column_aggregate_value(
     Args:
         engine:
         **kwargs:
+            filter_column_isnull: if True, null values are removed from the column before the metric is computed
+            dataframe_reduction: the name of a DataFrame reduction (e.g. "max") that is equivalent to the metric; if
+                provided, PandasExecutionEngine computes the metric for many columns of the same compute domain
+                at once
 
     Returns:
 
@@ -47,30 +51,17 @@ def column_aggregate_value(
     if issubclass(engine, PandasExecutionEngine):
 
         def wrapper(metric_fn: Callable):
-            @metric_value(
-                engine=PandasExecutionEngine,
-                metric_fn_type=metric_fn_type,
-                domain_type=domain_type,
-            )
-            @wraps(metric_fn)
-            def inner_func(
+            def compute_on_domain_records(
                 cls,
-                execution_engine: PandasExecutionEngine,
-                metric_domain_kwargs: Dict,
+                df,
+                column_name: str,
                 metric_value_kwargs: Dict,
                 metrics: Dict[str, Any],
-                runtime_configuration: Dict,
             ):
                 filter_column_isnull = kwargs.get(
                     "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
                 )
 
-                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
-                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
-                )
-
-                column_name = accessor_domain_kwargs["column"]
-
                 if column_name not in metrics["table.columns"]:
                     raise ge_exceptions.ExecutionEngineError(
                         message=f'Error: The column "{column_name}" in BatchData does not exist.'
@@ -86,6 +77,36 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            @metric_value(
+                engine=PandasExecutionEngine,
+                metric_fn_type=metric_fn_type,
+                domain_type=domain_type,
+            )
+            @wraps(metric_fn)
+            def inner_func(
+                cls,
+                execution_engine: PandasExecutionEngine,
+                metric_domain_kwargs: Dict,
+                metric_value_kwargs: Dict,
+                metrics: Dict[str, Any],
+                runtime_configuration: Dict,
+            ):
+                df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+                    domain_kwargs=metric_domain_kwargs, domain_type=domain_type
+                )
+
+                return compute_on_domain_records(
+                    cls,
+                    df=df,
+                    column_name=accessor_domain_kwargs["column"],
+                    metric_value_kwargs=metric_value_kwargs,
+                    metrics=metrics,
+                )
+
+            # These allow PandasExecutionEngine to resolve column aggregates that share a compute domain together,
+            # materializing the domain records only once (see PandasExecutionEngine.resolve_metrics).
+            inner_func.compute_on_domain_records = compute_on_domain_records
+            inner_func.dataframe_reduction = kwargs.get("dataframe_reduction")
             return inner_func
 
         return wrapper
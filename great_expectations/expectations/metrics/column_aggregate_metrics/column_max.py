@@ -16,7 +16,7 @@ from great_expectations.expectations.metrics.import_manager import F, sa
 class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, dataframe_reduction="max")
     def _pandas(cls, column, **kwargs):
         return column.max()
 
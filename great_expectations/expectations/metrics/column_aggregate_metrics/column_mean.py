@@ -18,7 +18,7 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, dataframe_reduction="mean")
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         return column.mean()
@@ -19,7 +19,7 @@ from great_expectations.expectations.metrics.import_manager import F
 class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, dataframe_reduction="min")
     def _pandas(cls, column, **kwargs):
         return column.min()
 
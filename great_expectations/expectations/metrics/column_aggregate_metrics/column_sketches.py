@@ -0,0 +1,378 @@
+"""Approximate column metrics computed from mergeable sketches (see great_expectations.core.sketches).
+
+The sketches themselves are metrics as well, so they can be stored, and merged across batches, by the caller. None of
+the existing expectations use these metrics; they are alternatives to the exact metrics that can be requested
+explicitly when the exact metrics are too expensive to compute.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from great_expectations.core import ExpectationConfiguration
+from great_expectations.core.sketches import (
+    CountMinSketch,
+    HyperLogLogSketch,
+    KLLSketch,
+)
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+)
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_partial,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.import_manager import F, sa
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.validator.validation_graph import MetricConfiguration
+
+
+def _build_sketch_with_spark(
+    execution_engine: SparkDFExecutionEngine,
+    metric_domain_kwargs: Dict,
+    new_sketch: Callable,
+):
+    """Builds a sketch of each partition of the non-null values of a column and merges the sketches."""
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        metric_domain_kwargs, MetricDomainTypes.COLUMN
+    )
+    column = accessor_domain_kwargs["column"]
+
+    def build_partition_sketch(rows):
+        yield new_sketch().update([row[0] for row in rows])
+
+    return (
+        df.select(column)
+        .where(F.col(column).isNotNull())
+        .rdd.mapPartitions(build_partition_sketch)
+        .fold(new_sketch(), lambda sketch, other: sketch.merge(other))
+    )
+
+
+class ColumnHyperLogLogSketch(ColumnAggregateMetricProvider):
+    """A HyperLogLogSketch of the non-null values of a column"""
+
+    metric_name = "column.hyperloglog_sketch"
+    value_keys = ("precision",)
+    default_kwarg_values = {"precision": 14}
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, precision=14, **kwargs):
+        return HyperLogLogSketch(precision=precision).update(column)
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        precision = metric_value_kwargs.get(
+            "precision", cls.default_kwarg_values["precision"]
+        )
+        return _build_sketch_with_spark(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            new_sketch=lambda: HyperLogLogSketch(precision=precision),
+        )
+
+
+class ColumnDistinctValuesApproxCount(ColumnAggregateMetricProvider):
+    """The approximate number of distinct non-null values of a column.
+
+    SqlAlchemyExecutionEngine uses the approximate distinct count function of the database, if it has one (ignoring
+    precision), and counts the distinct values exactly otherwise.
+    """
+
+    metric_name = "column.distinct_values.approx_count"
+    value_keys = ("precision",)
+    default_kwarg_values = {"precision": 14}
+    filter_column_isnull = True
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return round(metrics["column.hyperloglog_sketch"].estimate())
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(cls, column, _dialect, **kwargs):
+        dialect_name = _dialect.name.lower()
+        if dialect_name in ("bigquery", "snowflake", "mssql", "oracle"):
+            return sa.func.approx_count_distinct(column)
+        if dialect_name in ("presto", "trino"):
+            return sa.func.approx_distinct(column)
+        return sa.func.count(sa.distinct(column))
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return round(metrics["column.hyperloglog_sketch"].estimate())
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        if isinstance(
+            execution_engine, (PandasExecutionEngine, SparkDFExecutionEngine)
+        ):
+            dependencies["column.hyperloglog_sketch"] = MetricConfiguration(
+                metric_name="column.hyperloglog_sketch",
+                metric_domain_kwargs=metric.metric_domain_kwargs,
+                metric_value_kwargs={
+                    "precision": metric.metric_value_kwargs.get(
+                        "precision", cls.default_kwarg_values["precision"]
+                    ),
+                },
+            )
+
+        return dependencies
+
+
+class ColumnKLLSketch(ColumnAggregateMetricProvider):
+    """A KLLSketch of the non-null values of a numeric column"""
+
+    metric_name = "column.kll_sketch"
+    value_keys = ("k",)
+    default_kwarg_values = {"k": 200}
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, k=200, **kwargs):
+        return KLLSketch(k=k).update(column)
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        k = metric_value_kwargs.get("k", cls.default_kwarg_values["k"])
+        return _build_sketch_with_spark(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            new_sketch=lambda: KLLSketch(k=k),
+        )
+
+
+class _ColumnKLLSketchDependentMetricProvider(ColumnAggregateMetricProvider):
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.kll_sketch"] = MetricConfiguration(
+            metric_name="column.kll_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "k": metric.metric_value_kwargs.get(
+                    "k", ColumnKLLSketch.default_kwarg_values["k"]
+                ),
+            },
+        )
+
+        return dependencies
+
+
+class ColumnApproxQuantileValues(_ColumnKLLSketchDependentMetricProvider):
+    """The approximate quantiles of the non-null values of a numeric column"""
+
+    metric_name = "column.approx_quantile_values"
+    value_keys = ("quantiles", "k")
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.kll_sketch"].quantiles(metric_value_kwargs["quantiles"])
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.kll_sketch"].quantiles(metric_value_kwargs["quantiles"])
+
+
+class ColumnApproxMedian(_ColumnKLLSketchDependentMetricProvider):
+    """The approximate median of the non-null values of a numeric column"""
+
+    metric_name = "column.approx_median"
+    value_keys = ("k",)
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.kll_sketch"].quantiles([0.5])[0]
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return metrics["column.kll_sketch"].quantiles([0.5])[0]
+
+
+class ColumnCountMinSketch(ColumnAggregateMetricProvider):
+    """A CountMinSketch of the non-null values of a column"""
+
+    metric_name = "column.count_min_sketch"
+    value_keys = ("width", "depth")
+    default_kwarg_values = {"width": 2048, "depth": 5}
+    filter_column_isnull = True
+
+    @column_aggregate_value(engine=PandasExecutionEngine)
+    def _pandas(cls, column, width=2048, depth=5, **kwargs):
+        return CountMinSketch(width=width, depth=depth).update(column)
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        width = metric_value_kwargs.get("width", cls.default_kwarg_values["width"])
+        depth = metric_value_kwargs.get("depth", cls.default_kwarg_values["depth"])
+        return _build_sketch_with_spark(
+            execution_engine=execution_engine,
+            metric_domain_kwargs=metric_domain_kwargs,
+            new_sketch=lambda: CountMinSketch(width=width, depth=depth),
+        )
+
+
+class ColumnApproxValueCounts(ColumnAggregateMetricProvider):
+    """The approximate number of occurrences of each of the given values in a column, as a Series indexed by value.
+    The estimates are never lower than the actual counts."""
+
+    metric_name = "column.approx_value_counts"
+    value_keys = ("values", "width", "depth")
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: "PandasExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return cls._estimate_value_counts(
+            metrics["column.count_min_sketch"], metric_value_kwargs["values"]
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: "SparkDFExecutionEngine",
+        metric_domain_kwargs: Dict,
+        metric_value_kwargs: Dict,
+        metrics: Dict[Tuple, Any],
+        runtime_configuration: Dict,
+    ):
+        return cls._estimate_value_counts(
+            metrics["column.count_min_sketch"], metric_value_kwargs["values"]
+        )
+
+    @staticmethod
+    def _estimate_value_counts(sketch: CountMinSketch, values: list) -> pd.Series:
+        values = list(values)
+        return pd.Series(sketch.estimate(values), index=values)
+
+    @classmethod
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[Dict] = None,
+    ):
+        """Returns a dictionary of given metric names and their corresponding configuration,
+        specifying the metric types and their respective domains"""
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.count_min_sketch"] = MetricConfiguration(
+            metric_name="column.count_min_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                key: metric.metric_value_kwargs.get(key, default_value)
+                for key, default_value in ColumnCountMinSketch.default_kwarg_values.items()
+            },
+        )
+
+        return dependencies
@@ -31,7 +31,7 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, dataframe_reduction="std")
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         return column.std()
@@ -16,7 +16,7 @@ from great_expectations.expectations.metrics.import_manager import F, sa
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, dataframe_reduction="sum")
     def _pandas(cls, column, **kwargs):
         return column.sum()
 
@@ -1358,7 +1358,7 @@ def _pandas_map_condition_unexpected_count(
     return np.count_nonzero(metrics["unexpected_condition"][0])
 
 
-def _pandas_column_map_condition_values(
+def _pandas_map_condition_unexpected_records(
     cls,
     execution_engine: PandasExecutionEngine,
     metric_domain_kwargs: Dict,
@@ -1366,14 +1366,24 @@ def _pandas_column_map_condition_values(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    """Returns the records of the domain that do not meet the map condition, together with the compute and accessor
+    domain kwargs of the condition.
+
+    The domain is obtained and masked only once, so that the unexpected values, index list, value counts and rows
+    metrics of the same condition can all be read from the same records.
+    """
     (
         boolean_mapped_unexpected_values,
         compute_domain_kwargs,
         accessor_domain_kwargs,
     ) = metrics["unexpected_condition"]
+    """
+    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
+    with all of the available "domain_kwargs" keys.
+    """
+    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
     df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
+        domain_kwargs=domain_kwargs,
     )
 
     ###
@@ -1385,6 +1395,65 @@ def _pandas_column_map_condition_values(
         "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
     )
 
+    if "column" in accessor_domain_kwargs:
+        column_name = accessor_domain_kwargs["column"]
+
+        if column_name not in metrics["table.columns"]:
+            raise ge_exceptions.ExecutionEngineError(
+                message=f'Error: The column "{column_name}" in BatchData does not exist.'
+            )
+
+        if filter_column_isnull:
+            df = df[df[column_name].notnull()]
+
+    elif "column_list" in accessor_domain_kwargs:
+        column_list = accessor_domain_kwargs["column_list"]
+
+        for column_name in column_list:
+            if column_name not in metrics["table.columns"]:
+                raise ge_exceptions.ExecutionEngineError(
+                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
+                )
+
+    return (
+        df[boolean_mapped_unexpected_values],
+        compute_domain_kwargs,
+        accessor_domain_kwargs,
+    )
+
+
+def _pandas_get_map_condition_unexpected_records(
+    cls,
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Returns the "unexpected_records" dependency if it has been resolved, and computes the same value otherwise."""
+    if "unexpected_records" in metrics:
+        return metrics["unexpected_records"]
+    return _pandas_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
+
+
+def _pandas_column_map_condition_values(
+    cls,
+    execution_engine: PandasExecutionEngine,
+    metric_domain_kwargs: Dict,
+    metric_value_kwargs: Dict,
+    metrics: Dict[str, Any],
+    **kwargs,
+):
+    """Return values from the specified domain that match the map-style metric in the metrics dictionary."""
+    _, _, accessor_domain_kwargs = metrics["unexpected_condition"]
+
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
             """No "column" found in provided metric_domain_kwargs, but it is required for a column map metric
@@ -1392,19 +1461,16 @@ def _pandas_column_map_condition_values(
 """
         )
 
-    column_name = accessor_domain_kwargs["column"]
-
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.ExecutionEngineError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
-        )
-
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
+    unexpected_records, _, _ = _pandas_get_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
 
-    domain_values = df[column_name]
-
-    domain_values = domain_values[boolean_mapped_unexpected_values == True]
+    domain_values = unexpected_records[accessor_domain_kwargs["column"]]
 
     result_format = metric_value_kwargs["result_format"]
 
@@ -1688,57 +1754,21 @@ def _pandas_map_condition_index(
     metrics: Dict[str, Any],
     **kwargs,
 ):
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    unexpected_records, _, _ = _pandas_get_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.ExecutionEngineError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.ExecutionEngineError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
-
     if result_format["result_format"] == "COMPLETE":
-        return list(df.index)
+        return list(unexpected_records.index)
 
-    return list(df.index[: result_format["partial_unexpected_count"]])
+    return list(unexpected_records.index[: result_format["partial_unexpected_count"]])
 
 
 def _pandas_column_map_condition_value_counts(
@@ -1750,25 +1780,7 @@ def _pandas_column_map_condition_value_counts(
     **kwargs,
 ):
     """Returns respective value counts for distinct column values"""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    df = execution_engine.get_domain_records(
-        domain_kwargs=compute_domain_kwargs,
-    )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
-    )
-
-    column_name = accessor_domain_kwargs["column"]
+    _, _, accessor_domain_kwargs = metrics["unexpected_condition"]
 
     if "column" not in accessor_domain_kwargs:
         raise ValueError(
@@ -1777,37 +1789,35 @@ def _pandas_column_map_condition_value_counts(
 """
         )
 
-    if column_name not in metrics["table.columns"]:
-        raise ge_exceptions.ExecutionEngineError(
-            message=f'Error: The column "{column_name}" in BatchData does not exist.'
-        )
+    unexpected_records, _, _ = _pandas_get_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
+    )
 
-    if filter_column_isnull:
-        df = df[df[column_name].notnull()]
-
-    domain_values = df[column_name]
+    domain_values = unexpected_records[accessor_domain_kwargs["column"]]
 
     result_format = metric_value_kwargs["result_format"]
     value_counts = None
     try:
-        value_counts = domain_values[boolean_mapped_unexpected_values].value_counts()
-    except ValueError:
+        value_counts = domain_values.value_counts()
+    except (TypeError, ValueError):
+        # Unhashable values (e.g. lists) are counted as tuples.
         try:
-            value_counts = (
-                domain_values[boolean_mapped_unexpected_values]
-                .apply(tuple)
-                .value_counts()
-            )
-        except ValueError:
+            value_counts = domain_values.apply(tuple).value_counts()
+        except (TypeError, ValueError):
             pass
 
-    if not value_counts:
+    if value_counts is None:
         raise ge_exceptions.MetricError("Unable to compute value counts")
 
     if result_format["result_format"] == "COMPLETE":
         return value_counts
     else:
-        return value_counts[result_format["partial_unexpected_count"]]
+        return value_counts.iloc[: result_format["partial_unexpected_count"]]
 
 
 def _pandas_map_condition_rows(
@@ -1819,57 +1829,21 @@ def _pandas_map_condition_rows(
     **kwargs,
 ):
     """Return values from the specified domain (ignoring the column constraint) that match the map-style metric in the metrics dictionary."""
-    (
-        boolean_mapped_unexpected_values,
-        compute_domain_kwargs,
-        accessor_domain_kwargs,
-    ) = metrics.get("unexpected_condition")
-    """
-    In order to invoke the "ignore_row_if" filtering logic, "execution_engine.get_domain_records()" must be supplied
-    with all of the available "domain_kwargs" keys.
-    """
-    domain_kwargs = dict(**compute_domain_kwargs, **accessor_domain_kwargs)
-    df = execution_engine.get_domain_records(
-        domain_kwargs=domain_kwargs,
-    )
-
-    ###
-    # NOTE: 20201111 - JPC - in the map_series / map_condition_series world (pandas), we
-    # currently handle filter_column_isnull differently than other map_fn / map_condition
-    # cases.
-    ###
-    filter_column_isnull = kwargs.get(
-        "filter_column_isnull", getattr(cls, "filter_column_isnull", False)
+    unexpected_records, _, _ = _pandas_get_map_condition_unexpected_records(
+        cls,
+        execution_engine=execution_engine,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+        metrics=metrics,
+        **kwargs,
     )
 
-    if "column" in accessor_domain_kwargs:
-        column_name = accessor_domain_kwargs["column"]
-
-        if column_name not in metrics["table.columns"]:
-            raise ge_exceptions.ExecutionEngineError(
-                message=f'Error: The column "{column_name}" in BatchData does not exist.'
-            )
-
-        if filter_column_isnull:
-            df = df[df[column_name].notnull()]
-
-    elif "column_list" in accessor_domain_kwargs:
-        column_list = accessor_domain_kwargs["column_list"]
-
-        for column_name in column_list:
-            if column_name not in metrics["table.columns"]:
-                raise ge_exceptions.ExecutionEngineError(
-                    message=f'Error: The column "{column_name}" in BatchData does not exist.'
-                )
-
     result_format = metric_value_kwargs["result_format"]
 
-    df = df[boolean_mapped_unexpected_values]
-
     if result_format["result_format"] == "COMPLETE":
-        return df
+        return unexpected_records
 
-    return df.iloc[: result_format["partial_unexpected_count"]]
+    return unexpected_records.iloc[: result_format["partial_unexpected_count"]]
 
 
 def _sqlalchemy_map_condition_unexpected_count_aggregate_fn(
@@ -2756,6 +2730,15 @@ class MapMetricProvider(MetricProvider):
                         metric_provider=_pandas_map_condition_unexpected_count,
                         metric_fn_type=MetricFunctionTypes.VALUE,
                     )
+                    register_metric(
+                        metric_name=metric_name + ".unexpected_records",
+                        metric_domain_keys=metric_domain_keys,
+                        metric_value_keys=metric_value_keys,
+                        execution_engine=engine,
+                        metric_class=cls,
+                        metric_provider=_pandas_map_condition_unexpected_records,
+                        metric_fn_type=MetricFunctionTypes.VALUE,
+                    )
                     register_metric(
                         metric_name=metric_name + ".unexpected_index_list",
                         metric_domain_keys=metric_domain_keys,
@@ -3141,6 +3124,7 @@ class MapMetricProvider(MetricProvider):
             ".unexpected_index_list",
             ".unexpected_rows",
             ".filtered_row_count",
+            ".unexpected_records",
         ]:
             if metric_name.endswith(metric_suffix):
                 dependencies["unexpected_condition"] = MetricConfiguration(
@@ -3149,6 +3133,30 @@ class MapMetricProvider(MetricProvider):
                     base_metric_value_kwargs,
                 )
 
+        # Where the engine provides them, the unexpected records of the condition are computed once and shared by the
+        # unexpected values, value counts, index list and rows metrics, instead of each masking the domain again.
+        for metric_suffix in [
+            ".unexpected_values",
+            ".unexpected_value_counts",
+            ".unexpected_index_list",
+            ".unexpected_rows",
+        ]:
+            if metric_name.endswith(metric_suffix):
+                unexpected_records_metric_name = (
+                    metric_name[: -len(metric_suffix)] + ".unexpected_records"
+                )
+                try:
+                    _ = get_metric_provider(
+                        unexpected_records_metric_name, execution_engine
+                    )
+                    dependencies["unexpected_records"] = MetricConfiguration(
+                        unexpected_records_metric_name,
+                        metric.metric_domain_kwargs,
+                        base_metric_value_kwargs,
+                    )
+                except ge_exceptions.MetricProviderError:
+                    pass
+
         try:
             _ = get_metric_provider(metric_name + ".map", execution_engine)
             dependencies["metric_map_fn"] = MetricConfiguration(
@@ -1,5 +1,6 @@
 import logging
 import math
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from dateutil.parser import parse
@@ -14,6 +15,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.expectations.core.expect_column_values_to_be_in_type_list import (
+    ExpectColumnValuesToBeInTypeList,
+)
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 from great_expectations.profile.base import (
     OrderedProfilerCardinality,
@@ -105,6 +109,9 @@ class UserConfigurableProfiler:
                         it might make the most sense to set this to "unique"
         """
         self.column_info = {}
+        # Metrics of the profiled columns (e.g. their min and max) that are resolved in bulk, for Validators, before
+        # any expectations are built; see _add_column_metrics_to_column_info.
+        self.column_metrics = {}
         self.profile_dataset = profile_dataset
         assert isinstance(self.profile_dataset, (Dataset, Validator, Batch))
 
@@ -172,6 +179,11 @@ class UserConfigurableProfiler:
             if column_name not in self.ignored_columns
         ]
 
+        if isinstance(self.profile_dataset, Validator):
+            self._add_column_metrics_to_column_info(
+                self.profile_dataset, included_columns
+            )
+
         for column_name in included_columns:
             self._add_column_cardinality_to_column_info(
                 self.profile_dataset, column_name
@@ -374,6 +386,176 @@ class UserConfigurableProfiler:
                     pass
         return self.semantic_types_dict
 
+    def _add_column_metrics_to_column_info(
+        self, profile_dataset: Validator, column_names: List[str]
+    ):
+        """
+        Determines the type and the cardinality (unique count and proportion) of all of the given columns, along with the
+        min and max of their numeric columns, with a single request for metrics, rather than by running (and then removing)
+        several expectations per column.  The aggregate metrics of all of the columns are resolved together, so that
+        SQL and Spark execution engines compute them with one query per table (see resolve_metric_bundle).
+
+        Columns whose type cannot be determined from the table.column_types metric (e.g. Pandas columns of dtype object,
+        whose values are inspected one by one) are left to _add_column_type_to_column_info.  If any of the metrics
+        cannot be resolved, all of the columns are left to the per-column methods.
+        Args:
+            profile_dataset: A GE Validator
+            column_names: The names of the columns to profile
+
+        Returns:
+            The column_metrics dictionary
+        """
+        if not column_names:
+            return self.column_metrics
+
+        try:
+            column_types: List[dict] = profile_dataset.get_metric(
+                MetricConfiguration("table.column_types", {})
+            )
+            column_types_by_name: Dict[str, Any] = {
+                column_type["name"]: column_type["type"] for column_type in column_types
+            }
+
+            metrics: Dict[str, MetricConfiguration] = {}
+            column_types_to_add: Dict[str, str] = {}
+            for column_name in column_names:
+                column_type: Optional[str] = self._get_column_type_from_metric(
+                    profile_dataset, column_types_by_name.get(column_name)
+                )
+                if column_type is not None:
+                    column_types_to_add[column_name] = column_type
+
+                column_metric_names: List[str] = [
+                    "column.distinct_values.count",
+                    "column.unique_proportion",
+                ]
+                if column_type in ("FLOAT", "INT", "NUMERIC"):
+                    column_metric_names += ["column.min", "column.max"]
+                for metric_name in column_metric_names:
+                    metrics[f"{column_name}.{metric_name}"] = MetricConfiguration(
+                        metric_name, {"column": column_name}
+                    )
+            resolved_metrics: Dict[str, Any] = profile_dataset.get_metrics(metrics)
+        except Exception as e:
+            logger.debug(
+                f"Failed to resolve the column metrics in bulk ({e}); profiling each column separately."
+            )
+            return self.column_metrics
+
+        for column_name in column_names:
+            column_metrics: dict = {
+                metric_name[len(column_name) + 1 :]: value
+                for metric_name, value in resolved_metrics.items()
+                if metric_name.startswith(f"{column_name}.")
+                and metric_name[len(column_name) + 1 :]
+                in (
+                    "column.distinct_values.count",
+                    "column.unique_proportion",
+                    "column.min",
+                    "column.max",
+                )
+            }
+            self.column_metrics[column_name] = column_metrics
+
+            column_info_entry = self.column_info.setdefault(column_name, {})
+            column_info_entry[
+                "cardinality"
+            ] = OrderedProfilerCardinality.get_basic_column_cardinality(
+                column_metrics["column.distinct_values.count"],
+                column_metrics["column.unique_proportion"],
+            ).name
+            if column_name in column_types_to_add:
+                column_info_entry["type"] = column_types_to_add[column_name]
+
+        return self.column_metrics
+
+    @staticmethod
+    def _get_column_type_from_metric(
+        profile_dataset: Validator, actual_column_type: Any
+    ) -> Optional[str]:
+        """
+        Determines the data type of a column from its type in the table.column_types metric, in the same order as
+        _get_column_type, or returns None if the values of the column need to be inspected to determine it.
+        Args:
+            profile_dataset: A GE Validator
+            actual_column_type: The type of the column reported by the table.column_types metric
+
+        Returns:
+            The data type of the column, or None
+        """
+        if actual_column_type is None:
+            return None
+
+        execution_engine = profile_dataset.execution_engine
+        type_list_expectation = ExpectColumnValuesToBeInTypeList()
+
+        def _is_in_type_list(type_names) -> bool:
+            expected_types_list: List[str] = sorted(list(type_names))
+            if isinstance(execution_engine, PandasExecutionEngine):
+                result = type_list_expectation._validate_pandas(
+                    actual_column_type=actual_column_type,
+                    expected_types_list=expected_types_list,
+                )
+            elif isinstance(execution_engine, SqlAlchemyExecutionEngine):
+                result = type_list_expectation._validate_sqlalchemy(
+                    actual_column_type=actual_column_type,
+                    expected_types_list=expected_types_list,
+                    execution_engine=execution_engine,
+                )
+            else:
+                result = type_list_expectation._validate_spark(
+                    actual_column_type=actual_column_type,
+                    expected_types_list=expected_types_list,
+                )
+            return result["success"]
+
+        if isinstance(execution_engine, PandasExecutionEngine):
+            # The type of the values of object columns is checked value by value by the type_list expectation.
+            if actual_column_type.type.__name__ == "object_":
+                return None
+        elif not isinstance(
+            execution_engine, (SqlAlchemyExecutionEngine, SparkDFExecutionEngine)
+        ):
+            return None
+
+        if _is_in_type_list(ProfilerTypeMapping.INT_TYPE_NAMES) and _is_in_type_list(
+            ProfilerTypeMapping.FLOAT_TYPE_NAMES
+        ):
+            return "NUMERIC"
+        for type_, type_names in (
+            ("INT", ProfilerTypeMapping.INT_TYPE_NAMES),
+            ("FLOAT", ProfilerTypeMapping.FLOAT_TYPE_NAMES),
+            ("STRING", ProfilerTypeMapping.STRING_TYPE_NAMES),
+            ("BOOLEAN", ProfilerTypeMapping.BOOLEAN_TYPE_NAMES),
+            ("DATETIME", ProfilerTypeMapping.DATETIME_TYPE_NAMES),
+        ):
+            if _is_in_type_list(type_names):
+                return type_
+        return "UNKNOWN"
+
+    def _get_observed_column_metric(
+        self, profile_dataset, column, metric_name, expectation_type
+    ):
+        """
+        Returns the value of a column metric that was resolved by _add_column_metrics_to_column_info, or else the
+        observed value of the given expectation (which is then removed from the suite, as it only serves to observe it).
+        """
+        column_metrics: dict = self.column_metrics.get(column, {})
+        if metric_name in column_metrics:
+            return column_metrics[metric_name]
+
+        observed_value = getattr(profile_dataset, expectation_type)(
+            column, min_value=None, max_value=None, result_format="SUMMARY"
+        ).result["observed_value"]
+        profile_dataset._expectation_suite.remove_expectation(
+            ExpectationConfiguration(
+                expectation_type=expectation_type,
+                kwargs={"column": column},
+            ),
+            match_type="domain",
+        )
+        return observed_value
+
     def _add_column_type_to_column_info(self, profile_dataset, column_name):
         """
         Adds the data type of a column to the column_info dictionary on self
@@ -728,9 +910,12 @@ class UserConfigurableProfiler:
 
         # min
         if "expect_column_min_to_be_between" not in self.excluded_expectations:
-            observed_min = profile_dataset.expect_column_min_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
+            observed_min = self._get_observed_column_metric(
+                profile_dataset,
+                column,
+                metric_name="column.min",
+                expectation_type="expect_column_min_to_be_between",
+            )
             if not self._is_nan(observed_min):
 
                 profile_dataset.expect_column_min_to_be_between(
@@ -740,22 +925,18 @@ class UserConfigurableProfiler:
                 )
 
             else:
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_min_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
                 logger.debug(
                     f"Skipping expect_column_min_to_be_between because observed value is nan: {observed_min}"
                 )
 
         # max
         if "expect_column_max_to_be_between" not in self.excluded_expectations:
-            observed_max = profile_dataset.expect_column_max_to_be_between(
-                column, min_value=None, max_value=None, result_format="SUMMARY"
-            ).result["observed_value"]
+            observed_max = self._get_observed_column_metric(
+                profile_dataset,
+                column,
+                metric_name="column.max",
+                expectation_type="expect_column_max_to_be_between",
+            )
             if not self._is_nan(observed_max):
                 profile_dataset.expect_column_max_to_be_between(
                     column,
@@ -764,13 +945,6 @@ class UserConfigurableProfiler:
                 )
 
             else:
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_max_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
                 logger.debug(
                     f"Skipping expect_column_max_to_be_between because observed value is nan: {observed_max}"
                 )
@@ -1064,10 +1238,11 @@ class UserConfigurableProfiler:
             "expect_column_proportion_of_unique_values_to_be_between"
             not in self.excluded_expectations
         ):
-            pct_unique = (
-                profile_dataset.expect_column_proportion_of_unique_values_to_be_between(
-                    column, None, None
-                ).result["observed_value"]
+            pct_unique = self._get_observed_column_metric(
+                profile_dataset,
+                column,
+                metric_name="column.unique_proportion",
+                expectation_type="expect_column_proportion_of_unique_values_to_be_between",
             )
 
             if not self._is_nan(pct_unique):
@@ -1075,15 +1250,6 @@ class UserConfigurableProfiler:
                     column, min_value=pct_unique, max_value=pct_unique
                 )
             else:
-                # noinspection PyProtectedMember
-                profile_dataset._expectation_suite.remove_expectation(
-                    ExpectationConfiguration(
-                        expectation_type="expect_column_proportion_of_unique_values_to_be_between",
-                        kwargs={"column": column},
-                    ),
-                    match_type="domain",
-                )
-
                 logger.debug(
                     f"Skipping expect_column_proportion_of_unique_values_to_be_between because observed value is nan: {pct_unique}"
                 )
@@ -1,10 +1,16 @@
+import hashlib
+import json
 import logging
+import math
 import os
 import traceback
 from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List, Optional, Tuple
 
 import great_expectations.exceptions as exceptions
-from great_expectations.core.util import nested_update
+from great_expectations import __version__ as ge_version
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
     SiteSectionIdentifier,
@@ -28,6 +34,80 @@ FALSEY_YAML_STRINGS = [
     "NONE",
 ]
 
+# The links to these resources are split over several index pages when an index_page_size is configured.
+PAGINATED_INDEX_LINKS = ("validations_links", "profiling_links")
+
+
+def _get_content_hash(value: Any) -> str:
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    elif not isinstance(value, bytes):
+        value = json.dumps(value, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.md5(value).hexdigest()
+
+
+def _get_site_manifest_key(resource_key) -> str:
+    return "/".join(str(element) for element in resource_key.to_tuple())
+
+
+def _get_rendering_exception_message(e: Exception) -> str:
+    exception_message = f"""\
+An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
+not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
+diagnose and repair the underlying issue.  Detailed information follows:
+                """
+    exception_traceback = traceback.format_exc()
+    exception_message += (
+        f'{type(e).__name__}: "{str(e)}".  ' f'Traceback: "{exception_traceback}".'
+    )
+    return exception_message
+
+
+def _render_page(
+    renderer, view, resource, data_context_id, show_how_to_buttons
+) -> Tuple[Optional[str], Optional[str]]:
+    """Render the page of a resource; returns the page, or the message of the Exception that prevented rendering it."""
+    try:
+        rendered_content = renderer.render(resource)
+        viewable_content = view.render(
+            rendered_content,
+            data_context_id=data_context_id,
+            show_how_to_buttons=show_how_to_buttons,
+        )
+        return viewable_content, None
+    except Exception as e:
+        return None, _get_rendering_exception_message(e)
+
+
+# The renderer and the view with which a rendering worker process renders pages.  They are instantiated once per worker
+# process, so that its Jinja environment (and the templates compiled in it) are shared by all of the pages it renders.
+_page_rendering_worker_state: dict = {}
+
+
+def _initialize_page_rendering_worker(page_rendering_config: dict):
+    _page_rendering_worker_state.update(
+        renderer=instantiate_class_from_config(
+            config=page_rendering_config["renderer"], runtime_environment={}
+        ),
+        view=instantiate_class_from_config(
+            config=page_rendering_config["view"],
+            runtime_environment={
+                "custom_styles_directory": page_rendering_config[
+                    "custom_styles_directory"
+                ],
+                "custom_views_directory": page_rendering_config[
+                    "custom_views_directory"
+                ],
+            },
+        ),
+        data_context_id=page_rendering_config["data_context_id"],
+        show_how_to_buttons=page_rendering_config["show_how_to_buttons"],
+    )
+
+
+def _render_page_in_worker(resource) -> Tuple[Optional[str], Optional[str]]:
+    return _render_page(resource=resource, **_page_rendering_worker_state)
+
 
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
@@ -103,6 +183,16 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    A site can be built incrementally, by setting "incremental: true" in its configuration: a manifest of the pages
+    that were rendered (and of the content hash of the resource that each of them renders) is then kept in the site
+    store, only the pages of new or changed resources are rendered, and the index is built from the manifest instead
+    of reading every resource again.  Setting index_page_size in the site_index_builder configuration splits the
+    validation and profiling results of the index over pages of that many results.
+
+    Setting max_render_workers renders the pages of each section in that many worker processes, and stores them in
+    batches, with bulk requests to the site store, while the next batch is rendered.  Renderers and views are then
+    instantiated in the worker processes, without a data context.
     """
 
     def __init__(
@@ -114,12 +204,15 @@ class SiteBuilder:
         show_how_to_buttons=True,
         site_section_builders=None,
         runtime_environment=None,
+        incremental: bool = False,
+        max_render_workers: Optional[int] = None,
         **kwargs,
     ):
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental = incremental
 
         usage_statistics_config = data_context.anonymous_usage_statistics
         data_context_id = None
@@ -221,6 +314,7 @@ class SiteBuilder:
                     "custom_views_directory": custom_views_directory,
                     "data_context_id": self.data_context_id,
                     "show_how_to_buttons": self.show_how_to_buttons,
+                    "max_render_workers": max_render_workers,
                 },
                 config_defaults={"name": site_section_name, "module_name": module_name},
             )
@@ -266,6 +360,20 @@ class SiteBuilder:
                 class_name=site_index_builder["class_name"],
             )
 
+        # Pages that were rendered by another version of Great Expectations or with another configuration of the site
+        # are all rendered again by an incremental build.
+        self.build_fingerprint = _get_content_hash(
+            {
+                "great_expectations_version": ge_version,
+                "data_context_id": self.data_context_id,
+                "show_how_to_buttons": self.show_how_to_buttons,
+                "custom_styles_directory": custom_styles_directory,
+                "custom_views_directory": custom_views_directory,
+                "site_index_builder": site_index_builder,
+                "site_section_builders": site_section_builders,
+            }
+        )
+
     def clean_site(self):
         self.target_store.clean_site()
 
@@ -285,6 +393,14 @@ class SiteBuilder:
 
         :return:
         """
+        if self.incremental:
+            index_links_dict = self._build_incrementally(
+                resource_identifiers=resource_identifiers, build_index=build_index
+            )
+            return (
+                self.get_resource_url(only_if_exists=False),
+                index_links_dict,
+            )
 
         # copy static assets
         self.target_store.copy_static_assets()
@@ -300,6 +416,32 @@ class SiteBuilder:
             index_links_dict,
         )
 
+    def _build_incrementally(self, resource_identifiers=None, build_index=True):
+        site_manifest: dict = self.target_store.get_site_manifest()
+        if site_manifest.get("build_fingerprint") != self.build_fingerprint:
+            logger.debug("Building the site in full")
+            site_manifest = {
+                "build_fingerprint": self.build_fingerprint,
+                "sections": {},
+                "index_pages": {},
+            }
+            # Static assets only change along with the version of Great Expectations.
+            self.target_store.copy_static_assets()
+
+        for site_section, site_section_builder in self.site_section_builders.items():
+            site_section_builder.build(
+                resource_identifiers=resource_identifiers,
+                site_section_manifest=site_manifest["sections"].setdefault(
+                    site_section, {}
+                ),
+            )
+
+        index_page_url, index_links_dict = self.site_index_builder.build(
+            build_index=build_index, site_manifest=site_manifest
+        )
+        self.target_store.write_site_manifest(site_manifest)
+        return index_links_dict
+
     def get_resource_url(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -332,6 +474,7 @@ class DefaultSiteSectionBuilder:
         renderer=None,
         view=None,
         data_context_id=None,
+        max_render_workers=None,
         **kwargs,
     ):
         self.name = name
@@ -341,6 +484,7 @@ class DefaultSiteSectionBuilder:
         self.validation_results_limit = validation_results_limit
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
+        self.max_render_workers = max_render_workers
 
         if renderer is None:
             raise exceptions.InvalidConfigError(
@@ -384,8 +528,56 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None):
+        # Rendering worker processes instantiate the renderer and the view from their configuration.
+        self.page_rendering_config = {
+            "renderer": {
+                **renderer,
+                "module_name": renderer.get("module_name")
+                or "great_expectations.render.renderer",
+            },
+            "view": {**view, "module_name": module_name},
+            "custom_styles_directory": custom_styles_directory,
+            "custom_views_directory": custom_views_directory,
+            "data_context_id": data_context_id,
+            "show_how_to_buttons": show_how_to_buttons,
+        }
+
+    def build(self, resource_identifiers=None, site_section_manifest=None):
+        if self.max_render_workers and self.max_render_workers > 1:
+            with _ParallelSiteSectionPageBuilder(
+                site_section_builder=self,
+                max_render_workers=self.max_render_workers,
+                site_section_manifest=site_section_manifest,
+            ) as parallel_page_builder:
+                self._build(
+                    resource_identifiers=resource_identifiers,
+                    site_section_manifest=site_section_manifest,
+                    parallel_page_builder=parallel_page_builder,
+                )
+        else:
+            self._build(
+                resource_identifiers=resource_identifiers,
+                site_section_manifest=site_section_manifest,
+            )
+
+    def _build(
+        self,
+        resource_identifiers=None,
+        site_section_manifest=None,
+        parallel_page_builder=None,
+    ):
+        """
+        :param resource_identifiers: if given, pages are built only for these resources
+        :param site_section_manifest: the manifest entries of an incremental build of this section, keyed by resource
+        key.  If given, pages are built only for the resources that are new, that changed since their page was built, or
+        that are in resource_identifiers and changed; the entries are updated in place.
+        """
         source_store_keys = self.source_store.list_keys()
+        if site_section_manifest is not None:
+            self._remove_missing_resources_from_site_section_manifest(
+                site_section_manifest=site_section_manifest,
+                source_store_keys=source_store_keys,
+            )
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
@@ -397,7 +589,15 @@ class DefaultSiteSectionBuilder:
             # a page for every keys in its source store.
             # if the caller did pass resource_identifiers, the section builder
             # will build pages only for the specified resources
-            if resource_identifiers and resource_key not in resource_identifiers:
+            # (and, in an incremental build, for the resources that are not in the manifest yet)
+            if (
+                resource_identifiers
+                and resource_key not in resource_identifiers
+                and (
+                    site_section_manifest is None
+                    or _get_site_manifest_key(resource_key) in site_section_manifest
+                )
+            ):
                 continue
 
             if self.run_name_filter:
@@ -406,7 +606,27 @@ class DefaultSiteSectionBuilder:
                 ):
                     continue
             try:
-                resource = self.source_store.get(resource_key)
+                if site_section_manifest is None:
+                    resource = self.source_store.get(resource_key)
+                else:
+                    resource, site_section_manifest_entry = self._get_changed_resource(
+                        resource_key=resource_key,
+                        site_section_manifest_entry=site_section_manifest.get(
+                            _get_site_manifest_key(resource_key)
+                        ),
+                    )
+                    if resource is None:
+                        logger.debug(
+                            f"        Skipping unchanged resource {str(resource_key)}"
+                        )
+                        site_section_manifest[
+                            _get_site_manifest_key(resource_key)
+                        ] = site_section_manifest_entry
+                        continue
+                    # The entry is only recorded once the page is built, so that it is built again if this build fails.
+                    site_section_manifest.pop(
+                        _get_site_manifest_key(resource_key), None
+                    )
             except exceptions.InvalidKeyError:
                 logger.warning(
                     f"Object with Key: {str(resource_key)} could not be retrieved. Skipping..."
@@ -444,6 +664,16 @@ class DefaultSiteSectionBuilder:
                         )
                     )
 
+            if parallel_page_builder is not None:
+                parallel_page_builder.add_page(
+                    resource_key=resource_key,
+                    resource=resource,
+                    site_section_manifest_entry=site_section_manifest_entry
+                    if site_section_manifest is not None
+                    else None,
+                )
+                continue
+
             try:
                 rendered_content = self.renderer_class.render(resource)
                 viewable_content = self.view_class.render(
@@ -459,18 +689,207 @@ class DefaultSiteSectionBuilder:
                     ),
                     viewable_content,
                 )
+                if site_section_manifest is not None:
+                    site_section_manifest_entry[
+                        "index_link"
+                    ] = self._get_index_link_info(resource)
+                    site_section_manifest[
+                        _get_site_manifest_key(resource_key)
+                    ] = site_section_manifest_entry
             except Exception as e:
-                exception_message = f"""\
-An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
-not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
-diagnose and repair the underlying issue.  Detailed information follows:
-                """
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
+                logger.error(_get_rendering_exception_message(e))
+
+    def _get_changed_resource(
+        self, resource_key, site_section_manifest_entry: Optional[dict]
+    ) -> Tuple[Optional[Any], dict]:
+        """
+        Retrieve a resource if it changed since its page was built, along with its updated manifest entry (or None, if
+        the resource did not change).  The version of the stored resource (e.g. its ETag) is compared first, so that
+        unchanged resources are not retrieved when the source store backend can report versions; otherwise, the
+        content hash of the serialized resource is compared.
+        """
+        store_backend = self.source_store.store_backend
+        key = self.source_store.key_to_tuple(resource_key)
+        version = convert_to_json_serializable(store_backend.get_version(key))
+        if (
+            site_section_manifest_entry is not None
+            and version is not None
+            and version == site_section_manifest_entry.get("version")
+        ):
+            return None, site_section_manifest_entry
+
+        value = store_backend.get(key)
+        content_hash: str = _get_content_hash(value)
+        if (
+            site_section_manifest_entry is not None
+            and content_hash == site_section_manifest_entry.get("content_hash")
+        ):
+            return None, dict(site_section_manifest_entry, version=version)
+
+        site_section_manifest_entry = {
+            "resource_key": list(resource_key.to_tuple()),
+            "content_hash": content_hash,
+            "version": version,
+            "page": self.target_store.store_backends[
+                type(resource_key)
+            ]._convert_key_to_filepath(resource_key.to_tuple()),
+        }
+        resource = self.source_store.deserialize(resource_key, value) if value else None
+        return resource, site_section_manifest_entry
+
+    def _remove_missing_resources_from_site_section_manifest(
+        self, site_section_manifest: dict, source_store_keys: list
+    ):
+        """Remove the entries (and the pages) of the resources that are no longer in the source store."""
+        source_store_manifest_keys = {
+            _get_site_manifest_key(resource_key) for resource_key in source_store_keys
+        }
+        for manifest_key in list(site_section_manifest.keys()):
+            if manifest_key in source_store_manifest_keys:
+                continue
+            site_section_manifest_entry = site_section_manifest.pop(manifest_key)
+            resource_key = tuple(site_section_manifest_entry["resource_key"])
+            target_store_backend = self.target_store.store_backends[
+                self.source_store.key_class
+            ]
+            if target_store_backend.has_key(resource_key):
+                target_store_backend.remove_key(resource_key)
+
+    @staticmethod
+    def _get_index_link_info(resource) -> dict:
+        """The information about a validation result that the index shows, which is kept in the site manifest."""
+        if not hasattr(resource, "success"):
+            return {}
+        return convert_to_json_serializable(
+            {
+                "validation_success": resource.success,
+                "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+                "batch_spec": resource.meta.get("batch_spec", {}),
+            }
+        )
+
+
+class _ParallelSiteSectionPageBuilder:
+    """
+    Renders the pages of a site section in a pool of worker processes, in batches, and stores each batch of pages with
+    a single bulk request to the target store while the next batch is rendered.
+    """
+
+    # The number of pages that are rendered in each batch, per worker process.
+    PAGES_PER_WORKER_BATCH = 4
+
+    def __init__(
+        self,
+        site_section_builder: DefaultSiteSectionBuilder,
+        max_render_workers: int,
+        site_section_manifest: Optional[dict] = None,
+    ):
+        self._site_section_builder = site_section_builder
+        self._site_section_manifest = site_section_manifest
+        self._batch_size = max_render_workers * self.PAGES_PER_WORKER_BATCH
+        self._pages: List[Tuple[Any, Any, Optional[dict]]] = []
+        self._render_executor = ProcessPoolExecutor(
+            max_workers=max_render_workers,
+            initializer=_initialize_page_rendering_worker,
+            initargs=(site_section_builder.page_rendering_config,),
+        )
+        self._store_executor = ThreadPoolExecutor(max_workers=1)
+        self._store_future: Optional[Future] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_):
+        try:
+            if exc_type is None:
+                self._render_batch()
+                self._wait_for_stored_batch()
+        finally:
+            self._render_executor.shutdown()
+            self._store_executor.shutdown()
+
+    def add_page(
+        self, resource_key, resource, site_section_manifest_entry: Optional[dict]
+    ):
+        self._pages.append((resource_key, resource, site_section_manifest_entry))
+        if len(self._pages) >= self._batch_size:
+            self._render_batch()
+
+    def _render_batch(self):
+        if not self._pages:
+            return
+        pages, self._pages = self._pages, []
+        try:
+            rendered_pages = list(
+                self._render_executor.map(
+                    _render_page_in_worker, [resource for _, resource, _ in pages]
+                )
+            )
+        except Exception as e:
+            # e.g. a resource that cannot be sent to the worker processes; the pages of the batch are then rendered in
+            # this process, so that only the pages that cannot be rendered are skipped.
+            logger.error(_get_rendering_exception_message(e))
+            rendered_pages = [
+                _render_page(
+                    renderer=self._site_section_builder.renderer_class,
+                    view=self._site_section_builder.view_class,
+                    resource=resource,
+                    data_context_id=self._site_section_builder.data_context_id,
+                    show_how_to_buttons=self._site_section_builder.show_how_to_buttons,
                 )
+                for _, resource, _ in pages
+            ]
+
+        self._wait_for_stored_batch()
+        self._store_future = self._store_executor.submit(
+            self._store_batch, pages, rendered_pages
+        )
+
+    def _store_batch(
+        self,
+        pages: List[Tuple[Any, Any, Optional[dict]]],
+        rendered_pages: List[Tuple[Optional[str], Optional[str]]],
+    ) -> List[Tuple[Any, Any, Optional[dict]]]:
+        stored_pages = []
+        key_value_pairs = []
+        for page, (viewable_content, exception_message) in zip(pages, rendered_pages):
+            if exception_message is not None:
                 logger.error(exception_message)
+                continue
+            resource_key = page[0]
+            key_value_pairs.append(
+                (
+                    SiteSectionIdentifier(
+                        site_section_name=self._site_section_builder.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+            )
+            stored_pages.append(page)
+
+        try:
+            self._site_section_builder.target_store.set_many(key_value_pairs)
+        except Exception as e:
+            logger.error(_get_rendering_exception_message(e))
+            return []
+        return stored_pages
+
+    def _wait_for_stored_batch(self):
+        if self._store_future is None:
+            return
+        stored_pages = self._store_future.result()
+        self._store_future = None
+        if self._site_section_manifest is None:
+            return
+        # The manifest is only updated by the thread that builds the section.
+        for resource_key, resource, site_section_manifest_entry in stored_pages:
+            site_section_manifest_entry[
+                "index_link"
+            ] = self._site_section_builder._get_index_link_info(resource)
+            self._site_section_manifest[
+                _get_site_manifest_key(resource_key)
+            ] = site_section_manifest_entry
 
 
 class DefaultSiteIndexBuilder:
@@ -485,6 +904,7 @@ class DefaultSiteIndexBuilder:
         custom_views_directory=None,
         show_how_to_buttons=True,
         validation_results_limit=None,
+        index_page_size=None,
         renderer=None,
         view=None,
         data_context_id=None,
@@ -497,6 +917,7 @@ class DefaultSiteIndexBuilder:
         self.data_context = data_context
         self.target_store = target_store
         self.validation_results_limit = validation_results_limit
+        self.index_page_size = index_page_size
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
         self.source_stores = source_stores or {}
@@ -689,11 +1110,19 @@ class DefaultSiteIndexBuilder:
         return results
 
     # TODO: deprecate dual batch api support
-    def build(self, skip_and_clean_missing=True, build_index: bool = True):
+    def build(
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        site_manifest: Optional[dict] = None,
+    ):
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param site_manifest: the manifest of an incremental build of the site.  If given, the index is built from the
+        manifest entries of the site sections instead of from the target and source stores, and only the numbered
+        index pages that changed are written again.
         :return: tuple(index_page_url, index_links_dict)
         """
 
@@ -709,6 +1138,14 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
+        if site_manifest is not None:
+            self._add_site_manifest_resource_info_to_index_links_dict(
+                index_links_dict=index_links_dict, site_manifest=site_manifest
+            )
+            return self._write_index_pages(
+                index_links_dict=index_links_dict, site_manifest=site_manifest
+            )
+
         if (
             # TODO why is this duplicated?
             self.site_section_builders_config.get("expectations", "None")
@@ -892,6 +1329,211 @@ class DefaultSiteIndexBuilder:
                     )
                     logger.warning(error_msg)
 
+        return self._write_index_pages(index_links_dict=index_links_dict)
+
+    def _site_section_is_enabled(self, site_section_name: str) -> bool:
+        site_section_config = self.site_section_builders_config.get(
+            site_section_name, "None"
+        )
+        return bool(site_section_config) and (
+            site_section_config not in FALSEY_YAML_STRINGS
+        )
+
+    def _add_site_manifest_resource_info_to_index_links_dict(
+        self, index_links_dict: OrderedDict, site_manifest: dict
+    ):
+        """Add the links to the resources whose pages are recorded in the site manifest, without reading them."""
+        site_sections_manifest: dict = site_manifest.get("sections", {})
+
+        if self._site_section_is_enabled("expectations"):
+            for site_section_manifest_entry in sorted(
+                site_sections_manifest.get("expectations", {}).values(),
+                key=lambda entry: entry["resource_key"],
+            ):
+                expectation_suite_key = ExpectationSuiteIdentifier.from_tuple(
+                    tuple(site_section_manifest_entry["resource_key"])
+                )
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=expectation_suite_key.expectation_suite_name,
+                    section_name="expectations",
+                )
+
+        for section_name in ("profiling", "validations"):
+            if not self._site_section_is_enabled(section_name):
+                continue
+
+            validation_result_keys_and_index_link_info: List[
+                Tuple[ValidationResultIdentifier, dict]
+            ] = [
+                (
+                    ValidationResultIdentifier.from_tuple(
+                        tuple(site_section_manifest_entry["resource_key"])
+                    ),
+                    site_section_manifest_entry.get("index_link", {}),
+                )
+                for site_section_manifest_entry in site_sections_manifest.get(
+                    section_name, {}
+                ).values()
+            ]
+            if section_name == "validations":
+                validation_result_keys_and_index_link_info = sorted(
+                    validation_result_keys_and_index_link_info,
+                    key=lambda x: x[0].run_id.run_time,
+                    reverse=True,
+                )
+                if self.validation_results_limit:
+                    validation_result_keys_and_index_link_info = (
+                        validation_result_keys_and_index_link_info[
+                            : self.validation_results_limit
+                        ]
+                    )
+
+            for (
+                validation_result_key,
+                index_link_info,
+            ) in validation_result_keys_and_index_link_info:
+                batch_kwargs = index_link_info.get("batch_kwargs", {})
+                batch_spec = index_link_info.get("batch_spec", {})
+                self.add_resource_info_to_index_links_dict(
+                    index_links_dict=index_links_dict,
+                    expectation_suite_name=validation_result_key.expectation_suite_identifier.expectation_suite_name,
+                    section_name=section_name,
+                    batch_identifier=validation_result_key.batch_identifier,
+                    run_id=validation_result_key.run_id,
+                    validation_success=index_link_info.get("validation_success")
+                    if section_name == "validations"
+                    else None,
+                    run_time=validation_result_key.run_id.run_time,
+                    run_name=validation_result_key.run_id.run_name,
+                    asset_name=batch_kwargs.get("data_asset_name")
+                    or batch_spec.get("data_asset_name"),
+                    batch_kwargs=batch_kwargs,
+                    batch_spec=batch_spec,
+                )
+
+    def _paginate_index_links_dict(
+        self, index_links_dict: OrderedDict
+    ) -> List[OrderedDict]:
+        """
+        Split the links to validation and profiling results over index pages of at most index_page_size links each.
+
+        The first index page links to the most recent results (and to all of the expectation suites).  The numbered
+        index pages that follow hold all of the results in chronological order, so that new results only change the
+        last of them, and each of them links to its neighbors.
+        """
+        chronological_links: dict = {
+            links_name: sorted(
+                index_links_dict[links_name],
+                key=lambda link: (link["run_time"], link["filepath"]),
+            )
+            for links_name in PAGINATED_INDEX_LINKS
+            if links_name in index_links_dict
+        }
+        number_of_numbered_pages: int = max(
+            [
+                math.ceil(len(links) / self.index_page_size)
+                for links in chronological_links.values()
+            ],
+            default=0,
+        )
+        if number_of_numbered_pages <= 1:
+            return [index_links_dict]
+
+        index_page = OrderedDict(index_links_dict)
+        for links_name, links in chronological_links.items():
+            index_page[links_name] = links[-self.index_page_size :][::-1]
+        index_page["index_page_links"] = [
+            {
+                "title": str(page_number),
+                "filepath": self.target_store.get_index_page_filepath(page_number),
+            }
+            for page_number in range(1, number_of_numbered_pages + 1)
+        ]
+        index_pages: List[OrderedDict] = [index_page]
+
+        for page_number in range(1, number_of_numbered_pages + 1):
+            numbered_index_page = OrderedDict(site_name=index_links_dict["site_name"])
+            start = (page_number - 1) * self.index_page_size
+            for links_name, links in chronological_links.items():
+                numbered_index_page[links_name] = links[
+                    start : start + self.index_page_size
+                ][::-1]
+            numbered_index_page["index_page_links"] = [
+                {
+                    "title": "Latest",
+                    "filepath": self.target_store.get_index_page_filepath(),
+                }
+            ]
+            if page_number > 1:
+                numbered_index_page["index_page_links"].append(
+                    {
+                        "title": "Previous",
+                        "filepath": self.target_store.get_index_page_filepath(
+                            page_number - 1
+                        ),
+                    }
+                )
+            if page_number < number_of_numbered_pages:
+                numbered_index_page["index_page_links"].append(
+                    {
+                        "title": "Next",
+                        "filepath": self.target_store.get_index_page_filepath(
+                            page_number + 1
+                        ),
+                    }
+                )
+            index_pages.append(numbered_index_page)
+
+        return index_pages
+
+    def _write_index_pages(
+        self, index_links_dict: OrderedDict, site_manifest: Optional[dict] = None
+    ):
+        """
+        Render and write the index page and, if an index_page_size is configured, the numbered index pages.  The
+        numbered index pages whose links are unchanged since the last incremental build are not written again.
+        """
+        if not self.index_page_size:
+            viewable_content = self._render_index_page(index_links_dict)
+            return (
+                self.target_store.write_index_page(viewable_content),
+                index_links_dict,
+            )
+
+        index_pages: List[OrderedDict] = self._paginate_index_links_dict(
+            index_links_dict
+        )
+        index_page_url = self.target_store.write_index_page(
+            self._render_index_page(index_pages[0])
+        )
+
+        if site_manifest is None:
+            index_page_hashes = {}
+            written_page_numbers = self.target_store.list_numbered_index_page_numbers()
+        else:
+            index_page_hashes = site_manifest.setdefault("index_pages", {})
+            written_page_numbers = [
+                int(page_number) for page_number in index_page_hashes.keys()
+            ]
+
+        for page_number, numbered_index_page in enumerate(index_pages[1:], start=1):
+            index_page_hash = _get_content_hash(numbered_index_page)
+            if index_page_hashes.get(str(page_number)) == index_page_hash:
+                continue
+            self.target_store.write_index_page(
+                self._render_index_page(numbered_index_page), page_number=page_number
+            )
+            index_page_hashes[str(page_number)] = index_page_hash
+
+        for page_number in written_page_numbers:
+            if page_number >= len(index_pages):
+                self.target_store.remove_numbered_index_page(page_number)
+                index_page_hashes.pop(str(page_number), None)
+
+        return index_page_url, index_links_dict
+
+    def _render_index_page(self, index_links_dict: OrderedDict):
         try:
             rendered_content = self.renderer_class.render(index_links_dict)
             viewable_content = self.view_class.render(
@@ -911,7 +1553,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
             )
             logger.error(exception_message)
 
-        return (self.target_store.write_index_page(viewable_content), index_links_dict)
+        return viewable_content
 
 
 class CallToActionButton:
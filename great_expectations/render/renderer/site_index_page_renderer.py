@@ -280,6 +280,40 @@ class SiteIndexPageRenderer(Renderer):
             }
         )
 
+    @classmethod
+    def _render_index_page_links(cls, index_page_links):
+        link_params = {
+            f"index_page_link_{index}": index_page_link
+            for index, index_page_link in enumerate(index_page_links)
+        }
+        return RenderedStringTemplateContent(
+            **{
+                "content_block_type": "string_template",
+                "string_template": {
+                    "template": "$pages_title "
+                    + " ".join(f"${param_name}" for param_name in link_params),
+                    "params": {
+                        "pages_title": "Pages:",
+                        **{
+                            param_name: index_page_link["title"]
+                            for param_name, index_page_link in link_params.items()
+                        },
+                    },
+                    "styling": {
+                        "params": {
+                            param_name: {
+                                "tag": "a",
+                                "attributes": {"href": index_page_link["filepath"]},
+                                "classes": ["ge-index-page-link"],
+                            }
+                            for param_name, index_page_link in link_params.items()
+                        },
+                    },
+                },
+                "styling": {"classes": ["col-12", "ge-index-page-links"]},
+            }
+        )
+
     # TODO: deprecate dual batch api support in 0.14
     @classmethod
     def _render_batch_id_cell(cls, batch_id, batch_kwargs=None, batch_spec=None):
@@ -432,6 +466,11 @@ class SiteIndexPageRenderer(Renderer):
 
             content_blocks.append(tabs_content_block)
 
+            if index_links_dict.get("index_page_links"):
+                content_blocks.append(
+                    cls._render_index_page_links(index_links_dict["index_page_links"])
+                )
+
             section = RenderedSectionContent(
                 **{
                     "section_name": index_links_dict.get("site_name"),
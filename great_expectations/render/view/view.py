@@ -1,19 +1,29 @@
 import datetime
+import functools
 import json
+import logging
+import os
 import re
+import threading
 from collections import OrderedDict
 from string import Template as pTemplate
+from typing import Dict, FrozenSet, Optional, Tuple
 from uuid import uuid4
 
 import mistune
 from jinja2 import (
+    BaseLoader,
     ChoiceLoader,
     Environment,
+    FileSystemBytecodeCache,
     FileSystemLoader,
     PackageLoader,
+    TemplateError,
     contextfilter,
+    meta,
     select_autoescape,
 )
+from jinja2.runtime import LoopContext
 
 from great_expectations import __version__ as ge_version
 from great_expectations.render.types import (
@@ -22,6 +32,80 @@ from great_expectations.render.types import (
     RenderedDocumentContent,
 )
 
+logger = logging.getLogger(__name__)
+
+# Configured Jinja environments, shared by the views of the same class that use the same custom directories, along
+# with the names of the variables that their templates read from the context they are rendered in, and the
+# fingerprint of the files of the custom directories that they were configured with.
+_environments: Dict[tuple, Tuple[Environment, FrozenSet[str], tuple]] = {}
+_environments_lock = threading.Lock()
+
+# The view whose template is being rendered in the current thread, and the fragments rendered by its render.
+_render_state = threading.local()
+
+# Filters of the shared environments, which call the method of the same name of the view rendering the template.
+_VIEW_FILTER_NAMES: Tuple[str, ...] = (
+    "render_string_template",
+    "render_styling_from_string_template",
+    "render_styling",
+    "render_content_block",
+    "render_markdown",
+    "get_html_escaped_json_string_from_dict",
+    "generate_html_element_uuid",
+    "attributes_dict_to_html_string",
+    "render_bootstrap_table_data",
+    "add_data_context_id_to_url",
+)
+
+
+def _get_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    # The compiled templates are cached in a temporary directory, so that other processes do not compile them again.
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None
+
+
+def _get_directory_fingerprint(directory: Optional[str]) -> tuple:
+    # Custom templates and styles are identified by the path, size and modification time of each of their files.
+    if not directory:
+        return ()
+    return tuple(
+        sorted(
+            (os.path.relpath(os.path.join(dirpath, filename), directory),)
+            + _get_file_stat(os.path.join(dirpath, filename))
+            for dirpath, _, filenames in os.walk(directory)
+            for filename in filenames
+        )
+    )
+
+
+def _get_file_stat(path: str) -> tuple:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return ()
+    return stat_result.st_size, stat_result.st_mtime_ns
+
+
+def _view_filter(filter_name: str):
+    # Wrapping the method carries over its marking as a context filter.
+    @functools.wraps(getattr(DefaultJinjaView, filter_name))
+    def _filter(*args, **kwargs):
+        return getattr(_render_state.view, filter_name)(*args, **kwargs)
+
+    return _filter
+
+
+def _loop_context_to_json(value):
+    if isinstance(value, LoopContext):
+        return [value.index0, value.length]
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
 
 class NoOpTemplate:
     def render(self, document):
@@ -57,40 +141,77 @@ class DefaultJinjaView:
         self.custom_styles_directory = custom_styles_directory
         self.custom_views_directory = custom_views_directory
 
+        environment_key = (
+            type(self),
+            self.custom_styles_directory,
+            self.custom_views_directory,
+        )
+        # The environment is configured again when custom templates or styles have been edited.
+        fingerprint: tuple = (
+            _get_directory_fingerprint(self.custom_styles_directory),
+            _get_directory_fingerprint(self.custom_views_directory),
+        )
+        with _environments_lock:
+            if (
+                environment_key not in _environments
+                or _environments[environment_key][2] != fingerprint
+            ):
+                _environments[environment_key] = self._create_environment() + (
+                    fingerprint,
+                )
+            self.env, self._context_variable_names, _ = _environments[environment_key]
+
+    def _create_environment(self) -> Tuple[Environment, FrozenSet[str]]:
+        """
+        Configure a Jinja environment, and compile all of its templates.  Templates are not reloaded when their files
+        change, so that rendering them does not check their files each time; views configure a new environment when
+        the files of their custom directories change.  The environment is shared by views, so its filters call the
+        methods of the view that renders each template.
+        """
         templates_loader = PackageLoader("great_expectations", "render/view/templates")
         styles_loader = PackageLoader("great_expectations", "render/view/static/styles")
 
         loaders = [templates_loader, styles_loader]
+        template_loaders = [templates_loader]
         if self.custom_styles_directory:
             loaders.append(FileSystemLoader(self.custom_styles_directory))
         if self.custom_views_directory:
             loaders.append(FileSystemLoader(self.custom_views_directory))
+            template_loaders.append(loaders[-1])
 
         self.env = Environment(
             loader=ChoiceLoader(loaders),
             autoescape=select_autoescape(["html", "xml"]),
             extensions=["jinja2.ext.do"],
+            auto_reload=False,
+            bytecode_cache=_get_bytecode_cache(),
         )
 
-        self.env.filters["render_string_template"] = self.render_string_template
-        self.env.filters[
-            "render_styling_from_string_template"
-        ] = self.render_styling_from_string_template
-        self.env.filters["render_styling"] = self.render_styling
-        self.env.filters["render_content_block"] = self.render_content_block
-        self.env.filters["render_markdown"] = self.render_markdown
-        self.env.filters[
-            "get_html_escaped_json_string_from_dict"
-        ] = self.get_html_escaped_json_string_from_dict
-        self.env.filters["generate_html_element_uuid"] = self.generate_html_element_uuid
-        self.env.filters[
-            "attributes_dict_to_html_string"
-        ] = self.attributes_dict_to_html_string
-        self.env.filters[
-            "render_bootstrap_table_data"
-        ] = self.render_bootstrap_table_data
+        for filter_name in _VIEW_FILTER_NAMES:
+            self.env.filters[filter_name] = _view_filter(filter_name)
         self.env.globals["ge_version"] = ge_version
-        self.env.filters["add_data_context_id_to_url"] = self.add_data_context_id_to_url
+        self.env.globals["now"] = _now
+
+        context_variable_names = set()
+        for template_loader in template_loaders:
+            for template_name in template_loader.list_templates():
+                context_variable_names |= self._compile_template(
+                    template_loader=template_loader, template_name=template_name
+                )
+        # Content blocks are always passed to the templates that render them.
+        context_variable_names -= {"content_block", "index"}
+
+        return self.env, frozenset(context_variable_names)
+
+    def _compile_template(self, template_loader: BaseLoader, template_name: str):
+        """Compile a template, returning the names of the variables that it reads from its context."""
+        try:
+            self.env.get_template(template_name)
+            source, _, _ = template_loader.get_source(self.env, template_name)
+            return meta.find_undeclared_variables(self.env.parse(source))
+        except TemplateError as e:
+            logger.debug(f"Could not compile template {template_name}: {e}")
+            return set()
 
     def render(self, document, template=None, **kwargs):
         self._validate_document(document)
@@ -101,16 +222,66 @@ class DefaultJinjaView:
         t = self._get_template(template)
         if isinstance(document, RenderedContent):
             document = document.to_json_dict()
-        return t.render(document, **kwargs)
+
+        # Identical content blocks are rendered only once per document.
+        previous_render_state = getattr(_render_state, "__dict__", {}).copy()
+        _render_state.rendered_fragments = {}
+        _render_state.rendered_string_templates = {}
+        _render_state.document_variables = dict(document, **kwargs)
+        _render_state.generated_uuid_count = 0
+        _render_state.content_block_depth = 0
+        try:
+            return self._render_template(t, document, **kwargs)
+        finally:
+            _render_state.__dict__.clear()
+            _render_state.__dict__.update(previous_render_state)
 
     def _get_template(self, template):
         if template is None:
             return NoOpTemplate
 
-        template = self.env.get_template(template)
-        template.globals["now"] = lambda: datetime.datetime.now(datetime.timezone.utc)
+        return self.env.get_template(template)
+
+    def _render_template(self, template, *args, **kwargs):
+        """Render a template, with the filters of the shared environment calling the methods of this view."""
+        previous_view: Optional[DefaultJinjaView] = getattr(_render_state, "view", None)
+        _render_state.view = self
+        try:
+            return template.render(*args, **kwargs)
+        finally:
+            _render_state.view = previous_view
 
-        return template
+    def _get_rendered_fragment_key(
+        self, jinja_context, template_filename, content_block, index, content_block_id
+    ) -> Optional[str]:
+        """
+        Identify a rendered content block by the JSON of the content block and of the context variables that its
+        template might read; variables of the document being rendered are identified by their names.
+        """
+        document_variables: dict = _render_state.document_variables
+        context_variables = {}
+        for name in self._context_variable_names:
+            if name not in jinja_context:
+                continue
+            value = jinja_context.get(name)
+            if name in document_variables and value is document_variables[name]:
+                context_variables[name] = "<document variable>"
+            else:
+                context_variables[name] = value
+        try:
+            return json.dumps(
+                [
+                    template_filename,
+                    index,
+                    content_block_id,
+                    content_block,
+                    context_variables,
+                ],
+                sort_keys=True,
+                default=_loop_context_to_json,
+            )
+        except (TypeError, ValueError):
+            return None
 
     @contextfilter
     def add_data_context_id_to_url(self, jinja_context, url, add_datetime=True):
@@ -182,17 +353,51 @@ class DefaultJinjaView:
         else:
             template_filename = f"{content_block_type}.j2"
         template = self._get_template(template=template_filename)
-        if content_block_id:
-            return template.render(
-                jinja_context,
+
+        # Only the outermost content blocks are memoized: the JSON of a content block includes the content blocks nested
+        # in it, so keying those as well would serialize them over and over.
+        rendered_fragments: Optional[dict] = getattr(
+            _render_state, "rendered_fragments", None
+        )
+        rendered_fragment_key: Optional[str] = None
+        if rendered_fragments is not None and _render_state.content_block_depth == 0:
+            rendered_fragment_key = self._get_rendered_fragment_key(
+                jinja_context=jinja_context,
+                template_filename=template_filename,
                 content_block=content_block,
                 index=index,
                 content_block_id=content_block_id,
             )
-        else:
-            return template.render(
-                jinja_context, content_block=content_block, index=index
-            )
+            if rendered_fragment_key in rendered_fragments:
+                return rendered_fragments[rendered_fragment_key]
+            generated_uuid_count: int = _render_state.generated_uuid_count
+
+        if rendered_fragments is not None:
+            _render_state.content_block_depth += 1
+        try:
+            if content_block_id:
+                rendered_fragment = self._render_template(
+                    template,
+                    jinja_context,
+                    content_block=content_block,
+                    index=index,
+                    content_block_id=content_block_id,
+                )
+            else:
+                rendered_fragment = self._render_template(
+                    template, jinja_context, content_block=content_block, index=index
+                )
+        finally:
+            if rendered_fragments is not None:
+                _render_state.content_block_depth -= 1
+
+        # Fragments with generated element ids are not reused, so that the ids stay unique.
+        if (
+            rendered_fragment_key is not None
+            and _render_state.generated_uuid_count == generated_uuid_count
+        ):
+            rendered_fragments[rendered_fragment_key] = rendered_fragment
+        return rendered_fragment
 
     def render_dict_values(self, context, dict_, index=None, content_block_id=None):
         for key, val in dict_.items():
@@ -296,6 +501,8 @@ class DefaultJinjaView:
             return ""
 
     def generate_html_element_uuid(self, prefix=None):
+        if hasattr(_render_state, "generated_uuid_count"):
+            _render_state.generated_uuid_count += 1
         if prefix:
             return prefix + str(uuid4())
         else:
@@ -315,6 +522,23 @@ class DefaultJinjaView:
         if not isinstance(template, (dict, OrderedDict)):
             return template
 
+        # Identical string templates (e.g. the status icons of validation results) are rendered only once per document.
+        rendered_string_templates: Optional[dict] = getattr(
+            _render_state, "rendered_string_templates", None
+        )
+        if rendered_string_templates is None:
+            return self._render_string_template(template)
+        try:
+            rendered_string_template_key = json.dumps(template, sort_keys=True)
+        except (TypeError, ValueError):
+            return self._render_string_template(template)
+        if rendered_string_template_key not in rendered_string_templates:
+            rendered_string_templates[
+                rendered_string_template_key
+            ] = self._render_string_template(template)
+        return rendered_string_templates[rendered_string_template_key]
+
+    def _render_string_template(self, template):
         # if there are any groupings of two or more $, we need to double the groupings to account
         # for template string substitution escaping
         template["template"] = re.sub(
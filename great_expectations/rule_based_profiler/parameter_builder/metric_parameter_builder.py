@@ -1,5 +1,5 @@
 from numbers import Number
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from great_expectations import DataContext
 from great_expectations.rule_based_profiler.domain_builder import Domain
@@ -8,6 +8,7 @@ from great_expectations.rule_based_profiler.parameter_builder import (
     ParameterContainer,
     build_parameter_container,
 )
+from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
 
@@ -98,3 +99,22 @@ class MetricParameterBuilder(ParameterBuilder):
         build_parameter_container(
             parameter_container=parameter_container, parameter_values=parameter_values
         )
+
+    def _get_metric_configurations(
+        self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        metric_configurations: List[MetricConfiguration]
+        _, _, metric_configurations = self._build_metric_configurations(
+            batch_ids=[self.get_batch_id(variables=variables)],
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations
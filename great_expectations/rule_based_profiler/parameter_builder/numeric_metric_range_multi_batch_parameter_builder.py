@@ -18,6 +18,7 @@ from great_expectations.rule_based_profiler.util import (
     get_parameter_value_and_validate_return_type,
 )
 from great_expectations.util import is_numeric
+from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
 MAX_DECIMALS: int = 9
@@ -61,6 +62,8 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
         replace_nan_with_zero: Optional[Union[str, bool]] = True,
         false_positive_rate: Optional[Union[str, float]] = 5.0e-2,
         num_bootstrap_samples: Optional[Union[str, int]] = None,
+        bootstrap_random_seed: Optional[Union[str, int]] = None,
+        bootstrap_max_workers: Optional[Union[str, int]] = None,
         round_decimals: Optional[Union[str, int]] = None,
         truncate_values: Optional[
             Union[str, Dict[str, Union[Optional[int], Optional[float]]]]
@@ -84,6 +87,10 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
             identifying unexpected values as judged by the upper- and lower- quantiles of the observed metric data.
             num_bootstrap_samples: Applicable only for the "bootstrap" sampling method -- if omitted (default), then
             9999 is used (default in "https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.bootstrap.html").
+            bootstrap_random_seed: Applicable only for the "bootstrap" sampling method -- if omitted (default), then
+            resamples are drawn at random; otherwise, they are drawn reproducibly from this seed.
+            bootstrap_max_workers: Applicable only for the "bootstrap" sampling method -- if greater than 1, then the
+            chunks of resamples are computed by up to this many threads; otherwise (default), they are computed serially.
             round_decimals: user-configured non-negative integer indicating the number of decimals of the
             rounding precision of the computed parameter values (i.e., min_value, max_value) prior to packaging them on
             output.  If omitted, then no rounding is performed, unless the computed value is already an integer.
@@ -111,6 +118,10 @@ class NumericMetricRangeMultiBatchParameterBuilder(ParameterBuilder):
 
         self._num_bootstrap_samples = num_bootstrap_samples
 
+        self._bootstrap_random_seed = bootstrap_random_seed
+
+        self._bootstrap_max_workers = bootstrap_max_workers
+
         self._round_decimals = round_decimals
 
         if not truncate_values:
@@ -299,6 +310,33 @@ detected.
             parameter_container=parameter_container, parameter_values=parameter_values
         )
 
+    def _get_metric_configurations(
+        self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        batch_ids: Optional[List[str]] = self.get_batch_ids(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        if not batch_ids:
+            return []
+
+        metric_configurations: List[MetricConfiguration]
+        _, _, metric_configurations = self._build_metric_configurations(
+            batch_ids=batch_ids,
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+        return metric_configurations
+
     def _get_bootstrap_estimate(
         self,
         metric_values: np.ndarray,
@@ -324,10 +362,34 @@ detected.
         else:
             n_resamples = num_bootstrap_samples
 
+        # Obtain bootstrap_random_seed override from rule state (i.e., variables and parameters); from instance variable otherwise.
+        bootstrap_random_seed: Optional[
+            int
+        ] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self._bootstrap_random_seed,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        # Obtain bootstrap_max_workers override from rule state (i.e., variables and parameters); from instance variable otherwise.
+        bootstrap_max_workers: Optional[
+            int
+        ] = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=self._bootstrap_max_workers,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
         return compute_bootstrap_quantiles(
             metric_values=metric_values,
             false_positive_rate=false_positive_rate,
             n_resamples=n_resamples,
+            random_seed=bootstrap_random_seed,
+            max_workers=bootstrap_max_workers,
         )
 
     def _get_truncate_values_using_heuristics(
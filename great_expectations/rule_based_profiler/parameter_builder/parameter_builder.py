@@ -1,7 +1,9 @@
 import copy
+import logging
+import threading
 from abc import ABC, abstractmethod
 from numbers import Number
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -23,6 +25,12 @@ from great_expectations.util import is_numeric
 from great_expectations.validator.validation_graph import MetricConfiguration
 from great_expectations.validator.validator import Validator
 
+logger = logging.getLogger(__name__)
+
+# Data contexts, validators and the execution engines that they share are not thread-safe; ParameterBuilders that build
+# the parameters of several domains concurrently (see Profiler.profile()) take turns to access data.
+PARAMETER_BUILDER_DATA_ACCESS_LOCK = threading.RLock()
+
 
 class ParameterBuilder(ABC):
     """
@@ -63,6 +71,9 @@ class ParameterBuilder(ABC):
         self._data_context = data_context
         self._batch_request = batch_request
 
+        # Values of the metrics of several domains, resolved together by resolve_metrics_for_domains().
+        self._resolved_metrics: Dict[Tuple, Any] = {}
+
     def build_parameters(
         self,
         parameter_container: ParameterContainer,
@@ -89,35 +100,226 @@ class ParameterBuilder(ABC):
     ):
         pass
 
-    def get_validator(
+    def resolve_metrics_for_domains(
         self,
-        domain: Optional[Domain] = None,
+        domains: List[Domain],
+        *,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
-    ) -> Optional[Validator]:
-        return get_validator_from_batch_request(
-            purpose="parameter_builder",
-            data_context=self.data_context,
-            batch_request=self._batch_request,
-            domain=domain,
+    ):
+        """
+        Resolves the metrics that build_parameters() needs for all of the given domains (and all of their batches) with a
+        single validation graph, so that the execution engine can compute them together (e.g., with one query per
+        table).  build_parameters() then uses the resolved values, until clear_resolved_metrics() is called.
+
+        Metrics that cannot be determined up front (e.g., because their configuration refers to parameters that are
+        built for each domain) are resolved by build_parameters(), as are all metrics, if resolving them together fails.
+        """
+        validator: Optional[Validator]
+        metric_configurations: List[MetricConfiguration]
+        validator, metric_configurations = self.get_metric_configurations_for_domains(
+            domains=domains,
             variables=variables,
             parameters=parameters,
         )
+        if not metric_configurations:
+            return
+
+        try:
+            self.add_resolved_metrics(
+                resolved_metrics=self._resolve_metrics(
+                    validator=validator,
+                    metric_configurations=metric_configurations,
+                )
+            )
+        except Exception as e:
+            logger.debug(
+                f"{self.name} could not resolve the metrics of {len(domains)} domains together: {e}"
+            )
 
-    def get_batch_ids(
+    def get_metric_configurations_for_domains(
+        self,
+        domains: List[Domain],
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Tuple[Optional[Validator], List[MetricConfiguration]]:
+        """
+        Returns the configurations of the metrics that build_parameters() needs for all of the given domains (those that
+        can be determined up front), along with a Validator that has loaded their batches.
+        """
+        metric_configurations: Dict[Tuple, MetricConfiguration] = {}
+        validator: Optional[Validator] = None
+        domain: Domain
+        for domain in domains:
+            try:
+                domain_metric_configurations: List[
+                    MetricConfiguration
+                ] = self._get_metric_configurations(
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+                if domain_metric_configurations and validator is None:
+                    validator = self.get_validator(
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    )
+            except Exception as e:
+                logger.debug(
+                    f"{self.name} could not determine the metrics of domain {domain.id} up front: {e}"
+                )
+                continue
+
+            loaded_batch_ids: List[str] = (
+                validator.loaded_batch_ids if validator else []
+            )
+            metric_configuration: MetricConfiguration
+            for metric_configuration in domain_metric_configurations:
+                if (
+                    metric_configuration.metric_domain_kwargs.get("batch_id")
+                    in loaded_batch_ids
+                ):
+                    metric_configurations[
+                        metric_configuration.id
+                    ] = metric_configuration
+
+        return validator, list(metric_configurations.values())
+
+    def add_resolved_metrics(self, resolved_metrics: Dict[Tuple, Any]):
+        """Adds metric values (keyed by metric id) that build_parameters() uses rather than resolving the metrics again."""
+        self._resolved_metrics.update(resolved_metrics)
+
+    def clear_resolved_metrics(self):
+        """Drops the metric values that were resolved by resolve_metrics_for_domains()."""
+        self._resolved_metrics = {}
+
+    def _get_metric_configurations(
         self,
+        domain: Domain,
+        *,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[MetricConfiguration]:
+        """
+        Returns the configurations of the metrics that build_parameters() resolves for the given domain; ParameterBuilder
+        implementations that resolve metrics override this method, so that the metrics of all domains of a rule can be
+        resolved together.
+        """
+        return []
+
+    def _build_metric_configurations(
+        self,
+        batch_ids: List[str],
+        metric_name: str,
+        metric_domain_kwargs: Optional[Union[str, dict]] = None,
+        metric_value_kwargs: Optional[Union[str, dict]] = None,
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
-    ) -> Optional[List[str]]:
-        return get_batch_ids_from_batch_request(
-            data_context=self.data_context,
-            batch_request=self._batch_request,
+    ) -> Tuple[dict, Optional[dict], List[MetricConfiguration]]:
+        """
+        Builds the configuration of the metric for each of the batch_ids, returning the metric domain kwargs (without a
+        batch_id) and the metric value kwargs along with them.
+        """
+        domain_kwargs: dict = build_metric_domain_kwargs(
+            batch_id=None,
+            metric_domain_kwargs=metric_domain_kwargs,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
+        # Obtain value kwargs from rule state (i.e., variables and parameters); from instance variable otherwise.
+        metric_value_kwargs = get_parameter_value_and_validate_return_type(
+            domain=domain,
+            parameter_reference=metric_value_kwargs,
+            expected_return_type=None,
+            variables=variables,
+            parameters=parameters,
+        )
+
+        metric_configurations: List[MetricConfiguration] = []
+        batch_id: str
+        for batch_id in batch_ids:
+            batch_metric_domain_kwargs: dict = copy.deepcopy(domain_kwargs)
+            if batch_id:
+                batch_metric_domain_kwargs["batch_id"] = batch_id
+            metric_configurations.append(
+                MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=batch_metric_domain_kwargs,
+                    metric_value_kwargs=metric_value_kwargs,
+                    metric_dependencies=None,
+                )
+            )
+
+        return domain_kwargs, metric_value_kwargs, metric_configurations
+
+    def _resolve_metrics(
+        self,
+        validator: Validator,
+        metric_configurations: List[MetricConfiguration],
+    ) -> Dict[Tuple, Any]:
+        """
+        Resolves the given metrics with a single validation graph (reusing the values resolved by
+        resolve_metrics_for_domains()), returning their values keyed by metric id.
+        """
+        resolved_metrics: Dict[Tuple, Any] = {}
+        metrics_to_resolve: Dict[str, MetricConfiguration] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            if metric_configuration.id in self._resolved_metrics:
+                resolved_metrics[metric_configuration.id] = self._resolved_metrics[
+                    metric_configuration.id
+                ]
+            else:
+                metrics_to_resolve[str(metric_configuration.id)] = metric_configuration
+
+        if metrics_to_resolve:
+            metric_name: str
+            metric_value: Any
+            with PARAMETER_BUILDER_DATA_ACCESS_LOCK:
+                resolved_metric_values: Dict[str, Any] = validator.get_metrics(
+                    metrics=metrics_to_resolve
+                )
+            for metric_name, metric_value in resolved_metric_values.items():
+                resolved_metrics[metrics_to_resolve[metric_name].id] = metric_value
+
+        return resolved_metrics
+
+    def get_validator(
+        self,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Optional[Validator]:
+        with PARAMETER_BUILDER_DATA_ACCESS_LOCK:
+            return get_validator_from_batch_request(
+                purpose="parameter_builder",
+                data_context=self.data_context,
+                batch_request=self._batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
+    def get_batch_ids(
+        self,
+        domain: Optional[Domain] = None,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Optional[List[str]]:
+        with PARAMETER_BUILDER_DATA_ACCESS_LOCK:
+            return get_batch_ids_from_batch_request(
+                data_context=self.data_context,
+                batch_request=self._batch_request,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+
     def get_batch_id(
         self,
         domain: Optional[Domain] = None,
@@ -152,21 +354,20 @@ class ParameterBuilder(ABC):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> Dict[str, Union[Any, Number, Dict[str, Any]]]:
-        metric_domain_kwargs = build_metric_domain_kwargs(
-            batch_id=batch_id,
+        metric_configuration: MetricConfiguration
+        (
+            _,
+            metric_value_kwargs,
+            [metric_configuration],
+        ) = self._build_metric_configurations(
+            batch_ids=[batch_id],
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
-        # Obtain value kwargs from rule state (i.e., variables and parameters); from instance variable otherwise.
-        metric_value_kwargs = get_parameter_value_and_validate_return_type(
-            domain=domain,
-            parameter_reference=metric_value_kwargs,
-            expected_return_type=None,
-            variables=variables,
-            parameters=parameters,
-        )
 
         # Obtain enforce_numeric_metric from rule state (i.e., variables and parameters); from instance variable otherwise.
         enforce_numeric_metric = get_parameter_value_and_validate_return_type(
@@ -188,13 +389,13 @@ class ParameterBuilder(ABC):
 
         metric_configuration_arguments: Dict[str, Any] = {
             "metric_name": metric_name,
-            "metric_domain_kwargs": metric_domain_kwargs,
+            "metric_domain_kwargs": dict(metric_configuration.metric_domain_kwargs),
             "metric_value_kwargs": metric_value_kwargs,
             "metric_dependencies": None,
         }
-        metric_value: Union[Any, Number] = validator.get_metric(
-            metric=MetricConfiguration(**metric_configuration_arguments)
-        )
+        metric_value: Union[Any, Number] = self._resolve_metrics(
+            validator=validator, metric_configurations=[metric_configuration]
+        )[metric_configuration.id]
         if enforce_numeric_metric:
             if not is_numeric(value=metric_value):
                 raise ge_exceptions.ProfilerExecutionError(
@@ -230,25 +431,23 @@ class ParameterBuilder(ABC):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> Dict[str, Union[Union[np.ndarray, List[Union[Any, Number]]], Dict[str, Any]]]:
-        domain_kwargs = build_metric_domain_kwargs(
-            batch_id=None,
+        # The metric is requested for all of the batches at once, so that it is resolved with a single validation graph.
+        domain_kwargs: dict
+        metric_configurations: List[MetricConfiguration]
+        (
+            domain_kwargs,
+            metric_value_kwargs,
+            metric_configurations,
+        ) = self._build_metric_configurations(
+            batch_ids=batch_ids,
+            metric_name=metric_name,
             metric_domain_kwargs=metric_domain_kwargs,
+            metric_value_kwargs=metric_value_kwargs,
             domain=domain,
             variables=variables,
             parameters=parameters,
         )
 
-        metric_domain_kwargs: dict = copy.deepcopy(domain_kwargs)
-
-        # Obtain value kwargs from rule state (i.e., variables and parameters); from instance variable otherwise.
-        metric_value_kwargs = get_parameter_value_and_validate_return_type(
-            domain=domain,
-            parameter_reference=metric_value_kwargs,
-            expected_return_type=None,
-            variables=variables,
-            parameters=parameters,
-        )
-
         # Obtain enforce_numeric_metric from rule state (i.e., variables and parameters); from instance variable otherwise.
         enforce_numeric_metric = get_parameter_value_and_validate_return_type(
             domain=domain,
@@ -267,21 +466,16 @@ class ParameterBuilder(ABC):
             parameters=parameters,
         )
 
+        resolved_metrics: Dict[Tuple, Any] = self._resolve_metrics(
+            validator=validator, metric_configurations=metric_configurations
+        )
+
         metric_values: List[Union[Any, Number]] = []
 
         metric_value: Union[Any, Number]
-        batch_id: str
-        for batch_id in batch_ids:
-            metric_domain_kwargs["batch_id"] = batch_id
-            metric_configuration_arguments: Dict[str, Any] = {
-                "metric_name": metric_name,
-                "metric_domain_kwargs": metric_domain_kwargs,
-                "metric_value_kwargs": metric_value_kwargs,
-                "metric_dependencies": None,
-            }
-            metric_value = validator.get_metric(
-                metric=MetricConfiguration(**metric_configuration_arguments)
-            )
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            metric_value = resolved_metrics[metric_configuration.id]
             if enforce_numeric_metric:
                 if not is_numeric(value=metric_value):
                     raise ge_exceptions.ProfilerExecutionError(
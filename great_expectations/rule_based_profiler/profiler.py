@@ -1,5 +1,7 @@
+import concurrent.futures
+import logging
 import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as ge_exceptions
 from great_expectations import DataContext
@@ -8,10 +10,12 @@ from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.rule_based_profiler.domain_builder.domain_builder import (
     DomainBuilder,
 )
+from great_expectations.rule_based_profiler.domain_builder.types.domain import Domain
 from great_expectations.rule_based_profiler.expectation_configuration_builder.expectation_configuration_builder import (
     ExpectationConfigurationBuilder,
 )
 from great_expectations.rule_based_profiler.parameter_builder.parameter_builder import (
+    PARAMETER_BUILDER_DATA_ACCESS_LOCK,
     ParameterBuilder,
 )
 from great_expectations.rule_based_profiler.parameter_builder.parameter_container import (
@@ -19,6 +23,10 @@ from great_expectations.rule_based_profiler.parameter_builder.parameter_containe
     build_parameter_container_for_variables,
 )
 from great_expectations.rule_based_profiler.rule.rule import Rule
+from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+logger = logging.getLogger(__name__)
 
 
 class Profiler:
@@ -203,11 +211,13 @@ class Profiler:
         *,
         expectation_suite_name: Optional[str] = None,
         include_citation: bool = True,
+        max_workers: Optional[int] = None,
     ) -> ExpectationSuite:
         """
         Args:
             :param expectation_suite_name: A name for returned Expectation suite.
             :param include_citation: Whether or not to include the Profiler config in the metadata for the ExpectationSuite produced by the Profiler
+            :param max_workers: If greater than 1, the domains of all rules are profiled concurrently, by up to this many threads (the metrics that the rules need are resolved together beforehand); otherwise (default), rules are evaluated one at a time
         :return: Set of rule evaluation results in the form of an ExpectationSuite
         """
         if expectation_suite_name is None:
@@ -225,13 +235,141 @@ class Profiler:
                 profiler_config=self._profiler_config,
             )
 
+        expectation_configurations: List[ExpectationConfiguration]
+        if max_workers is not None and max_workers > 1:
+            expectation_configurations = self._generate_concurrently(
+                max_workers=max_workers
+            )
+        else:
+            expectation_configurations = []
+            rule: Rule
+            for rule in self._rules:
+                expectation_configurations.extend(rule.generate())
+
+        expectation_configuration: ExpectationConfiguration
+        for expectation_configuration in expectation_configurations:
+            expectation_suite.add_expectation(
+                expectation_configuration=expectation_configuration
+            )
+
+        return expectation_suite
+
+    def _generate_concurrently(
+        self, max_workers: int
+    ) -> List[ExpectationConfiguration]:
+        """
+        Builds the Expectation Configurations of all (rule, domain) pairs on a pool of max_workers threads, after the
+        metrics that the parameter builders of all rules need have been resolved together (each distinct metric once).
+
+        The Expectation Configurations are returned in the same order as if the rules were evaluated one at a time.
+        """
+        rule_domains: List[Tuple[Rule, List[Domain]]] = [
+            (rule, rule.get_domains()) for rule in self._rules
+        ]
+
+        try:
+            self._resolve_metrics_for_rules(rule_domains=rule_domains)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures: List[concurrent.futures.Future] = [
+                    executor.submit(rule.generate_for_domain, domain=domain)
+                    for rule, domains in rule_domains
+                    for domain in domains
+                ]
+                expectation_configurations: List[ExpectationConfiguration] = []
+                future: concurrent.futures.Future
+                for future in futures:
+                    expectation_configurations.extend(future.result())
+        finally:
+            rule: Rule
+            for rule in self._rules:
+                rule.clear_resolved_metrics()
+
+        return expectation_configurations
+
+    @staticmethod
+    def _resolve_metrics_for_rules(rule_domains: List[Tuple[Rule, List[Domain]]]):
+        """
+        Resolves the metrics that the parameter builders of all rules need for their domains, with one validation graph
+        per execution engine, so that metrics requested by several rules are resolved once.
+        """
+        validators: Dict[int, Validator] = {}
+        metric_configurations: Dict[int, Dict[Tuple, MetricConfiguration]] = {}
+        metric_requests: List[Tuple[ParameterBuilder, List[MetricConfiguration]]] = []
+
         rule: Rule
-        for rule in self._rules:
-            expectation_configurations: List[ExpectationConfiguration] = rule.generate()
-            expectation_configuration: ExpectationConfiguration
-            for expectation_configuration in expectation_configurations:
-                expectation_suite.add_expectation(
-                    expectation_configuration=expectation_configuration
+        domains: List[Domain]
+        for rule, domains in rule_domains:
+            parameter_builder: ParameterBuilder
+            for parameter_builder in rule.parameter_builders:
+                validator: Optional[Validator]
+                parameter_builder_metric_configurations: List[MetricConfiguration]
+                (
+                    validator,
+                    parameter_builder_metric_configurations,
+                ) = parameter_builder.get_metric_configurations_for_domains(
+                    domains=domains,
+                    variables=rule.variables,
+                    parameters=rule.parameters,
                 )
+                if validator is None or not parameter_builder_metric_configurations:
+                    continue
 
-        return expectation_suite
+                # Validators of the same execution engine share its loaded batches (and so, the metrics of those).
+                execution_engine_id: int = id(validator.execution_engine)
+                validators.setdefault(execution_engine_id, validator)
+                metric_configuration: MetricConfiguration
+                metric_configurations.setdefault(execution_engine_id, {}).update(
+                    {
+                        metric_configuration.id: metric_configuration
+                        for metric_configuration in parameter_builder_metric_configurations
+                    }
+                )
+                metric_requests.append(
+                    (parameter_builder, parameter_builder_metric_configurations)
+                )
+
+        resolved_metrics: Dict[Tuple, Any] = {}
+        execution_engine_id: int
+        validator: Validator
+        for execution_engine_id, validator in validators.items():
+            metrics: Dict[str, MetricConfiguration] = {
+                str(metric_id): metric_configuration
+                for metric_id, metric_configuration in metric_configurations[
+                    execution_engine_id
+                ].items()
+            }
+            try:
+                with PARAMETER_BUILDER_DATA_ACCESS_LOCK:
+                    resolved_metric_values: Dict[str, Any] = validator.get_metrics(
+                        metrics=metrics
+                    )
+            except Exception as e:
+                # The parameter builders resolve their metrics themselves.
+                logger.debug(
+                    f"Profiler could not resolve the metrics of all rules together: {e}"
+                )
+                continue
+
+            resolved_metrics.update(
+                {
+                    metrics[metric_name].id: metric_value
+                    for metric_name, metric_value in resolved_metric_values.items()
+                }
+            )
+
+        parameter_builder: ParameterBuilder
+        parameter_builder_metric_configurations: List[MetricConfiguration]
+        for (
+            parameter_builder,
+            parameter_builder_metric_configurations,
+        ) in metric_requests:
+            parameter_builder.add_resolved_metrics(
+                resolved_metrics={
+                    metric_configuration.id: resolved_metrics[metric_configuration.id]
+                    for metric_configuration in parameter_builder_metric_configurations
+                    if metric_configuration.id in resolved_metrics
+                }
+            )
@@ -1,4 +1,5 @@
 import copy
+import threading
 from typing import Dict, List, Optional
 
 from great_expectations.core import ExpectationConfiguration
@@ -40,6 +41,7 @@ class Rule:
         self._variables = variables
 
         self._parameters = {}
+        self._lock = threading.Lock()
 
     def generate(
         self,
@@ -52,39 +54,97 @@ class Rule:
         """
         expectation_configurations: List[ExpectationConfiguration] = []
 
-        domains: List[Domain] = self._domain_builder.get_domains(
-            variables=self.variables
-        )
+        domains: List[Domain] = self.get_domains()
 
-        domain: Domain
-        for domain in domains:
-            parameter_container: ParameterContainer = ParameterContainer(
-                parameter_nodes=None
+        # The metrics of all of the domains are resolved together, before the parameters of each domain are built.
+        parameter_builder: ParameterBuilder
+        for parameter_builder in self._parameter_builders:
+            parameter_builder.resolve_metrics_for_domains(
+                domains=domains,
+                variables=self.variables,
+                parameters=self.parameters,
             )
+
+        domain: Domain
+        try:
+            for domain in domains:
+                expectation_configurations.extend(
+                    self.generate_for_domain(domain=domain)
+                )
+        finally:
+            self.clear_resolved_metrics()
+
+        return expectation_configurations
+
+    def get_domains(self) -> List[Domain]:
+        """
+        Builds the domains of the rule.
+
+        :return: List of the Domains that the rule builds Expectation Configurations for
+        """
+        return self._domain_builder.get_domains(variables=self.variables)
+
+    def generate_for_domain(self, domain: Domain) -> List[ExpectationConfiguration]:
+        """
+        Builds the parameters of the given domain, and then its Expectation Configurations.  Domains do not depend on
+        each other, so that this method may be called for several domains of the rule concurrently.
+
+        :param domain: One of the Domains of the rule
+        :return: List of the Expectation Configurations of the domain
+        """
+        parameter_container: ParameterContainer = ParameterContainer(
+            parameter_nodes=None
+        )
+        with self._lock:
             self._parameters[domain.id] = parameter_container
-            parameter_builder: ParameterBuilder
-            for parameter_builder in self._parameter_builders:
-                parameter_builder.build_parameters(
-                    parameter_container=parameter_container,
+
+        parameter_builder: ParameterBuilder
+        for parameter_builder in self._parameter_builders:
+            parameter_builder.build_parameters(
+                parameter_container=parameter_container,
+                domain=domain,
+                variables=self.variables,
+                parameters=self._get_domain_parameters(domain=domain),
+            )
+
+        expectation_configurations: List[ExpectationConfiguration] = []
+        domain_parameters: Dict[str, ParameterContainer] = self._get_domain_parameters(
+            domain=domain
+        )
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        for (
+            expectation_configuration_builder
+        ) in self._expectation_configuration_builders:
+            expectation_configurations.append(
+                expectation_configuration_builder.build_expectation_configuration(
                     domain=domain,
                     variables=self.variables,
-                    parameters=self.parameters,
-                )
-
-            expectation_configuration_builder: ExpectationConfigurationBuilder
-            for (
-                expectation_configuration_builder
-            ) in self._expectation_configuration_builders:
-                expectation_configurations.append(
-                    expectation_configuration_builder.build_expectation_configuration(
-                        domain=domain,
-                        variables=self.variables,
-                        parameters=self.parameters,
-                    )
+                    parameters=domain_parameters,
                 )
+            )
 
         return expectation_configurations
 
+    def clear_resolved_metrics(self):
+        """Drops the metric values that the parameter builders of the rule resolved for several domains together."""
+        parameter_builder: ParameterBuilder
+        for parameter_builder in self._parameter_builders:
+            parameter_builder.clear_resolved_metrics()
+
+    def _get_domain_parameters(self, domain: Domain) -> Dict[str, ParameterContainer]:
+        # Parameters are only ever looked up for their own domain, so that a copy of the parameters of the given domain
+        # (rather than of all domains) prevents write-before-read hazard.
+        with self._lock:
+            return copy.deepcopy({domain.id: self._parameters[domain.id]})
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def parameter_builders(self) -> List[ParameterBuilder]:
+        return self._parameter_builders
+
     @property
     def variables(self) -> ParameterContainer:
         # Returning a copy of the "self._variables" state variable in order to prevent write-before-read hazard.
@@ -93,4 +153,5 @@ class Rule:
     @property
     def parameters(self) -> Dict[str, ParameterContainer]:
         # Returning a copy of the "self._parameters" state variable in order to prevent write-before-read hazard.
-        return copy.deepcopy(self._parameters)
+        with self._lock:
+            return copy.deepcopy(self._parameters)
@@ -1,7 +1,8 @@
+import concurrent.futures
 import copy
 import uuid
 from numbers import Number
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -17,6 +18,9 @@ from great_expectations.validator.validator import Validator
 
 NP_EPSILON: Union[Number, np.float64] = np.finfo(float).eps
 
+# Bootstrap resamples are drawn and reduced in chunks of at most this many values (so that memory use is bounded).
+BOOTSTRAP_MAX_CHUNK_ELEMENTS: int = 2 ** 18
+
 
 def get_validator(
     purpose: str,
@@ -217,24 +221,84 @@ def compute_bootstrap_quantiles(
     metric_values: np.ndarray,
     false_positive_rate: np.float64,
     n_resamples: int,
+    random_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
 ) -> tuple:
-    bootstraps: np.ndarray = np.random.choice(
-        metric_values, size=(n_resamples, metric_values.size)
+    """
+    Estimates the lower and upper quantiles of metric_values (for the given false_positive_rate) as the means of the
+    quantiles of n_resamples bootstrap resamples of metric_values.
+
+    The resamples are drawn and reduced in chunks of at most BOOTSTRAP_MAX_CHUNK_ELEMENTS values, so that the memory
+    used does not grow with n_resamples, and the chunks are computed by up to max_workers threads.  Given a random_seed,
+    the estimates are reproducible (whatever the max_workers).
+    """
+    metric_values = np.asarray(metric_values)
+    num_metric_values: int = metric_values.size
+    quantiles: np.ndarray = np.array(
+        [false_positive_rate / 2, 1.0 - (false_positive_rate / 2)]
+    )
+
+    chunk_num_resamples: int = max(
+        1, min(n_resamples, BOOTSTRAP_MAX_CHUNK_ELEMENTS // max(num_metric_values, 1))
+    )
+    chunk_sizes: List[int] = [chunk_num_resamples] * (
+        n_resamples // chunk_num_resamples
     )
-    lower_quantile = np.mean(
-        np.quantile(
-            bootstraps,
-            q=false_positive_rate / 2,
+    if n_resamples % chunk_num_resamples:
+        chunk_sizes.append(n_resamples % chunk_num_resamples)
+
+    def _sum_chunk_quantiles(chunk_index: int) -> np.ndarray:
+        resample_indices: np.ndarray = _get_bootstrap_resample_indices(
+            num_metric_values=num_metric_values,
+            num_resamples=chunk_sizes[chunk_index],
+            random_seed=random_seed,
+            chunk_index=chunk_index,
+        )
+        # Both quantiles are computed with a single partial sort of each resample.
+        return np.sum(
+            np.quantile(
+                metric_values[resample_indices],
+                q=quantiles,
+                axis=1,
+                interpolation="linear",  # can be omitted ("linear" is default)
+            ),
             axis=1,
-            interpolation="linear",  # can be omitted ("linear" is default)
         )
+
+    chunk_quantile_sums: List[np.ndarray]
+    if max_workers is not None and max_workers > 1 and len(chunk_sizes) > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            chunk_quantile_sums = list(
+                executor.map(_sum_chunk_quantiles, range(len(chunk_sizes)))
+            )
+    else:
+        chunk_quantile_sums = [
+            _sum_chunk_quantiles(chunk_index) for chunk_index in range(len(chunk_sizes))
+        ]
+
+    # Chunk sums are added in order, so that the estimates do not depend on the order in which the chunks complete.
+    lower_quantile, upper_quantile = np.sum(chunk_quantile_sums, axis=0) / n_resamples
+    return lower_quantile, upper_quantile
+
+
+def _get_bootstrap_resample_indices(
+    num_metric_values: int,
+    num_resamples: int,
+    random_seed: Optional[int],
+    chunk_index: int,
+) -> np.ndarray:
+    # Each chunk is drawn from its own seed, so that it does not depend on the order in which the chunks are drawn.
+    seed: Optional[Tuple[int, int]] = (
+        None if random_seed is None else (random_seed, chunk_index)
     )
-    upper_quantile = np.mean(
-        np.quantile(
-            bootstraps,
-            q=1.0 - (false_positive_rate / 2),
-            axis=1,
-            interpolation="linear",  # can be omitted ("linear" is default)
+    size: Tuple[int, int] = (num_resamples, num_metric_values)
+    dtype = np.int32 if num_metric_values < np.iinfo(np.int32).max else np.int64
+    if hasattr(np.random, "default_rng"):
+        return np.random.default_rng(seed).integers(
+            0, num_metric_values, size=size, dtype=dtype
         )
+
+    # NumPy versions older than 1.17 do not provide the Generator API.
+    return np.random.RandomState(seed).randint(
+        0, num_metric_values, size=size, dtype=dtype
     )
-    return lower_quantile, upper_quantile
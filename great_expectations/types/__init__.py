@@ -2,9 +2,12 @@ from .configurations import ClassConfig
 
 
 class DictDot:
+    # Empty slots let subclasses declare __slots__ of their own; subclasses without them still get a __dict__.
+    __slots__ = ()
+
     def __getitem__(self, item):
         if isinstance(item, int):
-            return list(self.__dict__.keys())[item]
+            return self._get_attribute_names()[item]
         return getattr(self, item)
 
     def __setitem__(self, key, value):
@@ -13,7 +16,24 @@ class DictDot:
     def __delitem__(self, key):
         delattr(self, key)
 
+    def _get_attribute_names(self) -> list:
+        # Attributes held in slots (declared by the base classes first) precede those held in the instance __dict__.
+        attribute_names: list = []
+        for cls in reversed(type(self).__mro__):
+            slots = cls.__dict__.get("__slots__", ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            attribute_names.extend(
+                name
+                for name in slots
+                if name not in ("__dict__", "__weakref__") and hasattr(self, name)
+            )
+        attribute_names.extend(getattr(self, "__dict__", {}).keys())
+        return attribute_names
+
 
 class SerializableDictDot(DictDot):
+    __slots__ = ()
+
     def to_json_dict(self) -> dict:
         raise NotImplementedError
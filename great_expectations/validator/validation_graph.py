@@ -1,11 +1,26 @@
 import copy
 import json
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-from great_expectations.core.id_dict import IDDict
+from great_expectations.core.id_dict import FrozenIDDict
 
 
 class MetricConfiguration:
+    """The name and the domain and value kwargs of a metric, together with the metrics that it depends on.
+
+    The domain and value kwargs are copied into FrozenIDDicts, so the id of a MetricConfiguration, which is read many
+    times while building and resolving a ValidationGraph, is computed only once. To change the kwargs of a metric,
+    build a new MetricConfiguration.
+    """
+
+    __slots__ = (
+        "_metric_name",
+        "_metric_domain_kwargs",
+        "_metric_value_kwargs",
+        "_id",
+        "metric_dependencies",
+    )
+
     def __init__(
         self,
         metric_name: str,
@@ -14,18 +29,44 @@ class MetricConfiguration:
         metric_dependencies: dict = None,
     ):
         self._metric_name = metric_name
-        if not isinstance(metric_domain_kwargs, IDDict):
-            metric_domain_kwargs = IDDict(metric_domain_kwargs)
+        if not isinstance(metric_domain_kwargs, FrozenIDDict):
+            metric_domain_kwargs = FrozenIDDict(metric_domain_kwargs)
         self._metric_domain_kwargs = metric_domain_kwargs
-        if not isinstance(metric_value_kwargs, IDDict):
+        if not isinstance(metric_value_kwargs, FrozenIDDict):
             if metric_value_kwargs is None:
                 metric_value_kwargs = {}
-            metric_value_kwargs = IDDict(metric_value_kwargs)
+            metric_value_kwargs = FrozenIDDict(metric_value_kwargs)
         self._metric_value_kwargs = metric_value_kwargs
+        self._id = None
         if metric_dependencies is None:
             metric_dependencies = {}
         self.metric_dependencies = metric_dependencies
 
+    def __copy__(self):
+        return MetricConfiguration(
+            metric_name=self._metric_name,
+            metric_domain_kwargs=self._metric_domain_kwargs,
+            metric_value_kwargs=self._metric_value_kwargs,
+            metric_dependencies=self.metric_dependencies,
+        )
+
+    def __deepcopy__(self, memo):
+        # Deep copies of the (frozen) kwargs are modifiable, so they are frozen again by the constructor.
+        return MetricConfiguration(
+            metric_name=self._metric_name,
+            metric_domain_kwargs=copy.deepcopy(self._metric_domain_kwargs, memo),
+            metric_value_kwargs=copy.deepcopy(self._metric_value_kwargs, memo),
+            metric_dependencies=copy.deepcopy(self.metric_dependencies, memo),
+        )
+
+    def __reduce__(self):
+        return MetricConfiguration, (
+            self._metric_name,
+            dict(self._metric_domain_kwargs),
+            dict(self._metric_value_kwargs),
+            self.metric_dependencies,
+        )
+
     def __repr__(self):
         return json.dumps(self.to_json_dict(), indent=2)
 
@@ -54,11 +95,13 @@ class MetricConfiguration:
 
     @property
     def id(self) -> Tuple[str, str, str]:
-        return (
-            self.metric_name,
-            self.metric_domain_kwargs_id,
-            self.metric_value_kwargs_id,
-        )
+        if self._id is None:
+            self._id = (
+                self._metric_name,
+                self._metric_domain_kwargs.to_id(),
+                self._metric_value_kwargs.to_id(),
+            )
+        return self._id
 
     def to_json_dict(self) -> dict:
         json_dict: dict = {
@@ -100,6 +143,8 @@ class ValidationGraph:
             self._edges = []
 
         self._edge_ids = {edge.id for edge in self._edges}
+        self._requested_metric_ids = set()
+        self._expanded_metric_ids = set()
 
     def add(self, edge: MetricEdge):
         if edge.id not in self._edge_ids:
@@ -109,3 +154,83 @@ class ValidationGraph:
     @property
     def edges(self):
         return copy.deepcopy(self._edges)
+
+    def add_requested_metric(self, metric: MetricConfiguration):
+        """Records that the value of metric is wanted by the caller, as opposed to being needed only as a dependency of
+        other metrics in the graph."""
+        self._requested_metric_ids.add(metric.id)
+
+    def add_expanded_metric(self, metric: MetricConfiguration):
+        """Records that all of the dependencies of metric (and, recursively, theirs) have been added to the graph."""
+        self._expanded_metric_ids.add(metric.id)
+
+    def has_expanded_metric(self, metric: MetricConfiguration) -> bool:
+        return metric.id in self._expanded_metric_ids
+
+    def get_dependency_index(
+        self, metrics: Optional[Dict[Tuple, object]] = None
+    ) -> Tuple[Dict[Tuple, MetricConfiguration], Dict[Tuple, int], Dict[Tuple, Set]]:
+        """Builds, in a single pass over the edges, the structures needed to schedule metric resolution
+        topologically.
+
+        Only metrics that are still needed are included: those reachable from a requested metric (or from a metric
+        that nothing depends on) without passing through an already-resolved metric.  A resolved metric therefore
+        prunes the part of the graph that only it depends on.
+
+        Args:
+            metrics: already-resolved metrics; these (and the edges leading to them) are treated as satisfied
+
+        Returns:
+            A tuple consisting of three elements:
+
+            1. a dictionary of the unresolved metric configurations in the graph, keyed by metric id;
+            2. a dictionary of the number of unresolved dependencies of each such metric, keyed by metric id;
+            3. a dictionary of the ids of the unresolved metrics that depend on each metric, keyed by metric id.
+        """
+        if metrics is None:
+            metrics = {}
+
+        all_metric_configurations: Dict[Tuple, MetricConfiguration] = {}
+        all_dependency_ids: Dict[Tuple, Set] = {}
+        ids_with_dependents: Set = set()
+        for edge in self._edges:
+            left_id = edge.left.id
+            all_metric_configurations.setdefault(left_id, edge.left)
+            dependencies = all_dependency_ids.setdefault(left_id, set())
+            if edge.right is not None:
+                right_id = edge.right.id
+                dependencies.add(right_id)
+                ids_with_dependents.add(right_id)
+
+        root_ids = (set(all_metric_configurations.keys()) - ids_with_dependents) | (
+            self._requested_metric_ids & set(all_metric_configurations.keys())
+        )
+        needed_ids: Set = set()
+        ids_to_visit = [metric_id for metric_id in root_ids if metric_id not in metrics]
+        while ids_to_visit:
+            metric_id = ids_to_visit.pop()
+            if metric_id in needed_ids:
+                continue
+            needed_ids.add(metric_id)
+            for dependency_id in all_dependency_ids.get(metric_id, ()):
+                if dependency_id not in metrics and dependency_id not in needed_ids:
+                    ids_to_visit.append(dependency_id)
+
+        metric_configurations: Dict[Tuple, MetricConfiguration] = {}
+        unmet_dependency_counts: Dict[Tuple, int] = {}
+        dependent_ids: Dict[Tuple, Set] = {}
+        for metric_id in needed_ids:
+            if metric_id not in all_metric_configurations:
+                # An unresolved dependency that is not itself part of the graph; its dependents can never be ready.
+                continue
+            metric_configurations[metric_id] = all_metric_configurations[metric_id]
+            unmet_dependency_ids = {
+                dependency_id
+                for dependency_id in all_dependency_ids[metric_id]
+                if dependency_id not in metrics
+            }
+            unmet_dependency_counts[metric_id] = len(unmet_dependency_ids)
+            for dependency_id in unmet_dependency_ids:
+                dependent_ids.setdefault(dependency_id, set()).add(metric_id)
+
+        return metric_configurations, unmet_dependency_counts, dependent_ids
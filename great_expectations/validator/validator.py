@@ -1,3 +1,4 @@
+import concurrent.futures
 import copy
 import datetime
 import inspect
@@ -7,7 +8,7 @@ import traceback
 import warnings
 from collections import defaultdict, namedtuple
 from collections.abc import Hashable
-from typing import Any, Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import pandas as pd
 from dateutil.parser import parse
@@ -24,7 +25,7 @@ from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
-from great_expectations.core.id_dict import BatchSpec
+from great_expectations.core.id_dict import BatchSpec, IDDict
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_asset.util import recursively_convert_to_json_serializable
 from great_expectations.dataset import PandasDataset, SparkDFDataset, SqlAlchemyDataset
@@ -67,6 +68,7 @@ class Validator:
         expectation_suite_name=None,
         data_context=None,
         batches=None,
+        metric_resolution_max_workers=None,
         **kwargs,
     ):
         """
@@ -74,6 +76,8 @@ class Validator:
 
         :param profiler (profiler class) = None: The profiler that should be run on the data_asset to
             build a baseline expectation suite.
+        :param metric_resolution_max_workers (int) = None: The maximum number of threads used to resolve independent
+            metrics concurrently; metrics are resolved serially if None.
 
         Note: DataAsset is designed to support multiple inheritance (e.g. PandasDataset inherits from both a
         Pandas DataFrame and Dataset which inherits from DataAsset), so it accepts generic *args and **kwargs arguments
@@ -86,7 +90,11 @@ class Validator:
         self._data_context = data_context
         self._execution_engine = execution_engine
         self._expose_dataframe_methods = False
+        self._metric_resolution_max_workers = metric_resolution_max_workers
         self._validator_config = {}
+        # Evaluation dependencies of the metrics expanded by build_metric_dependency_graph, keyed by execution engine
+        # type and metric id, together with the metric provider that they were obtained from.
+        self._metric_dependencies_cache = {}
 
         if batches is None:
             batches = tuple()
@@ -157,6 +165,15 @@ class Validator:
     def expose_dataframe_methods(self, value: bool):
         self._expose_dataframe_methods = value
 
+    @property
+    def metric_resolution_max_workers(self) -> Optional[int]:
+        """The maximum number of threads used to resolve independent metrics concurrently (serial if None or 1)"""
+        return self._metric_resolution_max_workers
+
+    @metric_resolution_max_workers.setter
+    def metric_resolution_max_workers(self, value: Optional[int]):
+        self._metric_resolution_max_workers = value
+
     def __getattr__(self, name):
         name = name.lower()
         if name.startswith("expect_") and get_expectation_impl(name):
@@ -294,26 +311,33 @@ class Validator:
         """Return a dictionary with the requested metrics"""
         graph = ValidationGraph()
         resolved_metrics = {}
+        # The kwargs of a MetricConfiguration are frozen, so the defaults are filled in on a new MetricConfiguration.
+        metric_configurations: Dict[str, MetricConfiguration] = {}
         for metric_name, metric_configuration in metrics.items():
             provider_cls, _ = get_metric_provider(
                 metric_configuration.metric_name, self.execution_engine
             )
+            metric_domain_kwargs = dict(metric_configuration.metric_domain_kwargs)
             for key in provider_cls.domain_keys:
                 if (
-                    key not in metric_configuration.metric_domain_kwargs
+                    key not in metric_domain_kwargs
                     and key in provider_cls.default_kwarg_values
                 ):
-                    metric_configuration.metric_domain_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
+                    metric_domain_kwargs[key] = provider_cls.default_kwarg_values[key]
+            metric_value_kwargs = dict(metric_configuration.metric_value_kwargs)
             for key in provider_cls.value_keys:
                 if (
-                    key not in metric_configuration.metric_value_kwargs
+                    key not in metric_value_kwargs
                     and key in provider_cls.default_kwarg_values
                 ):
-                    metric_configuration.metric_value_kwargs[
-                        key
-                    ] = provider_cls.default_kwarg_values[key]
+                    metric_value_kwargs[key] = provider_cls.default_kwarg_values[key]
+            metric_configuration = MetricConfiguration(
+                metric_name=metric_configuration.metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=metric_value_kwargs,
+                metric_dependencies=metric_configuration.metric_dependencies,
+            )
+            metric_configurations[metric_name] = metric_configuration
             self.build_metric_dependency_graph(
                 graph,
                 child_node=metric_configuration,
@@ -324,7 +348,7 @@ class Validator:
         self.resolve_validation_graph(graph, resolved_metrics)
         return {
             metric_name: resolved_metrics[metric_configuration.id]
-            for (metric_name, metric_configuration) in metrics.items()
+            for (metric_name, metric_configuration) in metric_configurations.items()
         }
 
     def get_metric(self, metric: MetricConfiguration) -> Any:
@@ -341,13 +365,14 @@ class Validator:
         runtime_configuration: Optional[dict] = None,
     ) -> None:
         """Obtain domain and value keys for metrics and proceeds to add these metrics to the validation graph
-        until all metrics have been added."""
+        until all metrics have been added.
+
+        The evaluation dependencies of a metric are obtained from its provider only once per execution engine type for
+        the lifetime of the Validator, and the dependencies of a metric that has already been expanded in the graph
+        are not traversed again."""
 
         # metric_kwargs = get_metric_kwargs(metric_name)
-        metric_impl = get_metric_provider(
-            child_node.metric_name, execution_engine=execution_engine
-        )[0]
-        metric_dependencies = metric_impl.get_evaluation_dependencies(
+        metric_dependencies = self._get_metric_dependencies(
             metric=child_node,
             configuration=configuration,
             execution_engine=execution_engine,
@@ -355,6 +380,9 @@ class Validator:
         )
         child_node.metric_dependencies = metric_dependencies
 
+        if parent_node is None:
+            graph.add_requested_metric(child_node)
+
         if parent_node:
             graph.add(
                 MetricEdge(
@@ -363,6 +391,9 @@ class Validator:
                 )
             )
 
+        if graph.has_expanded_metric(child_node):
+            return
+
         if len(metric_dependencies) == 0:
             graph.add(
                 MetricEdge(
@@ -387,6 +418,41 @@ class Validator:
                     runtime_configuration=runtime_configuration,
                 )
 
+        # Only a metric whose dependencies have all been added without error is marked as expanded.
+        graph.add_expanded_metric(child_node)
+
+    def _get_metric_dependencies(
+        self,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration],
+        execution_engine: "ExecutionEngine",
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[str, MetricConfiguration]:
+        """Returns the evaluation dependencies of metric, obtaining them from its metric provider only if they have not
+        already been obtained for the same metric and execution engine type.
+
+        Evaluation dependencies are determined by the metric (its name and kwargs) and the execution engine type; the
+        cached dependencies are discarded if a different provider has since been registered for the metric."""
+        metric_impl = get_metric_provider(
+            metric.metric_name, execution_engine=execution_engine
+        )[0]
+        cache_key = (type(execution_engine), metric.id)
+        cached = self._metric_dependencies_cache.get(cache_key)
+        if cached is not None and cached[0] is metric_impl:
+            return dict(cached[1])
+
+        metric_dependencies = metric_impl.get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+        self._metric_dependencies_cache[cache_key] = (
+            metric_impl,
+            dict(metric_dependencies),
+        )
+        return metric_dependencies
+
     def graph_validate(
         self,
         configurations: List[ExpectationConfiguration],
@@ -411,7 +477,41 @@ class Validator:
                 Returns:
                     A list of Validations, validating that all necessary metrics are available.
         """
-        graph = ValidationGraph()
+        return self.graph_validate_batches(
+            configurations=configurations,
+            batch_ids=[self.active_batch_id],
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )[self.active_batch_id]
+
+    def graph_validate_batches(
+        self,
+        configurations: List[ExpectationConfiguration],
+        batch_ids: Optional[List[str]] = None,
+        metrics: dict = None,
+        runtime_configuration: dict = None,
+    ) -> Dict[str, List[ExpectationValidationResult]]:
+        """Validates each of the configurations against each of several loaded batches, resolving the metrics needed
+        for all batches from a single validation graph.
+
+        Metrics that the execution engine resolves in bundles (e.g. in one query per compute domain) are bundled across
+        batches, and independent metrics of different batches are resolved concurrently if
+        metric_resolution_max_workers is greater than one.
+
+                Args:
+                    configurations(List[ExpectationConfiguration]): A list of needed Expectation Configurations that will
+                    be used to supply domain and values for metrics.
+                    batch_ids (List[str]): The ids of the loaded batches to validate; all loaded batches if None.
+                    metrics (dict): A list of currently registered metrics in the registry
+                    runtime_configuration (dict): A dictionary of runtime keyword arguments, controlling semantics
+                    such as the result_format.
+
+                Returns:
+                    A dictionary mapping each batch_id to the list of Validations of that batch.
+        """
+        if batch_ids is None:
+            batch_ids = self.loaded_batch_ids
+
         if runtime_configuration is None:
             runtime_configuration = {}
 
@@ -420,6 +520,70 @@ class Validator:
         else:
             catch_exceptions = False
 
+        evrs_by_batch_id = {}
+        graph = ValidationGraph()
+        processed_configurations_by_batch_id = {}
+        for batch_id in batch_ids:
+            (
+                processed_configurations_by_batch_id[batch_id],
+                evrs_by_batch_id[batch_id],
+            ) = self._build_validation_graph(
+                graph=graph,
+                configurations=configurations,
+                batch_id=batch_id,
+                runtime_configuration=runtime_configuration,
+                catch_exceptions=catch_exceptions,
+            )
+
+        if metrics is None:
+            metrics = {}
+
+        metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
+        for (
+            batch_id,
+            processed_configurations,
+        ) in processed_configurations_by_batch_id.items():
+            evrs = evrs_by_batch_id[batch_id]
+            for configuration in processed_configurations:
+                try:
+                    result = configuration.metrics_validate(
+                        metrics,
+                        execution_engine=self._execution_engine,
+                        runtime_configuration=runtime_configuration,
+                    )
+                    evrs.append(result)
+                except Exception as err:
+                    if catch_exceptions:
+                        raised_exception = True
+                        exception_traceback = traceback.format_exc()
+
+                        result = ExpectationValidationResult(
+                            success=False,
+                            exception_info={
+                                "raised_exception": raised_exception,
+                                "exception_traceback": exception_traceback,
+                                "exception_message": str(err),
+                            },
+                            expectation_config=configuration,
+                        )
+                        evrs.append(result)
+                    else:
+                        raise err
+        return evrs_by_batch_id
+
+    def _build_validation_graph(
+        self,
+        graph: ValidationGraph,
+        configurations: List[ExpectationConfiguration],
+        batch_id: str,
+        runtime_configuration: dict,
+        catch_exceptions: bool,
+    ) -> Tuple[List[ExpectationConfiguration], List[ExpectationValidationResult]]:
+        """Adds the metrics needed to validate each of the configurations against the batch with batch_id to graph.
+
+        Returns the configurations (with batch_id added to their kwargs) whose metrics were added to the graph, and the
+        validation results of the configurations whose metrics could not be added (if catch_exceptions is True;
+        otherwise, the error is raised)."""
         processed_configurations = []
         evrs = []
         for configuration in configurations:
@@ -431,8 +595,9 @@ class Validator:
             except AssertionError as e:
                 raise InvalidExpectationConfigurationError(str(e))
 
-            evaluated_config = copy.deepcopy(configuration)
-            evaluated_config.kwargs.update({"batch_id": self.active_batch_id})
+            # Only the kwargs are copied: the configuration itself is left unchanged, and its (possibly large) kwarg
+            # values are not modified during validation.
+            evaluated_config = configuration.copy_with_kwargs({"batch_id": batch_id})
 
             expectation_impl = get_expectation_impl(evaluated_config.expectation_type)
             validation_dependencies = expectation_impl().get_validation_dependencies(
@@ -466,84 +631,172 @@ class Validator:
                 else:
                     raise err
 
-        if metrics is None:
-            metrics = {}
+        return processed_configurations, evrs
 
-        metrics = self.resolve_validation_graph(graph, metrics, runtime_configuration)
-        for configuration in processed_configurations:
-            try:
-                result = configuration.metrics_validate(
-                    metrics,
-                    execution_engine=self._execution_engine,
-                    runtime_configuration=runtime_configuration,
-                )
-                evrs.append(result)
-            except Exception as err:
-                if catch_exceptions:
-                    raised_exception = True
-                    exception_traceback = traceback.format_exc()
+    def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
+        """Resolves all metrics of the validation graph in topological order.
 
-                    result = ExpectationValidationResult(
-                        success=False,
-                        exception_info={
-                            "raised_exception": raised_exception,
-                            "exception_traceback": exception_traceback,
-                            "exception_message": str(err),
-                        },
-                        expectation_config=configuration,
-                    )
-                    evrs.append(result)
-                else:
-                    raise err
-        return evrs
+        In-degree counts and reverse adjacency are built once; a metric is released for resolution as soon as all of
+        its dependencies have been resolved.  If metric_resolution_max_workers is greater than one, independent groups
+        of ready metrics are resolved concurrently on a thread pool, each given a snapshot of the metrics it depends
+        on; metrics that the execution engine resolves in bundles are kept together (see _group_ready_metrics), so
+        that they can share one trip to the compute engine.
 
-    def resolve_validation_graph(self, graph, metrics, runtime_configuration=None):
-        done: bool = False
-        pbar = None
-        while not done:
-            ready_metrics, needed_metrics = self._parse_validation_graph(graph, metrics)
-            if pbar is None:
-                pbar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
-                    desc="Calculating Metrics",
-                    disable=len(graph._edges) < 3,
-                )
-                pbar.update(0)
-            metrics.update(
-                self._resolve_metrics(
-                    execution_engine=self._execution_engine,
-                    metrics_to_resolve=ready_metrics,
-                    metrics=metrics,
-                    runtime_configuration=runtime_configuration,
-                )
+        Metrics available in the execution engine's metric cache are not recomputed, and neither are dependencies
+        needed only by such metrics.
+        """
+        (
+            metric_configurations,
+            unmet_dependency_counts,
+            dependent_ids,
+        ) = graph.get_dependency_index(metrics)
+        cached_metrics = self._execution_engine.get_cached_metrics(
+            metric_configurations.values()
+        )
+        if cached_metrics:
+            metrics.update(cached_metrics)
+            (
+                metric_configurations,
+                unmet_dependency_counts,
+                dependent_ids,
+            ) = graph.get_dependency_index(metrics)
+
+        ready_metrics = [
+            metric_configurations[metric_id]
+            for metric_id, count in unmet_dependency_counts.items()
+            if count == 0
+        ]
+        pbar = tqdm(
+            total=len(metric_configurations),
+            desc="Calculating Metrics",
+            disable=len(graph._edges) < 3,
+        )
+        pbar.update(0)
+
+        def _release_dependents(resolved_metric_ids: Iterable) -> List:
+            newly_ready_metrics = []
+            for metric_id in resolved_metric_ids:
+                for dependent_id in dependent_ids.get(metric_id, ()):
+                    unmet_dependency_counts[dependent_id] -= 1
+                    if unmet_dependency_counts[dependent_id] == 0:
+                        newly_ready_metrics.append(metric_configurations[dependent_id])
+            return newly_ready_metrics
+
+        num_resolved: int = 0
+        max_workers: Optional[int] = self.metric_resolution_max_workers
+        try:
+            if max_workers is None or max_workers <= 1:
+                while ready_metrics:
+                    metrics.update(
+                        self._resolve_metrics(
+                            execution_engine=self._execution_engine,
+                            metrics_to_resolve=ready_metrics,
+                            metrics=metrics,
+                            runtime_configuration=runtime_configuration,
+                        )
+                    )
+                    pbar.update(len(ready_metrics))
+                    num_resolved += len(ready_metrics)
+                    ready_metrics = _release_dependents(
+                        [metric.id for metric in ready_metrics]
+                    )
+            else:
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=max_workers
+                ) as executor:
+                    pending_futures: Dict[concurrent.futures.Future, List] = {}
+
+                    def _submit(metrics_to_submit: List) -> None:
+                        for metric_group in self._group_ready_metrics(
+                            metrics_to_submit
+                        ):
+                            # Workers do not read metrics, which is updated on this thread as their results come in.
+                            metric_dependencies = {
+                                dependency.id: metrics[dependency.id]
+                                for metric in metric_group
+                                for dependency in metric.metric_dependencies.values()
+                                if dependency.id in metrics
+                            }
+                            future = executor.submit(
+                                self._resolve_metrics,
+                                execution_engine=self._execution_engine,
+                                metrics_to_resolve=metric_group,
+                                metrics=metric_dependencies,
+                                runtime_configuration=runtime_configuration,
+                            )
+                            pending_futures[future] = metric_group
+
+                    _submit(ready_metrics)
+                    while pending_futures:
+                        done_futures, _ = concurrent.futures.wait(
+                            pending_futures,
+                            return_when=concurrent.futures.FIRST_COMPLETED,
+                        )
+                        ready_metrics = []
+                        for future in done_futures:
+                            metric_group = pending_futures.pop(future)
+                            try:
+                                metrics.update(future.result())
+                            except Exception:
+                                for pending_future in pending_futures:
+                                    pending_future.cancel()
+                                raise
+                            pbar.update(len(metric_group))
+                            num_resolved += len(metric_group)
+                            ready_metrics.extend(
+                                _release_dependents(
+                                    [metric.id for metric in metric_group]
+                                )
+                            )
+                        _submit(ready_metrics)
+        finally:
+            pbar.close()
+
+        if num_resolved < len(metric_configurations):
+            unresolved_metric_ids = [
+                metric_id
+                for metric_id, count in unmet_dependency_counts.items()
+                if count > 0
+            ]
+            raise GreatExpectationsError(
+                f"Unable to resolve metrics with unmet or circular dependencies: {str(unresolved_metric_ids)}"
             )
-            pbar.update(len(ready_metrics))
-            if len(ready_metrics) + len(needed_metrics) == 0:
-                done = True
-        pbar.close()
 
         return metrics
 
-    def _parse_validation_graph(self, validation_graph, metrics):
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in validation_graph.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
-
-        return maybe_ready - unmet_dependency, unmet_dependency
+    def _group_ready_metrics(
+        self, ready_metrics: List[MetricConfiguration]
+    ) -> List[List[MetricConfiguration]]:
+        """Splits ready metrics into independent units of work: all metrics that will be resolved through
+        resolve_metric_bundle form one group, the column aggregate metrics that the execution engine resolves together
+        over the records of a compute domain (those with a compute_on_domain_records function) form one group per
+        compute domain, and every other metric forms a group of its own."""
+        bundled_metrics = []
+        column_aggregate_metrics_by_domain: Dict[str, List] = {}
+        metric_groups = []
+        for metric in ready_metrics:
+            metric_fn = get_metric_provider(
+                metric_name=metric.metric_name, execution_engine=self._execution_engine
+            )[1]
+            if metric_fn is None:
+                bundled_metrics.append(metric)
+            elif getattr(metric_fn, "compute_on_domain_records", None) is not None:
+                compute_domain_id: str = IDDict(
+                    {
+                        k: v
+                        for k, v in metric.metric_domain_kwargs.items()
+                        if k != "column"
+                    }
+                ).to_id()
+                column_aggregate_metrics_by_domain.setdefault(
+                    compute_domain_id, []
+                ).append(metric)
+            else:
+                metric_groups.append([metric])
+        metric_groups[:0] = column_aggregate_metrics_by_domain.values()
+        if bundled_metrics:
+            metric_groups.insert(0, bundled_metrics)
+        return metric_groups
 
     def _resolve_metrics(
         self,
@@ -1087,6 +1340,77 @@ set as active.
         Raises:
            AttributeError - if 'catch_exceptions'=None and an expectation throws an AttributeError
         """
+        return self._validate(
+            batch_ids=None,
+            expectation_suite=expectation_suite,
+            run_id=run_id,
+            data_context=data_context,
+            evaluation_parameters=evaluation_parameters,
+            catch_exceptions=catch_exceptions,
+            result_format=result_format,
+            only_return_failures=only_return_failures,
+            run_name=run_name,
+            run_time=run_time,
+        )
+
+    def validate_batches(
+        self,
+        batch_ids: Optional[List[str]] = None,
+        expectation_suite=None,
+        run_id=None,
+        data_context=None,
+        evaluation_parameters=None,
+        catch_exceptions=True,
+        result_format=None,
+        only_return_failures=False,
+        run_name=None,
+        run_time=None,
+    ) -> Dict[str, ExpectationSuiteValidationResult]:
+        """Validates the expectation suite against each of several loaded batches at once.
+
+        The metrics of all batches are resolved from a single validation graph (see graph_validate_batches), which
+        lets the execution engine bundle and concurrently resolve the metrics of different batches, rather than
+        resolving one graph per batch as successive calls to validate would.
+
+        Args:
+            batch_ids (list or None): \
+                The ids of the (loaded) batches to validate. If None, all loaded batches are validated.
+
+            The other arguments are those of validate.
+
+        Returns:
+            A dictionary mapping each batch_id to the ExpectationSuiteValidationResult of that batch.
+        """
+        if batch_ids is None:
+            batch_ids = self.loaded_batch_ids
+        return self._validate(
+            batch_ids=batch_ids,
+            expectation_suite=expectation_suite,
+            run_id=run_id,
+            data_context=data_context,
+            evaluation_parameters=evaluation_parameters,
+            catch_exceptions=catch_exceptions,
+            result_format=result_format,
+            only_return_failures=only_return_failures,
+            run_name=run_name,
+            run_time=run_time,
+        )
+
+    def _validate(
+        self,
+        batch_ids: Optional[List[str]],
+        expectation_suite=None,
+        run_id=None,
+        data_context=None,
+        evaluation_parameters=None,
+        catch_exceptions=True,
+        result_format=None,
+        only_return_failures=False,
+        run_name=None,
+        run_time=None,
+    ):
+        """Validates the expectation suite against the active batch (if batch_ids is None) or against each of
+        batch_ids; in the latter case, the result is a dictionary of ExpectationSuiteValidationResult by batch_id."""
         try:
             validation_time = datetime.datetime.now(datetime.timezone.utc).strftime(
                 "%Y%m%dT%H%M%S.%fZ"
@@ -1211,44 +1535,67 @@ set as active.
             for col in columns:
                 expectations_to_evaluate.extend(columns[col])
 
-            results = self.graph_validate(
-                expectations_to_evaluate,
-                runtime_configuration={
-                    "catch_exceptions": catch_exceptions,
-                    "result_format": result_format,
-                },
-            )
-            statistics = _calc_validation_statistics(results)
-
-            if only_return_failures:
-                abbrev_results = []
-                for exp in results:
-                    if not exp.success:
-                        abbrev_results.append(exp)
-                results = abbrev_results
+            if batch_ids is None:
+                results_by_batch_id = {
+                    self.active_batch_id: self.graph_validate(
+                        expectations_to_evaluate,
+                        runtime_configuration={
+                            "catch_exceptions": catch_exceptions,
+                            "result_format": result_format,
+                        },
+                    )
+                }
+            else:
+                results_by_batch_id = self.graph_validate_batches(
+                    expectations_to_evaluate,
+                    batch_ids=batch_ids,
+                    runtime_configuration={
+                        "catch_exceptions": catch_exceptions,
+                        "result_format": result_format,
+                    },
+                )
 
             expectation_suite_name = expectation_suite.expectation_suite_name
 
-            result = ExpectationSuiteValidationResult(
-                results=results,
-                success=statistics.success,
-                statistics={
-                    "evaluated_expectations": statistics.evaluated_expectations,
-                    "successful_expectations": statistics.successful_expectations,
-                    "unsuccessful_expectations": statistics.unsuccessful_expectations,
-                    "success_percent": statistics.success_percent,
-                },
-                evaluation_parameters=runtime_evaluation_parameters,
-                meta={
-                    "great_expectations_version": ge_version,
-                    "expectation_suite_name": expectation_suite_name,
-                    "run_id": run_id,
-                    "batch_spec": self.active_batch_spec,
-                    "batch_markers": self.active_batch_markers,
-                    "active_batch_definition": self.active_batch_definition,
-                    "validation_time": validation_time,
-                },
-            )
+            suite_validation_results = {}
+            for batch_id, results in results_by_batch_id.items():
+                statistics = _calc_validation_statistics(results)
+
+                if only_return_failures:
+                    abbrev_results = []
+                    for exp in results:
+                        if not exp.success:
+                            abbrev_results.append(exp)
+                    results = abbrev_results
+
+                batch = self.batches.get(batch_id)
+                suite_validation_results[batch_id] = ExpectationSuiteValidationResult(
+                    results=results,
+                    success=statistics.success,
+                    statistics={
+                        "evaluated_expectations": statistics.evaluated_expectations,
+                        "successful_expectations": statistics.successful_expectations,
+                        "unsuccessful_expectations": statistics.unsuccessful_expectations,
+                        "success_percent": statistics.success_percent,
+                    },
+                    evaluation_parameters=runtime_evaluation_parameters,
+                    meta={
+                        "great_expectations_version": ge_version,
+                        "expectation_suite_name": expectation_suite_name,
+                        "run_id": run_id,
+                        "batch_spec": batch.batch_spec if batch else None,
+                        "batch_markers": batch.batch_markers if batch else None,
+                        "active_batch_definition": batch.batch_definition
+                        if batch
+                        else None,
+                        "validation_time": validation_time,
+                    },
+                )
+
+            if batch_ids is None:
+                result = suite_validation_results[self.active_batch_id]
+            else:
+                result = suite_validation_results
 
             self._data_context = validate__data_context
         except Exception as e:
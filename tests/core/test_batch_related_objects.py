@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pandas as pd
 import pytest
 
@@ -50,6 +53,22 @@ def test_batch_definition_equality():
     assert A == A2
 
 
+def test_batch_definition_copy_and_pickle():
+    A = BatchDefinition("A", "a", "aaa", batch_identifiers=IDDict({"id": "A"}))
+    A.batch_spec_passthrough = {"reader_method": "read_csv"}
+
+    # BatchDefinition uses __slots__, so instances carry no attribute dictionary.
+    assert not hasattr(A, "__dict__")
+    for A2 in [copy.deepcopy(A), pickle.loads(pickle.dumps(A))]:
+        assert A2 == A
+        assert A2.batch_spec_passthrough == {"reader_method": "read_csv"}
+
+    # Indexing by position yields the attribute names, as it does for DictDot objects that have a __dict__.
+    assert A[0] == "_datasource_name"
+    assert A[3] == "_batch_identifiers"
+    assert A[-1] == "_batch_spec_passthrough"
+
+
 def test_batch__str__method():
     batch = Batch(
         data=None,
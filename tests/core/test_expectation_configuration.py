@@ -175,3 +175,67 @@ def test_expectation_configuration_patch(config4, config5, config6, config7):
 
     with pytest.raises(ValueError):
         config5.patch("add", "/foo/-", 4)
+
+
+def test_expectation_configuration_copy_with_kwargs(config1):
+    config = config1.copy_with_kwargs({"batch_id": "1234", "result_format": "SUMMARY"})
+
+    assert config.expectation_type == config1.expectation_type
+    assert config.kwargs == {
+        "column": "a",
+        "value_set": [1, 2, 3],
+        "result_format": "SUMMARY",
+        "batch_id": "1234",
+    }
+    # The copied kwargs can be updated without affecting the original configuration...
+    config.kwargs["mostly"] = 0.9
+    assert config1.kwargs == {
+        "column": "a",
+        "value_set": [1, 2, 3],
+        "result_format": "BASIC",
+    }
+    # ...whose kwarg values are shared rather than copied.
+    assert config.kwargs["value_set"] is config1.kwargs["value_set"]
+
+
+def test_expectation_configuration_get_runtime_kwargs_does_not_modify_configuration(
+    config1,
+):
+    config1.kwargs["result_format"] = {"result_format": "SUMMARY"}
+
+    runtime_kwargs = config1.get_runtime_kwargs(
+        runtime_configuration={"include_config": False}
+    )
+
+    assert runtime_kwargs["result_format"] == {
+        "result_format": "SUMMARY",
+        "partial_unexpected_count": 20,
+    }
+    assert runtime_kwargs["include_config"] is False
+    assert config1.kwargs == {
+        "column": "a",
+        "value_set": [1, 2, 3],
+        "result_format": {"result_format": "SUMMARY"},
+    }
+
+
+def test_expectation_configuration_get_raw_configuration():
+    config = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": {"$PARAMETER": "value_set"}},
+        meta={"notes": "This is an expectation."},
+    )
+    config.process_evaluation_parameters(evaluation_parameters={"value_set": [1, 2, 3]})
+    assert config.kwargs["value_set"] == [1, 2, 3]
+
+    raw_config = config.get_raw_configuration()
+    assert raw_config.kwargs == {
+        "column": "a",
+        "value_set": {"$PARAMETER": "value_set"},
+    }
+    raw_config.kwargs["value_set"]["$PARAMETER"] = "other_value_set"
+    raw_config.meta["notes"] = "This is another expectation."
+    assert config.get_raw_configuration().kwargs["value_set"] == {
+        "$PARAMETER": "value_set"
+    }
+    assert config.meta["notes"] == "This is an expectation."
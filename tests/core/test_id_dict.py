@@ -0,0 +1,71 @@
+import copy
+import pickle
+
+import pytest
+
+from great_expectations.core.id_dict import FrozenIDDict, IDDict
+
+
+def test_id_dict_id_follows_modification():
+    id_dict = IDDict({"a": {"x": 1}, "b": 2})
+    original_id = id_dict.to_id()
+
+    id_dict["c"] = 3
+    assert id_dict.to_id() == IDDict({"a": {"x": 1}, "b": 2, "c": 3}).to_id()
+    del id_dict["c"]
+    assert id_dict.to_id() == original_id
+
+    # Values changed in place change the id as well.
+    id_dict["a"]["x"] = 5
+    assert id_dict.to_id() != original_id
+    assert id_dict.to_id() == IDDict({"a": {"x": 5}, "b": 2}).to_id()
+
+    assert id_dict.to_id(id_keys=["b"]) == "b=2"
+    assert id_dict.to_id(id_ignore_keys=["a", "b"]) == tuple()
+
+
+def test_id_dict_copies_do_not_share_cached_id():
+    id_dict = IDDict({"a": 1, "b": 2})
+    original_id = id_dict.to_id()
+
+    id_dict_copy = copy.deepcopy(id_dict)
+    id_dict_copy["c"] = 3
+    assert id_dict.to_id() == original_id
+    assert id_dict_copy.to_id() != original_id
+
+    assert pickle.loads(pickle.dumps(id_dict)).to_id() == original_id
+
+
+def test_frozen_id_dict_cannot_be_modified():
+    frozen = FrozenIDDict({"a": 1, "b": [1, 2]})
+    for modify in [
+        lambda d: d.__setitem__("a", 2),
+        lambda d: d.__delitem__("a"),
+        lambda d: d.update(a=2),
+        lambda d: d.pop("a"),
+        lambda d: d.popitem(),
+        lambda d: d.setdefault("c", 3),
+        lambda d: d.clear(),
+    ]:
+        with pytest.raises(TypeError):
+            modify(frozen)
+    assert frozen == {"a": 1, "b": [1, 2]}
+
+    # Copies are modifiable.
+    for frozen_copy in [copy.copy(frozen), copy.deepcopy(frozen), frozen.copy()]:
+        assert type(frozen_copy) == IDDict
+        assert frozen_copy.to_id() == frozen.to_id()
+        frozen_copy["a"] = 2
+    assert frozen["a"] == 1
+
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+def test_frozen_id_dict_values_cannot_be_modified_through_other_references():
+    kwargs = {"a": {"x": 1}, "b": 2}
+    frozen = FrozenIDDict(kwargs)
+    original_id = frozen.to_id()
+
+    kwargs["a"]["x"] = 5
+    assert frozen == {"a": {"x": 1}, "b": 2}
+    assert frozen.to_id() == original_id == IDDict({"a": {"x": 1}, "b": 2}).to_id()
@@ -0,0 +1,132 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from great_expectations.core.sketches import (
+    CountMinSketch,
+    HyperLogLogSketch,
+    KLLSketch,
+)
+from great_expectations.core.util import convert_to_json_serializable
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(seed=0).integers(0, 20000, 100000)
+
+
+def _round_trip(sketch):
+    json_dict = json.loads(json.dumps(convert_to_json_serializable(sketch)))
+    return type(sketch).from_json_dict(json_dict)
+
+
+def test_hyperloglog_sketch_estimate(values):
+    sketch = HyperLogLogSketch().update(values)
+    assert sketch.estimate() == pytest.approx(len(np.unique(values)), rel=0.03)
+
+    assert HyperLogLogSketch().estimate() == 0
+    assert HyperLogLogSketch().update(["a", "b", "a"]).estimate() == pytest.approx(
+        2, abs=0.1
+    )
+
+
+def test_hyperloglog_sketch_merge(values):
+    sketch = HyperLogLogSketch().update(values)
+    merged_sketch = (
+        HyperLogLogSketch()
+        .update(values[:30000])
+        .merge(HyperLogLogSketch().update(values[30000:]))
+    )
+    assert merged_sketch == sketch
+
+    with pytest.raises(ValueError):
+        sketch.merge(HyperLogLogSketch(precision=10))
+
+
+def test_hyperloglog_sketch_serialization(values):
+    sketch = HyperLogLogSketch(precision=10).update(values)
+    assert _round_trip(sketch) == sketch
+    assert pickle.loads(pickle.dumps(sketch)) == sketch
+
+    with pytest.raises(ValueError):
+        HyperLogLogSketch(precision=20)
+
+
+def test_kll_sketch_quantiles():
+    values = np.random.default_rng(seed=0).normal(size=100000)
+    sketch = KLLSketch().update(values).update([np.nan])
+    assert sketch.count == 100000
+
+    estimates = sketch.quantiles([0, 0.1, 0.5, 0.9, 1])
+    assert estimates[0] == values.min()
+    assert estimates[-1] == values.max()
+    for quantile, estimate in zip([0.1, 0.5, 0.9], estimates[1:-1]):
+        assert np.mean(values <= estimate) == pytest.approx(quantile, abs=0.02)
+
+    assert KLLSketch().quantiles([0.5]) == [None]
+    with pytest.raises(ValueError):
+        sketch.quantiles([1.5])
+
+
+def test_kll_sketch_quantiles_without_numpy_generator_api(monkeypatch):
+    values = np.random.default_rng(seed=0).normal(size=100000)
+    # NumPy versions older than 1.17 do not provide the Generator API.
+    monkeypatch.delattr(np.random, "default_rng")
+    sketch = KLLSketch().update(values)
+    assert sketch.count == 100000
+
+    estimate = sketch.quantiles([0.5])[0]
+    assert np.mean(values <= estimate) == pytest.approx(0.5, abs=0.02)
+
+
+def test_kll_sketch_merge():
+    values = np.random.default_rng(seed=0).normal(size=100000)
+    partition_sketches = [KLLSketch().update(part) for part in np.split(values, 8)]
+    merged_sketch = partition_sketches[0]
+    for sketch in partition_sketches[1:]:
+        merged_sketch.merge(sketch)
+
+    assert merged_sketch.count == 100000
+    estimate = merged_sketch.quantiles([0.5])[0]
+    assert np.mean(values <= estimate) == pytest.approx(0.5, abs=0.02)
+
+    with pytest.raises(ValueError):
+        merged_sketch.merge(KLLSketch(k=100))
+
+
+def test_kll_sketch_serialization():
+    sketch = KLLSketch(k=50).update(np.arange(10000))
+    assert _round_trip(sketch) == sketch
+    assert pickle.loads(pickle.dumps(sketch)) == sketch
+    assert _round_trip(sketch).quantiles([0.5]) == sketch.quantiles([0.5])
+
+
+def test_count_min_sketch_estimate(values):
+    sketch = CountMinSketch().update(values)
+    assert sketch.count == len(values)
+
+    actual_counts = np.bincount(values)
+    estimates = sketch.estimate(np.arange(100))
+    assert np.all(estimates >= actual_counts[:100])
+    assert np.all(estimates - actual_counts[:100] <= np.e / 2048 * len(values))
+
+    assert list(CountMinSketch().update(["a", "b", "a"]).estimate(["a", "b"])) == [
+        2,
+        1,
+    ]
+
+
+def test_count_min_sketch_merge_and_serialization(values):
+    sketch = CountMinSketch(width=256, depth=3).update(values)
+    merged_sketch = (
+        CountMinSketch(width=256, depth=3)
+        .update(values[:50000])
+        .merge(CountMinSketch(width=256, depth=3).update(values[50000:]))
+    )
+    assert merged_sketch == sketch
+    assert _round_trip(sketch) == sketch
+
+    with pytest.raises(ValueError):
+        sketch.merge(CountMinSketch())
@@ -0,0 +1,214 @@
+import os
+from unittest import mock
+
+import boto3
+import pytest
+from moto import mock_s3
+
+from great_expectations.core import ExpectationSuite
+from great_expectations.data_context.store import (
+    CachingStoreBackend,
+    ExpectationsStore,
+    InMemoryStoreBackend,
+    TupleFilesystemStoreBackend,
+    TupleS3StoreBackend,
+)
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+)
+from great_expectations.exceptions import InvalidKeyError
+
+
+@pytest.fixture
+def filesystem_store_backend(tmp_path):
+    return TupleFilesystemStoreBackend(
+        root_directory=str(tmp_path), base_directory="my_store"
+    )
+
+
+def _write_behind_cache(store_backend, key, value):
+    """Change the value of key as another writer would, making sure that its modification time changes."""
+    store_backend.set(key, value)
+    filepath = os.path.join(
+        store_backend.full_base_directory, store_backend._convert_key_to_filepath(key)
+    )
+    stat_result = os.stat(filepath)
+    os.utime(filepath, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 10 ** 9))
+
+
+def test_caching_store_backend_validates_cached_values(filesystem_store_backend):
+    caching_store_backend = CachingStoreBackend(store_backend=filesystem_store_backend)
+    caching_store_backend.set(("AAA",), "aaa")
+
+    with mock.patch.object(
+        filesystem_store_backend, "_get", wraps=filesystem_store_backend._get
+    ) as mock_get:
+        assert caching_store_backend.get(("AAA",)) == "aaa"
+        assert caching_store_backend.get(("AAA",)) == "aaa"
+        assert mock_get.call_count == 1
+
+        # A change made by another writer is picked up.
+        _write_behind_cache(filesystem_store_backend, ("AAA",), "bbb")
+        assert caching_store_backend.get(("AAA",)) == "bbb"
+        assert caching_store_backend.get(("AAA",)) == "bbb"
+        assert mock_get.call_count == 2
+
+        # Values that are set through the cache are invalidated.
+        caching_store_backend.set(("AAA",), "ccc")
+        assert caching_store_backend.get(("AAA",)) == "ccc"
+        assert mock_get.call_count == 3
+
+    filesystem_store_backend.remove_key(("AAA",))
+    with pytest.raises(InvalidKeyError):
+        caching_store_backend.get(("AAA",))
+    assert not caching_store_backend.has_key(("AAA",))
+
+
+def test_caching_store_backend_revalidate_after_seconds(caplog):
+    in_memory_store_backend = InMemoryStoreBackend()
+    in_memory_store_backend.set(("AAA",), "aaa")
+
+    # Values of backends that cannot report versions are not cached (nor copied)...
+    caching_store_backend = CachingStoreBackend(store_backend=in_memory_store_backend)
+    assert "InMemoryStoreBackend cannot report the versions" in caplog.text
+    with mock.patch.object(
+        in_memory_store_backend, "_get", wraps=in_memory_store_backend._get
+    ) as mock_get:
+        caching_store_backend.get(("AAA",))
+        caching_store_backend.get(("AAA",))
+        assert mock_get.call_count == 2
+    deserialized_value = {"value": "aaa"}
+    assert (
+        caching_store_backend.get_deserialized(
+            ("AAA",), deserialize=lambda value: deserialized_value
+        )
+        is deserialized_value
+    )
+    caplog.clear()
+
+    # ...unless they are served without validation for some time.
+    caching_store_backend = CachingStoreBackend(
+        store_backend=in_memory_store_backend, revalidate_after_seconds=3600
+    )
+    assert "cannot report the versions" not in caplog.text
+    with mock.patch.object(
+        in_memory_store_backend, "_get", wraps=in_memory_store_backend._get
+    ) as mock_get, mock.patch.object(
+        in_memory_store_backend, "_get_version"
+    ) as mock_get_version:
+        assert caching_store_backend.get(("AAA",)) == "aaa"
+        in_memory_store_backend.set(("AAA",), "bbb")
+        assert caching_store_backend.get(("AAA",)) == "aaa"
+        assert caching_store_backend.has_key(("AAA",))
+        assert mock_get.call_count == 1
+        assert mock_get_version.call_count == 1
+
+        caching_store_backend.clear()
+        assert caching_store_backend.get(("AAA",)) == "bbb"
+
+
+def test_caching_store_backend_evicts_least_recently_used_values(
+    filesystem_store_backend,
+):
+    caching_store_backend = CachingStoreBackend(
+        store_backend=filesystem_store_backend, max_size=2
+    )
+    for key in ["AAA", "BBB", "CCC"]:
+        caching_store_backend.set((key,), key.lower())
+
+    with mock.patch.object(
+        filesystem_store_backend, "_get", wraps=filesystem_store_backend._get
+    ) as mock_get:
+        for key in ["AAA", "BBB", "AAA", "CCC", "AAA", "BBB"]:
+            assert caching_store_backend.get((key,)) == key.lower()
+        assert [call.args[0] for call in mock_get.call_args_list] == [
+            ("AAA",),
+            ("BBB",),
+            ("CCC",),
+            ("BBB",),
+        ]
+
+
+def test_caching_store_backend_delegates_to_wrapped_backend(
+    filesystem_store_backend,
+):
+    caching_store_backend = CachingStoreBackend(store_backend=filesystem_store_backend)
+    caching_store_backend.set_many([(("AAA",), "aaa"), (("BBB",), "bbb")])
+
+    assert caching_store_backend.fixed_length_key is False
+    assert (
+        caching_store_backend.store_backend_id
+        == filesystem_store_backend.store_backend_id
+    )
+    assert caching_store_backend.full_base_directory == (
+        filesystem_store_backend.full_base_directory
+    )
+    assert set(caching_store_backend.list_keys()) == {
+        (".ge_store_backend_id",),
+        ("AAA",),
+        ("BBB",),
+    }
+    assert caching_store_backend.get_many([("BBB",), ("AAA",)]) == ["bbb", "aaa"]
+    assert caching_store_backend.has_many([("AAA",), ("CCC",)]) == [True, False]
+    assert caching_store_backend.config["store_backend"]["class_name"] == (
+        "TupleFilesystemStoreBackend"
+    )
+
+    caching_store_backend.move(("AAA",), ("CCC",))
+    assert caching_store_backend.get(("CCC",)) == "aaa"
+    with pytest.raises(InvalidKeyError):
+        caching_store_backend.get(("AAA",))
+
+
+def test_expectations_store_with_caching_store_backend(tmp_path):
+    store = ExpectationsStore(
+        store_backend={
+            "class_name": "CachingStoreBackend",
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "expectations",
+            },
+        },
+        runtime_environment={"root_directory": str(tmp_path)},
+    )
+    assert isinstance(store.store_backend, CachingStoreBackend)
+
+    key = ExpectationSuiteIdentifier("my_suite")
+    store.set(key, ExpectationSuite(expectation_suite_name="my_suite"))
+    # The defaults of the wrapped store backend are applied.
+    assert os.path.isfile(tmp_path / "expectations" / "my_suite.json")
+
+    with mock.patch.object(
+        store, "deserialize", wraps=store.deserialize
+    ) as mock_deserialize:
+        expectation_suite = store.get(key)
+        assert expectation_suite.expectation_suite_name == "my_suite"
+        expectation_suite.meta["notes"] = "changed by the caller"
+
+        cached_expectation_suite = store.get(key)
+        assert cached_expectation_suite is not expectation_suite
+        assert "notes" not in cached_expectation_suite.meta
+        assert mock_deserialize.call_count == 1
+
+
+@mock_s3
+def test_TupleS3StoreBackend_get_version():
+    bucket = "leakybucket"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix="this_is_a_test_prefix",
+        boto3_options={"region_name": "us-east-1"},
+    )
+    my_store.set(("AAA",), "aaa")
+    version = my_store.get_version(("AAA",))
+    assert version == my_store.get_version(("AAA",))
+
+    my_store.set(("AAA",), "bbb")
+    assert my_store.get_version(("AAA",)) != version
+
+    with pytest.raises(InvalidKeyError):
+        my_store.get_version(("BBB",))
@@ -6,7 +6,7 @@ import pytest
 import tests.test_utils as test_utils
 from great_expectations.data_context.store import DatabaseStoreBackend
 from great_expectations.data_context.util import instantiate_class_from_config
-from great_expectations.exceptions import StoreBackendError
+from great_expectations.exceptions import StoreBackendError, StoreError
 
 try:
     sqlalchemy = pytest.importorskip("sqlalchemy")
@@ -217,3 +217,120 @@ def test_database_store_backend_id_initialization(caplog, sa, test_backends):
         expectations_store_with_database_backend.store_backend_id
         == "00000000-0000-0000-0000-000000aaaaaa"
     )
+
+
+def test_database_store_backend_bulk_methods(caplog):
+    store_backend = DatabaseStoreBackend(
+        engine=sqlalchemy.create_engine("sqlite://"),
+        table_name="test_database_store_backend_bulk_methods",
+        key_columns=["k1", "k2"],
+    )
+    # Looking up the keys in several chunks gives the same results as a single query.
+    store_backend.MAX_BULK_QUERY_PARAMETERS = 6
+
+    key_value_pairs = [((str(index), "a"), f"value_{index}") for index in range(10)]
+    store_backend.set_many(key_value_pairs)
+    assert store_backend.get(("7", "a")) == "value_7"
+
+    keys = [key for key, _ in reversed(key_value_pairs)]
+    assert store_backend.get_many(keys) == [
+        value for _, value in reversed(key_value_pairs)
+    ]
+    assert store_backend.has_many(keys + [("10", "a"), ("1", "b")]) == [True] * 10 + [
+        False,
+        False,
+    ]
+
+    # Existing keys are updated and new keys are inserted in a single call.
+    store_backend.set_many([(("0", "a"), "new_value"), (("10", "a"), "value_10")])
+    assert store_backend.get_many([("0", "a"), ("1", "a"), ("10", "a")]) == [
+        "new_value",
+        "value_1",
+        "value_10",
+    ]
+
+    with pytest.raises(StoreError):
+        store_backend.get_many([("0", "a"), ("11", "a")])
+
+    # Without allow_update, storing a key that exists with the same value is tolerated, as it is by set.
+    store_backend.set_many([(("1", "a"), "value_1")], allow_update=False)
+    with pytest.raises(StoreBackendError):
+        store_backend.set_many([(("1", "a"), "other_value")], allow_update=False)
+
+
+def _record_statements(engine) -> list:
+    statements = []
+
+    @sqlalchemy.event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        statements.append(statement)
+
+    return statements
+
+
+def test_database_store_backend_upserts_values(tmp_path):
+    store_backend = DatabaseStoreBackend(
+        url=f"sqlite:///{tmp_path / 'store.db'}",
+        table_name="test_database_store_backend_upserts_values",
+        key_columns=["k1", "k2"],
+    )
+    statements = _record_statements(store_backend.engine)
+
+    store_backend.set(("1", "a"), "hello")
+    store_backend.set(("1", "a"), "goodbye")
+    store_backend.set(("1", "b"), "hello")
+    # Each value is stored with a single statement, rather than a lookup followed by an insert or an update.
+    assert len(statements) == 3
+    assert store_backend.get_many([("1", "a"), ("1", "b")]) == ["goodbye", "hello"]
+
+    statements.clear()
+    store_backend.set_many([((str(index), "c"), "value") for index in range(100)])
+    assert len(statements) == 1
+    assert store_backend.has_many([("0", "c"), ("99", "c")]) == [True, True]
+
+
+def test_database_store_backend_creates_unique_index_on_key_columns(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'store.db'}")
+    # A table without a primary key, e.g. one that was not created by DatabaseStoreBackend.
+    sqlalchemy.Table(
+        "my_table",
+        sqlalchemy.MetaData(),
+        sqlalchemy.Column("k1", sqlalchemy.String),
+        sqlalchemy.Column("k2", sqlalchemy.String),
+        sqlalchemy.Column("value", sqlalchemy.String),
+    ).create(bind=engine)
+
+    store_backend = DatabaseStoreBackend(
+        engine=engine, table_name="my_table", key_columns=["k1", "k2"]
+    )
+    assert {
+        (index["name"], tuple(index["column_names"]), bool(index["unique"]))
+        for index in sqlalchemy.inspect(engine).get_indexes("my_table")
+    } == {("ix_my_table_key_columns", ("k1", "k2"), True)}
+
+    store_backend.set(("1", "a"), "hello")
+    store_backend.set(("1", "a"), "goodbye")
+    assert store_backend.get(("1", "a")) == "goodbye"
+    assert store_backend.list_keys() == [("1", "a")]
+
+    # The index is only created once.
+    DatabaseStoreBackend(engine=engine, table_name="my_table", key_columns=["k1", "k2"])
+    assert len(sqlalchemy.inspect(engine).get_indexes("my_table")) == 1
+
+
+def test_database_store_backend_pool_options(tmp_path):
+    store_backend = DatabaseStoreBackend(
+        url=f"sqlite:///{tmp_path / 'store.db'}",
+        table_name="test_database_store_backend_pool_options",
+        key_columns=["k1"],
+        pool_size=3,
+        max_overflow=2,
+        pool_pre_ping=True,
+        poolclass=sqlalchemy.pool.QueuePool,
+    )
+    assert store_backend.engine.pool.size() == 3
+    assert store_backend.config["pool_size"] == 3
+    assert store_backend.config["max_overflow"] == 2
+    assert "pool_recycle" not in store_backend.config
@@ -247,3 +247,49 @@ def test_database_evaluation_parameter_store_get_bind_params(param_store):
         "urn:great_expectations:validations:asset2.warning:"
         "expect_column_values_to_match_regex.result.unexpected_percent:column=mycol": 12.3456789,
     }
+
+
+def test_evaluation_parameter_store_get_bind_params_with_bulk_requests():
+    param_store = instantiate_class_from_config(
+        config={
+            "class_name": "EvaluationParameterStore",
+            "store_backend": {
+                "class_name": "DatabaseStoreBackend",
+                "url": "sqlite://",
+            },
+        },
+        config_defaults={
+            "module_name": "great_expectations.data_context.store",
+        },
+        runtime_environment={},
+    )
+    run_id = RunIdentifier(run_name="my_run")
+    metrics = [
+        (
+            ValidationMetricIdentifier(
+                run_id=run_id,
+                data_asset_name=None,
+                expectation_suite_identifier="asset.warning",
+                metric_name="expect_column_max_to_be_between.result.observed_value",
+                metric_kwargs_id=f"column=col_{index}",
+            ),
+            index,
+        )
+        for index in range(50)
+    ]
+    param_store.set_many(metrics)
+    param_store.set(
+        ValidationMetricIdentifier(
+            run_id=RunIdentifier(run_name="other_run"),
+            data_asset_name=None,
+            expectation_suite_identifier="asset.warning",
+            metric_name="expect_table_row_count_to_be_between.result.observed_value",
+            metric_kwargs_id=None,
+        ),
+        512,
+    )
+
+    assert param_store.get_many([key for key, _ in metrics[:3]]) == [0, 1, 2]
+    assert param_store.get_bind_params(run_id) == {
+        key.to_evaluation_parameter_urn(): value for key, value in metrics
+    }
@@ -1166,3 +1166,204 @@ def test_GeCloudStoreBackend():
                     "Authorization": "Bearer 1234",
                 },
             )
+
+
+@pytest.mark.parametrize(
+    "store_backend_kwargs",
+    [
+        {"filepath_suffix": ".json"},
+        {"filepath_prefix": "validations", "filepath_suffix": ".json"},
+        {"filepath_template": "{0}/runs/{1}/{2}/result-{2}.json"},
+    ],
+)
+def test_TupleFilesystemStoreBackend_list_keys_with_prefix(
+    tmp_path_factory, store_backend_kwargs
+):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_TupleFilesystemStoreBackend_list_keys_with_prefix"
+        )
+    )
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=base_directory,
+        base_directory="store",
+        suppress_store_backend_id=True,
+        **store_backend_kwargs,
+    )
+    all_keys = [
+        (suite_name, run_name, batch_id)
+        for suite_name in ["suite_a", "suite_ab", "suite_b"]
+        for run_name in ["run_1", "run_10", "run_2"]
+        for batch_id in ["batch_1", "batch_2"]
+    ]
+    for key in all_keys:
+        my_store.set(key, "value")
+
+    assert sorted(my_store.list_keys()) == sorted(all_keys)
+    for prefix in [
+        ("suite_a",),
+        ("suite_a", "run_1"),
+        ("suite_a", "run_1", "batch_2"),
+        ("suite_c",),
+    ]:
+        expected_keys = sorted(key for key in all_keys if key[: len(prefix)] == prefix)
+        assert sorted(my_store.list_keys(prefix=prefix)) == expected_keys
+        assert sorted(my_store.iter_keys(prefix=prefix)) == expected_keys
+
+    assert my_store.has_key(("suite_a", "run_1", "batch_2"))
+    assert not my_store.has_key(("suite_a", "run_1", "batch_3"))
+
+
+def test_TupleFilesystemStoreBackend_list_keys_with_prefix_walks_only_prefix_directories(
+    tmp_path_factory,
+):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_TupleFilesystemStoreBackend_list_keys_with_prefix_walks_only_prefix_directories"
+        )
+    )
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=base_directory,
+        base_directory="store",
+        filepath_suffix=".json",
+        suppress_store_backend_id=True,
+    )
+    for suite_name in ["suite_a", "suite_ab", "suite_b"]:
+        my_store.set((suite_name, "run_1", "batch_1"), "value")
+
+    walked_directories = []
+    os_walk = os.walk
+
+    def _walk(top, *args, **kwargs):
+        for root, dirs, files in os_walk(top, *args, **kwargs):
+            walked_directories.append(
+                os.path.relpath(root, my_store.full_base_directory)
+            )
+            yield root, dirs, files
+
+    with patch("os.walk", side_effect=_walk):
+        assert my_store.list_keys(prefix=("suite_a",)) == [
+            ("suite_a", "run_1", "batch_1")
+        ]
+
+    # os.walk calls itself for each subdirectory, so subdirectories are recorded more than once.
+    assert sorted(set(walked_directories)) == [
+        ".",
+        "suite_a",
+        "suite_a/run_1",
+        "suite_ab",
+        "suite_ab/run_1",
+    ]
+
+
+@mock_s3
+def test_TupleS3StoreBackend_list_keys_with_prefix():
+    bucket = "leakybucket"
+    s3 = boto3.client("s3", region_name="us-east-1")
+    s3.create_bucket(Bucket=bucket)
+    all_keys = [
+        (suite_name, run_name, batch_id)
+        for suite_name in ["suite_a", "suite_ab", "suite_b"]
+        for run_name in ["run_1", "run_2"]
+        for batch_id in ["batch_1", "batch_2"]
+    ]
+    for key in all_keys:
+        s3.put_object(
+            Bucket=bucket, Key="my_prefix/validations/" + "/".join(key) + ".json"
+        )
+
+    my_store = TupleS3StoreBackend(
+        bucket=bucket,
+        prefix="my_prefix",
+        filepath_prefix="validations",
+        filepath_suffix=".json",
+        boto3_options={"region_name": "us-east-1"},
+        suppress_store_backend_id=True,
+    )
+
+    assert sorted(my_store.list_keys()) == sorted(all_keys)
+
+    list_objects_v2_prefixes = []
+    s3_client = boto3.client("s3", region_name="us-east-1")
+    s3_client.meta.events.register(
+        "provide-client-params.s3.ListObjectsV2",
+        lambda params, **kwargs: list_objects_v2_prefixes.append(params.get("Prefix")),
+    )
+    with patch.object(my_store, "_create_client", return_value=s3_client):
+        assert sorted(my_store.list_keys(prefix=("suite_a", "run_2"))) == [
+            ("suite_a", "run_2", "batch_1"),
+            ("suite_a", "run_2", "batch_2"),
+        ]
+        assert my_store.has_key(("suite_b", "run_1", "batch_1"))
+        assert not my_store.has_key(("suite_b", "run_1", "batch_3"))
+
+    assert list_objects_v2_prefixes == [
+        "my_prefix/validations/suite_a/run_2",
+        "my_prefix/validations/suite_b/run_1/batch_1",
+        "my_prefix/validations/suite_b/run_1/batch_3",
+    ]
+
+
+@pytest.mark.parametrize("store_backend_class", ["in_memory", "filesystem"])
+def test_StoreBackend_bulk_methods(store_backend_class, tmp_path_factory):
+    if store_backend_class == "in_memory":
+        my_store = InMemoryStoreBackend()
+    else:
+        my_store = TupleFilesystemStoreBackend(
+            root_directory=str(tmp_path_factory.mktemp("test_bulk_methods")),
+            base_directory="my_store",
+        )
+
+    key_value_pairs = [((f"key_{index}", "a"), f"value_{index}") for index in range(5)]
+    my_store.set_many(key_value_pairs)
+    assert my_store.get(("key_3", "a")) == "value_3"
+
+    keys = [key for key, _ in reversed(key_value_pairs)]
+    assert my_store.get_many(keys) == [value for _, value in reversed(key_value_pairs)]
+    assert my_store.get_many([]) == []
+    assert my_store.has_many(keys + [("key_5", "a")]) == [True] * 5 + [False]
+
+    my_store.set_many([(("key_0", "a"), "new_value"), (("key_5", "a"), "value_5")])
+    assert my_store.get_many([("key_0", "a"), ("key_5", "a")]) == [
+        "new_value",
+        "value_5",
+    ]
+
+    with pytest.raises((InvalidKeyError, StoreError)):
+        my_store.get_many([("key_0", "a"), ("key_6", "a")])
+    with pytest.raises(TypeError):
+        my_store.has_many(["key_0"])
+
+
+@mock_s3
+def test_TupleS3StoreBackend_bulk_methods():
+    bucket = "leakybucket"
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}",
+        bucket=bucket,
+        prefix="this_is_a_test_prefix",
+        boto3_options={"region_name": "us-east-1"},
+        max_request_workers=4,
+    )
+    assert my_store.config["max_request_workers"] == 4
+
+    keys = [(f"AAA{index}",) for index in range(10)]
+    my_store.set_many([(key, f"value_{key[0]}") for key in keys])
+
+    assert my_store.get_many(keys) == [f"value_{key[0]}" for key in keys]
+    assert my_store.has_many(keys[:3] + [("BBB",)]) == [True, True, True, False]
+    with pytest.raises(InvalidKeyError):
+        my_store.get_many([keys[0], ("BBB",)])
+
+
+def test_StoreBackend_map_concurrently_keeps_order():
+    def square(value):
+        return value * value
+
+    for max_workers in [None, 1, 8]:
+        assert StoreBackend._map_concurrently(
+            function=square, items=list(range(100)), max_workers=max_workers
+        ) == [value * value for value in range(100)]
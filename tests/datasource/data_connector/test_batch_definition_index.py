@@ -0,0 +1,219 @@
+from typing import List
+
+import pytest
+
+import great_expectations.exceptions.exceptions as ge_exceptions
+from great_expectations.core.batch import BatchDefinition, BatchRequestBase, IDDict
+from great_expectations.datasource.data_connector.batch_definition_index import (
+    BatchDefinitionIndex,
+)
+from great_expectations.datasource.data_connector.util import (
+    batch_definition_matches_batch_request,
+    build_sorters_from_config,
+)
+
+
+@pytest.fixture
+def sorters() -> dict:
+    return build_sorters_from_config(
+        config_list=[
+            {
+                "orderby": "asc",
+                "class_name": "LexicographicSorter",
+                "name": "name",
+            },
+            {
+                "datetime_format": "%Y%m%d",
+                "orderby": "desc",
+                "class_name": "DateTimeSorter",
+                "name": "timestamp",
+            },
+        ]
+    )
+
+
+def _build_batch_definition(
+    data_asset_name: str, name: str, timestamp: str
+) -> BatchDefinition:
+    return BatchDefinition(
+        datasource_name="my_datasource",
+        data_connector_name="my_data_connector",
+        data_asset_name=data_asset_name,
+        batch_identifiers=IDDict({"name": name, "timestamp": timestamp}),
+    )
+
+
+@pytest.fixture
+def batch_definition_list() -> List[BatchDefinition]:
+    return [
+        _build_batch_definition(
+            data_asset_name=data_asset_name,
+            name=name,
+            timestamp=f"202001{day:02d}",
+        )
+        for day in [3, 1, 2]
+        for name in ["james", "abe", "eugene"]
+        for data_asset_name in ["alpha", "beta"]
+    ]
+
+
+def _get_expected_batch_definition_list(
+    batch_definition_list: List[BatchDefinition],
+    batch_request: BatchRequestBase,
+    sorters: dict,
+) -> List[BatchDefinition]:
+    expected_batch_definition_list: List[BatchDefinition] = [
+        batch_definition
+        for batch_definition in batch_definition_list
+        if batch_definition_matches_batch_request(
+            batch_definition=batch_definition, batch_request=batch_request
+        )
+    ]
+    for sorter in reversed(list(sorters.values())):
+        expected_batch_definition_list = sorter.get_sorted_batch_definitions(
+            batch_definitions=expected_batch_definition_list
+        )
+    return expected_batch_definition_list
+
+
+def _build_batch_request(**kwargs) -> BatchRequestBase:
+    return BatchRequestBase(
+        datasource_name="my_datasource",
+        data_connector_name="my_data_connector",
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "batch_request_kwargs",
+    [
+        {"data_asset_name": ""},
+        {"data_asset_name": "alpha"},
+        {"data_asset_name": "beta", "batch_identifiers": {"name": "abe"}},
+        {
+            "data_asset_name": "alpha",
+            "data_connector_query": {
+                "batch_filter_parameters": {"timestamp": "20200102"}
+            },
+        },
+        {
+            "data_asset_name": "",
+            "batch_identifiers": {"timestamp": "20200103"},
+            "data_connector_query": {"batch_filter_parameters": {"name": "james"}},
+        },
+        {"data_asset_name": "alpha", "batch_identifiers": {"name": "zeke"}},
+        {"data_asset_name": "gamma"},
+        {
+            "data_asset_name": "alpha",
+            "batch_identifiers": {"name": "abe"},
+            "data_connector_query": {"batch_filter_parameters": {"name": "james"}},
+        },
+        {
+            "data_asset_name": "alpha",
+            "data_connector_query": {"batch_filter_parameters": {"name": ["abe"]}},
+        },
+    ],
+)
+def test_get_batch_definition_list_matches_filtering_and_sorting(
+    sorters, batch_definition_list, batch_request_kwargs
+):
+    batch_definition_index = BatchDefinitionIndex(sorters=sorters)
+    batch_definition_index.update(batch_definition_list=batch_definition_list)
+    assert len(batch_definition_index) == len(batch_definition_list)
+
+    batch_request: BatchRequestBase = _build_batch_request(**batch_request_kwargs)
+    assert batch_definition_index.get_batch_definition_list(
+        batch_request=batch_request
+    ) == _get_expected_batch_definition_list(
+        batch_definition_list=batch_definition_list,
+        batch_request=batch_request,
+        sorters=sorters,
+    )
+
+
+def test_get_batch_definition_list_without_sorters_keeps_order(
+    batch_definition_list,
+):
+    batch_definition_index = BatchDefinitionIndex()
+    batch_definition_index.update(batch_definition_list=batch_definition_list)
+
+    assert batch_definition_index.get_batch_definition_list(
+        batch_request=_build_batch_request(
+            data_asset_name="alpha", batch_identifiers={"name": "abe"}
+        )
+    ) == [
+        batch_definition
+        for batch_definition in batch_definition_list
+        if batch_definition.data_asset_name == "alpha"
+        and batch_definition.batch_identifiers["name"] == "abe"
+    ]
+
+
+def test_update_adds_and_removes_batch_definitions(sorters, batch_definition_list):
+    batch_definition_index = BatchDefinitionIndex(sorters=sorters)
+    batch_definition_index.update(batch_definition_list=batch_definition_list)
+    batch_request: BatchRequestBase = _build_batch_request(data_asset_name="alpha")
+    first_batch_definition: BatchDefinition = (
+        batch_definition_index.get_batch_definition_list(batch_request=batch_request)[0]
+    )
+    assert first_batch_definition.batch_identifiers == {
+        "name": "abe",
+        "timestamp": "20200103",
+    }
+
+    new_batch_definition: BatchDefinition = _build_batch_definition(
+        data_asset_name="alpha", name="abe", timestamp="20200104"
+    )
+    updated_batch_definition_list: List[BatchDefinition] = [
+        batch_definition
+        for batch_definition in batch_definition_list
+        if batch_definition.batch_identifiers["timestamp"] != "20200101"
+    ] + [new_batch_definition]
+    batch_definition_index.update(batch_definition_list=updated_batch_definition_list)
+
+    assert len(batch_definition_index) == len(batch_definition_list) - 6 + 1
+    assert (
+        batch_definition_index.get_batch_definition_list(batch_request=batch_request)[0]
+        is new_batch_definition
+    )
+    assert (
+        batch_definition_index.get_batch_definition_list(
+            batch_request=_build_batch_request(
+                data_asset_name="",
+                batch_identifiers={"timestamp": "20200101"},
+            )
+        )
+        == []
+    )
+    for batch_request_kwargs in [
+        {"data_asset_name": ""},
+        {"data_asset_name": "alpha", "batch_identifiers": {"name": "abe"}},
+        {"data_asset_name": "beta"},
+    ]:
+        batch_request = _build_batch_request(**batch_request_kwargs)
+        assert batch_definition_index.get_batch_definition_list(
+            batch_request=batch_request
+        ) == _get_expected_batch_definition_list(
+            batch_definition_list=updated_batch_definition_list,
+            batch_request=batch_request,
+            sorters=sorters,
+        )
+
+
+def test_get_batch_definition_list_raises_sorter_error(sorters):
+    batch_definition_index = BatchDefinitionIndex(sorters=sorters)
+    batch_definition_index.update(
+        batch_definition_list=[
+            BatchDefinition(
+                datasource_name="my_datasource",
+                data_connector_name="my_data_connector",
+                data_asset_name="alpha",
+                batch_identifiers=IDDict({"name": "abe"}),
+            )
+        ]
+    )
+
+    with pytest.raises(ge_exceptions.SorterError):
+        batch_definition_index.get_batch_definition_list(
+            batch_request=_build_batch_request(data_asset_name="alpha")
+        )
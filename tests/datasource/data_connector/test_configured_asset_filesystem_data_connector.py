@@ -1355,3 +1355,93 @@ def test_basic_instantiation_with_nested_directories(tmp_path_factory):
         # FIXME: (Sam) example_data_reference removed temporarily in PR #2590:
         # "example_data_reference": {},
     }
+
+
+def test_refresh_data_references_cache_maps_only_new_data_references(
+    tmp_path_factory,
+):
+    base_directory = str(
+        tmp_path_factory.mktemp(
+            "test_refresh_data_references_cache_maps_only_new_data_references"
+        )
+    )
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=[
+            "alpha-20200101.csv",
+            "alpha-20200102.csv",
+            "alpha-20200103.csv",
+        ],
+    )
+
+    my_data_connector = ConfiguredAssetFilesystemDataConnector(
+        name="my_data_connector",
+        datasource_name="FAKE_DATASOURCE_NAME",
+        default_regex={
+            "pattern": "alpha-(.*)\\.csv",
+            "group_names": ["timestamp"],
+        },
+        sorters=[
+            {
+                "datetime_format": "%Y%m%d",
+                "orderby": "desc",
+                "class_name": "DateTimeSorter",
+                "name": "timestamp",
+            },
+        ],
+        base_directory=base_directory,
+        assets={"alpha": {}},
+    )
+    latest_batch_request = BatchRequest(
+        datasource_name="FAKE_DATASOURCE_NAME",
+        data_connector_name="my_data_connector",
+        data_asset_name="alpha",
+        data_connector_query={"index": 0},
+    )
+
+    batch_definition_list: List[
+        BatchDefinition
+    ] = my_data_connector.get_batch_definition_list_from_batch_request(
+        batch_request=latest_batch_request
+    )
+    assert len(batch_definition_list) == 1
+    assert batch_definition_list[0].batch_identifiers == {"timestamp": "20200103"}
+
+    os.remove(os.path.join(base_directory, "alpha-20200101.csv"))
+    create_files_in_directory(
+        directory=base_directory,
+        file_name_list=["alpha-20200104.csv"],
+    )
+    with mock.patch.object(
+        my_data_connector,
+        "_map_data_references_to_batch_definition_lists",
+        wraps=my_data_connector._map_data_references_to_batch_definition_lists,
+    ) as mock_map_data_references_to_batch_definition_lists:
+        # noinspection PyProtectedMember
+        my_data_connector._refresh_data_references_cache()
+    mock_map_data_references_to_batch_definition_lists.assert_called_once_with(
+        data_references=["alpha-20200104.csv"], data_asset_name="alpha"
+    )
+    assert my_data_connector.get_data_reference_list_count() == 3
+
+    batch_definition_list = (
+        my_data_connector.get_batch_definition_list_from_batch_request(
+            batch_request=latest_batch_request
+        )
+    )
+    assert len(batch_definition_list) == 1
+    assert batch_definition_list[0].batch_identifiers == {"timestamp": "20200104"}
+
+    batch_definition_list = (
+        my_data_connector.get_batch_definition_list_from_batch_request(
+            batch_request=BatchRequest(
+                datasource_name="FAKE_DATASOURCE_NAME",
+                data_connector_name="my_data_connector",
+                data_asset_name="alpha",
+            )
+        )
+    )
+    assert [
+        batch_definition.batch_identifiers["timestamp"]
+        for batch_definition in batch_definition_list
+    ] == ["20200104", "20200103", "20200102"]
@@ -1,3 +1,5 @@
+import sys
+from typing import List
 from unittest import mock
 
 import pytest
@@ -5,15 +7,19 @@ import pytest
 import great_expectations.exceptions.exceptions as ge_exceptions
 from great_expectations.core.batch import BatchDefinition, BatchRequest, IDDict
 from great_expectations.datasource.data_connector.util import (
+    DataReferenceMatcher,
+    KeyListingCheckpoint,
     _invert_regex_to_data_reference_template,
     batch_definition_matches_batch_request,
     build_sorters_from_config,
     convert_batch_identifiers_to_data_reference_string_using_regex,
     convert_data_reference_string_to_batch_identifiers_using_regex,
     list_gcs_keys,
+    list_s3_keys,
     map_batch_definition_to_data_reference_string_using_regex,
     map_data_reference_string_to_batch_definition_list_using_regex,
 )
+from tests.test_utils import FakeS3Client
 
 
 def test_batch_definition_matches_batch_request():
@@ -419,6 +425,61 @@ def test__invert_regex_to_data_reference_template():
         )
 
 
+def test_data_reference_matcher():
+    data_reference_matcher = DataReferenceMatcher(
+        regex_pattern=r"^(.+)_(\d+)_(\d+)\.csv$",
+        group_names=["name", "timestamp", "price"],
+    )
+
+    assert (
+        data_reference_matcher.get_batch_definition_list(
+            datasource_name="test_environment",
+            data_connector_name="general_filesystem_data_connector",
+            data_reference="not_a_match.txt",
+        )
+        is None
+    )
+
+    batch_definition_list = [
+        data_reference_matcher.get_batch_definition_list(
+            datasource_name="test_environment",
+            data_connector_name="general_filesystem_data_connector",
+            data_reference=data_reference,
+            data_asset_name="TestFiles",
+        )[0]
+        for data_reference in ["eugene_20200809_1500.csv", "abe_20200809_1040.csv"]
+    ]
+    assert batch_definition_list[0] == BatchDefinition(
+        datasource_name="test_environment",
+        data_connector_name="general_filesystem_data_connector",
+        data_asset_name="TestFiles",
+        batch_identifiers=IDDict(
+            {"name": "eugene", "timestamp": "20200809", "price": "1500"}
+        ),
+    )
+    # The batch_identifiers of all BatchDefinitions share the same group name strings.
+    assert all(
+        first_key is second_key
+        for first_key, second_key in zip(
+            batch_definition_list[0].batch_identifiers,
+            batch_definition_list[1].batch_identifiers,
+        )
+    )
+
+    assert [
+        data_reference_matcher.get_data_reference(
+            batch_identifiers=batch_definition.batch_identifiers,
+            data_asset_name=batch_definition.data_asset_name,
+        )
+        for batch_definition in batch_definition_list
+    ] == ["eugene_20200809_1500.csv", "abe_20200809_1040.csv"]
+
+    with pytest.raises(TypeError):
+        data_reference_matcher.get_data_reference(
+            batch_identifiers={"name": "eugene", "timestamp": "20200809"}
+        )
+
+
 def test_build_sorters_from_config_good_config():
     sorters_config = [
         {
@@ -474,3 +535,179 @@ def test_list_gcs_keys_overwrites_delimiter(mock_gcs_conn):
     query_options = {"delimiter": "/"}
     list_gcs_keys(mock_gcs_conn, query_options, recursive=True)
     assert query_options["delimiter"] is None
+
+
+@pytest.fixture
+def nested_s3_keys() -> List[str]:
+    return [
+        f"data/{directory}/{subdirectory}/file_{file_index}.csv"
+        for directory in ["alpha", "beta", "gamma"]
+        for subdirectory in ["2020", "2021"]
+        for file_index in range(5)
+    ] + ["data/top_level.csv", "other/ignored.csv"]
+
+
+def _list_s3_keys(s3, **kwargs) -> List[str]:
+    query_options: dict = {
+        "Bucket": "test_bucket",
+        "Prefix": "data/",
+        "Delimiter": "/",
+        "MaxKeys": 4,
+    }
+    return list(
+        list_s3_keys(s3=s3, query_options=query_options, iterator_dict={}, **kwargs)
+    )
+
+
+def test_list_s3_keys_lists_pages_and_prefixes(nested_s3_keys):
+    assert _list_s3_keys(FakeS3Client(keys=nested_s3_keys)) == ["data/top_level.csv"]
+
+    keys: List[str] = _list_s3_keys(FakeS3Client(keys=nested_s3_keys), recursive=True)
+    # The keys of each page are listed before the prefixes in that page, and prefixes are listed depth-first.
+    assert keys == ["data/top_level.csv"] + sorted(
+        key for key in nested_s3_keys if key.startswith("data/") and key.count("/") > 1
+    )
+
+
+def test_list_s3_keys_lists_deep_hierarchies_iteratively():
+    depth: int = sys.getrecursionlimit() + 100
+    keys: List[str] = ["data/" + "level/" * depth + "file.csv", "data/file.csv"]
+
+    assert _list_s3_keys(FakeS3Client(keys=keys), recursive=True) == [
+        "data/file.csv",
+        keys[0],
+    ]
+
+
+def test_list_s3_keys_concurrently_lists_same_keys(nested_s3_keys):
+    s3 = FakeS3Client(keys=nested_s3_keys)
+    keys: List[str] = _list_s3_keys(s3, recursive=True, max_workers=4)
+
+    serial_s3 = FakeS3Client(keys=nested_s3_keys)
+    assert sorted(keys) == sorted(_list_s3_keys(serial_s3, recursive=True))
+    assert s3.request_count == serial_s3.request_count == 16
+
+
+def test_list_s3_keys_reuses_checkpoint(tmp_path, nested_s3_keys):
+    checkpoint_filepath: str = str(tmp_path / "listing_checkpoint.jsonl")
+    expected_keys: List[str] = _list_s3_keys(
+        FakeS3Client(keys=nested_s3_keys), recursive=True
+    )
+
+    s3 = FakeS3Client(keys=nested_s3_keys)
+    assert (
+        _list_s3_keys(
+            s3,
+            recursive=True,
+            checkpoint=KeyListingCheckpoint(filepath=checkpoint_filepath),
+        )
+        == expected_keys
+    )
+    assert s3.request_count > 0
+
+    # A later listing (e.g. by another run) with the same checkpoint does not list the bucket again.
+    s3 = FakeS3Client(keys=nested_s3_keys)
+    assert (
+        _list_s3_keys(
+            s3,
+            recursive=True,
+            checkpoint=KeyListingCheckpoint(filepath=checkpoint_filepath),
+        )
+        == expected_keys
+    )
+    assert s3.request_count == 0
+
+    # Expired records are listed again.
+    s3 = FakeS3Client(keys=nested_s3_keys)
+    assert (
+        _list_s3_keys(
+            s3,
+            recursive=True,
+            checkpoint=KeyListingCheckpoint(
+                filepath=checkpoint_filepath, max_age_seconds=-1
+            ),
+        )
+        == expected_keys
+    )
+    assert s3.request_count > 0
+
+
+def test_list_s3_keys_checkpoint_expires_records_of_long_lived_instance(
+    tmp_path, nested_s3_keys
+):
+    checkpoint = KeyListingCheckpoint(
+        filepath=str(tmp_path / "listing_checkpoint.jsonl"), max_age_seconds=60
+    )
+    with mock.patch("time.time", return_value=1000.0):
+        _list_s3_keys(
+            FakeS3Client(keys=nested_s3_keys), recursive=True, checkpoint=checkpoint
+        )
+
+    s3 = FakeS3Client(keys=nested_s3_keys + ["data/alpha/2020/new_file.csv"])
+    with mock.patch("time.time", return_value=1030.0):
+        assert "data/alpha/2020/new_file.csv" not in _list_s3_keys(
+            s3, recursive=True, checkpoint=checkpoint
+        )
+    assert s3.request_count == 0
+
+    # The same instance lists the bucket again once its records are older than max_age_seconds.
+    with mock.patch("time.time", return_value=1061.0):
+        assert "data/alpha/2020/new_file.csv" in _list_s3_keys(
+            s3, recursive=True, checkpoint=checkpoint
+        )
+    assert s3.request_count > 0
+
+
+def test_list_s3_keys_checkpoint_invalidate(tmp_path, nested_s3_keys):
+    checkpoint_filepath: str = str(tmp_path / "listing_checkpoint.jsonl")
+    checkpoint = KeyListingCheckpoint(filepath=checkpoint_filepath)
+    _list_s3_keys(
+        FakeS3Client(keys=nested_s3_keys), recursive=True, checkpoint=checkpoint
+    )
+
+    new_keys: List[str] = ["data/alpha/2020/new_file.csv", "data/beta/new_file.csv"]
+    s3 = FakeS3Client(keys=nested_s3_keys + new_keys)
+    checkpoint.invalidate(prefix="data/alpha/")
+    keys: List[str] = _list_s3_keys(s3, recursive=True, checkpoint=checkpoint)
+    assert "data/alpha/2020/new_file.csv" in keys
+    assert "data/beta/new_file.csv" not in keys
+    # Only the invalidated prefix and its sub-prefixes are listed again.
+    assert s3.request_count == 5
+
+    # Invalidation is persisted, and invalidating everything lists the whole bucket again.
+    checkpoint = KeyListingCheckpoint(filepath=checkpoint_filepath)
+    checkpoint.invalidate()
+    keys = _list_s3_keys(s3, recursive=True, checkpoint=checkpoint)
+    assert sorted(keys) == sorted(
+        _list_s3_keys(FakeS3Client(keys=nested_s3_keys + new_keys), recursive=True)
+    )
+
+
+def test_list_s3_keys_resumes_interrupted_listing(tmp_path, nested_s3_keys):
+    class FailingS3Client(FakeS3Client):
+        def list_objects_v2(self, **kwargs) -> dict:
+            if self.request_count >= 8:
+                raise ConnectionError("Connection lost.")
+            return super().list_objects_v2(**kwargs)
+
+    checkpoint_filepath: str = str(tmp_path / "listing_checkpoint.jsonl")
+    with pytest.raises(ConnectionError):
+        _list_s3_keys(
+            FailingS3Client(keys=nested_s3_keys),
+            recursive=True,
+            checkpoint=KeyListingCheckpoint(filepath=checkpoint_filepath),
+        )
+
+    s3 = FakeS3Client(keys=nested_s3_keys)
+    full_listing_s3 = FakeS3Client(keys=nested_s3_keys)
+    assert (
+        sorted(
+            _list_s3_keys(
+                s3,
+                recursive=True,
+                checkpoint=KeyListingCheckpoint(filepath=checkpoint_filepath),
+            )
+        )
+        == sorted(_list_s3_keys(full_listing_s3, recursive=True))
+    )
+    assert 0 < s3.request_count < full_listing_s3.request_count
@@ -0,0 +1,180 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.metric_cache import (
+    FilesystemMetricCache,
+    InMemoryMetricCache,
+    SqliteMetricCache,
+)
+from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture(params=["in_memory", "sqlite", "filesystem"])
+def metric_cache_factory(request, tmp_path):
+    def _build(**kwargs):
+        if request.param == "in_memory":
+            return InMemoryMetricCache(**kwargs)
+        if request.param == "sqlite":
+            return SqliteMetricCache(
+                filepath=os.path.join(tmp_path, "metric_cache.db"), **kwargs
+            )
+        return FilesystemMetricCache(
+            base_directory=os.path.join(tmp_path, "metric_cache"), **kwargs
+        )
+
+    return _build
+
+
+def test_metric_cache_get_and_set(metric_cache_factory):
+    cache = metric_cache_factory()
+    cache.set_many({"a": 1, "b": [1, 2, 3], "c": None})
+
+    assert cache.get_many(["a", "b", "c", "d"]) == {"a": 1, "b": [1, 2, 3], "c": None}
+    assert cache.hits == 3
+    assert cache.misses == 1
+
+    cache.clear()
+    assert cache.get_many(["a"]) == {}
+
+
+def test_metric_cache_evicts_least_recently_used(metric_cache_factory):
+    cache = metric_cache_factory(max_entries=2)
+    cache.set_many({"a": 1})
+    time.sleep(0.01)
+    cache.set_many({"b": 2})
+    time.sleep(0.01)
+    # Reading "a" makes "b" the least recently used entry.
+    assert cache.get_many(["a"]) == {"a": 1}
+    time.sleep(0.01)
+    cache.set_many({"c": 3})
+
+    assert len(cache) == 2
+    assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+
+def test_metric_cache_expires_entries(metric_cache_factory):
+    cache = metric_cache_factory(ttl_seconds=0.05)
+    cache.set_many({"a": 1})
+    assert cache.get_many(["a"]) == {"a": 1}
+
+    time.sleep(0.1)
+    assert cache.get_many(["a"]) == {}
+
+
+class _CachedValue:
+    pass
+
+
+@pytest.fixture(params=["sqlite", "filesystem"])
+def persistent_metric_cache(request, tmp_path):
+    if request.param == "sqlite":
+        return SqliteMetricCache(filepath=os.path.join(tmp_path, "metric_cache.db"))
+    return FilesystemMetricCache(base_directory=os.path.join(tmp_path, "metric_cache"))
+
+
+def test_persistent_metric_cache_skips_values_that_cannot_be_serialized(
+    persistent_metric_cache,
+):
+    persistent_metric_cache.set_many({"a": lambda: 1, "b": 2})
+
+    assert persistent_metric_cache.get_many(["a", "b"]) == {"b": 2}
+    if isinstance(persistent_metric_cache, FilesystemMetricCache):
+        # No partially written files are left behind.
+        assert os.listdir(persistent_metric_cache.base_directory) == [
+            "b" + FilesystemMetricCache.FILE_SUFFIX
+        ]
+
+
+def test_persistent_metric_cache_drops_entries_that_cannot_be_loaded(
+    persistent_metric_cache, monkeypatch
+):
+    persistent_metric_cache.set_many({"a": _CachedValue(), "b": 2})
+    # The class of the cached value is no longer available (e.g. after an upgrade).
+    monkeypatch.delitem(globals(), "_CachedValue")
+
+    assert persistent_metric_cache.get_many(["a", "b"]) == {"b": 2}
+    assert persistent_metric_cache.misses == 1
+    assert len(persistent_metric_cache) == 1
+
+
+def test_sqlite_metric_cache_evicts_by_size(tmp_path):
+    cache = SqliteMetricCache(
+        filepath=os.path.join(tmp_path, "metric_cache.db"), max_size_bytes=1500
+    )
+    cache.set_many({"a": "x" * 1000})
+    time.sleep(0.01)
+    cache.set_many({"b": "y" * 1000})
+
+    assert cache.get_many(["a", "b"]) == {"b": "y" * 1000}
+
+
+def test_sqlite_metric_cache_persists_across_instances(tmp_path):
+    filepath = os.path.join(tmp_path, "metric_cache.db")
+    SqliteMetricCache(filepath=filepath).set_many({"a": {"min": 1, "max": 3}})
+
+    assert SqliteMetricCache(filepath=filepath).get_many(["a"]) == {
+        "a": {"min": 1, "max": 3}
+    }
+
+
+def test_execution_engine_instantiates_metric_cache_from_config(tmp_path):
+    engine = PandasExecutionEngine(
+        metric_cache={
+            "class_name": "SqliteMetricCache",
+            "filepath": os.path.join(tmp_path, "metric_cache.db"),
+            "ttl_seconds": 3600,
+        }
+    )
+    assert isinstance(engine.metric_cache, SqliteMetricCache)
+    assert engine.config["metric_cache"]["class_name"] == "SqliteMetricCache"
+
+    assert PandasExecutionEngine().metric_cache is None
+
+
+def test_unchanged_batch_reuses_cached_metrics_across_engines(tmp_path):
+    filepath = os.path.join(tmp_path, "metric_cache.db")
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": [4, 5, 6, 7]})
+
+    first_validator = Validator(
+        execution_engine=PandasExecutionEngine(
+            metric_cache=SqliteMetricCache(filepath=filepath)
+        ),
+        batches=[Batch(data=df)],
+    )
+    first_results = first_validator.get_metrics(
+        {
+            "row_count": MetricConfiguration("table.row_count", {}),
+            "max_a": MetricConfiguration("column.max", {"column": "a"}),
+        }
+    )
+    assert first_results == {"row_count": 4, "max_a": 3}
+
+    second_cache = SqliteMetricCache(filepath=filepath)
+    second_validator = Validator(
+        execution_engine=PandasExecutionEngine(metric_cache=second_cache),
+        batches=[Batch(data=df.copy())],
+    )
+    second_results = second_validator.get_metrics(
+        {
+            "row_count": MetricConfiguration("table.row_count", {}),
+            "max_a": MetricConfiguration("column.max", {"column": "a"}),
+            "min_b": MetricConfiguration("column.min", {"column": "b"}),
+        }
+    )
+    assert second_results == {"row_count": 4, "max_a": 3, "min_b": 4}
+    # Only the metrics that were not computed by the first run are looked up without success.
+    assert second_cache.hits >= 2
+    hits_before = second_cache.hits
+
+    changed_validator = Validator(
+        execution_engine=PandasExecutionEngine(metric_cache=second_cache),
+        batches=[Batch(data=df.iloc[:2])],
+    )
+    assert changed_validator.get_metric(MetricConfiguration("table.row_count", {})) == 2
+    assert second_cache.hits == hits_before
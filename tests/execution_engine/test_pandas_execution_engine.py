@@ -561,6 +561,184 @@ def test_resolve_metric_bundle():
     )
 
 
+def test_resolve_column_aggregate_bundle_materializes_each_domain_once():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, 4],
+            "b": [1.5, None, 3.0, 2.0],
+            "c": ["w", "x", "y", "z"],
+        }
+    )
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+
+    metrics: dict = {}
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    row_condition_kwargs = {"row_condition": "a>1", "condition_parser": "pandas"}
+    desired_metrics = []
+    for domain_kwargs in [{}, row_condition_kwargs]:
+        for column in ["a", "b", "c"]:
+            for metric_name in ["column.max", "column.min", "column.distinct_values"]:
+                desired_metrics.append(
+                    MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={"column": column, **domain_kwargs},
+                        metric_value_kwargs=None,
+                        metric_dependencies={"table.columns": table_columns_metric},
+                    )
+                )
+        for column in ["a", "b"]:
+            for metric_name in [
+                "column.mean",
+                "column.sum",
+                "column.standard_deviation",
+            ]:
+                desired_metrics.append(
+                    MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={"column": column, **domain_kwargs},
+                        metric_value_kwargs=None,
+                        metric_dependencies={"table.columns": table_columns_metric},
+                    )
+                )
+
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "get_domain_records",
+        wraps=engine.get_domain_records,
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+    assert mock_get_domain_records.call_count == 2
+
+    filtered_df = df.query("a>1").reset_index(drop=True)
+    series_reductions = {
+        "column.max": "max",
+        "column.min": "min",
+        "column.mean": "mean",
+        "column.sum": "sum",
+        "column.standard_deviation": "std",
+    }
+    for metric in desired_metrics:
+        column = metric.metric_domain_kwargs["column"]
+        source_df = (
+            filtered_df if "row_condition" in metric.metric_domain_kwargs else df
+        )
+        if metric.metric_name == "column.distinct_values":
+            # NaN is not equal to itself, so distinct values are compared without it.
+            expected = set(source_df[column].dropna().unique())
+            assert {
+                value for value in results[metric.id] if not pd.isnull(value)
+            } == expected
+            continue
+        expected = getattr(source_df[column], series_reductions[metric.metric_name])()
+        assert results[metric.id] == expected
+        assert type(results[metric.id]) == type(expected)
+
+
+def test_resolve_column_aggregate_bundle_with_nonexistent_column():
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": pd.DataFrame({"a": [1]})})
+
+    metrics: dict = {}
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "not_a_column"},
+        metric_value_kwargs=None,
+        metric_dependencies={"table.columns": table_columns_metric},
+    )
+    with pytest.raises(ge_exceptions.ExecutionEngineError):
+        engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+
+
+def test_get_domain_records_reuses_filtered_records():
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, None, 4, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"my_id": df})
+    cache = engine.domain_records_cache
+
+    # Column domains that share a row_condition share their records.
+    first = engine.get_domain_records(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": "b>2",
+            "condition_parser": "pandas",
+        }
+    )
+    second = engine.get_domain_records(
+        domain_kwargs={
+            "column": "b",
+            "row_condition": "b>2",
+            "condition_parser": "pandas",
+        }
+    )
+    assert second is first
+    assert first.equals(pd.DataFrame({"a": [3], "b": [4.0]}))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    column_pair_records = engine.get_domain_records(
+        domain_kwargs={
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        }
+    )
+    assert column_pair_records.equals(df.dropna(subset=["a", "b"]))
+    assert len(cache) == 2
+
+    # Domains that require no filtering are not cached.
+    assert engine.get_domain_records(domain_kwargs={"column": "a"}) is df
+    assert len(cache) == 2
+
+    # Reloading the batch invalidates its records.
+    engine.load_batch_data("my_id", pd.DataFrame({"a": [5], "b": [6]}))
+    assert len(cache) == 0
+    assert engine.get_domain_records(
+        domain_kwargs={
+            "column": "a",
+            "row_condition": "b>2",
+            "condition_parser": "pandas",
+        }
+    ).equals(pd.DataFrame({"a": [5], "b": [6]}))
+
+
+def test_get_domain_records_cache_limits():
+    df = pd.DataFrame({"a": list(range(100))})
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, domain_records_cache_max_entries=2
+    )
+    assert engine.config["domain_records_cache_max_entries"] == 2
+    for threshold in [10, 20, 30]:
+        engine.get_domain_records(
+            domain_kwargs={
+                "row_condition": f"a>{threshold}",
+                "condition_parser": "pandas",
+            }
+        )
+    assert len(engine.domain_records_cache) == 2
+
+    engine = PandasExecutionEngine(
+        batch_data_dict={"my_id": df}, domain_records_cache_max_bytes=1000
+    )
+    # 89 rows of int64 values (plus the index) exceed the limit, while 9 rows do not.
+    engine.get_domain_records(
+        domain_kwargs={"row_condition": "a>10", "condition_parser": "pandas"}
+    )
+    engine.get_domain_records(
+        domain_kwargs={"row_condition": "a>90", "condition_parser": "pandas"}
+    )
+    assert len(engine.domain_records_cache) == 1
+    assert engine.domain_records_cache.total_bytes <= 1000
+
+    assert (
+        PandasExecutionEngine(domain_records_cache_max_entries=0).domain_records_cache
+        is None
+    )
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error
 def test_resolve_metric_bundle_with_nonexistent_metric():
     df = pd.DataFrame({"a": [1, 2, 3, None]})
@@ -1,5 +1,7 @@
 import logging
 import os
+import threading
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -18,6 +20,7 @@ from great_expectations.execution_engine.sqlalchemy_execution_engine import (
 # Function to test for spark dataframe equality
 from great_expectations.self_check.util import build_sa_engine
 from great_expectations.validator.validation_graph import MetricConfiguration
+from great_expectations.validator.validator import Validator
 from tests.expectations.test_util import get_table_columns_metric
 from tests.test_utils import get_sqlite_table_names, get_sqlite_temp_table_names
 
@@ -732,3 +735,226 @@ def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     )
 
     validate_tmp_tables()
+
+
+def test_resolve_metric_bundle_groups_batches_split_from_the_same_table(sa):
+    sqlite_engine = sa.create_engine("sqlite://")
+    pd.DataFrame({"g": ["x", "x", "y", "y", "y", "z"], "a": [1, 2, 3, 4, 5, 6]}).to_sql(
+        "t", sqlite_engine, index=False
+    )
+
+    def _build_execution_engine():
+        execution_engine = SqlAlchemyExecutionEngine(
+            engine=sqlite_engine, create_temp_table=False
+        )
+        for split_value in ["x", "y", "z"]:
+            batch_data, _ = execution_engine.get_batch_data_and_markers(
+                batch_spec=SqlAlchemyDatasourceBatchSpec(
+                    table_name="t",
+                    splitter_method="_split_on_column_value",
+                    splitter_kwargs={"column_name": "g"},
+                    batch_identifiers={"g": split_value},
+                )
+            )
+            execution_engine.load_batch_data(split_value, batch_data)
+        return execution_engine
+
+    metrics: dict = {}
+    for batch_id in ["x", "y", "z"]:
+        for metric_name in ["column.min", "column.max", "column.mean"]:
+            metrics[f"{batch_id}.{metric_name}"] = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"batch_id": batch_id, "column": "a"},
+                metric_value_kwargs=None,
+            )
+        metrics[f"{batch_id}.table.row_count"] = MetricConfiguration(
+            metric_name="table.row_count",
+            metric_domain_kwargs={"batch_id": batch_id},
+            metric_value_kwargs=None,
+        )
+
+    execution_engine = _build_execution_engine()
+    with mock.patch.object(
+        execution_engine.engine, "execute", wraps=execution_engine.engine.execute
+    ) as mock_execute:
+        results = Validator(execution_engine=execution_engine).get_metrics(
+            metrics=metrics
+        )
+    queries = [
+        str(call.args[0])
+        for call in mock_execute.call_args_list
+        if "GROUP BY" in str(call.args[0])
+    ]
+    # One query computes the column metrics, and another the row counts, of all three batches.
+    assert len(queries) == 2
+    assert len(mock_execute.call_args_list) == 5
+
+    assert results == {
+        "x.column.min": 1,
+        "x.column.max": 2,
+        "x.column.mean": 1.5,
+        "x.table.row_count": 2,
+        "y.column.min": 3,
+        "y.column.max": 5,
+        "y.column.mean": 4.0,
+        "y.table.row_count": 3,
+        "z.column.min": 6,
+        "z.column.max": 6,
+        "z.column.mean": 6.0,
+        "z.table.row_count": 1,
+    }
+
+    # Batches are computed one at a time when the database cannot run the grouped query.
+    execution_engine = _build_execution_engine()
+    execute = execution_engine.engine.execute
+
+    def _execute_without_group_by(statement, *args, **kwargs):
+        if "GROUP BY" in str(statement):
+            raise sa.exc.ProgrammingError(str(statement), None, Exception("no"))
+        return execute(statement, *args, **kwargs)
+
+    with mock.patch.object(
+        execution_engine.engine, "execute", side_effect=_execute_without_group_by
+    ) as mock_execute:
+        assert (
+            Validator(execution_engine=execution_engine).get_metrics(metrics=metrics)
+            == results
+        )
+    assert (
+        len(
+            [
+                call
+                for call in mock_execute.call_args_list
+                if "GROUP BY" in str(call.args[0])
+            ]
+        )
+        == 2
+    )
+
+    # Batches loaded into temporary tables are computed one at a time.
+    execution_engine = _build_execution_engine()
+    execution_engine._create_temp_table = True
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=SqlAlchemyDatasourceBatchSpec(
+            table_name="t",
+            splitter_method="_split_on_column_value",
+            splitter_kwargs={"column_name": "g"},
+            batch_identifiers={"g": "x"},
+        )
+    )
+    assert batch_data.split_expression is None
+
+
+def test_connection_scope(sa, tmp_path):
+    connection_string: str = f"sqlite:///{tmp_path / 'connection_scope.db'}"
+
+    # Temporary tables of sqlite only persist within a connection, so a single connection is used by default.
+    execution_engine = SqlAlchemyExecutionEngine(connection_string=connection_string)
+    assert execution_engine.connection_scope == "session"
+    assert isinstance(execution_engine.engine, sa.engine.Connection)
+    assert execution_engine.engine is execution_engine.engine
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string, connection_scope="pool"
+    )
+    assert isinstance(execution_engine.engine, sa.engine.Engine)
+
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string,
+        connection_scope="thread",
+        create_temp_table=False,
+    )
+    connection = execution_engine.engine
+    assert isinstance(connection, sa.engine.Connection)
+    assert execution_engine.engine is connection
+
+    other_thread_connections: list = []
+    thread = threading.Thread(
+        target=lambda: other_thread_connections.append(execution_engine.engine)
+    )
+    thread.start()
+    thread.join()
+    assert other_thread_connections[0] is not connection
+
+    execution_engine.close()
+    assert connection.closed
+    assert other_thread_connections[0].closed
+
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            connection_string=connection_string, connection_scope="transaction"
+        )
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            connection_string=connection_string, connection_scope="thread"
+        )
+    with pytest.raises(ge_exceptions.InvalidConfigError):
+        SqlAlchemyExecutionEngine(
+            connection_string=connection_string, max_concurrent_queries=4
+        )
+
+
+def _test_thread_connection_scope_resolves_metrics_concurrently(
+    sa, connection_string: str, table_name_prefix: str, **kwargs
+):
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=connection_string,
+        connection_scope="thread",
+        create_temp_table=False,
+        max_concurrent_queries=4,
+        **kwargs,
+    )
+
+    metrics: dict = {}
+    for idx in range(8):
+        table_name: str = f"{table_name_prefix}_{idx}"
+        pd.DataFrame({"a": [idx, idx + 1, idx + 2]}).to_sql(
+            table_name, execution_engine.engine, index=False, if_exists="replace"
+        )
+        batch_data, _ = execution_engine.get_batch_data_and_markers(
+            batch_spec=SqlAlchemyDatasourceBatchSpec(table_name=table_name)
+        )
+        execution_engine.load_batch_data(table_name, batch_data)
+        metrics[table_name] = MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={"batch_id": table_name, "column": "a"},
+            metric_value_kwargs=None,
+        )
+
+    results: dict = Validator(execution_engine=execution_engine).get_metrics(
+        metrics=metrics
+    )
+    assert results == {f"{table_name_prefix}_{idx}": idx + 2 for idx in range(8)}
+
+    # The bundled queries of the batches were executed on the connections of the threads of the query executor.
+    assert any(
+        thread is not threading.current_thread()
+        for thread in execution_engine._thread_connections
+    )
+
+    execution_engine.close()
+
+
+def test_thread_connection_scope_resolves_metrics_concurrently_sqlite(sa, tmp_path):
+    _test_thread_connection_scope_resolves_metrics_concurrently(
+        sa=sa,
+        connection_string=f"sqlite:///{tmp_path / 'connection_scope.db'}",
+        table_name_prefix="connection_scope",
+    )
+
+
+def test_thread_connection_scope_resolves_metrics_concurrently_postgresql(
+    sa, test_backends
+):
+    if "postgresql" not in test_backends:
+        pytest.skip(
+            "test_thread_connection_scope_resolves_metrics_concurrently_postgresql requires postgresql"
+        )
+
+    db_hostname = os.getenv("GE_TEST_LOCAL_DB_HOSTNAME", "localhost")
+    _test_thread_connection_scope_resolves_metrics_concurrently(
+        sa=sa,
+        connection_string=f"postgresql://postgres@{db_hostname}/test_ci",
+        table_name_prefix="connection_scope",
+        pool_size=4,
+    )
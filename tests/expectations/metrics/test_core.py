@@ -1,5 +1,6 @@
 import copy
 import logging
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -11,6 +12,7 @@ from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
 )
+from great_expectations.execution_engine.execution_engine import MetricFunctionTypes
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyBatchData,
     SqlAlchemyExecutionEngine,
@@ -585,6 +587,121 @@ def test_map_unique_column_exists_pd():
     assert metrics[unexpected_rows_metric.id]["a"].values == [3]
 
 
+def test_map_unexpected_records_shared_by_unexpected_metrics_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": [1, 5, 2, 5, 7, None], "b": [1, 2, 3, 4, 5, 6]})
+    )
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    condition_metric = MetricConfiguration(
+        metric_name="column_values.in_set.condition",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2]},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(condition_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    unexpected_records_metric = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_records",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"value_set": [1, 2]},
+        metric_dependencies={
+            "unexpected_condition": condition_metric,
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(unexpected_records_metric,), metrics=metrics
+    )
+    metrics.update(results)
+
+    unexpected_records, _, accessor_domain_kwargs = metrics[
+        unexpected_records_metric.id
+    ]
+    assert list(unexpected_records.index) == [1, 3, 4]
+    assert accessor_domain_kwargs == {"column": "a"}
+    # The unexpected records are a computed value (rather than a partial function), and are cached as such.
+    assert (
+        get_metric_provider(unexpected_records_metric.metric_name, engine)[
+            1
+        ].metric_fn_type
+        == MetricFunctionTypes.VALUE
+    )
+
+    desired_metrics = [
+        MetricConfiguration(
+            metric_name=f"column_values.in_set.{metric_suffix}",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "value_set": [1, 2],
+                "result_format": {
+                    "result_format": "SUMMARY",
+                    "partial_unexpected_count": 2,
+                },
+            },
+            metric_dependencies={
+                "unexpected_condition": condition_metric,
+                "unexpected_records": unexpected_records_metric,
+                "table.columns": table_columns_metric,
+            },
+        )
+        for metric_suffix in [
+            "unexpected_values",
+            "unexpected_index_list",
+            "unexpected_value_counts",
+            "unexpected_rows",
+        ]
+    ]
+    with mock.patch.object(
+        PandasExecutionEngine,
+        "get_domain_records",
+        wraps=engine.get_domain_records,
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(
+            metrics_to_resolve=desired_metrics, metrics=metrics
+        )
+    # The domain was masked once, by the unexpected_records metric.
+    assert mock_get_domain_records.call_count == 0
+
+    values, index_list, value_counts, rows = [
+        results[metric.id] for metric in desired_metrics
+    ]
+    assert values == [5, 5]
+    assert index_list == [1, 3]
+    assert value_counts.to_dict() == {5.0: 2, 7.0: 1}
+    assert list(rows["b"]) == [2, 4]
+
+    # Without the shared dependency, each metric computes the unexpected records itself.
+    desired_metric = MetricConfiguration(
+        metric_name="column_values.in_set.unexpected_index_list",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "value_set": [1, 2],
+            "result_format": {"result_format": "COMPLETE"},
+        },
+        metric_dependencies={
+            "unexpected_condition": condition_metric,
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(desired_metric,), metrics=metrics
+    )
+    assert results[desired_metric.id] == [1, 3, 4]
+
+
 def test_map_unique_column_does_not_exist_pd():
     engine = build_pandas_engine(pd.DataFrame({"a": [1, 2, 3, 3, None]}))
 
@@ -4286,3 +4403,107 @@ def test_map_select_column_values_unique_within_record_spark(spark_session):
         {"a": 1.0, "b": 1.0, "c": 2.0},
         {"a": 4.0, "b": 4.0, "c": 4.0},
     ]
+
+
+def test_sketch_metrics_pd():
+    df = pd.DataFrame(
+        {
+            "a": np.append(np.arange(1000, dtype=float), [np.nan] * 10),
+            "b": ["x"] * 900 + ["y"] * 100 + [None] * 10,
+        }
+    )
+    engine = build_pandas_engine(df)
+
+    metrics: dict = {}
+
+    table_columns_metric: MetricConfiguration
+    results: dict
+
+    table_columns_metric, results = get_table_columns_metric(engine=engine)
+    metrics.update(results)
+
+    hyperloglog_sketch_metric = MetricConfiguration(
+        metric_name="column.hyperloglog_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"precision": 12},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    kll_sketch_metric = MetricConfiguration(
+        metric_name="column.kll_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"k": 200},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    count_min_sketch_metric = MetricConfiguration(
+        metric_name="column.count_min_sketch",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"width": 2048, "depth": 5},
+        metric_dependencies={
+            "table.columns": table_columns_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            hyperloglog_sketch_metric,
+            kll_sketch_metric,
+            count_min_sketch_metric,
+        ),
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    assert metrics[kll_sketch_metric.id].count == 1000
+    assert metrics[count_min_sketch_metric.id].count == 1000
+
+    approx_count_metric = MetricConfiguration(
+        metric_name="column.distinct_values.approx_count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"precision": 12},
+        metric_dependencies={
+            "column.hyperloglog_sketch": hyperloglog_sketch_metric,
+        },
+    )
+    approx_quantile_values_metric = MetricConfiguration(
+        metric_name="column.approx_quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"quantiles": [0.0, 0.25, 1.0]},
+        metric_dependencies={
+            "column.kll_sketch": kll_sketch_metric,
+        },
+    )
+    approx_median_metric = MetricConfiguration(
+        metric_name="column.approx_median",
+        metric_domain_kwargs={"column": "a"},
+        metric_dependencies={
+            "column.kll_sketch": kll_sketch_metric,
+        },
+    )
+    approx_value_counts_metric = MetricConfiguration(
+        metric_name="column.approx_value_counts",
+        metric_domain_kwargs={"column": "b"},
+        metric_value_kwargs={"values": ["x", "y"]},
+        metric_dependencies={
+            "column.count_min_sketch": count_min_sketch_metric,
+        },
+    )
+    results = engine.resolve_metrics(
+        metrics_to_resolve=(
+            approx_count_metric,
+            approx_quantile_values_metric,
+            approx_median_metric,
+            approx_value_counts_metric,
+        ),
+        metrics=metrics,
+    )
+
+    assert results[approx_count_metric.id] == pytest.approx(1000, rel=0.05)
+    quantiles = results[approx_quantile_values_metric.id]
+    assert quantiles[0] == 0
+    assert quantiles[1] == pytest.approx(250, abs=10)
+    assert quantiles[2] == 999
+    assert results[approx_median_metric.id] == pytest.approx(500, abs=10)
+    assert results[approx_value_counts_metric.id].to_dict() == {"x": 900, "y": 100}
@@ -85,3 +85,38 @@ def test_get_map_metric_dependencies():
     metric = MetricConfiguration("foo.unexpected_index_list", {}, {})
     dependencies = mp.get_evaluation_dependencies(metric)
     assert dependencies["unexpected_condition"].id[0] == "foo.condition"
+
+
+def test_get_map_metric_dependencies_with_unexpected_records(empty_sqlite_db):
+    mp = ColumnMapMetricProvider()
+    for metric_suffix in [
+        "unexpected_values",
+        "unexpected_value_counts",
+        "unexpected_index_list",
+        "unexpected_rows",
+    ]:
+        metric = MetricConfiguration(
+            f"column_values.in_set.{metric_suffix}",
+            {"column": "a"},
+            {"value_set": [1], "result_format": {"result_format": "SUMMARY"}},
+        )
+        dependencies = mp.get_evaluation_dependencies(
+            metric, execution_engine=PandasExecutionEngine()
+        )
+        assert dependencies["unexpected_condition"].id[0] == (
+            "column_values.in_set.condition"
+        )
+        # The unexpected records do not depend on the result_format, so they are shared by all of these metrics.
+        assert (
+            dependencies["unexpected_records"].id
+            == MetricConfiguration(
+                "column_values.in_set.unexpected_records",
+                {"column": "a"},
+                {"value_set": [1]},
+            ).id
+        )
+
+        dependencies = mp.get_evaluation_dependencies(
+            metric, execution_engine=SqlAlchemyExecutionEngine(engine=empty_sqlite_db)
+        )
+        assert "unexpected_records" not in dependencies
@@ -0,0 +1,8 @@
+import _pytest.config
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def skip_if_performance_tests_not_enabled(pytestconfig: _pytest.config.Config):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
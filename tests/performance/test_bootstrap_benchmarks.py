@@ -0,0 +1,49 @@
+"""
+Test performance of the bootstrap estimates of the quantiles of long metric value histories.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.rule_based_profiler.domain_builder import Domain
+from great_expectations.rule_based_profiler.parameter_builder import (
+    NumericMetricRangeMultiBatchParameterBuilder,
+)
+
+
+@pytest.mark.parametrize("num_metric_values", [10000])
+@pytest.mark.parametrize("bootstrap_random_seed", [None, 0])
+@pytest.mark.parametrize("bootstrap_max_workers", [None, 4])
+def test_bootstrap_estimate_benchmark(
+    benchmark: BenchmarkFixture,
+    num_metric_values: int,
+    bootstrap_random_seed: Optional[int],
+    bootstrap_max_workers: Optional[int],
+):
+    """Benchmark the default bootstrap estimate of the quantiles of a history of num_metric_values metric values."""
+    metric_values: np.ndarray = np.random.default_rng(0).normal(
+        loc=5.0e3, scale=1.0e3, size=num_metric_values
+    )
+    parameter_builder = NumericMetricRangeMultiBatchParameterBuilder(
+        parameter_name="row_count_range",
+        metric_name="table.row_count",
+        bootstrap_random_seed=bootstrap_random_seed,
+        bootstrap_max_workers=bootstrap_max_workers,
+    )
+
+    lower_quantile, upper_quantile = benchmark.pedantic(
+        parameter_builder._get_bootstrap_estimate,
+        kwargs={
+            "metric_values": metric_values,
+            "false_positive_rate": np.float64(5.0e-2),
+            "domain": Domain(domain_type=MetricDomainTypes.TABLE),
+        },
+        rounds=3,
+        iterations=1,
+    )
+
+    assert lower_quantile < 5.0e3 < upper_quantile
@@ -0,0 +1,73 @@
+"""
+Test performance of mapping the data references of a data connector to batch definitions.
+"""
+
+from typing import List, Optional
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.datasource.data_connector import (
+    ConfiguredAssetFilesystemDataConnector,
+)
+from great_expectations.datasource.data_connector.asset import Asset
+from great_expectations.execution_engine import PandasExecutionEngine
+
+
+class _InMemoryDataConnector(ConfiguredAssetFilesystemDataConnector):
+    """A ConfiguredAssetFilesystemDataConnector that lists generated data references instead of files on disk."""
+
+    def __init__(self, data_references: List[str], **kwargs):
+        super().__init__(**kwargs)
+        self._data_references = data_references
+
+    def _get_data_reference_list_for_asset(self, asset: Optional[Asset]) -> List[str]:
+        return self._data_references
+
+
+def _build_data_connector(
+    number_of_data_references: int, base_directory: str
+) -> _InMemoryDataConnector:
+    return _InMemoryDataConnector(
+        data_references=[
+            f"file_{idx // 1000:04d}_2020{idx % 12 + 1:02d}{idx % 28 + 1:02d}_{idx % 1000}.csv"
+            for idx in range(number_of_data_references)
+        ],
+        name="my_data_connector",
+        datasource_name="my_datasource",
+        execution_engine=PandasExecutionEngine(),
+        base_directory=base_directory,
+        default_regex={
+            "pattern": r"file_(\d+)_(\d{8})_(\d+)\.csv",
+            "group_names": ["name", "timestamp", "price"],
+        },
+        assets={"alpha": {}},
+    )
+
+
+@pytest.mark.parametrize("number_of_data_references", [100000, 1000000])
+def test_refresh_data_references_cache_benchmark(
+    benchmark: BenchmarkFixture,
+    tmp_path,
+    number_of_data_references: int,
+):
+    """Benchmark mapping every data reference of a data connector to a batch definition."""
+    data_connector: _InMemoryDataConnector = _build_data_connector(
+        number_of_data_references=number_of_data_references,
+        base_directory=str(tmp_path),
+    )
+
+    def _setup():
+        # Start from an empty cache, so that no round reuses the batch definitions mapped by another.
+        data_connector._data_references_cache = {}
+        return tuple(), {}
+
+    benchmark.pedantic(
+        data_connector._refresh_data_references_cache,
+        setup=_setup,
+        rounds=3,
+        iterations=1,
+    )
+
+    assert data_connector.get_data_reference_list_count() == number_of_data_references
+    assert data_connector.get_unmatched_data_references() == []
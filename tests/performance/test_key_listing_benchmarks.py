@@ -0,0 +1,96 @@
+"""
+Test performance of listing the keys of a large object store bucket.
+"""
+
+from typing import List, Optional
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.datasource.data_connector.util import (
+    KeyListingCheckpoint,
+    list_s3_keys,
+)
+from tests.test_utils import FakeS3Client
+
+NUMBER_OF_DIRECTORIES: int = 1000
+NUMBER_OF_FILES_PER_DIRECTORY: int = 1000
+# A small stand-in for the round trip of each S3 request.
+REQUEST_LATENCY_SECONDS: float = 0.005
+
+
+def _build_s3_client() -> FakeS3Client:
+    return FakeS3Client(
+        keys=[
+            f"data/directory_{directory_index:04d}/file_{file_index:04d}.csv"
+            for directory_index in range(NUMBER_OF_DIRECTORIES)
+            for file_index in range(NUMBER_OF_FILES_PER_DIRECTORY)
+        ],
+        request_latency_seconds=REQUEST_LATENCY_SECONDS,
+    )
+
+
+def _list_s3_keys(
+    s3: FakeS3Client,
+    max_workers: Optional[int],
+    checkpoint: Optional[KeyListingCheckpoint] = None,
+) -> List[str]:
+    return list(
+        list_s3_keys(
+            s3=s3,
+            query_options={
+                "Bucket": "test_bucket",
+                "Prefix": "data/",
+                "Delimiter": "/",
+                "MaxKeys": 1000,
+            },
+            iterator_dict={},
+            recursive=True,
+            max_workers=max_workers,
+            checkpoint=checkpoint,
+        )
+    )
+
+
+@pytest.mark.parametrize("max_workers", [None, 16])
+def test_list_s3_keys_benchmark(
+    benchmark: BenchmarkFixture,
+    max_workers: Optional[int],
+):
+    """Benchmark listing 1M keys spread over 1000 prefixes, serially and with prefixes listed concurrently."""
+    s3: FakeS3Client = _build_s3_client()
+
+    keys: List[str] = benchmark.pedantic(
+        _list_s3_keys,
+        args=(s3, max_workers),
+        rounds=3,
+        iterations=1,
+    )
+
+    assert len(keys) == NUMBER_OF_DIRECTORIES * NUMBER_OF_FILES_PER_DIRECTORY
+
+
+def test_list_s3_keys_from_checkpoint_benchmark(
+    benchmark: BenchmarkFixture,
+    tmp_path,
+):
+    """Benchmark listing 1M keys that were recorded in a checkpoint by an earlier listing."""
+    s3: FakeS3Client = _build_s3_client()
+    checkpoint_filepath: str = str(tmp_path / "listing_checkpoint.jsonl")
+    _list_s3_keys(
+        s3=s3,
+        max_workers=16,
+        checkpoint=KeyListingCheckpoint(filepath=checkpoint_filepath),
+    )
+    request_count: int = s3.request_count
+
+    def _setup():
+        # Each round reads the checkpoint file again, as a new run would.
+        return (s3, None, KeyListingCheckpoint(filepath=checkpoint_filepath)), {}
+
+    keys: List[str] = benchmark.pedantic(
+        _list_s3_keys, setup=_setup, rounds=3, iterations=1
+    )
+
+    assert len(keys) == NUMBER_OF_DIRECTORIES * NUMBER_OF_FILES_PER_DIRECTORY
+    assert s3.request_count == request_count
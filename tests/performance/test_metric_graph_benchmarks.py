@@ -0,0 +1,158 @@
+"""
+Test performance of building and resolving metric dependency graphs.
+"""
+
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.expectation_configuration import ExpectationConfiguration
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.validation_graph import (
+    MetricConfiguration,
+    ValidationGraph,
+)
+from great_expectations.validator.validator import Validator
+
+METRIC_NAMES: List[str] = [
+    "column.max",
+    "column.min",
+    "column.mean",
+    "column.sum",
+    "column_values.nonnull.unexpected_count",
+]
+
+
+def _get_column_names(number_of_metrics: int) -> List[str]:
+    return [f"column_{idx}" for idx in range(number_of_metrics // len(METRIC_NAMES))]
+
+
+def _build_validator(number_of_metrics: int) -> Validator:
+    columns: List[str] = _get_column_names(number_of_metrics=number_of_metrics)
+    df = pd.DataFrame(
+        np.random.default_rng(seed=0).random((100, len(columns))),
+        columns=columns,
+    )
+    return Validator(
+        execution_engine=PandasExecutionEngine(caching=False),
+        batches=[Batch(data=df)],
+    )
+
+
+def _build_metric_configurations(number_of_metrics: int) -> List[MetricConfiguration]:
+    return [
+        MetricConfiguration(
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": column},
+        )
+        for column in _get_column_names(number_of_metrics=number_of_metrics)
+        for metric_name in METRIC_NAMES
+    ]
+
+
+def _build_graph(
+    validator: Validator, metric_configurations: List[MetricConfiguration]
+) -> ValidationGraph:
+    graph = ValidationGraph()
+    for metric_configuration in metric_configurations:
+        validator.build_metric_dependency_graph(
+            graph=graph,
+            child_node=metric_configuration,
+            configuration=None,
+            execution_engine=validator.execution_engine,
+        )
+    return graph
+
+
+@pytest.mark.parametrize("number_of_metrics", [1000, 10000])
+def test_build_metric_dependency_graph_benchmark(
+    benchmark: BenchmarkFixture,
+    number_of_metrics: int,
+):
+    """Benchmark building the dependency graph of many column metrics, which is dominated by computing, hashing and
+    comparing metric ids."""
+    validator: Validator = _build_validator(number_of_metrics=number_of_metrics)
+
+    def _setup():
+        # The metric configurations are rebuilt each round so that no round reuses the ids computed by another.
+        return (
+            validator,
+            _build_metric_configurations(number_of_metrics=number_of_metrics),
+        ), {}
+
+    graph: ValidationGraph = benchmark.pedantic(
+        _build_graph, setup=_setup, rounds=5, iterations=1
+    )
+
+    # Each metric shares the "table.columns" dependency, and column_values.nonnull.unexpected_count depends on its
+    # condition as well.
+    assert len(graph.edges) > number_of_metrics
+
+
+@pytest.mark.parametrize("number_of_metrics", [1000, 10000])
+def test_resolve_validation_graph_benchmark(
+    benchmark: BenchmarkFixture,
+    number_of_metrics: int,
+):
+    """Benchmark resolving the dependency graph of many column metrics."""
+    validator: Validator = _build_validator(number_of_metrics=number_of_metrics)
+
+    def _setup():
+        metric_configurations: List[MetricConfiguration] = _build_metric_configurations(
+            number_of_metrics=number_of_metrics
+        )
+        graph: ValidationGraph = _build_graph(
+            validator=validator, metric_configurations=metric_configurations
+        )
+        return (graph, {}), {}
+
+    metrics: dict = benchmark.pedantic(
+        validator.resolve_validation_graph, setup=_setup, rounds=3, iterations=1
+    )
+
+    assert len(metrics) > number_of_metrics
+
+
+@pytest.mark.parametrize("number_of_expectations", [2000])
+def test_graph_validate_setup_benchmark(
+    benchmark: BenchmarkFixture,
+    number_of_expectations: int,
+):
+    """Benchmark building the validation graph of a suite of expect_column_values_to_be_in_set expectations with large
+    value sets, i.e. the work that graph_validate does before resolving any metric."""
+    number_of_columns = 20
+    validator: Validator = _build_validator(
+        number_of_metrics=number_of_columns * len(METRIC_NAMES)
+    )
+    value_set: List[float] = np.random.default_rng(seed=0).random(10000).tolist()
+    configurations: List[ExpectationConfiguration] = [
+        ExpectationConfiguration(
+            expectation_type="expect_column_values_to_be_in_set",
+            kwargs={
+                "column": f"column_{idx % number_of_columns}",
+                "value_set": value_set,
+                "mostly": 0.5 + idx / (2 * number_of_expectations),
+            },
+        )
+        for idx in range(number_of_expectations)
+    ]
+
+    def _setup():
+        return tuple(), {
+            "graph": ValidationGraph(),
+            "configurations": configurations,
+            "batch_id": validator.active_batch_id,
+            "runtime_configuration": {},
+            "catch_exceptions": False,
+        }
+
+    processed_configurations, evrs = benchmark.pedantic(
+        validator._build_validation_graph, setup=_setup, rounds=3, iterations=1
+    )
+
+    assert len(processed_configurations) == number_of_expectations
+    assert not evrs
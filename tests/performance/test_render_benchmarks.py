@@ -0,0 +1,110 @@
+"""
+Test performance of rendering the Data Docs page of a validation result.
+"""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuiteValidationResult,
+    ExpectationValidationResult,
+)
+from great_expectations.render.renderer import ValidationResultsPageRenderer
+from great_expectations.render.types import RenderedDocumentContent
+from great_expectations.render.view import DefaultJinjaPageView
+
+
+def _build_validation_result(
+    number_of_expectations: int,
+) -> ExpectationSuiteValidationResult:
+    results = []
+    for idx in range(number_of_expectations):
+        column = f"column_{idx // 3}"
+        if idx % 3 == 0:
+            expectation_config = ExpectationConfiguration(
+                expectation_type="expect_column_values_to_not_be_null",
+                kwargs={"column": column},
+            )
+            result = {
+                "element_count": 1000,
+                "unexpected_count": 0,
+                "unexpected_percent": 0.0,
+                "partial_unexpected_list": [],
+            }
+        elif idx % 3 == 1:
+            expectation_config = ExpectationConfiguration(
+                expectation_type="expect_column_values_to_be_in_set",
+                kwargs={"column": column, "value_set": ["a", "b", "c"]},
+            )
+            result = {
+                "element_count": 1000,
+                "missing_count": 0,
+                "missing_percent": 0.0,
+                "unexpected_count": 2,
+                "unexpected_percent": 0.2,
+                "unexpected_percent_nonmissing": 0.2,
+                "partial_unexpected_list": ["d", "e"],
+                "partial_unexpected_counts": [
+                    {"value": "d", "count": 1},
+                    {"value": "e", "count": 1},
+                ],
+            }
+        else:
+            expectation_config = ExpectationConfiguration(
+                expectation_type="expect_column_mean_to_be_between",
+                kwargs={"column": column, "min_value": 0, "max_value": 10},
+            )
+            result = {"observed_value": 5.0, "element_count": 1000}
+        results.append(
+            ExpectationValidationResult(
+                success=idx % 3 != 1,
+                expectation_config=expectation_config,
+                result=result,
+            )
+        )
+
+    return ExpectationSuiteValidationResult(
+        success=False,
+        results=results,
+        statistics={
+            "evaluated_expectations": number_of_expectations,
+            "successful_expectations": number_of_expectations
+            - number_of_expectations // 3,
+            "unsuccessful_expectations": number_of_expectations // 3,
+            "success_percent": 66.7,
+        },
+        meta={
+            "great_expectations_version": "0.13.49",
+            "expectation_suite_name": "my_suite",
+            "run_id": {
+                "run_name": "my_run",
+                "run_time": "2021-12-01T00:00:00.000000+00:00",
+            },
+            "batch_kwargs": {"data_asset_name": "my_data_asset"},
+            "batch_markers": {},
+            "batch_parameters": {},
+            "validation_time": "20211201T000000.000000Z",
+        },
+    )
+
+
+@pytest.mark.parametrize("number_of_expectations", [300])
+def test_render_validation_results_page_benchmark(
+    benchmark: BenchmarkFixture,
+    number_of_expectations: int,
+):
+    """Benchmark rendering the page of a validation result to HTML with a new view, as each site section does."""
+    rendered_content: RenderedDocumentContent = ValidationResultsPageRenderer().render(
+        _build_validation_result(number_of_expectations=number_of_expectations)
+    )
+
+    html: str = benchmark.pedantic(
+        lambda: DefaultJinjaPageView().render(rendered_content),
+        rounds=5,
+        iterations=1,
+    )
+
+    assert html.count("expect_column_values_to_be_in_set") or html.count(
+        "values must belong to this set"
+    )
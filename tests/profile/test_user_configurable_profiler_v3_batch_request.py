@@ -747,6 +747,41 @@ def test_column_cardinality_functions(cardinality_validator):
     assert cardinality_with_large_pct_and_no_num.name == "NONE"
 
 
+def test_column_metrics_are_resolved_in_bulk(cardinality_validator, mocker):
+    """
+    What does this test do and why?
+    Ensures that the types, cardinalities, mins and maxes of all columns are resolved with a single request for
+    metrics, without running any expectations, and that the suite built from them is the same as when each column is
+    profiled separately
+    """
+    get_metrics = mocker.spy(cardinality_validator, "get_metrics")
+    graph_validate = mocker.spy(cardinality_validator, "graph_validate")
+    profiler = UserConfigurableProfiler(cardinality_validator)
+
+    # One request each for table.columns, table.column_types and the metrics of all columns.
+    assert get_metrics.call_count == 3
+    assert graph_validate.call_count == 0
+    assert profiler.column_info.get("col_few") == {
+        "cardinality": "FEW",
+        "type": "INT",
+    }
+    assert profiler.column_metrics["col_few"]["column.min"] == 0
+    assert profiler.column_metrics["col_few"]["column.max"] == 49
+    suite = profiler.build_suite()
+
+    mocker.patch.object(
+        UserConfigurableProfiler,
+        "_add_column_metrics_to_column_info",
+        return_value={},
+    )
+    profiler_without_column_metrics = UserConfigurableProfiler(cardinality_validator)
+    assert profiler_without_column_metrics.column_metrics == {}
+    assert profiler_without_column_metrics.column_info == profiler.column_info
+    assert (
+        profiler_without_column_metrics.build_suite().expectations == suite.expectations
+    )
+
+
 def test_profiler_all_expectation_types_pandas(
     titanic_data_context_modular_api,
     taxi_validator_pandas,
@@ -1,6 +1,7 @@
 import os
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 from freezegun import freeze_time
@@ -202,7 +203,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -326,7 +327,7 @@ def test_configuration_driven_site_builder(
     team_site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **team_site_config
+        **team_site_config,
     )
     team_site_builder.clean_site()
     obs = [
@@ -350,7 +351,7 @@ def test_configuration_driven_site_builder(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -433,7 +434,7 @@ def test_configuration_driven_site_builder_skip_and_clean_missing(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     site_builder.build()
 
@@ -565,7 +566,7 @@ def test_configuration_driven_site_builder_without_how_to_buttons(
     site_builder = SiteBuilder(
         data_context=context,
         runtime_environment={"root_directory": context.root_directory},
-        **local_site_config
+        **local_site_config,
     )
     res = site_builder.build()
 
@@ -715,3 +716,207 @@ def test_site_builder_usage_statistics_disabled(
             page_contents = f.read()
             assert expected_logo_url in page_contents
             assert data_context_id not in page_contents
+
+
+def test_site_builder_incremental_build(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    local_site_config["site_index_builder"] = {
+        "class_name": "DefaultSiteIndexBuilder",
+        "index_page_size": 2,
+    }
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        incremental=True,
+        **local_site_config,
+    )
+    target_store = site_builder.target_store
+    validations_store = context.stores["validations_store"]
+    validation_result_keys = validations_store.list_keys()
+    assert len(validation_result_keys) == 5
+
+    source_store_backends = [
+        validations_store.store_backend,
+        context.stores["expectations_store"].store_backend,
+    ]
+
+    def build_and_count_rendered_pages(expected_source_store_reads=None):
+        with mock.patch.object(
+            source_store_backends[0], "get", wraps=source_store_backends[0].get
+        ) as mock_validations_get, mock.patch.object(
+            source_store_backends[1], "get", wraps=source_store_backends[1].get
+        ) as mock_expectations_get, mock.patch.object(
+            target_store, "set", wraps=target_store.set
+        ) as mock_set:
+            index_links_dict = site_builder.build()[1]
+        if expected_source_store_reads is not None:
+            # Resources that did not change (and the index links to them) are not read from the source stores again.
+            assert {
+                call.args[0]
+                for call in mock_validations_get.call_args_list
+                + mock_expectations_get.call_args_list
+            } == expected_source_store_reads
+        return mock_set.call_count, index_links_dict
+
+    number_of_rendered_pages, index_links_dict = build_and_count_rendered_pages()
+    assert number_of_rendered_pages == len(
+        context.stores["expectations_store"].list_keys()
+    ) + len(validation_result_keys)
+    assert len(index_links_dict["profiling_links"]) == 5
+    assert target_store.list_numbered_index_page_numbers() == [1, 2, 3]
+    site_manifest = target_store.get_site_manifest()
+    assert site_manifest["build_fingerprint"] == site_builder.build_fingerprint
+    assert set(site_manifest["index_pages"].keys()) == {"1", "2", "3"}
+    assert len(site_manifest["sections"]["profiling"]) == 5
+
+    index_page_path = site_builder.get_resource_url()[len("file://") :]
+    with open(index_page_path) as f:
+        index_page = f.read()
+    assert 'href="index_1.html"' in index_page
+    assert 'href="index_3.html"' in index_page
+
+    # Nothing is read or rendered again when nothing changed.
+    number_of_rendered_pages, index_links_dict = build_and_count_rendered_pages(
+        expected_source_store_reads=set()
+    )
+    assert number_of_rendered_pages == 0
+    assert len(index_links_dict["profiling_links"]) == 5
+
+    # Only the pages of changed resources are rendered again.
+    validation_result = validations_store.get(validation_result_keys[0])
+    validation_result.meta["notes"] = "changed"
+    validations_store.set(validation_result_keys[0], validation_result)
+    number_of_rendered_pages, _ = build_and_count_rendered_pages(
+        expected_source_store_reads={
+            validations_store.key_to_tuple(validation_result_keys[0])
+        }
+    )
+    assert number_of_rendered_pages == 1
+
+    # The pages of removed resources are removed, as are the index pages that are no longer needed.
+    for validation_result_key in validation_result_keys[:2]:
+        validations_store.store_backend.remove_key(
+            validations_store.key_to_tuple(validation_result_key)
+        )
+    number_of_rendered_pages, index_links_dict = build_and_count_rendered_pages(
+        expected_source_store_reads=set()
+    )
+    assert number_of_rendered_pages == 0
+    assert len(index_links_dict["profiling_links"]) == 3
+    assert set(target_store.store_backends[ValidationResultIdentifier].list_keys()) == {
+        validations_store.key_to_tuple(validation_result_key)
+        for validation_result_key in validation_result_keys[2:]
+    }
+    assert target_store.list_numbered_index_page_numbers() == [1, 2]
+
+
+def test_site_builder_with_max_render_workers(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    )
+    parallel_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **{
+            **local_site_config,
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "uncommitted/data_docs/parallel_site/",
+            },
+        },
+        incremental=True,
+        max_render_workers=2,
+    )
+    site_builder.build()
+    with mock.patch.object(
+        parallel_site_builder.target_store,
+        "set_many",
+        wraps=parallel_site_builder.target_store.set_many,
+    ) as mock_set_many:
+        parallel_index_links_dict = parallel_site_builder.build()[1]
+    # The pages of each section are stored with a single bulk request.
+    assert mock_set_many.call_count == 2
+
+    for resource_identifier_type in [
+        ExpectationSuiteIdentifier,
+        ValidationResultIdentifier,
+    ]:
+        site_keys = site_builder.target_store.store_backends[
+            resource_identifier_type
+        ].list_keys()
+        assert len(site_keys) > 0
+        assert sorted(site_keys) == sorted(
+            parallel_site_builder.target_store.store_backends[
+                resource_identifier_type
+            ].list_keys()
+        )
+
+    site_manifest = parallel_site_builder.target_store.get_site_manifest()
+    assert len(site_manifest["sections"]["profiling"]) == len(
+        parallel_index_links_dict["profiling_links"]
+    )
+    for profiling_link in parallel_index_links_dict["profiling_links"]:
+        with open(
+            os.path.join(
+                parallel_site_builder.target_store.store_backends[
+                    "index_page"
+                ].full_base_directory,
+                profiling_link["filepath"],
+            )
+        ) as f:
+            assert profiling_link["expectation_suite_name"] in f.read()
+
+
+def test_site_builder_with_max_render_workers_renders_failed_batches_serially(
+    site_builder_data_context_with_html_store_titanic_random,
+):
+    context = site_builder_data_context_with_html_store_titanic_random
+    local_site_config = dict(context._project_config.data_docs_sites["local_site"])
+    site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **local_site_config,
+    )
+    parallel_site_builder = SiteBuilder(
+        data_context=context,
+        runtime_environment={"root_directory": context.root_directory},
+        **{
+            **local_site_config,
+            "store_backend": {
+                "class_name": "TupleFilesystemStoreBackend",
+                "base_directory": "uncommitted/data_docs/parallel_site/",
+            },
+        },
+        max_render_workers=2,
+    )
+    site_builder.build()
+    # e.g. resources that cannot be sent to the worker processes
+    with mock.patch(
+        "great_expectations.render.renderer.site_builder.ProcessPoolExecutor.map",
+        side_effect=RuntimeError("The batch could not be rendered."),
+    ) as mock_map:
+        parallel_site_builder.build()
+    assert mock_map.call_count == 2
+
+    for resource_identifier_type in [
+        ExpectationSuiteIdentifier,
+        ValidationResultIdentifier,
+    ]:
+        site_keys = site_builder.target_store.store_backends[
+            resource_identifier_type
+        ].list_keys()
+        assert len(site_keys) > 0
+        assert sorted(site_keys) == sorted(
+            parallel_site_builder.target_store.store_backends[
+                resource_identifier_type
+            ].list_keys()
+        )
@@ -634,3 +634,88 @@ def test_render_text():
         .replace("\t", "")
         .replace("\n", "")
     )
+
+
+def test_views_share_compiled_environment():
+    view = DefaultJinjaPageView()
+    other_view = DefaultJinjaPageView()
+    assert view.env is other_view.env
+    assert view.env.auto_reload is False
+
+    component_view = ge.render.view.view.DefaultJinjaComponentView()
+    assert component_view.env is not view.env
+
+
+def test_render_identical_content_blocks_are_memoized(mocker):
+    string_template_content = {
+        "content_block_type": "string_template",
+        "string_template": {
+            "template": "$status",
+            "params": {"status": "passed"},
+            "styling": {"params": {"status": {"classes": ["text-success"]}}},
+        },
+    }
+    text_content = {
+        "content_block_type": "text",
+        "text": [
+            string_template_content,
+            json.loads(json.dumps(string_template_content)),
+        ],
+    }
+
+    # The filters of the shared environment call the methods of the view that renders the template.
+    render_string_template = mocker.spy(
+        ge.render.view.view.DefaultJinjaView, "_render_string_template"
+    )
+    rendered_doc = ge.render.view.view.DefaultJinjaComponentView().render(
+        {
+            "content_block": text_content,
+            "section_loop": {"index": 1},
+            "content_block_loop": {"index": 2},
+        }
+    )
+    assert rendered_doc.count('<span class="text-success" >passed</span>') == 2
+    assert render_string_template.call_count == 1
+
+
+def test_views_share_environment_but_not_filters():
+    document = {
+        "content_block": {"content_block_type": "text", "text": ["hello"]},
+        "section_loop": {"index": 1},
+        "content_block_loop": {"index": 2},
+    }
+    view = ge.render.view.view.DefaultJinjaComponentView()
+    other_view = ge.render.view.view.DefaultJinjaComponentView()
+    assert other_view.env is view.env
+    other_view.render_content_block = lambda *args, **kwargs: "overridden"
+
+    assert "hello" in view.render(document)
+    assert "overridden" not in view.render(document)
+    assert "overridden" in other_view.render(document)
+
+
+def test_views_reconfigure_environment_when_custom_views_change(tmp_path):
+    custom_template_path = tmp_path / "custom_block.j2"
+    custom_template_path.write_text("<p>before {{ content_block.text }}</p>")
+    document = {
+        "content_block": {"content_block_type": "custom_block", "text": "edit"},
+        "section_loop": {"index": 1},
+        "content_block_loop": {"index": 2},
+    }
+
+    view = ge.render.view.view.DefaultJinjaComponentView(
+        custom_views_directory=str(tmp_path)
+    )
+    assert "<p>before edit</p>" in view.render(document)
+    assert (
+        ge.render.view.view.DefaultJinjaComponentView(
+            custom_views_directory=str(tmp_path)
+        ).env
+        is view.env
+    )
+
+    custom_template_path.write_text("<p>after {{ content_block.text }}</p>")
+    view = ge.render.view.view.DefaultJinjaComponentView(
+        custom_views_directory=str(tmp_path)
+    )
+    assert "<p>after edit</p>" in view.render(document)
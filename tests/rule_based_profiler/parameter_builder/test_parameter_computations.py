@@ -1,11 +1,16 @@
 from typing import Dict, Optional, Union
+from unittest import mock
 
 import numpy as np
 import pandas as pd
 import scipy.stats as stats
 
+import great_expectations.rule_based_profiler.util as profiler_util
+from great_expectations.execution_engine.execution_engine import MetricDomainTypes
+from great_expectations.rule_based_profiler.domain_builder import Domain
 from great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder import (
     DEFAULT_BOOTSTRAP_NUM_RESAMPLES,
+    NumericMetricRangeMultiBatchParameterBuilder,
 )
 from great_expectations.rule_based_profiler.util import compute_bootstrap_quantiles
 
@@ -53,3 +58,90 @@ def test_custom_bootstrap_efficacy():
             <= actual_false_positive_rates[column]
             <= false_positive_rate + 0.01
         )
+
+
+def test_bootstrap_quantiles_are_computed_in_chunks_reproducibly(monkeypatch):
+    metric_values: np.ndarray = np.around(stats.norm.rvs(5000, 1000, size=100))
+    false_positive_rate: np.float64 = np.float64(0.05)
+    n_resamples: int = 1000
+
+    # Resamples of 100 values are drawn and reduced in chunks of (at most) 64 resamples.
+    monkeypatch.setattr(profiler_util, "BOOTSTRAP_MAX_CHUNK_ELEMENTS", 6400)
+
+    quantiles: tuple = compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        random_seed=42,
+    )
+    assert (
+        compute_bootstrap_quantiles(
+            metric_values=metric_values,
+            false_positive_rate=false_positive_rate,
+            n_resamples=n_resamples,
+            random_seed=42,
+            max_workers=4,
+        )
+        == quantiles
+    )
+    assert (
+        compute_bootstrap_quantiles(
+            metric_values=metric_values,
+            false_positive_rate=false_positive_rate,
+            n_resamples=n_resamples,
+            random_seed=43,
+        )
+        != quantiles
+    )
+
+    # The estimates are the means of the quantiles of all of the resamples, as if these were drawn at once.
+    resample_indices: np.ndarray = np.concatenate(
+        [
+            profiler_util._get_bootstrap_resample_indices(
+                num_metric_values=metric_values.size,
+                num_resamples=min(64, n_resamples - chunk_index * 64),
+                random_seed=42,
+                chunk_index=chunk_index,
+            )
+            for chunk_index in range(16)
+        ]
+    )
+    assert resample_indices.shape == (n_resamples, metric_values.size)
+    bootstraps: np.ndarray = metric_values[resample_indices]
+    np.testing.assert_allclose(
+        quantiles,
+        (
+            np.mean(np.quantile(bootstraps, q=false_positive_rate / 2, axis=1)),
+            np.mean(np.quantile(bootstraps, q=1.0 - (false_positive_rate / 2), axis=1)),
+        ),
+    )
+
+
+def test_bootstrap_estimate_uses_configured_seed_and_max_workers():
+    parameter_builder = NumericMetricRangeMultiBatchParameterBuilder(
+        parameter_name="row_count_range",
+        metric_name="table.row_count",
+        num_bootstrap_samples=1000,
+        bootstrap_random_seed=42,
+        bootstrap_max_workers=4,
+    )
+    metric_values: np.ndarray = np.around(stats.norm.rvs(5000, 1000, size=100))
+
+    with mock.patch(
+        "great_expectations.rule_based_profiler.parameter_builder.numeric_metric_range_multi_batch_parameter_builder.compute_bootstrap_quantiles",
+        wraps=compute_bootstrap_quantiles,
+    ) as mock_compute_bootstrap_quantiles:
+        quantiles: tuple = parameter_builder._get_bootstrap_estimate(
+            metric_values=metric_values,
+            false_positive_rate=np.float64(0.05),
+            domain=Domain(domain_type=MetricDomainTypes.TABLE),
+        )
+
+    assert mock_compute_bootstrap_quantiles.call_args.kwargs["random_seed"] == 42
+    assert mock_compute_bootstrap_quantiles.call_args.kwargs["max_workers"] == 4
+    assert quantiles == compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        false_positive_rate=np.float64(0.05),
+        n_resamples=1000,
+        random_seed=42,
+    )
@@ -1,5 +1,6 @@
 import datetime
 from typing import Any, Dict, List, cast
+from unittest import mock
 
 import numpy as np
 import pandas as pd
@@ -210,6 +211,94 @@ def test_bobby_profiler_user_workflow_multi_batch_row_count_range_rule_and_colum
     )
 
 
+@pytest.mark.skipif(
+    version.parse(np.version.version) < version.parse("1.21.0"),
+    reason="requires numpy version 1.21.0 or newer",
+)
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_multi_batch_resolves_metrics_of_all_domains_of_a_rule_together(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    profiler_config: dict = yaml.load(
+        bobby_columnar_table_multi_batch["profiler_config"]
+    )
+    profiler: Profiler = Profiler(
+        profiler_config=profiler_config,
+        data_context=data_context,
+    )
+
+    with mock.patch.object(
+        Validator, "get_metrics", autospec=True, side_effect=Validator.get_metrics
+    ) as mock_get_metrics:
+        expectation_suite: ExpectationSuite = profiler.profile(
+            expectation_suite_name=bobby_columnar_table_multi_batch[
+                "test_configuration_oneshot_sampling_method"
+            ]["expectation_suite_name"],
+            include_citation=True,
+        )
+
+    # The metrics of all column domains (and all batches) of each multi-batch rule are resolved with one graph, rather
+    # than with one graph for each domain (which takes 33 calls).
+    assert mock_get_metrics.call_count == 5
+
+    assert (
+        expectation_suite
+        == bobby_columnar_table_multi_batch[
+            "test_configuration_oneshot_sampling_method"
+        ]["expected_expectation_suite"]
+    )
+
+
+@pytest.mark.skipif(
+    version.parse(np.version.version) < version.parse("1.21.0"),
+    reason="requires numpy version 1.21.0 or newer",
+)
+@freeze_time("09/26/2019 13:42:41")
+def test_bobby_profiler_user_workflow_multi_batch_concurrent_execution(
+    bobby_columnar_table_multi_batch_deterministic_data_context,
+    bobby_columnar_table_multi_batch,
+):
+    data_context: DataContext = (
+        bobby_columnar_table_multi_batch_deterministic_data_context
+    )
+
+    profiler_config: dict = yaml.load(
+        bobby_columnar_table_multi_batch["profiler_config"]
+    )
+    profiler: Profiler = Profiler(
+        profiler_config=profiler_config,
+        data_context=data_context,
+    )
+
+    with mock.patch.object(
+        Validator, "get_metrics", autospec=True, side_effect=Validator.get_metrics
+    ) as mock_get_metrics:
+        expectation_suite: ExpectationSuite = profiler.profile(
+            expectation_suite_name=bobby_columnar_table_multi_batch[
+                "test_configuration_oneshot_sampling_method"
+            ]["expectation_suite_name"],
+            include_citation=True,
+            max_workers=4,
+        )
+
+    # Apart from the metrics that the domain builders use, the metrics of all rules are resolved with one graph.
+    assert mock_get_metrics.call_count == 3
+    assert len(mock_get_metrics.call_args_list[-1].kwargs["metrics"]) == 62
+
+    # Expectations are added in the same order as when rules are evaluated one at a time.
+    assert (
+        expectation_suite
+        == bobby_columnar_table_multi_batch[
+            "test_configuration_oneshot_sampling_method"
+        ]["expected_expectation_suite"]
+    )
+
+
 @pytest.mark.skipif(
     version.parse(np.version.version) < version.parse("1.21.0"),
     reason="requires numpy version 1.21.0 or newer",
@@ -1,7 +1,10 @@
+import bisect
 import logging
 import os
+import threading
+import time
 import uuid
-from typing import List
+from typing import Iterable, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -254,6 +257,74 @@ def build_tuple_s3_store_backend(
     )
 
 
+class FakeS3Client:
+    """
+    An in-memory stand-in for the "list_objects_v2" method of a boto3 S3 client, for testing and benchmarking key
+    listing without a network (or moto, which is too slow to hold millions of keys).  Each request optionally sleeps for
+    request_latency_seconds, to simulate the round trip to S3.
+    """
+
+    def __init__(self, keys: Iterable[str], request_latency_seconds: float = 0.0):
+        self._keys = sorted(keys)
+        self._request_latency_seconds = request_latency_seconds
+        self._request_count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def request_count(self) -> int:
+        return self._request_count
+
+    def list_objects_v2(
+        self,
+        Bucket: str,
+        Prefix: str = "",
+        Delimiter: str = "",
+        MaxKeys: int = 1000,
+        ContinuationToken: Optional[str] = None,
+    ) -> dict:
+        with self._lock:
+            self._request_count += 1
+        if self._request_latency_seconds:
+            time.sleep(self._request_latency_seconds)
+
+        keys: List[str] = self._keys
+        index: int = bisect.bisect_left(keys, Prefix)
+        if ContinuationToken is not None:
+            index = int(ContinuationToken)
+
+        contents: List[dict] = []
+        common_prefixes: List[dict] = []
+        while (
+            index < len(keys)
+            and keys[index].startswith(Prefix)
+            and len(contents) + len(common_prefixes) < MaxKeys
+        ):
+            key: str = keys[index]
+            delimiter_position: int = (
+                key.find(Delimiter, len(Prefix)) if Delimiter else -1
+            )
+            if delimiter_position >= 0:
+                common_prefix: str = key[: delimiter_position + len(Delimiter)]
+                common_prefixes.append({"Prefix": common_prefix})
+                index = bisect.bisect_left(keys, common_prefix + "\uffff")
+            else:
+                contents.append({"Key": key, "Size": 1})
+                index += 1
+
+        is_truncated: bool = index < len(keys) and keys[index].startswith(Prefix)
+        response: dict = {
+            "IsTruncated": is_truncated,
+            "KeyCount": len(contents) + len(common_prefixes),
+        }
+        if contents:
+            response["Contents"] = contents
+        if common_prefixes:
+            response["CommonPrefixes"] = common_prefixes
+        if is_truncated:
+            response["NextContinuationToken"] = str(index)
+        return response
+
+
 def build_checkpoint_store_using_filesystem(
     store_name: str,
     base_directory: str,
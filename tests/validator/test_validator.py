@@ -1,4 +1,7 @@
+import copy
+import pickle
 from typing import Any, Dict, List, Set, Union
+from unittest import mock
 
 import pandas as pd
 import pytest
@@ -26,9 +29,11 @@ from great_expectations.execution_engine import PandasExecutionEngine
 from great_expectations.expectations.core.expect_column_value_z_scores_to_be_less_than import (
     ExpectColumnValueZScoresToBeLessThan,
 )
+from great_expectations.expectations.metrics.metric_provider import MetricProvider
 from great_expectations.expectations.registry import get_expectation_impl
 from great_expectations.validator.validation_graph import (
     MetricConfiguration,
+    MetricEdge,
     ValidationGraph,
 )
 from great_expectations.validator.validator import Validator
@@ -63,10 +68,14 @@ def test_parse_validation_graph():
             Validator(execution_engine=engine).build_metric_dependency_graph(
                 graph, metric_configuration, configuration, execution_engine=engine
             )
-    ready_metrics, needed_metrics = Validator(engine)._parse_validation_graph(
-        validation_graph=graph, metrics=dict()
-    )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    _, unmet_dependency_counts, _ = graph.get_dependency_index(metrics=dict())
+    ready_metric_ids = [
+        metric_id for metric_id, count in unmet_dependency_counts.items() if count == 0
+    ]
+    needed_metric_ids = [
+        metric_id for metric_id, count in unmet_dependency_counts.items() if count > 0
+    ]
+    assert len(ready_metric_ids) == 2 and len(needed_metric_ids) == 10
 
 
 # Should be passing tests even if given incorrect MetricProvider data
@@ -99,10 +108,16 @@ def test_parse_validation_graph_with_bad_metrics_args():
             validator.build_metric_dependency_graph(
                 graph, metric_configuration, configuration, execution_engine=engine
             )
-    ready_metrics, needed_metrics = validator._parse_validation_graph(
-        validation_graph=graph, metrics=("nonexistent", "NONE")
+    _, unmet_dependency_counts, _ = graph.get_dependency_index(
+        metrics=("nonexistent", "NONE")
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    ready_metric_ids = [
+        metric_id for metric_id, count in unmet_dependency_counts.items() if count == 0
+    ]
+    needed_metric_ids = [
+        metric_id for metric_id, count in unmet_dependency_counts.items() if count > 0
+    ]
+    assert len(ready_metric_ids) == 2 and len(needed_metric_ids) == 10
 
 
 def test_populate_dependencies():
@@ -137,7 +152,7 @@ def test_populate_dependencies():
             Validator(execution_engine=engine).build_metric_dependency_graph(
                 graph, metric_configuration, configuration, execution_engine=engine
             )
-    assert len(graph.edges) == 17
+    assert len(graph.edges) == 20
 
 
 def test_populate_dependencies_with_incorrect_metric_name():
@@ -181,6 +196,213 @@ def test_populate_dependencies_with_incorrect_metric_name():
     assert isinstance(graph, ge_exceptions.MetricProviderError)
 
 
+def test_metric_configuration_id_and_frozen_kwargs():
+    metric_domain_kwargs = {"column": "a", "batch_id": "1234"}
+    metric_configuration = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=None,
+    )
+    metric_id = metric_configuration.id
+    assert metric_id == (
+        "column.max",
+        IDDict(metric_domain_kwargs).to_id(),
+        tuple(),
+    )
+    assert metric_configuration.id is metric_id
+
+    # The kwargs are copied, so the id does not change when the caller reuses its dictionary.
+    metric_domain_kwargs["batch_id"] = "5678"
+    assert metric_configuration.id == metric_id
+    with pytest.raises(TypeError):
+        metric_configuration.metric_domain_kwargs["batch_id"] = "5678"
+
+    with pytest.raises(AttributeError):
+        metric_configuration.some_attribute = True
+
+    for metric_configuration_copy in [
+        copy.copy(metric_configuration),
+        copy.deepcopy(metric_configuration),
+        pickle.loads(pickle.dumps(metric_configuration)),
+    ]:
+        assert metric_configuration_copy.id == metric_id
+        with pytest.raises(TypeError):
+            metric_configuration_copy.metric_domain_kwargs["batch_id"] = "5678"
+
+
+def test_validation_graph_dependency_index():
+    engine = PandasExecutionEngine()
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_value_z_scores_to_be_less_than",
+        kwargs={
+            "column": "a",
+            "mostly": 0.9,
+            "threshold": 4,
+            "double_sided": True,
+        },
+    )
+    graph = ValidationGraph()
+    validator = Validator(execution_engine=engine)
+    validation_dependencies = get_expectation_impl(
+        "expect_column_value_z_scores_to_be_less_than"
+    )(expectation_configuration).get_validation_dependencies(
+        expectation_configuration, engine
+    )
+    for metric_configuration in validation_dependencies["metrics"].values():
+        validator.build_metric_dependency_graph(
+            graph, metric_configuration, expectation_configuration, engine
+        )
+
+    (
+        metric_configurations,
+        unmet_dependency_counts,
+        dependent_ids,
+    ) = graph.get_dependency_index()
+    assert len(metric_configurations) == 12
+    assert set(unmet_dependency_counts.keys()) == set(metric_configurations.keys())
+    for metric_id, metric_configuration in metric_configurations.items():
+        assert metric_configuration.id == metric_id
+    for metric_id, dependents in dependent_ids.items():
+        assert metric_id in metric_configurations
+        assert dependents <= set(metric_configurations.keys())
+
+
+def test_build_metric_dependency_graph_expands_each_metric_once():
+    engine = PandasExecutionEngine()
+    validator = Validator(execution_engine=engine)
+    metric_configurations = []
+    for column in ["a", "b"]:
+        expectation_configuration = ExpectationConfiguration(
+            expectation_type="expect_column_value_z_scores_to_be_less_than",
+            kwargs={
+                "column": column,
+                "mostly": 0.9,
+                "threshold": 4,
+                "double_sided": True,
+            },
+        )
+        validation_dependencies = get_expectation_impl(
+            "expect_column_value_z_scores_to_be_less_than"
+        )(expectation_configuration).get_validation_dependencies(
+            expectation_configuration, engine
+        )
+        metric_configurations.extend(
+            (metric_configuration, expectation_configuration)
+            for metric_configuration in validation_dependencies["metrics"].values()
+        )
+
+    expanded_metric_ids = []
+    get_evaluation_dependencies = MetricProvider.get_evaluation_dependencies.__func__
+
+    def spy_get_evaluation_dependencies(cls, metric, **kwargs):
+        expanded_metric_ids.append(metric.id)
+        return get_evaluation_dependencies(cls, metric=metric, **kwargs)
+
+    def build_graph():
+        graph = ValidationGraph()
+        for metric_configuration, expectation_configuration in metric_configurations:
+            validator.build_metric_dependency_graph(
+                graph, metric_configuration, expectation_configuration, engine
+            )
+        return graph
+
+    with mock.patch.object(
+        MetricProvider,
+        "get_evaluation_dependencies",
+        classmethod(spy_get_evaluation_dependencies),
+    ):
+        graph = build_graph()
+        metric_ids = set(graph.get_dependency_index()[0].keys())
+        # table.columns, among others, is shared by both expectations but obtains its dependencies only once.
+        assert len(expanded_metric_ids) == len(set(expanded_metric_ids))
+        assert set(expanded_metric_ids) == metric_ids
+
+        # A new graph is built from the dependencies cached by the Validator.
+        expanded_metric_ids.clear()
+        other_graph = build_graph()
+        assert expanded_metric_ids == []
+        assert other_graph._edge_ids == graph._edge_ids
+
+
+@pytest.mark.parametrize("metric_resolution_max_workers", [None, 4])
+def test_resolve_validation_graph_topological_order(
+    basic_datasource, metric_resolution_max_workers
+):
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
+    batch = basic_datasource.get_single_batch_from_batch_request(
+        RuntimeBatchRequest(
+            **{
+                "datasource_name": "my_datasource",
+                "data_connector_name": "test_runtime_data_connector",
+                "data_asset_name": "IN_MEMORY_DATA_ASSET",
+                "runtime_parameters": {
+                    "batch_data": df,
+                },
+                "batch_identifiers": {
+                    "pipeline_stage_name": 0,
+                    "airflow_run_id": 0,
+                    "custom_key_0": 0,
+                },
+            }
+        )
+    )
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[batch],
+        metric_resolution_max_workers=metric_resolution_max_workers,
+    )
+    with mock.patch.object(
+        validator.execution_engine,
+        "resolve_column_aggregate_bundle",
+        wraps=validator.execution_engine.resolve_column_aggregate_bundle,
+    ) as mock_resolve_column_aggregate_bundle, mock.patch.object(
+        validator, "_resolve_metrics", wraps=validator._resolve_metrics
+    ) as mock_resolve_metrics:
+        metrics = validator.get_metrics(
+            {
+                "max_a": MetricConfiguration("column.max", {"column": "a"}),
+                "min_b": MetricConfiguration("column.min", {"column": "b"}),
+                "mean_a": MetricConfiguration("column.mean", {"column": "a"}),
+                "row_count": MetricConfiguration("table.row_count", {}),
+                "b_nulls": MetricConfiguration(
+                    "column_values.nonnull.unexpected_count", {"column": "b"}
+                ),
+            }
+        )
+    # The column aggregates of the batch are resolved in one bundle, whether or not metrics are resolved concurrently.
+    bundled_metric_names = [
+        sorted(metric.metric_name for metric, _, _, _ in call.args[0])
+        for call in mock_resolve_column_aggregate_bundle.call_args_list
+    ]
+    assert ["column.max", "column.mean", "column.min"] in bundled_metric_names
+    if metric_resolution_max_workers is not None:
+        # Each concurrent resolution is given only the metrics that it depends on.
+        for call in mock_resolve_metrics.call_args_list:
+            assert set(call.kwargs["metrics"]) == {
+                dependency.id
+                for metric in call.kwargs["metrics_to_resolve"]
+                for dependency in metric.metric_dependencies.values()
+            }
+    assert metrics == {
+        "max_a": 22,
+        "min_b": 1,
+        "mean_a": 7.666666666666667,
+        "row_count": 6,
+        "b_nulls": 1,
+    }
+
+
+def test_resolve_validation_graph_with_unmet_dependency_raises():
+    engine = PandasExecutionEngine()
+    row_count = MetricConfiguration("table.row_count", {})
+    missing = MetricConfiguration("table.columns", {})
+    graph = ValidationGraph()
+    graph.add(MetricEdge(row_count, missing))
+
+    with pytest.raises(ge_exceptions.GreatExpectationsError):
+        Validator(execution_engine=engine).resolve_validation_graph(graph, {})
+
+
 def test_graph_validate(basic_datasource):
     df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10], "b": [1, 2, 3, 4, 5, None]})
 
@@ -233,6 +455,29 @@ def test_graph_validate(basic_datasource):
     ]
 
 
+def test_graph_validate_does_not_modify_configurations():
+    df = pd.DataFrame({"a": [1, 5, 22, 3, 5, 10]})
+    value_set = list(range(25))
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={"column": "a", "value_set": value_set},
+    )
+
+    validator = Validator(
+        execution_engine=PandasExecutionEngine(), batches=[Batch(data=df)]
+    )
+    result = validator.graph_validate(configurations=[expectation_configuration])
+
+    assert result[0].success
+    assert result[0].expectation_config.kwargs == {
+        "column": "a",
+        "value_set": value_set,
+        "batch_id": validator.active_batch_id,
+    }
+    assert expectation_configuration.kwargs == {"column": "a", "value_set": value_set}
+    assert value_set == list(range(25))
+
+
 def test_graph_validate_with_exception(basic_datasource):
     def mock_error(*args, **kwargs):
         raise Exception("Mock Error")
@@ -773,3 +1018,65 @@ def test_instantiate_validator_with_a_list_of_batch_requests(
     assert ve.value.args == (
         "Only one of batch_request or batch_request_list may be specified",
     )
+
+
+def test_graph_validate_batches(multi_batch_taxi_validator):
+    validator: Validator = multi_batch_taxi_validator
+    expectation_configurations = [
+        ExpectationConfiguration(
+            expectation_type="expect_table_row_count_to_be_between",
+            kwargs={"min_value": 0, "max_value": None},
+        ),
+        ExpectationConfiguration(
+            expectation_type="expect_column_max_to_be_between",
+            kwargs={"column": "passenger_count", "min_value": 0, "max_value": 6},
+        ),
+    ]
+
+    results_by_batch_id = validator.graph_validate_batches(
+        configurations=expectation_configurations
+    )
+
+    assert set(results_by_batch_id.keys()) == set(validator.batches.keys())
+    for batch_id, results in results_by_batch_id.items():
+        validator.active_batch_id = batch_id
+        assert [result.expectation_config for result in results] == [
+            result.expectation_config
+            for result in validator.graph_validate(
+                configurations=expectation_configurations
+            )
+        ]
+        assert [result.result for result in results] == [
+            result.result
+            for result in validator.graph_validate(
+                configurations=expectation_configurations
+            )
+        ]
+        assert {result.expectation_config.kwargs["batch_id"] for result in results} == {
+            batch_id
+        }
+
+
+def test_validate_batches(multi_batch_taxi_validator):
+    validator: Validator = multi_batch_taxi_validator
+    validator.expect_column_values_to_not_be_null(column="vendor_id")
+    validator.expect_column_max_to_be_between(
+        column="passenger_count", min_value=0, max_value=6
+    )
+
+    results_by_batch_id = validator.validate_batches()
+
+    assert set(results_by_batch_id.keys()) == set(validator.batches.keys())
+    for batch_id, suite_validation_result in results_by_batch_id.items():
+        validator.active_batch_id = batch_id
+        expected_suite_validation_result = validator.validate()
+        assert (
+            suite_validation_result.meta["active_batch_definition"]
+            == validator.batches[batch_id].batch_definition
+        )
+        assert suite_validation_result.statistics == (
+            expected_suite_validation_result.statistics
+        )
+        assert [result.result for result in suite_validation_result.results] == [
+            result.result for result in expected_suite_validation_result.results
+        ]